@@ -0,0 +1,113 @@
+"""
+Latency and throughput of the HTTP API server under a local load generator.
+
+    python -m benchmarks.bench_http --connections 16 --requests 4000 --pipeline 1 4
+
+Each run starts the server in a child process and drives POST /v1/trends/fetch
+from N client connections, once reconnecting per request and once over
+keep-alive connections at each pipeline depth.
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import time
+
+BODY = json.dumps({"platform": "youtube", "region": "ET", "time_window": "24h", "limit": 10}).encode()
+REQUEST = b"POST /v1/trends/fetch HTTP/1.1\r\nHost: bench\r\nContent-Length: %d\r\n\r\n%s" % (len(BODY), BODY)
+CLOSE_REQUEST = REQUEST.replace(b"Host: bench\r\n", b"Host: bench\r\nConnection: close\r\n")
+
+
+def _serve(port, ready):
+    from chimera.api import ApiServer
+
+    async def main():
+        async with ApiServer(port=port) as server:
+            ready.put(server.port)
+            await server.serve_forever()
+
+    asyncio.run(main())
+
+
+async def _read_response(reader):
+    head = await reader.readuntil(b"\r\n\r\n")
+    length = 0
+    for line in head.split(b"\r\n"):
+        if line[:15].lower() == b"content-length:":
+            length = int(line[15:])
+    await reader.readexactly(length)
+    if not head.startswith(b"HTTP/1.1 200"):
+        raise RuntimeError(head.split(b"\r\n")[0].decode())
+
+
+async def _keepalive_client(port, n, depth, latencies):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    sent = 0
+    while sent < n:
+        batch = min(depth, n - sent)
+        start = time.perf_counter()
+        writer.write(REQUEST * batch)
+        for _ in range(batch):
+            await _read_response(reader)
+            latencies.append(time.perf_counter() - start)
+        sent += batch
+    writer.close()
+    await writer.wait_closed()
+
+
+async def _reconnect_client(port, n, latencies):
+    for _ in range(n):
+        start = time.perf_counter()
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(CLOSE_REQUEST)
+        await _read_response(reader)
+        latencies.append(time.perf_counter() - start)
+        writer.close()
+        await writer.wait_closed()
+
+
+async def _load(port, connections, requests, depth):
+    latencies = []
+    per_conn = requests // connections
+    if depth:
+        clients = [_keepalive_client(port, per_conn, depth, latencies) for _ in range(connections)]
+    else:
+        clients = [_reconnect_client(port, per_conn, latencies) for _ in range(connections)]
+    start = time.perf_counter()
+    await asyncio.gather(*clients)
+    return time.perf_counter() - start, sorted(latencies)
+
+
+def _pct(values, p):
+    return values[min(len(values) - 1, int(p * len(values)))] * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--connections", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=4000)
+    parser.add_argument("--pipeline", type=int, nargs="+", default=[1, 4])
+    parser.add_argument("--port", type=int, default=0)
+    args = parser.parse_args()
+
+    ready = multiprocessing.Queue()
+    server = multiprocessing.Process(target=_serve, args=(args.port, ready), daemon=True)
+    server.start()
+    port = ready.get(timeout=30)
+    try:
+        asyncio.run(_load(port, args.connections, args.connections * 4, 1))  # warm up
+        for depth in [0] + args.pipeline:
+            elapsed, lat = asyncio.run(_load(port, args.connections, args.requests, depth))
+            mode = "reconnect" if depth == 0 else f"keep-alive pipeline={depth}"
+            print(
+                f"{mode:<26s} req/s={len(lat) / elapsed:>8.0f} "
+                f"p50={_pct(lat, 0.50):6.2f}ms p99={_pct(lat, 0.99):6.2f}ms max={lat[-1] * 1000:6.2f}ms"
+            )
+    finally:
+        server.terminate()
+        server.join()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Per-request cost of the rate limiters, single-threaded and under thread contention.
+
+    python -m benchmarks.bench_ratelimit --calls 200000 --keys 1000 --threads 1 4
+"""
+
+import argparse
+import threading
+import time
+
+from chimera.api import RateLimiter, SharedRateLimiter
+
+# Quotas high enough that every call takes the admit path, which is the common case.
+QUOTAS = {"read": (10**9, 60.0), "write": (10**9, 60.0)}
+
+
+def _drive(limiter, keys, calls):
+    allow = limiter.allow
+    for i in range(calls):
+        allow(keys[i % len(keys)], "read")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=200_000)
+    parser.add_argument("--keys", type=int, default=1000)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 4])
+    args = parser.parse_args()
+
+    keys = [f"svc_{i}" for i in range(args.keys)]
+    for name, limiter in (("local", RateLimiter(QUOTAS)), ("shared", SharedRateLimiter(QUOTAS))):
+        _drive(limiter, keys, len(keys))  # populate the table
+        for n in args.threads:
+            per_thread = args.calls // n
+            threads = [threading.Thread(target=_drive, args=(limiter, keys, per_thread)) for _ in range(n)]
+            start = time.perf_counter()
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            elapsed = time.perf_counter() - start
+            print(f"{name:<7s} threads={n:<3d} us/call={elapsed / (per_thread * n) * 1e6:6.2f}")
+        if isinstance(limiter, SharedRateLimiter):
+            limiter.unlink()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Throughput of ShardedRunner vs. worker count.
+
+    python -m benchmarks.bench_sharding --requests 400 --workers 1 2 4 8
+"""
+
+import argparse
+import time
+
+from chimera.pipeline import ShardedRunner
+
+PLATFORMS = ["youtube", "tiktok", "instagram", "x", "reddit"]
+REGIONS = ["ET", "US", "GB", "DE", "FR", "BR", "IN", "JP", "KE", "NG"]
+
+
+def _requests(n):
+    for i in range(n):
+        yield {
+            "platform": PLATFORMS[i % len(PLATFORMS)],
+            "region": REGIONS[(i // len(PLATFORMS)) % len(REGIONS)],
+            "time_window": f"{1 + i % 48}h",
+            "limit": 50,
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--batch-size", type=int, default=16)
+    args = parser.parse_args()
+
+    requests = list(_requests(args.requests))
+    baseline = None
+    for workers in args.workers:
+        with ShardedRunner(workers, batch_size=args.batch_size) as runner:
+            runner.run(requests[: workers])  # warm the worker processes
+            start = time.perf_counter()
+            result = runner.run(requests)
+            elapsed = time.perf_counter() - start
+        rate = result["metrics"]["totals"]["topics"] / elapsed
+        baseline = baseline or rate
+        print(f"workers={workers:<3d} topics/s={rate:>10.0f} speedup={rate / baseline:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""
+Benchmark suite for the four skills, with JSON baselines and regression gating.
+
+    python -m benchmarks.bench_skills                                 # run and print
+    python -m benchmarks.bench_skills --save benchmarks/baselines/skills.json
+    python -m benchmarks.bench_skills --compare benchmarks/baselines/skills.json --threshold 0.15
+
+Every case reports ops/sec (best of --rounds time-boxed rounds), p50/p99
+per-call latency, and two allocation figures measured in a separate
+tracemalloc pass so tracing never skews the timings: ``alloc_bytes`` is the
+peak traced memory one call allocates, ``alloc_blocks`` the memory blocks
+still held by its result. --compare exits non-zero when any case's ops/sec
+falls more than --threshold below the baseline.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+from chimera.skills import evaluate_policy, fetch_trends, generate_draft, publish_content
+from chimera.skills.fetch_trends import INPUT_SCHEMA as FETCH_SCHEMA
+
+TRENDS = {"platform": "youtube", "region": "ET", "time_window": "24h"}
+TOPIC = {"topic_id": "tpc_bench", "platform": "youtube"}
+DRAFT = {"draft_id": "drf_bench", "platform": "youtube", "confidence": 0.8}
+
+
+def _limits():
+    rule = next(r for r in FETCH_SCHEMA if r["field"] == "limit")
+    return range(rule["min"], rule["max"] + 1)
+
+
+def cases():
+    """(name, skill, params) for every benchmarked path; error paths are named after their code."""
+    out = [(f"fetch_trends/limit={n}", fetch_trends, dict(TRENDS, limit=n)) for n in _limits()]
+    out += [
+        ("fetch_trends/INVALID_PLATFORM", fetch_trends, dict(TRENDS, platform="myspace")),
+        ("fetch_trends/INVALID_LIMIT", fetch_trends, dict(TRENDS, limit=0)),
+        ("generate_draft/ok", generate_draft, {"content_type": "post", "constraints": ["brand_safe"], "selected_topics": [TOPIC]}),
+        ("generate_draft/INVALID_CONTENT_TYPE", generate_draft, {"content_type": "essay", "selected_topics": [TOPIC]}),
+        ("evaluate_policy/APPROVED", evaluate_policy, {"draft": DRAFT, "confidence_threshold": 0.5}),
+        ("evaluate_policy/REQUIRES_HUMAN_REVIEW", evaluate_policy, {"draft": DRAFT, "confidence_threshold": 0.9}),
+        ("evaluate_policy/INVALID_CONFIDENCE_THRESHOLD", evaluate_policy, {"draft": DRAFT, "confidence_threshold": 1.5}),
+        ("publish_content/ok", publish_content, {"draft": DRAFT, "approval_id": "hap_bench", "schedule_time": "2026-02-05T12:00:00Z"}),
+        ("publish_content/MISSING_APPROVAL", publish_content, {"draft": DRAFT}),
+        ("publish_content/INVALID_SCHEDULE_TIME", publish_content, {"draft": DRAFT, "approval_id": "hap_bench", "schedule_time": "tomorrow"}),
+    ]
+    return out
+
+
+def _timed_round(fn, params, seconds):
+    clock = time.perf_counter_ns
+    samples = []
+    append = samples.append
+    deadline = clock() + int(seconds * 1e9)
+    start = clock()
+    while True:
+        t0 = clock()
+        fn(params)
+        t1 = clock()
+        append(t1 - t0)
+        if t1 >= deadline:
+            break
+    return samples, clock() - start
+
+
+def _traced_peak(fn, params, calls):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        peak = 0
+        for _ in range(calls):
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            fn(params)
+            peak += tracemalloc.get_traced_memory()[1] - base
+    finally:
+        tracemalloc.stop()
+    return peak // calls
+
+
+def _noop(params):
+    return None
+
+
+def _allocations(fn, params, calls=50):
+    # The tracing machinery allocates too; subtract what an empty call measures.
+    peak = max(0, _traced_peak(fn, params, calls) - _traced_peak(_noop, params, calls))
+    gc.collect()
+    before = sys.getallocatedblocks()
+    kept = [fn(params) for _ in range(calls)]
+    blocks = (sys.getallocatedblocks() - before) / calls
+    del kept
+    return peak, round(blocks, 1)
+
+
+def measure(fn, params, rounds, seconds):
+    fn(params)  # warm caches (validator memo, imports)
+    best = None
+    for _ in range(rounds):
+        samples, elapsed = _timed_round(fn, params, seconds)
+        ops = len(samples) / (elapsed / 1e9)
+        if best is None or ops > best[0]:
+            best = (ops, samples)
+    ops, samples = best
+    samples.sort()
+    alloc_bytes, alloc_blocks = _allocations(fn, params)
+    return {
+        "ops_per_sec": round(ops, 1),
+        "p50_us": round(samples[len(samples) // 2] / 1e3, 3),
+        "p99_us": round(samples[min(len(samples) - 1, int(len(samples) * 0.99))] / 1e3, 3),
+        "alloc_bytes": alloc_bytes,
+        "alloc_blocks": alloc_blocks,
+    }
+
+
+def compare(results, baseline, threshold):
+    """Cases whose ops/sec fell more than ``threshold`` (a fraction) below the baseline.
+
+    Cases missing from the baseline, or recorded there without a positive
+    ops/sec, have nothing to compare against and are skipped.
+    """
+    regressions = []
+    for name, now in results.items():
+        then = baseline.get(name)
+        if then is None or not then.get("ops_per_sec", 0) > 0:
+            continue
+        change = now["ops_per_sec"] / then["ops_per_sec"] - 1.0
+        if change < -threshold:
+            regressions.append((name, then["ops_per_sec"], now["ops_per_sec"], change))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--seconds", type=float, default=0.05, help="length of each timed round per case")
+    parser.add_argument("--filter", default="", help="only run cases whose name contains this")
+    parser.add_argument("--save", metavar="PATH", help="write results as a JSON baseline")
+    parser.add_argument("--compare", metavar="PATH", help="compare against a JSON baseline")
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed ops/sec drop (fraction)")
+    args = parser.parse_args()
+    if args.compare and not os.path.exists(args.compare):
+        sys.exit(f"no baseline at {args.compare}: record one first with --save {args.compare} (make bench-baseline)")
+
+    results = {}
+    for name, fn, params in cases():
+        if args.filter not in name:
+            continue
+        r = results[name] = measure(fn, params, args.rounds, args.seconds)
+        print(
+            f"{name:<46s} ops/s={r['ops_per_sec']:>10.0f} p50={r['p50_us']:8.2f}us "
+            f"p99={r['p99_us']:8.2f}us alloc={r['alloc_bytes']:>7d}B blocks={r['alloc_blocks']:>7.1f}"
+        )
+
+    if args.save:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save)), exist_ok=True)
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({"python": platform.python_version(), "machine": platform.machine(), "cases": results}, f, indent=2)
+            f.write("\n")
+        print(f"baseline written to {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)["cases"]
+        regressions = compare(results, baseline, args.threshold)
+        for name, then, now, change in regressions:
+            print(f"REGRESSION {name}: {then:.0f} -> {now:.0f} ops/s ({change:+.1%})")
+        missing = sorted(set(results) - set(baseline))
+        if missing:
+            print(f"not in baseline: {', '.join(missing)}")
+        if regressions:
+            sys.exit(1)
+        print(f"no regressions beyond {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Compiled input validators vs. the inline checks the skills used to carry.
+
+    python -m benchmarks.bench_validation --payloads 100000
+
+Single calls of the compiled fetch_trends validator run level with the
+inline checks. evaluate_policy has so few checks that building the
+``(None, values)`` result, which inline checks do not need, makes its
+compiled validator 15-25% slower (roughly 3.0M/s vs 3.8M/s on a 1-CPU
+sandbox). The skill therefore keeps its checks inline and the compiled
+validator only backs batch callers. validate_many, which returns only the
+errors, is ahead of inline for both.
+"""
+
+import argparse
+import time
+
+from chimera.skills._validate import validate_many
+from chimera.skills.evaluate_policy import _validate_input as compiled_evaluate_policy
+from chimera.skills.fetch_trends import _validate_input as compiled_fetch_trends
+
+_PLATFORMS = {"youtube", "tiktok", "instagram", "twitter", "x", "reddit"}
+
+
+def inline_fetch_trends(params):
+    # The pre-compiler checks from fetch_trends(), minus error envelope construction.
+    platform = params.get("platform")
+    region = params.get("region")
+    time_window = params.get("time_window")
+    limit = params.get("limit", 25)
+    if not isinstance(platform, str) or platform not in _PLATFORMS:
+        return "INVALID_PLATFORM"
+    if not isinstance(region, str) or len(region) != 2 or not region.isupper():
+        return "INVALID_REGION"
+    if not isinstance(time_window, str) or not time_window or not time_window[-1] in {"h", "H", "d", "D"}:
+        return "INVALID_TIME_WINDOW"
+    if not time_window[:-1].isdigit():
+        return "INVALID_TIME_WINDOW"
+    if not isinstance(limit, int) or not (1 <= limit <= 50):
+        return "INVALID_LIMIT"
+    return None
+
+
+def inline_evaluate_policy(params):
+    draft = params.get("draft")
+    try:
+        thr = float(params.get("confidence_threshold", 0.7))
+    except Exception:
+        return "INVALID_CONFIDENCE_THRESHOLD"
+    if not (0.0 <= thr <= 1.0):
+        return "INVALID_CONFIDENCE_THRESHOLD"
+    if not isinstance(draft, dict):
+        return "INVALID_DRAFT"
+    draft_id = draft.get("draft_id")
+    if not isinstance(draft_id, str) or not draft_id.startswith("drf_"):
+        return "INVALID_DRAFT"
+    return None
+
+
+def _fetch_payloads(n):
+    bad = [{"platform": "myspace"}, {"platform": "x", "region": "et"}, {"platform": "x", "region": "ET", "time_window": "1w"}]
+    for i in range(n):
+        if i % 10 == 0:
+            yield bad[i % 3]
+        else:
+            yield {"platform": "youtube", "region": "ET", "time_window": f"{1 + i % 48}h", "limit": 1 + i % 50}
+
+
+def _policy_payloads(n):
+    for i in range(n):
+        yield {"draft": {"draft_id": f"drf_{i:012x}"}, "confidence_threshold": (i % 11) / 10}
+
+
+def _each(validator, payloads):
+    # Results are dropped as a skill would drop them; keeping 100k result tuples
+    # alive would mostly measure the garbage collector.
+    for p in payloads:
+        validator(p)
+
+
+def _time(fn, payloads):
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        fn(payloads)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--payloads", type=int, default=100_000)
+    args = parser.parse_args()
+
+    for name, inline, compiled, payloads in (
+        ("fetch_trends", inline_fetch_trends, compiled_fetch_trends, list(_fetch_payloads(args.payloads))),
+        ("evaluate_policy", inline_evaluate_policy, compiled_evaluate_policy, list(_policy_payloads(args.payloads))),
+    ):
+        t_inline = _time(lambda ps: _each(inline, ps), payloads)
+        t_single = _time(lambda ps: _each(compiled, ps), payloads)
+        t_batch = _time(lambda ps: validate_many(compiled, ps), payloads)
+        n = len(payloads)
+        print(
+            f"{name:<16s} inline={n / t_inline:>10.0f}/s compiled={n / t_single:>10.0f}/s "
+            f"validate_many={n / t_batch:>10.0f}/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,15 @@
+from .http import HttpError, Request, Response, status_for
+from .ratelimit import QUOTAS, RateLimiter, SharedRateLimiter
+from .server import ApiServer, serve
+
+__all__ = [
+    "QUOTAS",
+    "ApiServer",
+    "HttpError",
+    "RateLimiter",
+    "Request",
+    "Response",
+    "SharedRateLimiter",
+    "serve",
+    "status_for",
+]
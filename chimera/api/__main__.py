@@ -0,0 +1,38 @@
+import argparse
+
+from .ratelimit import RateLimiter
+from .server import serve
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve the spec HTTP endpoints.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--db", help="SQLite database path (entities are not persisted without one)")
+    parser.add_argument("--rate-limit", action="store_true", help="enforce the spec's read/write quotas")
+    parser.add_argument("--metrics", action="store_true", help="instrument skills and serve GET /metrics")
+    parser.add_argument("--capture", metavar="PATH", help="record skill traffic for `python -m chimera.replay`")
+    args = parser.parse_args()
+
+    store = None
+    if args.db:
+        from ..store import SQLiteStore
+
+        store = SQLiteStore(args.db)
+    if args.metrics:
+        from ..metrics import instrument
+
+        instrument()
+    if args.capture:
+        from ..replay import start_capture, stop_capture
+
+        start_capture(args.capture)
+    try:
+        serve(args.host, args.port, store=store, rate_limiter=RateLimiter() if args.rate_limit else None)
+    finally:
+        if args.capture:
+            stop_capture()
+
+
+if __name__ == "__main__":
+    main()
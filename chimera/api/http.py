@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import asyncio
+from typing import AsyncIterator, Dict, Iterable, Optional, Union
+from urllib.parse import parse_qsl, urlsplit
+
+
+REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    408: "Request Timeout",
+    409: "Conflict",
+    413: "Payload Too Large",
+    429: "Too Many Requests",
+    431: "Request Header Fields Too Large",
+    500: "Internal Server Error",
+    501: "Not Implemented",
+    502: "Bad Gateway",
+    505: "HTTP Version Not Supported",
+}
+
+MAX_HEADERS = 100
+
+Body = Union[bytes, Iterable[bytes], AsyncIterator[bytes]]
+
+
+class HttpError(Exception):
+    """Malformed or unsupported request; the connection is closed after the error response."""
+
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class Request:
+    __slots__ = ("method", "target", "path", "query", "version", "headers", "body")
+
+    def __init__(self, method: str, target: str, version: str, headers: Dict[str, str], body: bytes) -> None:
+        self.method = method
+        self.target = target
+        split = urlsplit(target)
+        self.path = split.path
+        self.query = dict(parse_qsl(split.query, keep_blank_values=True))
+        self.version = version
+        self.headers = headers
+        self.body = body
+
+    @property
+    def keep_alive(self) -> bool:
+        conn = self.headers.get("connection", "").lower()
+        if self.version == "HTTP/1.0":
+            return conn == "keep-alive"
+        return conn != "close"
+
+
+class Response:
+    __slots__ = ("status", "headers", "body")
+
+    def __init__(self, status: int, body: Body = b"", headers: Optional[Dict[str, str]] = None) -> None:
+        self.status = status
+        self.body = body
+        self.headers = {"Content-Type": "application/json"}
+        if headers:
+            self.headers.update(headers)
+
+
+async def read_request(reader: asyncio.StreamReader, max_body: int) -> Optional[Request]:
+    """Parse one HTTP/1.1 request from ``reader``; None on a clean EOF between requests."""
+    try:
+        line = await reader.readline()
+    except ValueError:  # line longer than the reader's limit
+        raise HttpError(431, "request line too long") from None
+    if not line:
+        return None
+    if line in (b"\r\n", b"\n"):  # tolerate a stray CRLF between pipelined requests
+        line = await reader.readline()
+    try:
+        method, target, version = line.decode("latin-1").rstrip("\r\n").split(" ")
+    except ValueError:
+        raise HttpError(400, "malformed request line") from None
+    if version not in ("HTTP/1.1", "HTTP/1.0"):
+        raise HttpError(505, f"unsupported version {version}")
+
+    headers: Dict[str, str] = {}
+    for _ in range(MAX_HEADERS + 1):
+        try:
+            raw = await reader.readline()
+        except ValueError:
+            raise HttpError(431, "header line too long") from None
+        if raw in (b"\r\n", b"\n", b""):
+            break
+        name, sep, value = raw.decode("latin-1").partition(":")
+        if not sep:
+            raise HttpError(400, "malformed header")
+        headers[name.strip().lower()] = value.strip()
+    else:
+        raise HttpError(431, "too many headers")
+
+    if "chunked" in headers.get("transfer-encoding", "").lower():
+        raise HttpError(501, "chunked request bodies are not supported")
+    try:
+        length = int(headers.get("content-length", "0"))
+    except ValueError:
+        raise HttpError(400, "invalid Content-Length") from None
+    if length < 0:
+        raise HttpError(400, "invalid Content-Length")
+    if length > max_body:
+        raise HttpError(413, f"body exceeds {max_body} bytes")
+    body = await reader.readexactly(length) if length else b""
+    return Request(method, target, version, headers, body)
+
+
+def _head(status: int, headers: Dict[str, str]) -> bytes:
+    lines = [f"HTTP/1.1 {status} {REASONS.get(status, 'Unknown')}"]
+    lines += [f"{k}: {v}" for k, v in headers.items()]
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+
+async def write_response(writer: asyncio.StreamWriter, response: Response, keep_alive: bool) -> None:
+    """Write ``response``; bytes go out with Content-Length, iterators as chunked transfer encoding."""
+    headers = dict(response.headers)
+    headers["Connection"] = "keep-alive" if keep_alive else "close"
+    body = response.body
+    if isinstance(body, (bytes, bytearray, memoryview)):
+        headers["Content-Length"] = str(len(body))
+        writer.write(_head(response.status, headers) + bytes(body))
+        await writer.drain()
+        return
+
+    headers["Transfer-Encoding"] = "chunked"
+    writer.write(_head(response.status, headers))
+    if hasattr(body, "__aiter__"):
+        async for chunk in body:  # type: ignore[union-attr]
+            if chunk:
+                writer.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+                await writer.drain()
+    else:
+        for chunk in body:  # type: ignore[union-attr]
+            if chunk:
+                writer.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+                await writer.drain()
+    writer.write(b"0\r\n\r\n")
+    await writer.drain()
+
+
+_CONFLICT = frozenset(
+    {
+        "MISSING_APPROVAL",
+        "DRAFT_REJECTED",
+        "DRAFT_NOT_APPROVED",
+        "DRAFT_IMMUTABLE",
+        "HUMAN_REJECTION",
+        "INVALID_REVIEW_STATE",
+        "WORKFLOW_NOT_PAUSED",
+        "WORKFLOW_FINALIZED",
+    }
+)
+_UPSTREAM = frozenset({"UPSTREAM_ERROR", "GENERATION_ERROR", "POLICY_ENGINE_ERROR", "PUBLISH_ERROR"})
+
+
+def status_for(code: str) -> int:
+    """HTTP status for a spec error code (specs/technical.md 4)."""
+    if code in _CONFLICT:
+        return 409
+    if code.startswith("INVALID_"):
+        return 400
+    if code.endswith("_NOT_FOUND"):
+        return 404
+    if code in _UPSTREAM:
+        return 502
+    if code == "RATE_LIMITED":
+        return 429
+    return 500
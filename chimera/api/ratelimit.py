@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import hashlib
+import math
+import multiprocessing
+import threading
+import time
+from collections import OrderedDict
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Tuple
+
+# Security Intent (specs/technical.md): requests per window, per endpoint class.
+QUOTAS: Dict[str, Tuple[int, float]] = {
+    "read": (60, 60.0),
+    "write": (10, 60.0),
+}
+
+
+def endpoint_class(method: str) -> str:
+    """GET endpoints are reads; everything else (the spec's POSTs) is a write."""
+    return "read" if method in ("GET", "HEAD") else "write"
+
+
+def _retry_after(prev: int, curr: int, limit: int, frac: float, window: float) -> float:
+    """Seconds until the sliding estimate ``prev * (1 - frac) + curr`` drops below ``limit``."""
+    if curr < limit:
+        # The previous window's weight decays within this window.
+        return max(0.0, (1.0 - (limit - curr) / prev - frac) * window)
+    # Only the next window can help, once this window's count has decayed enough.
+    return (1.0 - frac + 1.0 - limit / curr) * window if curr else (1.0 - frac) * window
+
+
+class RateLimiter:
+    """In-process sliding-window rate limiter keyed by (service token, endpoint class).
+
+    Each key keeps three integers: the current fixed window's index and the
+    counts of the previous and current windows. A request is admitted while
+    ``prev * (1 - elapsed_fraction) + curr < limit``, which approximates a true
+    sliding window without storing timestamps. Keys are spread over
+    ``shards`` dicts with one lock each, so threads rarely contend. At most
+    ``max_keys`` keys are held: each shard keeps its keys in least recently
+    used order, and a full one drops the least recently used key, plus any
+    behind it that were idle for a whole window (their estimate is already
+    zero), in O(1) per new key.
+    """
+
+    def __init__(
+        self,
+        quotas: Optional[Dict[str, Tuple[int, float]]] = None,
+        *,
+        shards: int = 16,
+        max_keys: int = 65536,
+    ) -> None:
+        self.quotas = dict(QUOTAS if quotas is None else quotas)
+        self._shards: List[Tuple[threading.Lock, "OrderedDict[Tuple[str, str], List[int]]"]] = [
+            (threading.Lock(), OrderedDict()) for _ in range(shards)
+        ]
+        self._shard_capacity = max(1, max_keys // shards)
+
+    def __len__(self) -> int:
+        return sum(len(table) for _, table in self._shards)
+
+    def allow(self, key: str, endpoint_class: str, now: Optional[float] = None) -> Tuple[bool, float]:
+        """Count one request; returns (admitted, seconds to wait before retrying)."""
+        limit, window = self.quotas[endpoint_class]
+        if now is None:
+            now = time.monotonic()
+        t = now / window
+        idx = int(t)
+        frac = t - idx
+        k = (key, endpoint_class)
+        lock, table = self._shards[hash(k) % len(self._shards)]
+        with lock:
+            entry = table.get(k)
+            if entry is None:
+                if len(table) >= self._shard_capacity:
+                    self._evict(table, now)
+                entry = table[k] = [idx, 0, 0]
+            else:
+                table.move_to_end(k)
+                if entry[0] != idx:
+                    entry[1] = entry[2] if entry[0] == idx - 1 else 0
+                    entry[2] = 0
+                    entry[0] = idx
+            prev, curr = entry[1], entry[2]
+            if prev * (1.0 - frac) + curr < limit:
+                entry[2] = curr + 1
+                return True, 0.0
+        return False, _retry_after(prev, curr, limit, frac, window)
+
+    def _evict(self, table: "OrderedDict[Tuple[str, str], List[int]]", now: float) -> None:
+        table.popitem(last=False)
+        quotas = self.quotas
+        while table:
+            k, entry = next(iter(table.items()))
+            if entry[0] >= int(now / quotas[k[1]][1]) - 1:
+                break
+            del table[k]
+
+
+def _stable_hash(key: str, endpoint_class: str) -> int:
+    # hash() is salted per process; slots must agree across workers. Never 0 (empty slot).
+    digest = hashlib.blake2b(f"{endpoint_class}\0{key}".encode("utf-8"), digest_size=8).digest()
+    return (int.from_bytes(digest, "little") >> 1) | 1
+
+
+class SharedRateLimiter:
+    """Sliding-window rate limiter whose counters live in shared memory.
+
+    Same algorithm and ``allow`` contract as RateLimiter, but the table is a
+    fixed array of ``slots`` records (key hash, window index, prev, curr) in a
+    ``multiprocessing.shared_memory`` block, guarded by ``shards`` process
+    locks, so worker processes enforce one quota together. Create it in the
+    parent and hand it to workers (it pickles by name); the creating process
+    calls ``unlink()`` when done. A key probes up to ``probes`` slots; when
+    none is free it reclaims the slot with the oldest window, which resets
+    that key's count (memory stays fixed, and a reclaimed key fails open).
+    """
+
+    _FIELDS = 4  # key hash, window index, previous count, current count
+
+    def __init__(
+        self,
+        quotas: Optional[Dict[str, Tuple[int, float]]] = None,
+        *,
+        slots: int = 65536,
+        shards: int = 16,
+        probes: int = 8,
+    ) -> None:
+        self.quotas = dict(QUOTAS if quotas is None else quotas)
+        self.slots = slots - slots % shards
+        self.shards = shards
+        self.probes = probes
+        self._locks = [multiprocessing.Lock() for _ in range(shards)]
+        self._shm = shared_memory.SharedMemory(create=True, size=self.slots * self._FIELDS * 8)
+        self._shm.buf[:] = bytes(self._shm.size)
+        self._owner = True
+        self._attach()
+
+    def _attach(self) -> None:
+        self._table = self._shm.buf.cast("q")
+        self._per_shard = self.slots // self.shards
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {
+            "quotas": self.quotas,
+            "slots": self.slots,
+            "shards": self.shards,
+            "probes": self.probes,
+            "locks": self._locks,
+            "name": self._shm.name,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.quotas = state["quotas"]
+        self.slots, self.shards, self.probes = state["slots"], state["shards"], state["probes"]
+        self._locks = state["locks"]
+        self._shm = shared_memory.SharedMemory(name=state["name"])
+        self._owner = False
+        self._attach()
+
+    def close(self) -> None:
+        self._table.release()
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Close and free the shared block (creator only)."""
+        self.close()
+        if self._owner:
+            self._shm.unlink()
+
+    def allow(self, key: str, endpoint_class: str, now: Optional[float] = None) -> Tuple[bool, float]:
+        """Count one request; returns (admitted, seconds to wait before retrying)."""
+        limit, window = self.quotas[endpoint_class]
+        t = (time.monotonic() if now is None else now) / window
+        idx = int(t)
+        frac = t - idx
+        h = _stable_hash(key, endpoint_class)
+        shard = h % self.shards
+        per = self._per_shard
+        base = shard * per
+        start = (h // self.shards) % per
+        table = self._table
+        with self._locks[shard]:
+            slot = victim = -1
+            oldest = 1 << 62
+            for i in range(min(self.probes, per)):
+                off = (base + (start + i) % per) * self._FIELDS
+                stored = table[off]
+                if stored == h:
+                    slot = off
+                    break
+                if stored == 0:
+                    victim = off
+                    break
+                if table[off + 1] < oldest:
+                    oldest, victim = table[off + 1], off
+            if slot < 0:
+                slot = victim
+                table[slot], table[slot + 1], table[slot + 2], table[slot + 3] = h, idx, 0, 0
+            elif table[slot + 1] != idx:
+                table[slot + 2] = table[slot + 3] if table[slot + 1] == idx - 1 else 0
+                table[slot + 3] = 0
+                table[slot + 1] = idx
+            prev, curr = table[slot + 2], table[slot + 3]
+            if prev * (1.0 - frac) + curr < limit:
+                table[slot + 3] = curr + 1
+                return True, 0.0
+        return False, _retry_after(prev, curr, limit, frac, window)
+
+
+def retry_after_header(seconds: float) -> str:
+    return str(max(1, math.ceil(seconds)))
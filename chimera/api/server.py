@@ -0,0 +1,478 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import itertools
+import json
+import os
+import re
+from concurrent.futures import Executor
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from .. import metrics as metrics_mod
+from ..clock import now as _ts, pinned
+from ..skills import registry
+from .http import HttpError, Request, Response, read_request, status_for, write_response
+from .ratelimit import endpoint_class, retry_after_header
+
+if TYPE_CHECKING:
+    from ..audit import SkillRunIndex
+    from ..metrics import Metrics
+    from ..store import SQLiteStore
+    from ..workflow import WorkflowEngine
+    from .ratelimit import RateLimiter, SharedRateLimiter
+
+
+# Audit rows are encoded and streamed in batches of this many runs.
+STREAM_BATCH = 256
+
+
+def _err(code: str, message: str, details: Dict[str, Any] | None = None) -> Dict[str, Any]:
+    e: Dict[str, Any] = {"code": code, "message": message, "timestamp": _ts()}
+    if details is not None:
+        e["details"] = details
+    return {"error": e}
+
+
+def _dumps(obj: Any) -> bytes:
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _encode(out: Dict[str, Any]) -> Tuple[int, bytes]:
+    if "error" in out:
+        return status_for(out["error"]["code"]), _dumps(out)
+    return 200, _dumps(out)
+
+
+# Endpoint bodies. Each maps the spec request shape onto skill params, runs the
+# skill and flattens the entity into the spec response, returning (status,
+# encoded body). They run on the executor, so they are plain module-level
+# functions: JSON encoding and store I/O stay off the event loop too.
+
+
+def fetch_trends(body: Dict[str, Any], store: "SQLiteStore | None") -> Tuple[int, bytes]:
+    """POST /v1/trends/fetch (specs/technical.md 3.1)."""
+    out = registry.dispatch("skill_fetch_trends", body, store=store)
+    if "error" in out:
+        return _encode(out)
+    return 200, _dumps(
+        {
+            "request_id": out["request_id"],
+            "platform": body["platform"],
+            "region": body["region"],
+            "time_window": body["time_window"],
+            "collected_at": out["timestamp"],
+            "topics": out["topics"],
+        }
+    )
+
+
+def create_draft(body: Dict[str, Any], store: "SQLiteStore | None") -> Tuple[int, bytes]:
+    """POST /v1/content/drafts (3.2): ``topic_id`` becomes the skill's single selected topic."""
+    topic_id = body.get("topic_id")
+    topic: Dict[str, Any] = {"topic_id": topic_id, "platform": body.get("platform")}
+    if store is not None and isinstance(topic_id, str):
+        stored = store.get_topic(topic_id)
+        if stored is not None and topic["platform"] is None:
+            topic["platform"] = stored["platform"]
+    params = {"content_type": body.get("content_type"), "constraints": body.get("constraints"), "selected_topics": [topic]}
+    out = registry.dispatch("skill_generate_draft", params, store=store)
+    if "error" in out:
+        return _encode(out)
+    return 200, _dumps(dict(out["draft"], status="DRAFT_CREATED"))
+
+
+def _draft_for(draft_id: Any, store: "SQLiteStore | None") -> Dict[str, Any]:
+    if store is not None and isinstance(draft_id, str):
+        stored = store.get_draft(draft_id)
+        if stored is not None:
+            return stored
+    return {"draft_id": draft_id}
+
+
+def evaluate_review(body: Dict[str, Any], store: "SQLiteStore | None") -> Tuple[int, bytes]:
+    """POST /v1/reviews/evaluate (3.3): ``min_confidence_to_autopass`` is the skill's confidence_threshold."""
+    params: Dict[str, Any] = {"draft": _draft_for(body.get("draft_id"), store)}
+    if "min_confidence_to_autopass" in body:
+        params["confidence_threshold"] = body["min_confidence_to_autopass"]
+    out = registry.dispatch("skill_evaluate_policy", params, store=store)
+    if "error" in out:
+        return _encode(out)
+    return 200, _dumps(out["review"])
+
+
+def execute_publish(body: Dict[str, Any], store: "SQLiteStore | None") -> Tuple[int, bytes]:
+    """POST /v1/publish/execute (3.5): approval evidence is checked against the store."""
+    params = {
+        "draft": _draft_for(body.get("draft_id"), store),
+        "approval_id": body.get("approval_id"),
+        "schedule_time": body.get("schedule_at"),
+    }
+    out = registry.dispatch("skill_publish_content", params, store=store)
+    if "error" in out:
+        return _encode(out)
+    return 200, _dumps(out["publish"])
+
+
+def agent_status(agent_id: str, store: "SQLiteStore | None") -> Tuple[int, bytes]:
+    """GET /v1/agents/{agent_id}/status (3.7)."""
+    row = store.get_agent_status(agent_id) if store is not None else None
+    if row is None:
+        return _encode(_err("AGENT_NOT_FOUND", f"Agent '{agent_id}' does not exist"))
+    return 200, _dumps(row)
+
+
+def _take(runs: Iterator[Tuple[str, Dict[str, Any]]], n: int) -> Tuple[List[bytes], Optional[str]]:
+    encoded: List[bytes] = []
+    cursor = None
+    for cursor, run in itertools.islice(runs, n):
+        encoded.append(_dumps(run))
+    return encoded, cursor
+
+
+# Client-chosen X-Request-Id values are echoed back only if they match; anything else
+# (too long, or bytes such as a bare CR that could split the response headers) is replaced.
+_REQUEST_ID_RE = re.compile(r"[A-Za-z0-9._-]{1,64}")
+
+_ROUTES: List[Tuple[str, "re.Pattern[str]", str]] = [
+    ("POST", re.compile(r"/v1/trends/fetch"), "_trends_fetch"),
+    ("POST", re.compile(r"/v1/content/drafts"), "_content_drafts"),
+    ("POST", re.compile(r"/v1/reviews/evaluate"), "_reviews_evaluate"),
+    ("POST", re.compile(r"/v1/publish/execute"), "_publish_execute"),
+    ("GET", re.compile(r"/v1/capabilities"), "_capabilities"),
+    ("GET", re.compile(r"/v1/agents/([^/]+)/status"), "_agent_status"),
+    ("POST", re.compile(r"/v1/workflows/([^/]+)/(pause|resume|cancel)"), "_workflow_control"),
+    ("GET", re.compile(r"/v1/audit/skill-runs"), "_audit_skill_runs"),
+    ("GET", re.compile(r"/metrics"), "_metrics"),
+]
+
+
+class ApiServer:
+    """asyncio HTTP/1.1 server for the spec endpoints (specs/technical.md 3).
+
+    Connections are persistent (HTTP/1.1 keep-alive, ``Connection: close``
+    and HTTP/1.0 honoured) and pipelined: requests on one connection are
+    handled concurrently, up to ``pipeline_depth`` in flight, and their
+    responses are written back in request order. Skill calls, store lookups
+    and response encoding run on ``executor`` (the loop's default thread pool
+    when None), so the event loop only parses and writes bytes. Audit queries
+    are streamed with chunked transfer encoding in batches of STREAM_BATCH
+    runs, so a large result is never materialized as one body.
+
+    ``store`` persists entities and backs the draft/topic/approval lookups,
+    ``workflows`` enables 3.8-3.10 and ``audit_index`` enables 3.11; an
+    endpoint whose backing component is not configured answers 404.
+    ``rate_limiter`` enforces the read/write quotas per client address and
+    answers 429 RATE_LIMITED with ``Retry-After`` when a quota is exhausted.
+    ``GET /metrics`` serves ``metrics`` (default: the instrumentation turned
+    on by ``chimera.metrics.instrument``) in Prometheus text format.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        *,
+        store: "SQLiteStore | None" = None,
+        workflows: "WorkflowEngine | None" = None,
+        audit_index: "SkillRunIndex | None" = None,
+        rate_limiter: "RateLimiter | SharedRateLimiter | None" = None,
+        metrics: "Metrics | None" = None,
+        executor: Optional[Executor] = None,
+        keepalive_timeout: float = 15.0,
+        max_body: int = 1 << 20,
+        pipeline_depth: int = 16,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.store = store
+        self.workflows = workflows
+        self.audit_index = audit_index
+        self.rate_limiter = rate_limiter
+        self.metrics = metrics
+        self.executor = executor
+        self.keepalive_timeout = keepalive_timeout
+        self.max_body = max_body
+        self.pipeline_depth = pipeline_depth
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._connections: "Set[asyncio.Task[None]]" = set()
+        self._capabilities_body: Optional[bytes] = None
+        self._request_ids = itertools.count(1)
+        self._request_prefix = os.urandom(4).hex()
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        assert self._server is not None
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            # Open keep-alive connections outlive the listener; end them too.
+            tasks = list(self._connections)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> "ApiServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.close()
+
+    # -- connection handling -------------------------------------------------
+
+    async def _connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        task = asyncio.current_task()
+        assert task is not None
+        self._connections.add(task)
+        pending: "asyncio.Queue[Optional[Tuple[asyncio.Future[Response], bool]]]" = asyncio.Queue(self.pipeline_depth)
+        responder = asyncio.ensure_future(self._respond(pending, writer))
+        peer = writer.get_extra_info("peername")
+        client = peer[0] if isinstance(peer, tuple) else str(peer)
+        try:
+            while not responder.done():
+                try:
+                    request = await asyncio.wait_for(read_request(reader, self.max_body), self.keepalive_timeout)
+                except HttpError as e:
+                    response = Response(e.status, _dumps(_err("INVALID_INPUT", e.message)))
+                    await pending.put((_resolved(response), False))
+                    break
+                if request is None:
+                    break
+                keep_alive = request.keep_alive
+                await pending.put((asyncio.ensure_future(self._handle(request, client)), keep_alive))
+                if not keep_alive:
+                    break
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            try:
+                if not responder.done():
+                    await pending.put(None)
+                await responder
+            finally:
+                writer.close()
+                self._connections.discard(task)
+
+    async def _respond(self, pending: "asyncio.Queue", writer: asyncio.StreamWriter) -> None:
+        broken = False
+        while True:
+            item = await pending.get()
+            if item is None:
+                return
+            future, keep_alive = item
+            if broken:
+                future.cancel()
+                continue
+            try:
+                response = await future
+            except Exception:  # _route answers handler errors; this catches what fails around it
+                response = Response(500, _dumps(_err("UPSTREAM_ERROR", "request could not be processed")))
+            try:
+                await write_response(writer, response, keep_alive)
+            except ConnectionError:
+                broken = True
+                continue
+            except Exception:
+                # A streamed body failed after the head went out: the response cannot be
+                # finished, so end the connection and let the client see it truncated.
+                writer.close()
+                broken = True
+                continue
+            if not keep_alive:
+                # Unblock the reader so it stops accepting pipelined requests.
+                writer.close()
+                broken = True
+
+    # -- routing -------------------------------------------------------------
+
+    async def _handle(self, request: Request, client: str) -> Response:
+        # One timestamp per request, so skill outputs and error envelopes agree.
+        with pinned():
+            return await self._route(request, client)
+
+    async def _route(self, request: Request, client: str) -> Response:
+        request_id = request.headers.get("x-request-id", "")
+        if not _REQUEST_ID_RE.fullmatch(request_id):
+            request_id = f"req_{self._request_prefix}{next(self._request_ids):x}"
+        allowed = []
+        for method, pattern, name in _ROUTES:
+            match = pattern.fullmatch(request.path)
+            if match is None:
+                continue
+            if method != request.method:
+                allowed.append(method)
+                continue
+            if self.rate_limiter is not None:
+                admitted, wait = self.rate_limiter.allow(_client_key(request, client), endpoint_class(method))
+                if not admitted:
+                    response = Response(
+                        429,
+                        _dumps(_err("RATE_LIMITED", "rate limit exceeded", {"retry_after_seconds": round(wait, 3)})),
+                        {"Retry-After": retry_after_header(wait)},
+                    )
+                    break
+            try:
+                response = await getattr(self, name)(request, *match.groups())
+            except Exception:  # never leak internals (spec 3.7); the message stays generic
+                response = Response(500, _dumps(_err("UPSTREAM_ERROR", "request could not be processed")))
+            break
+        else:
+            if allowed:
+                response = Response(
+                    405,
+                    _dumps(_err("INVALID_INPUT", f"method {request.method} not allowed", {"allowed": allowed})),
+                    {"Allow": ", ".join(allowed)},
+                )
+            else:
+                response = Response(404, _dumps(_err("INVALID_INPUT", f"no route for {request.path}")))
+        if response.status >= 400 and isinstance(response.body, bytes):
+            out = json.loads(response.body)
+            out["error"]["request_id"] = request_id
+            response.body = _dumps(out)
+        response.headers["X-Request-Id"] = request_id
+        return response
+
+    def _json_body(self, request: Request) -> Dict[str, Any]:
+        if not request.body:
+            return {}
+        try:
+            body = json.loads(request.body)
+        except (UnicodeDecodeError, ValueError):
+            raise HttpError(400, "request body is not valid JSON") from None
+        if not isinstance(body, dict):
+            raise HttpError(400, "request body must be a JSON object")
+        return body
+
+    async def _run(self, fn: Callable[..., Tuple[int, bytes]], *args: Any) -> Response:
+        loop = asyncio.get_running_loop()
+        call = functools.partial(fn, *args)
+        status, body = await loop.run_in_executor(self.executor, contextvars.copy_context().run, call)
+        return Response(status, body)
+
+    async def _endpoint(self, request: Request, fn: Callable[..., Tuple[int, bytes]]) -> Response:
+        try:
+            body = self._json_body(request)
+        except HttpError as e:
+            return Response(e.status, _dumps(_err("INVALID_INPUT", e.message)))
+        return await self._run(fn, body, self.store)
+
+    async def _trends_fetch(self, request: Request) -> Response:
+        return await self._endpoint(request, fetch_trends)
+
+    async def _content_drafts(self, request: Request) -> Response:
+        return await self._endpoint(request, create_draft)
+
+    async def _reviews_evaluate(self, request: Request) -> Response:
+        return await self._endpoint(request, evaluate_review)
+
+    async def _publish_execute(self, request: Request) -> Response:
+        return await self._endpoint(request, execute_publish)
+
+    async def _capabilities(self, request: Request) -> Response:
+        # The manifest is static for the life of the process; encode it once.
+        if self._capabilities_body is None:
+            self._capabilities_body = _dumps(registry.capabilities())
+        return Response(200, self._capabilities_body)
+
+    async def _agent_status(self, request: Request, agent_id: str) -> Response:
+        return await self._run(agent_status, agent_id, self.store)
+
+    async def _workflow_control(self, request: Request, workflow_id: str, action: str) -> Response:
+        if self.workflows is None:
+            return Response(404, _dumps(_err("INVALID_INPUT", f"no route for {request.path}")))
+        try:
+            body = self._json_body(request)
+        except HttpError as e:
+            return Response(e.status, _dumps(_err("INVALID_INPUT", e.message)))
+        if action == "resume":
+            call = functools.partial(self.workflows.resume, workflow_id, body.get("modifications"))
+        else:
+            call = functools.partial(getattr(self.workflows, action), workflow_id, body.get("reason"))
+        out = await asyncio.get_running_loop().run_in_executor(self.executor, contextvars.copy_context().run, call)
+        return Response(*_encode(out))
+
+    async def _metrics(self, request: Request) -> Response:
+        metrics = self.metrics or metrics_mod.active()
+        if metrics is None:
+            return Response(404, _dumps(_err("INVALID_INPUT", f"no route for {request.path}")))
+        return Response(200, metrics.prometheus().encode("utf-8"), {"Content-Type": "text/plain; version=0.0.4"})
+
+    async def _audit_skill_runs(self, request: Request) -> Response:
+        """GET /v1/audit/skill-runs (3.11), streamed as chunked JSON."""
+        index = self.audit_index
+        if index is None:
+            return Response(404, _dumps(_err("INVALID_INPUT", f"no route for {request.path}")))
+        q = request.query
+        raw_limit = q.get("limit", "100")
+        if not raw_limit.isdigit() or int(raw_limit) < 1:
+            return Response(400, _dumps(_err("INVALID_LIMIT", "limit must be a positive integer", {"limit": raw_limit})))
+        limit = int(raw_limit)
+        filters = (q.get("agent_id"), q.get("skill_name"), q.get("start_time"), q.get("end_time"))
+        try:
+            runs = index.iter_runs(*filters, cursor=q.get("cursor"))
+            loop = asyncio.get_running_loop()
+            # Pull the first batch eagerly so a bad cursor is still a 400, not a broken stream.
+            first = await loop.run_in_executor(self.executor, _take, runs, min(STREAM_BATCH, limit))
+        except ValueError as e:
+            return Response(400, _dumps(_err("INVALID_INPUT", str(e))))
+        return Response(200, self._stream_runs(runs, first, limit, filters))
+
+    async def _stream_runs(
+        self,
+        runs: Iterator[Tuple[str, Dict[str, Any]]],
+        first: Tuple[List[bytes], Optional[str]],
+        limit: int,
+        filters: Tuple[Optional[str], ...],
+    ) -> AsyncIterator[bytes]:
+        assert self.audit_index is not None
+        loop = asyncio.get_running_loop()
+        encoded, cursor = first
+        sent = 0
+        yield b'{"skill_runs":['
+        while encoded:
+            yield (b"," if sent else b"") + b",".join(encoded)
+            sent += len(encoded)
+            if sent >= limit:
+                break
+            encoded, last = await loop.run_in_executor(self.executor, _take, runs, min(STREAM_BATCH, limit - sent))
+            cursor = last or cursor
+        # A next_cursor is only returned when at least one more run exists.
+        more = sent >= limit and await loop.run_in_executor(self.executor, _take, runs, 1) != ([], None)
+        total = await loop.run_in_executor(self.executor, functools.partial(self.audit_index.count, *filters))
+        yield b'],"total_count":%d,"limit":%d,"next_cursor":%s}' % (total, limit, _dumps(cursor if more else None))
+
+
+def _client_key(request: Request, client: str) -> str:
+    # The bearer token is not verified by the server, so it must not pick the quota:
+    # a peer rotating tokens would get a fresh one each time.
+    return client
+
+
+def _resolved(response: Response) -> "asyncio.Future[Response]":
+    future: "asyncio.Future[Response]" = asyncio.get_running_loop().create_future()
+    future.set_result(response)
+    return future
+
+
+def serve(host: str = "127.0.0.1", port: int = 8080, **kwargs: Any) -> None:
+    """Run an ApiServer until interrupted."""
+
+    async def main() -> None:
+        async with ApiServer(host, port, **kwargs) as server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
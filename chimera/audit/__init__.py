@@ -0,0 +1,5 @@
+from .blobs import BlobStore
+from .index import SkillRunIndex
+from .log import AuditWriter, audited_skills, read_segments
+
+__all__ = ["AuditWriter", "BlobStore", "SkillRunIndex", "audited_skills", "read_segments"]
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+import zlib
+from typing import Any, Dict, List, Tuple
+
+
+# Entry: <16-byte sha256 prefix, payload length, crc32(payload)> then the payload.
+_ENTRY = struct.Struct("<16sII")
+_PACK_PREFIX = "blobs-"
+_PACK_SUFFIX = ".pack"
+REF_PREFIX = "sha256:"
+
+
+def canonical_json(payload: Any) -> bytes:
+    return json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def _digest(data: bytes) -> bytes:
+    return hashlib.sha256(data).digest()[:16]
+
+
+def digest_ref(payload: Any) -> str:
+    """Ref for a JSON payload; identical to what BlobStore.put_json returns for it."""
+    return REF_PREFIX + _digest(canonical_json(payload)).hex()
+
+
+def _parse_ref(ref: str) -> bytes:
+    if not isinstance(ref, str) or not ref.startswith(REF_PREFIX):
+        raise KeyError(ref)
+    try:
+        key = bytes.fromhex(ref[len(REF_PREFIX) :])
+    except ValueError:
+        raise KeyError(ref) from None
+    if len(key) != 16:
+        raise KeyError(ref)
+    return key
+
+
+class BlobStore:
+    """Content-addressed store for audit `input_ref`/`output_ref` payloads.
+
+    Payloads are deduplicated by hash and appended to packed segment files;
+    reads return ``memoryview`` slices of a read-only mmap of the segment, so
+    no bytes are copied until the caller decodes them. The in-memory index
+    (digest -> segment, offset, length) is rebuilt from entry headers on open,
+    truncating any torn tail left by a crash.
+    """
+
+    def __init__(self, directory: str, *, segment_bytes: int = 256 * 1024 * 1024) -> None:
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self._index: Dict[bytes, Tuple[int, int, int]] = {}
+        self._maps: Dict[int, mmap.mmap] = {}
+        self._lock = threading.Lock()
+        self._stats = dict.fromkeys(("puts", "dedup_hits", "bytes_in", "bytes_stored"), 0)
+
+        packs = self._packs()
+        for seq, path in packs:
+            self._load(seq, path)
+        self._seq = packs[-1][0] if packs else 1
+        self._file = open(self._path(self._seq), "ab")
+
+    def _path(self, seq: int) -> str:
+        return os.path.join(self.directory, f"{_PACK_PREFIX}{seq:08d}{_PACK_SUFFIX}")
+
+    def _packs(self) -> List[Tuple[int, str]]:
+        out = []
+        for name in os.listdir(self.directory):
+            if name.startswith(_PACK_PREFIX) and name.endswith(_PACK_SUFFIX):
+                seq = name[len(_PACK_PREFIX) : -len(_PACK_SUFFIX)]
+                if seq.isdigit():
+                    out.append((int(seq), os.path.join(self.directory, name)))
+        return sorted(out)
+
+    def _load(self, seq: int, path: str) -> None:
+        size = os.path.getsize(path)
+        good = 0
+        if size:
+            with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                pos = 0
+                while pos + _ENTRY.size <= size:
+                    key, length, crc = _ENTRY.unpack_from(m, pos)
+                    start = pos + _ENTRY.size
+                    if start + length > size or zlib.crc32(m[start : start + length]) != crc:
+                        break
+                    self._index.setdefault(key, (seq, start, length))
+                    pos = good = start + length
+        if good != size:
+            with open(path, "r+b") as f:
+                f.truncate(good)
+
+    # -- writes ------------------------------------------------------------
+
+    def put(self, data: bytes) -> str:
+        key = _digest(data)
+        with self._lock:
+            self._stats["puts"] += 1
+            self._stats["bytes_in"] += len(data)
+            if key in self._index:
+                self._stats["dedup_hits"] += 1
+                return REF_PREFIX + key.hex()
+            offset = self._file.tell()
+            if offset and offset + _ENTRY.size + len(data) > self.segment_bytes:
+                self._file.close()
+                self._seq += 1
+                self._file = open(self._path(self._seq), "ab")
+                offset = 0
+            self._file.write(_ENTRY.pack(key, len(data), zlib.crc32(data)))
+            self._file.write(data)
+            self._file.flush()
+            self._index[key] = (self._seq, offset + _ENTRY.size, len(data))
+            self._stats["bytes_stored"] += _ENTRY.size + len(data)
+        return REF_PREFIX + key.hex()
+
+    def put_json(self, payload: Any) -> str:
+        return self.put(canonical_json(payload))
+
+    def sync(self) -> None:
+        with self._lock:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    # -- reads -------------------------------------------------------------
+
+    def __contains__(self, ref: str) -> bool:
+        try:
+            return _parse_ref(ref) in self._index
+        except KeyError:
+            return False
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def get(self, ref: str) -> memoryview:
+        """Zero-copy view of the payload behind ``ref`` (release it before close())."""
+        seq, start, length = self._index[_parse_ref(ref)]
+        m = self._maps.get(seq)
+        if m is None or len(m) < start + length:
+            with self._lock:
+                if seq == self._seq:
+                    self._file.flush()
+                with open(self._path(seq), "rb") as f:
+                    m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                # Older maps stay referenced by any views handed out earlier.
+                self._maps[seq] = m
+        return memoryview(m)[start : start + length]
+
+    def get_json(self, ref: str) -> Any:
+        view = self.get(ref)
+        try:
+            return json.loads(view.tobytes())
+        finally:
+            view.release()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats, blobs=len(self._index), segments=self._seq)
+        stats["dedup_ratio"] = (stats["bytes_in"] / stats["bytes_stored"]) if stats["bytes_stored"] else 1.0
+        return stats
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+            maps, self._maps = self._maps, {}
+        for m in maps.values():
+            try:
+                m.close()
+            except BufferError:
+                pass  # a caller still holds a view; the map is freed with it
+
+    def __enter__(self) -> "BlobStore":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import base64
+import itertools
+import re
+import threading
+from bisect import bisect_left, bisect_right, insort
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .log import read_segments
+
+
+# Timestamps are fixed-width ISO-8601 UTC strings, so a prefix is a time bucket
+# and string order is time order.
+BUCKET_WIDTHS = {"minute": 16, "hour": 13, "day": 10}
+_ISO_Z = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z")
+
+# Only these fields are exposed by GET /v1/audit/skill-runs (spec 3.11).
+RUN_FIELDS = (
+    "run_id",
+    "skill_name",
+    "triggered_by_agent_id",
+    "input_ref",
+    "output_ref",
+    "status",
+    "started_at",
+    "finished_at",
+)
+
+_Key = Tuple[str, int]
+
+
+def _insert(keys: List[_Key], key: _Key) -> None:
+    # Runs mostly arrive in time order: appending is the common case.
+    if not keys or key > keys[-1]:
+        keys.append(key)
+    else:
+        insort(keys, key)
+
+
+class _Partition:
+    """One time bucket: its run keys in order, and per-agent/per-skill sorted key lists.
+
+    Postings hold keys rather than row positions, so a run that arrives
+    out of order is inserted in place everywhere and nothing is renumbered.
+    """
+
+    __slots__ = ("keys", "rows", "by_agent", "by_skill")
+
+    def __init__(self) -> None:
+        self.keys: List[_Key] = []
+        self.rows: Dict[int, Dict[str, Any]] = {}  # by arrival sequence number (key[1])
+        self.by_agent: Dict[Any, List[_Key]] = {}
+        self.by_skill: Dict[Any, List[_Key]] = {}
+
+    def add(self, key: _Key, row: Dict[str, Any]) -> None:
+        self.rows[key[1]] = row
+        _insert(self.keys, key)
+        _insert(self.by_agent.setdefault(row.get("triggered_by_agent_id"), []), key)
+        _insert(self.by_skill.setdefault(row.get("skill_name"), []), key)
+
+
+def encode_cursor(key: _Key) -> str:
+    return base64.urlsafe_b64encode(f"{key[0]}|{key[1]}".encode("ascii")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> _Key:
+    try:
+        started_at, seq = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("ascii").split("|")
+        return started_at, int(seq)
+    except (ValueError, UnicodeError):
+        raise ValueError("cursor is invalid") from None
+
+
+class SkillRunIndex:
+    """Time-partitioned index over `skill_runs` for GET /v1/audit/skill-runs.
+
+    Runs are bucketed by ``started_at`` prefix (minute/hour/day). Each
+    partition keeps its run keys sorted by (started_at, arrival) with
+    per-agent and per-skill posting lists of the same keys, so a query
+    binary-searches the partition keys for the time range, then
+    binary-searches posting lists within the edge partitions. Counting never
+    builds result rows. ``iter_runs`` streams the index as it stood when the
+    iteration started: runs added meanwhile are left out.
+    """
+
+    def __init__(self, bucket: str = "hour") -> None:
+        if bucket not in BUCKET_WIDTHS:
+            raise ValueError(f"bucket must be one of: {', '.join(BUCKET_WIDTHS)}")
+        self.bucket = bucket
+        self._width = BUCKET_WIDTHS[bucket]
+        self._bucket_keys: List[str] = []
+        self._partitions: Dict[str, _Partition] = {}
+        self._seq = itertools.count()
+        self._last_seq = -1
+        self._lock = threading.RLock()
+
+    @classmethod
+    def from_segments(cls, directory: str, bucket: str = "hour") -> "SkillRunIndex":
+        index = cls(bucket)
+        index.add_many(read_segments(directory))
+        return index
+
+    def __len__(self) -> int:
+        return sum(len(p.keys) for p in self._partitions.values())
+
+    def add(self, run: Dict[str, Any]) -> None:
+        self.add_many((run,))
+
+    def add_many(self, runs: Iterable[Dict[str, Any]]) -> None:
+        with self._lock:
+            for run in runs:
+                started_at = run["started_at"]
+                bucket = started_at[: self._width]
+                part = self._partitions.get(bucket)
+                if part is None:
+                    part = self._partitions[bucket] = _Partition()
+                    insort(self._bucket_keys, bucket)
+                self._last_seq = seq = next(self._seq)
+                part.add((started_at, seq), {f: run.get(f) for f in RUN_FIELDS})
+
+    # -- query -------------------------------------------------------------
+
+    def _plan(
+        self,
+        agent_id: Optional[str],
+        skill_name: Optional[str],
+        start_time: Optional[str],
+        end_time: Optional[str],
+        after: Optional[_Key],
+    ) -> Iterator[Tuple[_Partition, List[_Key], int, int, Optional[Tuple[str, str]]]]:
+        """Yield (partition, keys, lo, hi, residual) for every partition left after pruning.
+
+        ``keys[lo:hi]`` are the candidate rows in time range. With both
+        filters set, candidates come from the shorter posting list and must
+        still match ``residual`` (field, value).
+        """
+        for t in (start_time, end_time):
+            if t is not None and not (isinstance(t, str) and _ISO_Z.fullmatch(t)):
+                raise ValueError("start_time/end_time must be ISO 8601 UTC (YYYY-MM-DDTHH:MM:SSZ)")
+        low: Optional[_Key] = (start_time, -1) if start_time is not None else None
+        if after is not None and (low is None or after > low):
+            low = after
+        high: Optional[_Key] = (end_time, float("inf")) if end_time is not None else None  # type: ignore[assignment]
+
+        keys = self._bucket_keys
+        first = bisect_left(keys, low[0][: self._width]) if low else 0
+        last = bisect_right(keys, high[0][: self._width]) if high else len(keys)
+        for bucket in keys[first:last]:
+            part = self._partitions[bucket]
+            by_agent, by_skill = part.by_agent, part.by_skill
+            residual: Optional[Tuple[str, str]] = None
+            if agent_id is not None and skill_name is not None:
+                a, s = by_agent.get(agent_id, []), by_skill.get(skill_name, [])
+                if len(a) <= len(s):
+                    positions, residual = a, ("skill_name", skill_name)
+                else:
+                    positions, residual = s, ("triggered_by_agent_id", agent_id)
+            elif agent_id is not None:
+                positions = by_agent.get(agent_id, [])
+            elif skill_name is not None:
+                positions = by_skill.get(skill_name, [])
+            else:
+                positions = part.keys
+            if not positions:
+                continue
+            lo, hi = 0, len(positions)
+            if low is not None and positions[0] <= low:
+                lo = bisect_right(positions, low)
+            if high is not None and positions[-1] > high:
+                hi = bisect_right(positions, high)
+            if lo < hi:
+                yield part, positions, lo, hi, residual
+
+    def count(
+        self,
+        agent_id: Optional[str] = None,
+        skill_name: Optional[str] = None,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+    ) -> int:
+        total = 0
+        with self._lock:
+            for part, positions, lo, hi, residual in self._plan(agent_id, skill_name, start_time, end_time, None):
+                if residual is None:
+                    total += hi - lo
+                else:
+                    field, value = residual
+                    rows = part.rows
+                    total += sum(1 for i in range(lo, hi) if rows[positions[i][1]][field] == value)
+        return total
+
+    def iter_runs(
+        self,
+        agent_id: Optional[str] = None,
+        skill_name: Optional[str] = None,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        cursor: Optional[str] = None,
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Stream (cursor, run) pairs in chronological order, one partition at a time.
+
+        The plan records each partition's range as its first and last key and
+        the index's newest sequence number. Keys never move or change, so each
+        chunk is located again by key when it is read, and runs added since
+        (a higher sequence number) are skipped: every chunk comes from the
+        same snapshot however much is inserted while the stream is consumed.
+        """
+        after = decode_cursor(cursor) if cursor else None
+        with self._lock:
+            snapshot = self._last_seq
+            plan = [
+                (part, positions, positions[lo], positions[hi - 1], residual)
+                for part, positions, lo, hi, residual in self._plan(agent_id, skill_name, start_time, end_time, after)
+            ]
+        for part, positions, first, last, residual in plan:
+            with self._lock:
+                keys = positions[bisect_left(positions, first) : bisect_right(positions, last)]
+                rows = part.rows
+                if self._last_seq != snapshot:
+                    keys = [key for key in keys if key[1] <= snapshot]
+                chunk = [(key, rows[key[1]]) for key in keys]
+            for key, row in chunk:
+                if residual is not None and row[residual[0]] != residual[1]:
+                    continue
+                yield encode_cursor(key), dict(row)
+
+    def query(
+        self,
+        agent_id: Optional[str] = None,
+        skill_name: Optional[str] = None,
+        start_time: Optional[str] = None,
+        end_time: Optional[str] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        if not isinstance(limit, int) or isinstance(limit, bool) or limit < 1:
+            raise ValueError("limit must be a positive integer")
+        runs: List[Dict[str, Any]] = []
+        next_cursor = None
+        for key, run in self.iter_runs(agent_id, skill_name, start_time, end_time, cursor):
+            if len(runs) == limit:
+                break
+            runs.append(run)
+            next_cursor = key
+        else:
+            next_cursor = None
+        return {
+            "skill_runs": runs,
+            "total_count": self.count(agent_id, skill_name, start_time, end_time),
+            "limit": limit,
+            "next_cursor": next_cursor,
+        }
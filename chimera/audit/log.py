@@ -0,0 +1,359 @@
+from __future__ import annotations
+
+import functools
+import json
+import os
+import queue
+import secrets
+import struct
+import threading
+import time
+import zlib
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from ..clock import now as _ts
+from .blobs import digest_ref
+
+if TYPE_CHECKING:
+    from ..store import SQLiteStore
+    from .index import SkillRunIndex
+
+
+FSYNC_POLICIES = {"always", "interval", "never"}
+
+# Frame: <payload length, crc32(payload)> followed by a compact JSON record.
+_FRAME = struct.Struct("<II")
+_SEGMENT_PREFIX = "skill_runs-"
+_SEGMENT_SUFFIX = ".log"
+
+RefFn = Callable[[Any], str]
+
+
+def _segment_name(seq: int) -> str:
+    return f"{_SEGMENT_PREFIX}{seq:08d}{_SEGMENT_SUFFIX}"
+
+
+def list_segments(directory: str) -> List[Tuple[int, str]]:
+    out = []
+    for name in os.listdir(directory):
+        if name.startswith(_SEGMENT_PREFIX) and name.endswith(_SEGMENT_SUFFIX):
+            seq = name[len(_SEGMENT_PREFIX) : -len(_SEGMENT_SUFFIX)]
+            if seq.isdigit():
+                out.append((int(seq), os.path.join(directory, name)))
+    return sorted(out)
+
+
+def _scan(path: str) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """Yield (end_offset, record) for every intact frame; stop at the first torn/corrupt one."""
+    with open(path, "rb") as f:
+        data = f.read()
+    pos = 0
+    while pos + _FRAME.size <= len(data):
+        length, crc = _FRAME.unpack_from(data, pos)
+        start = pos + _FRAME.size
+        end = start + length
+        if end > len(data):
+            return
+        payload = data[start:end]
+        if zlib.crc32(payload) != crc:
+            return
+        try:
+            record = json.loads(payload)
+        except ValueError:
+            return
+        pos = end
+        yield pos, record
+
+
+def recover_segment(path: str) -> int:
+    """Truncate a segment after its last intact frame. Returns the number of valid records."""
+    good, count = 0, 0
+    for good, _ in _scan(path):
+        count += 1
+    if os.path.getsize(path) != good:
+        with open(path, "r+b") as f:
+            f.truncate(good)
+            f.flush()
+            os.fsync(f.fileno())
+    return count
+
+
+def read_segments(directory: str) -> Iterator[Dict[str, Any]]:
+    """Iterate every committed skill_runs record in append order."""
+    for _, path in list_segments(directory):
+        for _, record in _scan(path):
+            yield record
+
+
+class _Waiter:
+    """A flush() call waiting on the writer thread; ``ok`` is False if records were lost."""
+
+    __slots__ = ("done", "ok")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.ok = True
+
+
+class AuditWriter:
+    """Append-only, group-committed writer for `skill_runs` audit records.
+
+    Callers only enqueue; a background thread drains everything queued since
+    its last write, appends it to the active segment in one write, and fsyncs
+    according to ``fsync``: ``"always"`` (every group), ``"interval"`` (at most
+    every ``fsync_interval`` seconds) or ``"never"`` (left to the OS).
+    ``ref`` turns payloads into `input_ref`/`output_ref` values; pass
+    ``BlobStore.put_json`` to keep the payloads retrievable. On open
+    the last segment is truncated after its final intact frame, so a crash
+    mid-write loses at most the torn group. A group whose write or fsync
+    fails is cut back off the segment (or, if even that fails, the writer
+    moves on to a new segment) and counted in ``stats()["lost"]``; the next
+    ``flush()`` returns False. Committed groups are also fed to an optional
+    SkillRunIndex and mirrored to an optional SQLiteStore.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        *,
+        fsync: str = "interval",
+        fsync_interval: float = 1.0,
+        max_batch: int = 1024,
+        segment_bytes: int = 64 * 1024 * 1024,
+        agent_id: Optional[str] = None,
+        ref: Optional[RefFn] = None,
+        store: "SQLiteStore | None" = None,
+        index: "SkillRunIndex | None" = None,
+    ) -> None:
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"fsync must be one of: {', '.join(sorted(FSYNC_POLICIES))}")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.fsync = fsync
+        self.fsync_interval = fsync_interval
+        self.max_batch = max_batch
+        self.segment_bytes = segment_bytes
+        self.agent_id = agent_id
+        self._ref = ref or digest_ref
+        self._store = store
+        self._index = index
+        self._queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self._stats = dict.fromkeys(("records", "groups", "fsyncs", "bytes", "recovered", "errors", "lost", "store_errors"), 0)
+        self._last_fsync = time.monotonic()
+        self._failed = False  # a group was lost since the last flush was answered
+        self._closed = False
+        self._close_lock = threading.Lock()  # no waiter is queued behind the writer's stop
+        self._close_ok = True  # the final flush's answer, repeated by flush() after close
+
+        segments = list_segments(directory)
+        if segments:
+            self._seq, path = segments[-1]
+            self._stats["recovered"] = recover_segment(path)
+        else:
+            self._seq, path = 1, os.path.join(directory, _segment_name(1))
+        # Unbuffered: each group is one write, and a failed one leaves nothing behind in a buffer.
+        self._file = open(path, "ab", buffering=0)
+
+        self._thread = threading.Thread(target=self._run, name="chimera-audit-writer", daemon=True)
+        self._thread.start()
+
+    # -- caller side (never touches disk) ---------------------------------
+
+    def record(self, run: Dict[str, Any]) -> None:
+        if self._closed:
+            raise RuntimeError("audit writer is closed")
+        self._queue.put(run)
+
+    def wrap(
+        self,
+        skill: Callable[..., Dict[str, Any]],
+        skill_name: Optional[str] = None,
+        agent_id: Optional[str] = None,
+    ) -> Callable[..., Dict[str, Any]]:
+        name = skill_name or f"skill_{skill.__name__}"
+        agent = agent_id or self.agent_id
+
+        @functools.wraps(skill)
+        def audited(params: Dict[str, Any], *args: Any, **kwargs: Any) -> Dict[str, Any]:
+            started_at = _ts()
+            try:
+                result = skill(params, *args, **kwargs)
+            except Exception as exc:
+                self.record(self._pending(name, agent, params, {"exception": repr(exc)}, "failure", started_at))
+                raise
+            status = "failure" if isinstance(result, dict) and "error" in result else "success"
+            self.record(self._pending(name, agent, params, result, status, started_at))
+            return result
+
+        return audited
+
+    @staticmethod
+    def _pending(
+        name: str, agent: Optional[str], params: Any, result: Any, status: str, started_at: str
+    ) -> Dict[str, Any]:
+        # Payloads stay in memory until the writer thread turns them into refs.
+        return {
+            "run_id": f"run_{secrets.token_hex(8)}",
+            "skill_name": name,
+            "triggered_by_agent_id": agent,
+            "input": dict(params) if isinstance(params, dict) else params,
+            "output": result,
+            "status": status,
+            "started_at": started_at,
+            "finished_at": _ts(),
+        }
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until everything recorded so far is written (and fsynced unless policy is "never").
+
+        False on timeout, or if a write or fsync failed since the previous
+        flush was answered: some records were lost (see ``stats()``). On a
+        closed writer it returns at once with the answer close() got.
+        """
+        waiter = _Waiter()
+        with self._close_lock:
+            if self._closed:
+                return self._close_ok
+            self._queue.put(waiter)
+        return waiter.done.wait(timeout) and waiter.ok
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        ok = self.flush()
+        with self._close_lock:
+            if self._closed:
+                return
+            self._close_ok = ok
+            self._closed = True
+            self._queue.put(None)
+        self._thread.join()
+        self._file.close()
+
+    def __enter__(self) -> "AuditWriter":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def stats(self) -> Dict[str, int]:
+        return dict(self._stats, segment=self._seq)
+
+    # -- writer thread ----------------------------------------------------
+
+    def _finalize(self, run: Dict[str, Any]) -> Dict[str, Any]:
+        if "input" in run or "output" in run:
+            run = dict(run)
+            run["input_ref"] = self._ref(run.pop("input", None))
+            run["output_ref"] = self._ref(run.pop("output", None))
+        return run
+
+    def _run(self) -> None:
+        stop = False
+        while not stop:
+            batch: List[Dict[str, Any]] = []
+            waiters: List[_Waiter] = []
+            item = self._queue.get()
+            while True:
+                if item is None:
+                    stop = True
+                elif isinstance(item, _Waiter):
+                    waiters.append(item)
+                else:
+                    batch.append(item)
+                if stop or len(batch) >= self.max_batch:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            try:
+                if batch:
+                    self._commit([self._finalize(r) for r in batch], force_sync=bool(waiters))
+                elif waiters and self.fsync != "never":
+                    self._sync()
+            except Exception:
+                self._stats["errors"] += 1
+                self._stats["lost"] += len(batch)
+                self._failed = True
+            if waiters:
+                for w in waiters:
+                    w.ok = not self._failed
+                    w.done.set()
+                self._failed = False
+
+    def _commit(self, runs: List[Dict[str, Any]], force_sync: bool) -> None:
+        frames = []
+        for run in runs:
+            payload = json.dumps(run, separators=(",", ":"), default=str).encode("utf-8")
+            frames.append(_FRAME.pack(len(payload), zlib.crc32(payload)))
+            frames.append(payload)
+        data = b"".join(frames)
+        if self._file.tell() and self._file.tell() + len(data) > self.segment_bytes:
+            self._roll()
+        start = self._file.tell()
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[self._file.write(view) :]
+            if self.fsync == "always" or (
+                self.fsync == "interval"
+                and (force_sync or time.monotonic() - self._last_fsync >= self.fsync_interval)
+            ):
+                self._sync()
+        except Exception:
+            self._discard(start)
+            raise
+        self._stats["records"] += len(runs)
+        self._stats["groups"] += 1
+        self._stats["bytes"] += len(data)
+        if self._index is not None:
+            self._index.add_many(runs)
+        if self._store is not None:
+            try:
+                self._store.insert_skill_runs(runs)
+            except Exception:
+                self._stats["store_errors"] += 1
+
+    def _sync(self) -> None:
+        os.fsync(self._file.fileno())
+        self._last_fsync = time.monotonic()
+        self._stats["fsyncs"] += 1
+
+    def _roll(self) -> None:
+        if self.fsync != "never":
+            self._sync()
+        self._file.close()
+        self._open_next()
+
+    def _open_next(self) -> None:
+        self._seq += 1
+        self._file = open(os.path.join(self.directory, _segment_name(self._seq)), "ab", buffering=0)
+
+    def _discard(self, start: int) -> None:
+        """Cut a failed group off the segment, so later groups never land behind a torn frame.
+
+        Recovery truncates a segment at its first bad frame, which would take
+        every group written after it along. If the truncate fails too, the
+        torn bytes are left at the end of this segment and writing moves on to
+        a new one.
+        """
+        try:
+            self._file.truncate(start)
+            self._file.seek(start)
+        except Exception:
+            try:
+                self._file.close()
+            except Exception:
+                pass
+            self._open_next()
+
+
+def audited_skills(writer: AuditWriter, agent_id: Optional[str] = None) -> Dict[str, Callable[..., Dict[str, Any]]]:
+    """Return the four runtime skills wrapped by ``writer``, keyed by skill_name."""
+    from ..skills import evaluate_policy, fetch_trends, generate_draft, publish_content
+
+    return {
+        f"skill_{skill.__name__}": writer.wrap(skill, agent_id=agent_id)
+        for skill in (fetch_trends, generate_draft, evaluate_policy, publish_content)
+    }
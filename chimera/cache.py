@@ -0,0 +1,391 @@
+from __future__ import annotations
+
+import collections
+import functools
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+# Skills whose results are pure functions of their params (without a store).
+# publish_content is excluded: publishing is an action, not an artifact.
+CACHEABLE = {
+    "skill_fetch_trends": "ftr",
+    "skill_generate_draft": "gdr",
+    "skill_evaluate_policy": "evp",
+}
+
+_ENTRY_SUFFIX = ".json"
+_STATS_DIR = "stats"
+_STATS_SUFFIX = ".stats"
+# Per-process counters, one little-endian u64 each, in an mmapped file under stats/.
+_COUNTERS = ("memory_hits", "disk_hits", "misses", "puts", "evictions", "bytes_written")
+_STATS = struct.Struct(f"<{len(_COUNTERS)}Q")
+# After them, what the process took over from exited processes' files: the same
+# counters plus how many processes they covered.
+_RETIRED = struct.Struct(f"<{len(_COUNTERS) + 1}Q")
+_STATS_SIZE = _STATS.size + _RETIRED.size
+# Entries smaller than this are read with one read() call; mapping costs more than it saves.
+_MMAP_MIN = 64 * 1024
+
+
+def _canonical(value: Any) -> bytes:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def cache_key(name: str, *args: Any, **kwargs: Any) -> str:
+    """Stable key for a call: ``{prefix}_{sha256 hex}`` over the canonical JSON of its arguments.
+
+    The full digest, not a 48-bit entity ID: a collision would silently serve
+    another call's artifact.
+    """
+    prefix = CACHEABLE.get(name, name)
+    return f"{prefix}_{hashlib.sha256(_canonical([name, args, kwargs])).hexdigest()}"
+
+
+def _alive(pid: int) -> bool:
+    if os.name != "posix":
+        return True  # no signal-0 probe; never prune
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        pass  # exists, owned by someone else
+    return True
+
+
+def _read_stats(path: str) -> Tuple[int, ...]:
+    """Own counters, then retired counters and process count (zeros where a file is short)."""
+    with open(path, "rb") as f:
+        data = f.read(_STATS_SIZE)
+    return struct.unpack(f"<{len(_COUNTERS) * 2 + 1}Q", data + bytes(_STATS_SIZE - len(data)))
+
+
+class _Counters:
+    """This process's slot in the shared stats directory.
+
+    Only this process writes the file, so no cross-process locking is needed;
+    the class lock covers several caches on one directory in one process,
+    which share one instance (see ``open``).
+
+    Files of exited processes would otherwise pile up, and a new process
+    given a recycled PID would carry on from its predecessor's counts. So
+    the first open in a process claims (by atomic rename) its own leftover
+    file and every file whose PID is no longer running, folds their counts
+    into the retired part of its fresh file, and deletes them; totals over
+    the directory stay the same. PIDs are only meaningful on one host:
+    don't share a stats directory across hosts or PID namespaces.
+    """
+
+    _lock = threading.Lock()
+    _open: Dict[str, "_Counters"] = {}
+
+    @classmethod
+    def open(cls, directory: str) -> "_Counters":
+        path = os.path.join(directory, f"{os.getpid()}{_STATS_SUFFIX}")
+        with cls._lock:
+            counters = cls._open.get(path)
+            if counters is None:
+                counters = cls._open[path] = cls(directory, path)
+            counters._users += 1
+        return counters
+
+    def __init__(self, directory: str, path: str) -> None:
+        self._path = path
+        self._users = 0
+        # No cache in this process has the file open, so one already there is an exited
+        # process's, whose PID was reused.
+        claimed = [c for c in (self._claim(path),) if c is not None]
+        fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.ftruncate(fd, _STATS_SIZE)
+            self._map = mmap.mmap(fd, _STATS_SIZE)
+        finally:
+            os.close(fd)
+        for name in os.listdir(directory):
+            pid = name[: -len(_STATS_SUFFIX)]
+            if name.endswith(_STATS_SUFFIX) and pid.isdigit() and int(pid) != os.getpid() and not _alive(int(pid)):
+                c = self._claim(os.path.join(directory, name))
+                if c is not None:
+                    claimed.append(c)
+        retired = [0] * (len(_COUNTERS) + 1)
+        for c in claimed:
+            try:
+                values = _read_stats(c)
+                os.unlink(c)
+            except OSError:
+                continue
+            own, theirs = values[: len(_COUNTERS)], values[len(_COUNTERS) :]
+            for i, n in enumerate(own):
+                retired[i] += n
+            for i, n in enumerate(theirs):
+                retired[i] += n
+            retired[-1] += 1
+        _RETIRED.pack_into(self._map, _STATS.size, *retired)
+
+    @staticmethod
+    def _claim(path: str) -> Optional[str]:
+        """Rename an exited process's file out of the way; None if it is gone (or another process won)."""
+        claimed = f"{path}.{os.getpid()}.retiring"
+        try:
+            os.rename(path, claimed)
+        except FileNotFoundError:
+            return None
+        return claimed
+
+    def add(self, index: int, n: int = 1) -> None:
+        offset = index * 8
+        with self._lock:
+            struct.pack_into("<Q", self._map, offset, struct.unpack_from("<Q", self._map, offset)[0] + n)
+
+    def snapshot(self) -> Dict[str, int]:
+        return dict(zip(_COUNTERS, _STATS.unpack_from(self._map, 0)))
+
+    def close(self) -> None:
+        with self._lock:
+            self._users -= 1
+            if self._users:
+                return
+            if self._open.get(self._path) is self:
+                del self._open[self._path]
+        self._map.close()
+
+
+_MEMORY_HITS, _DISK_HITS, _MISSES, _PUTS, _EVICTIONS, _BYTES_WRITTEN = range(len(_COUNTERS))
+
+
+class ArtifactCache:
+    """Two-tier cache for generated artifacts: in-process LRU over a shared on-disk tier.
+
+    The disk tier is a directory any number of processes may open. Each entry
+    is one JSON file named by its key, written to a temporary file and
+    ``os.replace``-d into place, so a reader sees either nothing or the whole
+    entry. Large entries are read through mmap. When the directory grows past
+    ``max_bytes`` the least recently written (or disk-read) entries are
+    removed until it is back under ``low_water`` of the budget; the size is
+    re-scanned only after this process has written another tenth of the
+    budget, since other processes write too.
+
+    Every process counts memory hits, disk hits, misses, puts and evictions
+    in its own mmapped file under ``stats/``; ``stats()["all"]`` sums them,
+    so hit rates cover the whole worker pool. Files of exited workers are
+    folded into a live one's when a cache opens, so ``stats/`` holds about
+    one file per running process. Values are shared, not copied:
+    treat results as read-only, as with IncrementalPipeline outputs.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        *,
+        memory_entries: int = 1024,
+        max_bytes: int = 256 * 1024 * 1024,
+        low_water: float = 0.9,
+    ) -> None:
+        if memory_entries < 0 or max_bytes < 1 or not 0 < low_water <= 1:
+            raise ValueError("invalid cache limits")
+        self.directory = directory
+        self.memory_entries = memory_entries
+        self.max_bytes = max_bytes
+        self.low_water = low_water
+        os.makedirs(os.path.join(directory, _STATS_DIR), exist_ok=True)
+        self._memory: "collections.OrderedDict[str, Any]" = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = _Counters.open(os.path.join(directory, _STATS_DIR))
+        self._closed = False
+        self._since_scan = 0
+        self._tmp_seq = 0
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + _ENTRY_SUFFIX)
+
+    # -- lookups ---------------------------------------------------------------
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+                self._counters.add(_MEMORY_HITS)
+                return value
+        value = self._read(key)
+        with self._lock:
+            if value is None:
+                self._counters.add(_MISSES)
+                return None
+            self._counters.add(_DISK_HITS)
+            self._remember(key, value)
+        return value
+
+    def _read(self, key: str) -> Optional[Any]:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                if os.fstat(f.fileno()).st_size < _MMAP_MIN:
+                    value = json.loads(f.read())
+                else:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                        value = json.loads(m[:])
+            os.utime(path)  # a read counts as recent use for eviction
+        except (FileNotFoundError, ValueError):
+            # Evicted meanwhile, or (never expected with os.replace) unreadable: a miss.
+            return None
+        return value
+
+    def _remember(self, key: str, value: Any) -> None:
+        if not self.memory_entries:
+            return
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    # -- writes ----------------------------------------------------------------
+
+    def put(self, key: str, value: Any) -> None:
+        data = _canonical(value)
+        with self._lock:
+            self._remember(key, value)
+            self._tmp_seq += 1
+            tmp = os.path.join(self.directory, f".{key}.{os.getpid()}.{threading.get_ident()}.{self._tmp_seq}.tmp")
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, self._path(key))
+        with self._lock:
+            self._counters.add(_PUTS)
+            self._counters.add(_BYTES_WRITTEN, len(data))
+            self._since_scan += len(data)
+            scan = self._since_scan >= self.max_bytes // 10
+            if scan:
+                self._since_scan = 0
+        if scan:
+            self.evict()
+
+    def _entries(self) -> Iterator[Tuple[float, int, str]]:
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.name.endswith(_ENTRY_SUFFIX) and not entry.name.startswith("."):
+                    try:
+                        st = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    yield st.st_mtime, st.st_size, entry.path
+
+    def size(self) -> int:
+        """Bytes currently held by the disk tier (all processes)."""
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self) -> int:
+        """Bring the disk tier under budget now; returns the number of entries removed."""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return 0
+        target = self.max_bytes * self.low_water
+        removed = 0
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass  # another process evicted it first
+            else:
+                removed += 1
+            total -= size
+        with self._lock:
+            self._counters.add(_EVICTIONS, removed)
+        return removed
+
+    # -- skills ------------------------------------------------------------------
+
+    def wrap(self, fn: Callable[..., Dict[str, Any]], name: Optional[str] = None) -> Callable[..., Dict[str, Any]]:
+        """Cache ``fn``'s successful results by ``cache_key(name, *args, **kwargs)``.
+
+        Calls given a ``store`` bypass the cache, since their side effects
+        (persisted rows, existence checks) must happen every time. A hit
+        returns the artifact as first generated, timestamps included.
+        """
+        name = name or f"skill_{fn.__name__}"
+
+        @functools.wraps(fn)
+        def cached(*args: Any, **kwargs: Any) -> Dict[str, Any]:
+            if kwargs.get("store") is not None:
+                return fn(*args, **kwargs)
+            kwargs.pop("store", None)
+            key = cache_key(name, *args, **kwargs)
+            out = self.get(key)
+            if out is None:
+                out = fn(*args, **kwargs)
+                if "error" not in out:
+                    self.put(key, out)
+            return out
+
+        return cached
+
+    # -- housekeeping --------------------------------------------------------------
+
+    def stats(self) -> Dict[str, Any]:
+        """This process's counters, and ``all``: the sum over every process that used the directory."""
+        with self._lock:
+            local: Dict[str, Any] = self._counters.snapshot()
+            local["memory_entries"] = len(self._memory)
+        totals = dict.fromkeys(_COUNTERS, 0)
+        stats_dir = os.path.join(self.directory, _STATS_DIR)
+        processes = 0
+        for name in os.listdir(stats_dir):
+            if not name.endswith(_STATS_SUFFIX):
+                continue
+            try:
+                values = _read_stats(os.path.join(stats_dir, name))
+            except OSError:
+                continue
+            own, retired = values[: len(_COUNTERS)], values[len(_COUNTERS) :]
+            processes += 1 + retired[-1]
+            for counter, mine, theirs in zip(_COUNTERS, own, retired):
+                totals[counter] += mine + theirs
+        lookups = totals["memory_hits"] + totals["disk_hits"] + totals["misses"]
+        hits = totals["memory_hits"] + totals["disk_hits"]
+        all_: Dict[str, Any] = dict(totals, processes=processes, hit_rate=hits / lookups if lookups else 0.0)
+        return dict(local, all=all_)
+
+    def clear_memory(self) -> None:
+        with self._lock:
+            self._memory.clear()
+
+    def close(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            if not self._closed:
+                self._closed = True
+                self._counters.close()
+
+    def __enter__(self) -> "ArtifactCache":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def cached_skills(cache: ArtifactCache) -> Dict[str, Callable[..., Dict[str, Any]]]:
+    """The CACHEABLE skills wrapped by ``cache``, keyed by skill_name."""
+    from .skills import get_skill
+
+    return {name: cache.wrap(get_skill(name), name) for name in CACHEABLE}
+
+
+_worker_caches: Dict[str, ArtifactCache] = {}
+_worker_lock = threading.Lock()
+
+
+def worker_cache(directory: str) -> ArtifactCache:
+    """One ArtifactCache per directory per process (for pool workers that cannot be handed one)."""
+    with _worker_lock:
+        cache = _worker_caches.get(directory)
+        if cache is None:
+            cache = _worker_caches[directory] = ArtifactCache(directory)
+        return cache
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import calendar
+import contextlib
+import contextvars
+import functools
+import threading
+import time
+from typing import Callable, Iterator, Optional, Tuple
+
+# specs/technical.md Section 4: timestamps are ISO-8601 UTC at second resolution.
+FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+@functools.lru_cache(maxsize=256)
+def to_epoch(timestamp: str) -> int:
+    """Seconds since the epoch for a FORMAT timestamp (batches share one, hence the memo)."""
+    return calendar.timegm(time.strptime(timestamp, FORMAT))
+
+
+class SystemClock:
+    """Wall-clock UTC timestamps, formatted at most once per second.
+
+    ``now`` reads ``time.time()`` and returns the cached string unless the
+    second has changed. The (second, text) pair is replaced as one tuple, so
+    concurrent callers never see a torn cache; two threads crossing a
+    second boundary at once just both format it.
+    """
+
+    def __init__(self, source: Callable[[], float] = time.time) -> None:
+        self._source = source
+        self._cached: Tuple[int, str] = (-1, "")
+
+    def now(self) -> str:
+        second = int(self._source())
+        cached = self._cached
+        if cached[0] != second:
+            cached = self._cached = (second, time.strftime(FORMAT, time.gmtime(second)))
+        return cached[1]
+
+
+class FrozenClock:
+    """Always returns the same timestamp (tests, replay)."""
+
+    def __init__(self, timestamp: str) -> None:
+        self.timestamp = timestamp
+
+    def now(self) -> str:
+        return self.timestamp
+
+
+_now: Callable[[], str] = SystemClock().now
+_install_lock = threading.Lock()
+# Set for the duration of one request or pipeline run; wins over the installed clock.
+_pinned: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("chimera_clock_pinned", default=None)
+
+
+def now() -> str:
+    """The current timestamp: the pinned one if a run pinned it, else the installed clock's."""
+    pinned = _pinned.get()
+    if pinned is not None:
+        return pinned
+    return _now()
+
+
+def set_clock(clock: "SystemClock | FrozenClock") -> Callable[[], str]:
+    """Install ``clock`` process-wide; returns the previous ``now`` so callers can restore it."""
+    global _now
+    with _install_lock:
+        previous, _now = _now, clock.now
+    return previous
+
+
+@contextlib.contextmanager
+def frozen(timestamp: str) -> Iterator[None]:
+    """Make every timestamp, in every thread, read ``timestamp`` until the block exits."""
+    global _now
+    previous = set_clock(FrozenClock(timestamp))
+    try:
+        yield
+    finally:
+        with _install_lock:
+            _now = previous
+
+
+@contextlib.contextmanager
+def pinned(timestamp: Optional[str] = None) -> Iterator[str]:
+    """Carry one timestamp through a request or run (current context and tasks spawned from it).
+
+    Defaults to the current time; a block already inside ``pinned`` keeps the
+    outer timestamp. Work handed to executors sees it only when submitted
+    through ``contextvars.copy_context().run``.
+    """
+    outer = _pinned.get()
+    if outer is not None:
+        yield outer
+        return
+    token = _pinned.set(timestamp or _now())
+    try:
+        yield _pinned.get()  # type: ignore[misc]
+    finally:
+        _pinned.reset(token)
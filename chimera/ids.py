@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import functools
+import hashlib
+from typing import Any, Iterable, List, Tuple
+
+# An ID is ``{prefix}_{first 12 hex digits of sha256(seed)}``; the companion
+# fraction (topic score, draft confidence) is the first 32 bits of the same
+# digest scaled to [0.0, 1.0] and rounded to 3 places. Changing either breaks
+# every stored ID (specs/technical.md Section 5.3), so both are pinned by tests.
+
+Pair = Tuple[str, float]
+
+
+def seed(*parts: Any) -> str:
+    """Seed string for ``parts``: ``str`` of each, ``|``-joined (what the skills' f-strings produce)."""
+    return "|".join(map(str, parts))
+
+
+def _finish(digest: bytes) -> Tuple[str, float]:
+    return digest[:6].hex(), round(int.from_bytes(digest[:4], "big") / 0xFFFFFFFF, 3)
+
+
+def _pair(seed: str) -> Tuple[str, float]:
+    return _finish(hashlib.sha256(seed.encode("utf-8")).digest())
+
+
+def _series(base: str, start: int, count: int) -> Tuple[Tuple[str, float], ...]:
+    # Seeds "base|start" .. "base|start+count-1" share a prefix: feed it to
+    # sha256 once and copy the midstate for each suffix.
+    head = hashlib.sha256(f"{base}|".encode("utf-8"))
+    out = []
+    for i in range(start, start + count):
+        h = head.copy()
+        h.update(str(i).encode("ascii"))
+        out.append(_finish(h.digest()))
+    return tuple(out)
+
+
+class IdKernel:
+    """Deterministic IDs and fractions from seeds, with an optional bounded memo.
+
+    With ``memo_size`` > 0 the digests of the ``memo_size`` most recently
+    used seeds are kept in an LRU, so hot seeds such as a popular
+    platform/region/window skip hashing entirely. Series hold up to a few
+    dozen pairs each, so they get a sixteenth of the entries.
+    """
+
+    def __init__(self, memo_size: int = 0) -> None:
+        self.memo_size = memo_size
+        if memo_size:
+            self._pair = functools.lru_cache(maxsize=memo_size)(_pair)
+            self._series = functools.lru_cache(maxsize=max(1, memo_size // 16))(_series)
+        else:
+            self._pair = _pair
+            self._series = _series
+
+    def stable_id(self, prefix: str, seed: str) -> str:
+        return f"{prefix}_{self._pair(seed)[0]}"
+
+    def stable_fraction(self, seed: str) -> float:
+        return self._pair(seed)[1]
+
+    def stable_pair(self, prefix: str, seed: str) -> Pair:
+        """ID and fraction for ``seed`` from a single digest."""
+        h, fraction = self._pair(seed)
+        return f"{prefix}_{h}", fraction
+
+    def mint_ids(self, prefix: str, seeds: Iterable[str]) -> List[str]:
+        pair = self._pair
+        return [f"{prefix}_{pair(s)[0]}" for s in seeds]
+
+    def mint_pairs(self, prefix: str, seeds: Iterable[str]) -> List[Pair]:
+        pair = self._pair
+        out = []
+        for s in seeds:
+            h, fraction = pair(s)
+            out.append((f"{prefix}_{h}", fraction))
+        return out
+
+    def mint_series(self, prefix: str, base: str, count: int, start: int = 0) -> List[Pair]:
+        """Pairs for the seeds ``f"{base}|{i}"``, i in ``start .. start+count-1``."""
+        return [(f"{prefix}_{h}", fraction) for h, fraction in self._series(base, start, count)]
+
+    def cache_clear(self) -> None:
+        if self.memo_size:
+            self._pair.cache_clear()  # type: ignore[attr-defined]
+            self._series.cache_clear()  # type: ignore[attr-defined]
+
+
+# Shared by every skill; at full size the memos hold roughly 2 MB.
+DEFAULT = IdKernel(memo_size=4096)
+
+stable_id = DEFAULT.stable_id
+stable_fraction = DEFAULT.stable_fraction
+stable_pair = DEFAULT.stable_pair
+mint_ids = DEFAULT.mint_ids
+mint_pairs = DEFAULT.mint_pairs
+mint_series = DEFAULT.mint_series
@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+import functools
+import importlib
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# HDR-style log-linear buckets: 2**SUB_BITS linear sub-buckets per power of two,
+# so any recorded value is reported within ~3% (1 / 2**SUB_BITS).
+SUB_BITS = 5
+_SUB = 1 << SUB_BITS
+# Values are nanoseconds; anything above 2**MAX_BITS ns (~4.9h) lands in the last bucket.
+MAX_BITS = 44
+_BUCKETS = (MAX_BITS - SUB_BITS + 1) << SUB_BITS
+
+QUANTILES = (0.5, 0.9, 0.99, 0.999)
+
+# Internal helpers of each skill module, grouped into the phases they time.
+PHASES: Dict[str, str] = {
+    "_validate_input": "validate",
+    "_ts": "timestamp",
+    "_stable_id": "hash",
+    "_stable_pair": "hash",
+    "_stable_series": "hash",
+}
+
+
+def _upper(idx: int) -> int:
+    """Highest value that falls in bucket ``idx``."""
+    e = (idx >> SUB_BITS) - 1
+    if e <= 0:
+        return idx
+    return ((idx - (e << SUB_BITS) + 1) << e) - 1
+
+
+class Histogram:
+    """Fixed-memory latency histogram over nanosecond values.
+
+    Recording is a bucket computation and a few integer increments, with no
+    lock: concurrent threads may rarely lose an increment, which is accepted
+    for monitoring data.
+    """
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self) -> None:
+        self.counts = [0] * _BUCKETS
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def record(self, ns: int) -> None:
+        e = ns.bit_length() - SUB_BITS - 1
+        if e > 0:
+            idx = (e << SUB_BITS) + (ns >> e)
+            self.counts[idx if idx < _BUCKETS else _BUCKETS - 1] += 1
+        else:
+            self.counts[ns] += 1
+        self.count += 1
+        self.total += ns
+        if ns > self.max:
+            self.max = ns
+
+    def quantile(self, q: float) -> int:
+        if not self.count:
+            return 0
+        rank = max(1, int(q * self.count + 0.5))
+        seen = 0
+        for idx, c in enumerate(self.counts):
+            if c:
+                seen += c
+                if seen >= rank:
+                    return min(_upper(idx), self.max)
+        return self.max
+
+    def snapshot(self) -> Dict[str, Any]:
+        out: Dict[str, Any] = {"count": self.count, "sum_ns": self.total, "max_ns": self.max}
+        for q in QUANTILES:
+            out[f"p{q * 100:g}_ns"] = self.quantile(q)
+        return out
+
+
+class Metrics:
+    """Per-skill, per-phase latency histograms and per-skill error-code counters.
+
+    Phases are ``total`` (the whole skill call, recorded by ``wrap``) and the
+    helper phases in PHASES; ``instrument`` patches those helpers inside the
+    skill modules so every caller is measured. Time a skill spends outside
+    them (mostly building dicts) is ``total`` minus the phases.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._histograms: Dict[Tuple[str, str], Histogram] = {}
+        self._errors: Dict[Tuple[str, str], int] = {}
+
+    def histogram(self, skill_name: str, phase: str = "total") -> Histogram:
+        key = (skill_name, phase)
+        h = self._histograms.get(key)
+        if h is None:
+            with self._lock:
+                h = self._histograms.setdefault(key, Histogram())
+        return h
+
+    def count_error(self, skill_name: str, code: str) -> None:
+        key = (skill_name, code)
+        with self._lock:
+            self._errors[key] = self._errors.get(key, 0) + 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+            self._errors.clear()
+
+    def wrap(self, skill: Callable[..., Dict[str, Any]], skill_name: Optional[str] = None) -> Callable[..., Dict[str, Any]]:
+        """Record the skill's total latency, and its ``error.code`` when it returns an error."""
+        name = skill_name or f"skill_{skill.__name__}"
+        hist = self.histogram(name)
+        clock = time.perf_counter_ns
+
+        @functools.wraps(skill)
+        def timed(params: Dict[str, Any], *args: Any, **kwargs: Any) -> Dict[str, Any]:
+            start = clock()
+            try:
+                result = skill(params, *args, **kwargs)
+            finally:
+                hist.record(clock() - start)
+            if isinstance(result, dict) and "error" in result:
+                self.count_error(name, result["error"].get("code", "UNKNOWN"))
+            return result
+
+        return timed
+
+    def _timed_phase(self, fn: Callable[..., Any], skill_name: str, phase: str) -> Callable[..., Any]:
+        hist = self.histogram(skill_name, phase)
+        clock = time.perf_counter_ns
+
+        # Helpers take positional arguments only; a call that raises is not recorded.
+        @functools.wraps(fn)
+        def timed(*args: Any) -> Any:
+            start = clock()
+            out = fn(*args)
+            hist.record(clock() - start)
+            return out
+
+        return timed
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            histograms = list(self._histograms.items())
+            errors = list(self._errors.items())
+        latency: Dict[str, Dict[str, Any]] = {}
+        for (skill_name, phase), h in sorted(histograms):
+            if not h.count:
+                continue
+            latency.setdefault(skill_name, {})[phase] = h.snapshot()
+        counts: Dict[str, Dict[str, int]] = {}
+        for (skill_name, code), n in sorted(errors):
+            counts.setdefault(skill_name, {})[code] = n
+        return {"latency": latency, "errors": counts}
+
+    def prometheus(self) -> str:
+        """Prometheus text exposition (format 0.0.4): latency summaries and error counters."""
+        with self._lock:
+            histograms = sorted(self._histograms.items())
+            errors = sorted(self._errors.items())
+        lines: List[str] = [
+            "# HELP chimera_skill_latency_seconds Skill and skill-phase latency.",
+            "# TYPE chimera_skill_latency_seconds summary",
+        ]
+        for (skill_name, phase), h in histograms:
+            if not h.count:
+                continue
+            labels = f'skill="{skill_name}",phase="{phase}"'
+            for q in QUANTILES:
+                lines.append(f'chimera_skill_latency_seconds{{{labels},quantile="{q:g}"}} {h.quantile(q) / 1e9:.9f}')
+            lines.append(f"chimera_skill_latency_seconds_sum{{{labels}}} {h.total / 1e9:.9f}")
+            lines.append(f"chimera_skill_latency_seconds_count{{{labels}}} {h.count}")
+        lines += [
+            "# HELP chimera_skill_errors_total Skill error responses by error.code.",
+            "# TYPE chimera_skill_errors_total counter",
+        ]
+        for (skill_name, code), n in errors:
+            lines.append(f'chimera_skill_errors_total{{skill="{skill_name}",code="{code}"}} {n}')
+        return "\n".join(lines) + "\n"
+
+
+# Originals replaced by instrument(): (module, attribute) -> original.
+_patched: Dict[Tuple[str, str], Any] = {}
+_active: Optional[Metrics] = None
+_install_lock = threading.Lock()
+
+
+def instrument(metrics: Optional[Metrics] = None) -> Metrics:
+    """Turn instrumentation on for every registered skill and return the active Metrics.
+
+    Patches the PHASES helpers in each skill module (so direct callers such as
+    the pipeline stages are measured too) and routes ``registry.dispatch``
+    through ``Metrics.wrap``. Until this is called nothing is patched, so
+    disabled instrumentation costs nothing.
+    """
+    global _active
+    from .skills import registry
+
+    with _install_lock:
+        if _active is not None:
+            _uninstall()
+        metrics = metrics or Metrics()
+        for skill_name, (module_name, attr) in registry.SKILLS.items():
+            module = importlib.import_module(module_name)
+            for helper, phase in PHASES.items():
+                fn = getattr(module, helper, None)
+                if fn is not None:
+                    _patched[(module_name, helper)] = fn
+                    setattr(module, helper, metrics._timed_phase(fn, skill_name, phase))
+            skill = getattr(module, attr)
+            with registry._lock:
+                registry._resolved[skill_name] = metrics.wrap(skill, skill_name)
+        _active = metrics
+        return metrics
+
+
+def uninstrument() -> None:
+    """Restore the original skill helpers and registry entries."""
+    with _install_lock:
+        _uninstall()
+
+
+def _uninstall() -> None:
+    global _active
+    from .skills import registry
+
+    for (module_name, helper), fn in _patched.items():
+        setattr(importlib.import_module(module_name), helper, fn)
+    _patched.clear()
+    with registry._lock:
+        for skill_name in registry.SKILLS:
+            registry._resolved.pop(skill_name, None)
+    _active = None
+
+
+def active() -> Optional[Metrics]:
+    return _active
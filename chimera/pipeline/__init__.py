@@ -0,0 +1,5 @@
+from .engine import Pipeline, run_pipeline
+from .incremental import IncrementalPipeline
+from .sharding import ShardedRunner
+
+__all__ = ["IncrementalPipeline", "Pipeline", "ShardedRunner", "run_pipeline"]
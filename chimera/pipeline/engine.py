@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import inspect
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any, AsyncIterable, Awaitable, Callable, Dict, Iterable, List, Optional, Union
+
+from ..clock import now as _ts, pinned
+from .stages import draft_stage, fetch_stage, publish_stage, review_stage
+
+if TYPE_CHECKING:
+    from ..review.simhash import NearDuplicateReviewer
+    from ..store import SQLiteStore
+
+
+STAGES = ("fetch", "draft", "review", "publish")
+DEFAULT_CONCURRENCY = {"fetch": 2, "draft": 4, "review": 4, "publish": 2}
+
+_DONE = object()
+
+ParkFn = Callable[[Dict[str, Any], Dict[str, Any]], Any]
+
+
+def _call_pinned(timestamp: str, fn: Callable[..., Dict[str, Any]], args: Any, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Process-pool entry point: contexts cannot be pickled, so the run's timestamp is passed along."""
+    with pinned(timestamp):
+        return fn(*args, **kwargs)
+
+
+class Pipeline:
+    """Streaming fetch -> draft -> review -> publish pipeline over bounded asyncio queues.
+
+    Every stage has its own worker pool (``concurrency``) reading from a queue
+    of at most ``queue_size`` items, so a slow stage makes upstream ``put``
+    calls wait instead of buffering unboundedly. Skill calls run on
+    ``executor`` (the loop's default thread pool when None) to keep the event
+    loop free. Drafts whose review is REQUIRES_HUMAN_REVIEW are parked, handed
+    to ``on_park`` and never reach publish; REJECTED drafts stop at review
+    (specs/technical.md 3.3). Skill errors are collected per item, never
+    silently dropped (specs/functional.md F8). With ``near_duplicates``,
+    reviews go through that NearDuplicateReviewer, which flags (or reuses
+    the decision for) drafts close to one it already reviewed.
+    """
+
+    def __init__(
+        self,
+        *,
+        content_type: str = "short_script",
+        constraints: Optional[List[str]] = None,
+        confidence_threshold: float = 0.7,
+        schedule_time: Optional[str] = None,
+        concurrency: Optional[Dict[str, int]] = None,
+        queue_size: int = 64,
+        executor: Optional[Executor] = None,
+        store: "SQLiteStore | None" = None,
+        on_park: Optional[ParkFn] = None,
+        near_duplicates: "NearDuplicateReviewer | None" = None,
+    ) -> None:
+        self.content_type = content_type
+        self.constraints = constraints or []
+        self.confidence_threshold = confidence_threshold
+        self.schedule_time = schedule_time
+        self.concurrency = dict(DEFAULT_CONCURRENCY, **(concurrency or {}))
+        for stage, n in self.concurrency.items():
+            if stage not in STAGES or not isinstance(n, int) or n < 1:
+                raise ValueError(f"invalid concurrency for stage {stage!r}: {n!r}")
+        if queue_size < 1:
+            raise ValueError("queue_size must be a positive integer")
+        self.queue_size = queue_size
+        self.executor = executor
+        self.store = store
+        self.on_park = on_park
+        self.near_duplicates = near_duplicates
+
+    async def _call(self, fn: Callable[..., Dict[str, Any]], *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        if self.store is not None:
+            kwargs["store"] = self.store
+        if isinstance(self.executor, ProcessPoolExecutor):
+            return await loop.run_in_executor(self.executor, _call_pinned, _ts(), fn, args, kwargs)
+        # Executor threads don't inherit contextvars; carry the run's pinned timestamp over.
+        call = functools.partial(fn, *args, **kwargs)
+        return await loop.run_in_executor(self.executor, contextvars.copy_context().run, call)
+
+    async def run(self, requests: Union[Iterable[Dict[str, Any]], AsyncIterable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Run every request through the stages; all outputs of one run share one timestamp."""
+        with pinned():
+            return await self._run(requests)
+
+    async def _run(self, requests: Union[Iterable[Dict[str, Any]], AsyncIterable[Dict[str, Any]]]) -> Dict[str, Any]:
+        queues = {stage: asyncio.Queue(self.queue_size) for stage in STAGES}
+        result: Dict[str, Any] = {"published": [], "parked": [], "rejected": [], "errors": []}
+        stats = {stage: {"processed": 0, "max_queue_depth": 0} for stage in STAGES}
+
+        async def put(stage: str, item: Any) -> None:
+            await queues[stage].put(item)
+            depth = queues[stage].qsize()
+            if depth > stats[stage]["max_queue_depth"]:
+                stats[stage]["max_queue_depth"] = depth
+
+        park_tasks: List["asyncio.Future[Any]"] = []
+
+        def fail(stage: str, item: Any, error: Dict[str, Any]) -> None:
+            result["errors"].append({"stage": stage, "input": item, "error": error})
+
+        async def settle(entry: Dict[str, Any], parked: Awaitable[Any]) -> None:
+            try:
+                await parked
+            except Exception as exc:
+                result["parked"][:] = [e for e in result["parked"] if e is not entry]
+                fail("review", entry["draft"], {"code": "PIPELINE_ERROR", "message": repr(exc)})
+
+        async def handle(stage: str, item: Any) -> None:
+            if stage == "fetch":
+                out = await self._call(fetch_stage, item)
+                if "error" in out:
+                    return fail(stage, item, out["error"])
+                for topic in out["topics"]:
+                    await put("draft", topic)
+            elif stage == "draft":
+                out = await self._call(draft_stage, item, self.content_type, self.constraints)
+                if "error" in out:
+                    return fail(stage, item, out["error"])
+                await put("review", out["draft"])
+            elif stage == "review":
+                review_fn = review_stage if self.near_duplicates is None else self.near_duplicates.review
+                out = await self._call(review_fn, item, self.confidence_threshold)
+                if "error" in out:
+                    return fail(stage, item, out["error"])
+                review = out["review"]
+                if review["decision"] == "APPROVED":
+                    await put("publish", (item, review))
+                elif review["decision"] == "REQUIRES_HUMAN_REVIEW":
+                    entry = {"draft": item, "review": review}
+                    # A draft on_park fails for is reported in errors instead (by the worker when
+                    # on_park raises, by settle when its awaitable does), never in both lists.
+                    parked = self.on_park(item, review) if self.on_park is not None else None
+                    result["parked"].append(entry)
+                    if inspect.isawaitable(parked):
+                        # Parking sinks never hold up the review workers.
+                        park_tasks.append(asyncio.ensure_future(settle(entry, parked)))
+                else:
+                    result["rejected"].append({"draft": item, "review": review})
+            else:
+                draft, review = item
+                out = await self._call(publish_stage, draft, review, None, self.schedule_time)
+                if "error" in out:
+                    return fail(stage, item, out["error"])
+                result["published"].append(out["publish"])
+
+        async def worker(stage: str) -> None:
+            q = queues[stage]
+            while True:
+                item = await q.get()
+                if item is _DONE:
+                    return
+                try:
+                    await handle(stage, item)
+                except Exception as exc:
+                    fail(stage, item, {"code": "PIPELINE_ERROR", "message": repr(exc)})
+                stats[stage]["processed"] += 1
+
+        async def stage_pool(stage: str, downstream: Optional[str]) -> None:
+            await asyncio.gather(*(worker(stage) for _ in range(self.concurrency[stage])))
+            if downstream is not None:
+                for _ in range(self.concurrency[downstream]):
+                    await queues[downstream].put(_DONE)
+
+        async def feed() -> None:
+            if hasattr(requests, "__aiter__"):
+                async for params in requests:  # type: ignore[union-attr]
+                    await put("fetch", params)
+            else:
+                for params in requests:  # type: ignore[union-attr]
+                    await put("fetch", params)
+            for _ in range(self.concurrency["fetch"]):
+                await queues["fetch"].put(_DONE)
+
+        await asyncio.gather(
+            feed(),
+            *(stage_pool(stage, downstream) for stage, downstream in zip(STAGES, STAGES[1:] + (None,))),
+        )
+        if park_tasks:
+            await asyncio.gather(*park_tasks)
+        result["stats"] = stats
+        return result
+
+
+def run_pipeline(requests: Iterable[Dict[str, Any]], **options: Any) -> Dict[str, Any]:
+    """Synchronous entry point: ``run_pipeline([{"platform": ..., ...}], content_type="post")``."""
+    return asyncio.run(Pipeline(**options).run(requests))
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .engine import STAGES
+from .stages import draft_stage, fetch_stage, publish_stage, review_stage
+
+if TYPE_CHECKING:
+    from ..store import SQLiteStore
+
+
+def fingerprint(*parts: Any) -> str:
+    return hashlib.sha256("|".join(map(str, parts)).encode("utf-8")).hexdigest()[:16]
+
+
+class IncrementalPipeline:
+    """Memoized fetch -> draft -> review -> publish that only recomputes changed nodes.
+
+    Every artifact node records a fingerprint of the inputs its skill actually
+    reads, starting from the skills' stable-ID seeds:
+
+    - draft: ``content_type|topic_id|platform|constraints`` (generate_draft
+      reads nothing else of the topic: not its label, description, ``score``
+      or ``collected_at``)
+    - review: ``draft_id|confidence|confidence_threshold``
+    - publish: ``draft_id|review_id|decision|schedule_time``
+
+    A node whose fingerprint matches its last run reuses its output, so a
+    topic whose score or wording moved skips draft, review and publish.
+    ``stats`` counts skipped vs. recomputed nodes per stage. Error results are
+    never memoized. At most ``max_nodes`` nodes are kept; past that the least
+    recently used ones are dropped (and recomputed if they come back).
+    """
+
+    def __init__(
+        self,
+        *,
+        content_type: str = "short_script",
+        constraints: Optional[List[str]] = None,
+        confidence_threshold: float = 0.7,
+        schedule_time: Optional[str] = None,
+        store: "SQLiteStore | None" = None,
+        max_nodes: int = 100_000,
+    ) -> None:
+        if max_nodes < 1:
+            raise ValueError("max_nodes must be positive")
+        self.content_type = content_type
+        self.constraints = constraints or []
+        self.confidence_threshold = confidence_threshold
+        self.schedule_time = schedule_time
+        self.store = store
+        self.max_nodes = max_nodes
+        self._nodes: "OrderedDict[Tuple[str, str], Tuple[str, Dict[str, Any]]]" = OrderedDict()
+        self.stats = {stage: {"recomputed": 0, "skipped": 0} for stage in STAGES}
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def reset(self) -> None:
+        self._nodes.clear()
+        self.stats = {stage: {"recomputed": 0, "skipped": 0} for stage in STAGES}
+
+    def _node(self, stage: str, key: str, fp: str, compute: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        node = (stage, key)
+        cached = self._nodes.get(node)
+        if cached is not None and cached[0] == fp:
+            self._nodes.move_to_end(node)
+            self.stats[stage]["skipped"] += 1
+            return cached[1]
+        out = compute()
+        self.stats[stage]["recomputed"] += 1
+        if "error" not in out:
+            self._nodes[node] = (fp, out)
+            self._nodes.move_to_end(node)
+            if len(self._nodes) > self.max_nodes:
+                self._nodes.popitem(last=False)
+        return out
+
+    def run(self, requests: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """Fetch every request (fetch is the change source, so it always runs) and update downstream."""
+        topics: List[Dict[str, Any]] = []
+        errors: List[Dict[str, Any]] = []
+        for params in requests:
+            out = fetch_stage(params, store=self.store)
+            self.stats["fetch"]["recomputed"] += 1
+            if "error" in out:
+                errors.append({"stage": "fetch", "input": params, "error": out["error"]})
+            else:
+                topics.extend(out["topics"])
+        result = self.update(topics)
+        result["errors"][:0] = errors
+        return result
+
+    def update(self, topics: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """Propagate a batch of (possibly changed) topics through draft -> review -> publish."""
+        result: Dict[str, Any] = {"published": [], "parked": [], "rejected": [], "errors": []}
+        constraints = ",".join(self.constraints)
+        for topic in topics:
+            topic_id = topic.get("topic_id")
+            fp = fingerprint(self.content_type, topic_id, topic.get("platform"), constraints)
+            out = self._node(
+                "draft",
+                f"{topic_id}|{self.content_type}",
+                fp,
+                lambda: draft_stage(topic, self.content_type, self.constraints, store=self.store),
+            )
+            if "error" in out:
+                result["errors"].append({"stage": "draft", "input": topic, "error": out["error"]})
+                continue
+            draft = out["draft"]
+
+            fp = fingerprint(draft["draft_id"], draft.get("confidence"), self.confidence_threshold)
+            out = self._node(
+                "review", draft["draft_id"], fp, lambda: review_stage(draft, self.confidence_threshold, store=self.store)
+            )
+            if "error" in out:
+                result["errors"].append({"stage": "review", "input": draft, "error": out["error"]})
+                continue
+            review = out["review"]
+            if review["decision"] == "REQUIRES_HUMAN_REVIEW":
+                result["parked"].append({"draft": draft, "review": review})
+                continue
+            if review["decision"] != "APPROVED":
+                result["rejected"].append({"draft": draft, "review": review})
+                continue
+
+            fp = fingerprint(draft["draft_id"], review["review_id"], review["decision"], self.schedule_time)
+            out = self._node(
+                "publish",
+                draft["draft_id"],
+                fp,
+                lambda: publish_stage(draft, review, None, self.schedule_time, store=self.store),
+            )
+            if "error" in out:
+                result["errors"].append({"stage": "publish", "input": draft, "error": out["error"]})
+                continue
+            result["published"].append(out["publish"])
+        result["stats"] = {stage: dict(counts) for stage, counts in self.stats.items()}
+        return result
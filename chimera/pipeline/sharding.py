@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import marshal
+import os
+import time
+import zlib
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from ..clock import pinned
+from .stages import draft_stage, fetch_stage, publish_stage, review_stage
+
+
+ShardKeyFn = Callable[[Dict[str, Any]], str]
+
+_METRICS = ("requests", "topics", "drafts", "published", "parked", "rejected", "errors")
+
+
+def by_platform_region(params: Dict[str, Any]) -> str:
+    return f"{params.get('platform')}/{params.get('region')}"
+
+
+def shard_of(key: str, shards: int) -> int:
+    # crc32 is stable across processes and runs (unlike hash() with PYTHONHASHSEED).
+    return zlib.crc32(key.encode("utf-8")) % shards
+
+
+def run_batch(payload: bytes) -> bytes:
+    """Worker entry point: run full fetch -> publish chains for a marshalled batch.
+
+    Batches cross the process boundary as ``marshal`` bytes (plain dicts, lists,
+    strings and floats only), which is much cheaper than pickling per item.
+    """
+    options, requests = marshal.loads(payload)
+    with pinned(options.get("timestamp")):
+        return marshal.dumps(_run_chains(options, requests))
+
+
+def _run_chains(options: Dict[str, Any], requests: List[Dict[str, Any]]) -> Dict[str, Any]:
+    content_type = options["content_type"]
+    constraints = options["constraints"]
+    threshold = options["confidence_threshold"]
+    schedule_time = options["schedule_time"]
+    fetch, generate, evaluate = fetch_stage, draft_stage, review_stage
+    if options.get("cache_dir"):
+        # Workers on every shard share generated artifacts through the disk tier.
+        from ..cache import worker_cache
+
+        cache = worker_cache(options["cache_dir"])
+        fetch, generate, evaluate = (cache.wrap(fn, fn.__name__) for fn in (fetch_stage, draft_stage, review_stage))
+
+    out: Dict[str, Any] = {"published": [], "parked": [], "rejected": [], "errors": []}
+    metrics = dict.fromkeys(_METRICS, 0)
+    started = time.perf_counter()
+    for params in requests:
+        metrics["requests"] += 1
+        fetched = fetch(params)
+        if "error" in fetched:
+            out["errors"].append({"stage": "fetch", "input": params, "error": fetched["error"]})
+            continue
+        for topic in fetched["topics"]:
+            metrics["topics"] += 1
+            drafted = generate(topic, content_type, constraints)
+            if "error" in drafted:
+                out["errors"].append({"stage": "draft", "input": topic, "error": drafted["error"]})
+                continue
+            draft = drafted["draft"]
+            metrics["drafts"] += 1
+            reviewed = evaluate(draft, threshold)
+            if "error" in reviewed:
+                out["errors"].append({"stage": "review", "input": draft, "error": reviewed["error"]})
+                continue
+            review = reviewed["review"]
+            if review["decision"] == "REQUIRES_HUMAN_REVIEW":
+                out["parked"].append({"draft": draft, "review": review})
+                continue
+            if review["decision"] != "APPROVED":
+                out["rejected"].append({"draft": draft, "review": review})
+                continue
+            published = publish_stage(draft, review, None, schedule_time)
+            if "error" in published:
+                out["errors"].append({"stage": "publish", "input": draft, "error": published["error"]})
+                continue
+            out["published"].append(published["publish"])
+    for key in ("published", "parked", "rejected", "errors"):
+        metrics[key] = len(out[key])
+    out["metrics"] = dict(metrics, busy_seconds=time.perf_counter() - started, pid=os.getpid())
+    return out
+
+
+class ShardedRunner:
+    """Run workflow chains across worker processes, sharded by a stable key.
+
+    Requests with the same ``shard_key`` (platform/region by default) always
+    go to the same single-process shard. That keeps per-process caches warm
+    and makes results independent of pool scheduling. Batches of
+    ``batch_size`` requests are marshalled to the shard, and results and
+    metrics are merged in the parent.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        *,
+        shard_key: ShardKeyFn = by_platform_region,
+        batch_size: int = 32,
+        content_type: str = "short_script",
+        constraints: Optional[List[str]] = None,
+        confidence_threshold: float = 0.7,
+        schedule_time: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+    ) -> None:
+        self.workers = workers or os.cpu_count() or 1
+        if self.workers < 1 or batch_size < 1:
+            raise ValueError("workers and batch_size must be positive integers")
+        self.shard_key = shard_key
+        self.batch_size = batch_size
+        self._options = {
+            "content_type": content_type,
+            "constraints": list(constraints or []),
+            "confidence_threshold": float(confidence_threshold),
+            "schedule_time": schedule_time,
+            "cache_dir": cache_dir,
+        }
+        self._pools: List[ProcessPoolExecutor] = []
+
+    def __enter__(self) -> "ShardedRunner":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def _pool(self, shard: int) -> ProcessPoolExecutor:
+        while len(self._pools) <= shard:
+            self._pools.append(ProcessPoolExecutor(max_workers=1))
+        return self._pools[shard]
+
+    def close(self) -> None:
+        for pool in self._pools:
+            pool.shutdown()
+        self._pools = []
+
+    def run(self, requests: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        shards: List[List[Dict[str, Any]]] = [[] for _ in range(self.workers)]
+        for params in requests:
+            shards[shard_of(self.shard_key(params), self.workers)].append(params)
+
+        # Every batch of one run carries the same timestamp, whichever worker runs it.
+        with pinned() as timestamp:
+            options = dict(self._options, timestamp=timestamp)
+        futures: List[Tuple[int, "Future[bytes]"]] = []
+        for shard, items in enumerate(shards):
+            for i in range(0, len(items), self.batch_size):
+                payload = marshal.dumps((options, items[i : i + self.batch_size]))
+                futures.append((shard, self._pool(shard).submit(run_batch, payload)))
+
+        result: Dict[str, Any] = {"published": [], "parked": [], "rejected": [], "errors": []}
+        per_shard = [dict(dict.fromkeys(_METRICS, 0), batches=0, busy_seconds=0.0) for _ in range(self.workers)]
+        for shard, future in futures:
+            batch = marshal.loads(future.result())
+            for key in ("published", "parked", "rejected", "errors"):
+                result[key].extend(batch[key])
+            m = per_shard[shard]
+            m["batches"] += 1
+            for key in _METRICS:
+                m[key] += batch["metrics"][key]
+            m["busy_seconds"] += batch["metrics"]["busy_seconds"]
+
+        totals = {key: sum(m[key] for m in per_shard) for key in _METRICS}
+        totals["busy_seconds"] = sum(m["busy_seconds"] for m in per_shard)
+        result["metrics"] = {"shards": per_shard, "totals": totals}
+        return result
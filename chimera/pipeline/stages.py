@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from ..skills.evaluate_policy import evaluate_policy
+from ..skills.fetch_trends import fetch_trends
+from ..skills.generate_draft import generate_draft
+from ..skills.publish_content import publish_content
+
+if TYPE_CHECKING:
+    from ..store import SQLiteStore
+
+
+# Planner workflow (specs/functional.md F5): fetch -> draft -> review -> publish.
+# Each stage is a plain function so it can run inline, on a thread, or in a worker process.
+
+
+def fetch_stage(params: Dict[str, Any], store: "SQLiteStore | None" = None) -> Dict[str, Any]:
+    return fetch_trends(params, store=store)
+
+
+def draft_stage(
+    topic: Dict[str, Any],
+    content_type: str = "short_script",
+    constraints: Optional[List[str]] = None,
+    store: "SQLiteStore | None" = None,
+) -> Dict[str, Any]:
+    return generate_draft(
+        {"content_type": content_type, "constraints": constraints or [], "selected_topics": [topic]},
+        store=store,
+    )
+
+
+def review_stage(
+    draft: Dict[str, Any], confidence_threshold: float = 0.7, store: "SQLiteStore | None" = None
+) -> Dict[str, Any]:
+    return evaluate_policy({"draft": draft, "confidence_threshold": confidence_threshold}, store=store)
+
+
+def publish_stage(
+    draft: Dict[str, Any],
+    review: Dict[str, Any],
+    approval_id: Optional[str] = None,
+    schedule_time: Optional[str] = None,
+    store: "SQLiteStore | None" = None,
+) -> Dict[str, Any]:
+    # An APPROVED review is its own approval evidence; REQUIRES_HUMAN_REVIEW needs a hap_ id.
+    return publish_content(
+        {
+            "draft": dict(draft, review=review),
+            "approval_id": approval_id or review["review_id"],
+            "schedule_time": schedule_time,
+        },
+        store=store,
+    )
@@ -0,0 +1,315 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import functools
+import gzip
+import hashlib
+import json
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from .clock import frozen, now as _ts
+from .metrics import QUANTILES, Histogram
+
+if TYPE_CHECKING:
+    from .store import SQLiteStore
+
+FORMAT = "chimera-replay"
+VERSION = 1
+
+# A captured call: (offset from capture start in µs, skill_name, duration in µs, params).
+Record = Tuple[int, str, int, Dict[str, Any]]
+
+_FLUSH_EVERY = 1024
+
+
+_encode = json.JSONEncoder(separators=(",", ":"), default=str).encode
+
+
+def _dumps(obj: Any) -> str:
+    # Canonical form (sorted keys) for digests; log lines use the faster _encode.
+    return json.dumps(obj, separators=(",", ":"), sort_keys=True, default=str)
+
+
+class Recorder:
+    """Capture skill invocations made through ``registry.dispatch`` to a gzip JSON-lines log.
+
+    The first line is a header (format, version, ``started_at``); every other
+    line is one Record. Each call is encoded when it returns (so later
+    mutation of its params cannot change what was captured), buffered, and
+    written in batches.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.started_at = _ts()
+        self._file = gzip.open(path, "wt", encoding="utf-8")
+        self._file.write(_encode({"format": FORMAT, "version": VERSION, "started_at": self.started_at}) + "\n")
+        self._lock = threading.Lock()
+        self._buffer: List[str] = []
+        self._origin = time.perf_counter_ns()
+        self.count = 0
+
+    def wrap(self, skill: Callable[..., Dict[str, Any]], skill_name: str) -> Callable[..., Dict[str, Any]]:
+        clock = time.perf_counter_ns
+        origin = self._origin
+
+        @functools.wraps(skill)
+        def captured(params: Dict[str, Any], *args: Any, **kwargs: Any) -> Dict[str, Any]:
+            start = clock()
+            try:
+                return skill(params, *args, **kwargs)
+            finally:
+                end = clock()
+                self._append(_encode(((start - origin) // 1000, skill_name, (end - start) // 1000, params)) + "\n")
+
+        return captured
+
+    def _append(self, line: str) -> None:
+        with self._lock:
+            if self._file.closed:
+                return  # still wrapped by something installed after capture started
+            self._buffer.append(line)
+            self.count += 1
+            if len(self._buffer) >= _FLUSH_EVERY:
+                self._write()
+
+    def _write(self) -> None:
+        batch, self._buffer = self._buffer, []
+        self._file.write("".join(batch))
+
+    def flush(self) -> None:
+        with self._lock:
+            self._write()
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file.closed:
+                return
+            self._write()
+            self._file.close()
+
+
+_recorder: Optional[Recorder] = None
+# skill_name -> (what the registry resolved before capture, the capture wrapper).
+_saved: Dict[str, Tuple[Callable[..., Dict[str, Any]], Callable[..., Dict[str, Any]]]] = {}
+_install_lock = threading.Lock()
+
+
+def start_capture(path: str) -> Recorder:
+    """Record every ``registry.dispatch`` call (the HTTP server's path) until ``stop_capture``.
+
+    Wraps whatever the registry currently resolves, so capture composes with
+    ``metrics.instrument`` when that is installed first.
+    """
+    global _recorder
+    from .skills import registry
+
+    with _install_lock:
+        if _recorder is not None:
+            raise RuntimeError(f"already capturing to {_recorder.path}")
+        recorder = Recorder(path)
+        for skill_name in registry.SKILLS:
+            skill = registry.get_skill(skill_name)
+            wrapped = recorder.wrap(skill, skill_name)
+            _saved[skill_name] = (skill, wrapped)
+            with registry._lock:
+                registry._resolved[skill_name] = wrapped
+        _recorder = recorder
+        return recorder
+
+
+def stop_capture() -> Optional[Recorder]:
+    """Restore the registry and close the log; returns the finished Recorder.
+
+    Only entries that still resolve to the capture wrappers are restored;
+    one replaced since (e.g. by ``metrics.instrument``) is left alone.
+    """
+    global _recorder
+    from .skills import registry
+
+    with _install_lock:
+        recorder, _recorder = _recorder, None
+        with registry._lock:
+            for skill_name, (skill, wrapped) in _saved.items():
+                if registry._resolved.get(skill_name) is wrapped:
+                    registry._resolved[skill_name] = skill
+        _saved.clear()
+    if recorder is not None:
+        recorder.close()
+    return recorder
+
+
+@contextlib.contextmanager
+def capture(path: str) -> Iterator[Recorder]:
+    recorder = start_capture(path)
+    try:
+        yield recorder
+    finally:
+        stop_capture()
+
+
+def load(path: str) -> Tuple[Dict[str, Any], List[Record]]:
+    """Read a capture log: (header, records in capture order)."""
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        header = json.loads(f.readline())
+        if header.get("format") != FORMAT or header.get("version") != VERSION:
+            raise ValueError(f"{path}: not a {FORMAT} v{VERSION} log")
+        records = [tuple(json.loads(line)) for line in f if line.strip()]
+    records.sort(key=lambda r: r[0])
+    return header, records  # type: ignore[return-value]
+
+
+def digest(output: Dict[str, Any]) -> str:
+    return hashlib.sha256(_dumps(output).encode("utf-8")).hexdigest()[:16]
+
+
+def _run_skill(record: Record, store: "SQLiteStore | None") -> Dict[str, Any]:
+    from .skills import registry
+
+    return registry.dispatch(record[1], record[3], store=store)
+
+
+def _run_pipeline(record: Record, store: "SQLiteStore | None", options: Dict[str, Any], executor: ThreadPoolExecutor) -> Dict[str, Any]:
+    # Only fetch requests enter the pipeline; its later stages regenerate the rest.
+    from .pipeline import Pipeline
+
+    result = asyncio.run(Pipeline(store=store, executor=executor, **options).run([record[3]]))
+    result.pop("stats", None)
+    return result
+
+
+def replay(
+    records: List[Record],
+    *,
+    speed: float = 1.0,
+    concurrency: int = 8,
+    target: str = "skills",
+    store: "SQLiteStore | None" = None,
+    freeze: Optional[str] = None,
+    pipeline_options: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Re-issue captured traffic and report throughput, latency percentiles and output digests.
+
+    ``speed`` scales the captured inter-arrival gaps (1.0 real time, 10.0 ten
+    times faster, 0 as fast as ``concurrency`` workers allow). When paced,
+    latency is measured from each call's scheduled start rather than its
+    actual start, so time spent queued behind slow calls is counted instead
+    of hidden; at max speed a new call starts whenever one finishes. ``target="pipeline"`` pushes each skill_fetch_trends record
+    through a full Pipeline run. With ``freeze`` set, skill timestamps are
+    pinned so ``outputs`` can be diffed between builds.
+    """
+    if target not in ("skills", "pipeline"):
+        raise ValueError(f"unknown replay target: {target!r}")
+    if speed < 0 or concurrency < 1:
+        raise ValueError("speed must be >= 0 and concurrency >= 1")
+    # Pipeline runs hand their skill calls to a shared pool instead of a fresh one per run.
+    stage_pool = ThreadPoolExecutor(concurrency) if target == "pipeline" else None
+    if stage_pool is None:
+        call: Callable[[Record], Dict[str, Any]] = functools.partial(_run_skill, store=store)
+    else:
+        records = [r for r in records if r[1] == "skill_fetch_trends"]
+        call = functools.partial(_run_pipeline, store=store, options=pipeline_options or {}, executor=stage_pool)
+
+    hist = Histogram()
+    errors: Dict[str, int] = {}
+    outputs: List[Optional[str]] = [None] * len(records)
+    lock = threading.Lock()
+    # At max speed the driver is closed-loop: at most `concurrency` calls in flight.
+    slots = threading.BoundedSemaphore(concurrency)
+    clock = time.perf_counter_ns
+
+    def run(i: int, due: int) -> None:
+        try:
+            out = call(records[i])
+        except Exception as exc:
+            out = {"error": {"code": "REPLAY_EXCEPTION", "message": repr(exc)}}
+        finally:
+            if not speed:
+                slots.release()
+        elapsed = clock() - due
+        code = out["error"].get("code", "UNKNOWN") if "error" in out else None
+        with lock:
+            hist.record(elapsed)
+            if code is not None:
+                errors[code] = errors.get(code, 0) + 1
+            outputs[i] = digest(out)
+
+    futures = []
+    with frozen(freeze) if freeze else contextlib.nullcontext():
+        start = clock()
+        with ThreadPoolExecutor(concurrency) as pool:
+            first = records[0][0] if records else 0
+            for i, record in enumerate(records):
+                if speed:
+                    due = start + int((record[0] - first) * 1000 / speed)
+                    delay = due - clock()
+                    if delay > 0:
+                        time.sleep(delay / 1e9)
+                else:
+                    slots.acquire()
+                    due = clock()
+                futures.append(pool.submit(run, i, due))
+        elapsed = clock() - start
+    if stage_pool is not None:
+        stage_pool.shutdown()
+    # run() tallies what the call returns or raises; anything failing after that
+    # (an output that is not an envelope, say) is counted here instead of lost.
+    for future in futures:
+        if future.exception() is not None:
+            errors["REPLAY_EXCEPTION"] = errors.get("REPLAY_EXCEPTION", 0) + 1
+
+    latency: Dict[str, Any] = {f"p{q * 100:g}_us": round(hist.quantile(q) / 1e3, 1) for q in QUANTILES}
+    latency["max_us"] = round(hist.max / 1e3, 1)
+    return {
+        "target": target,
+        "requests": len(records),
+        "errors": errors,
+        "elapsed_s": round(elapsed / 1e9, 3),
+        "throughput_rps": round(len(records) / (elapsed / 1e9), 1) if elapsed else 0.0,
+        "latency": latency,
+        "outputs": outputs,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Replay a captured skill traffic log.")
+    parser.add_argument("log", help="capture log written by start_capture / `chimera.api --capture`")
+    parser.add_argument("--speed", type=float, default=1.0, help="1 = real time, 10 = 10x, 0 = max")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--target", choices=("skills", "pipeline"), default="skills")
+    parser.add_argument("--db", help="SQLite database to replay against (none by default)")
+    parser.add_argument("--freeze", metavar="TIMESTAMP", help="timestamp every output carries (default: the log's started_at)")
+    parser.add_argument("--outputs", metavar="PATH", help="write one output digest per line, for diffing builds")
+    args = parser.parse_args(argv)
+
+    header, records = load(args.log)
+    store = None
+    if args.db:
+        from .store import SQLiteStore
+
+        store = SQLiteStore(args.db)
+    report = replay(
+        records,
+        speed=args.speed,
+        concurrency=args.concurrency,
+        target=args.target,
+        store=store,
+        freeze=args.freeze or header["started_at"],
+    )
+    outputs = report.pop("outputs")
+    if args.outputs:
+        with open(args.outputs, "w", encoding="utf-8") as f:
+            f.writelines(f"{d}\n" for d in outputs)
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
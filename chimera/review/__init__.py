@@ -0,0 +1,4 @@
+from .queue import ReviewQueue
+from .simhash import NEAR_DUPLICATE, NearDuplicateReviewer, SimHashIndex, draft_fingerprint, simhash
+
+__all__ = ["NEAR_DUPLICATE", "NearDuplicateReviewer", "ReviewQueue", "SimHashIndex", "draft_fingerprint", "simhash"]
@@ -0,0 +1,343 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import re
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from ..clock import now as _ts
+from ..ids import stable_id as _stable_id
+
+if TYPE_CHECKING:
+    from ..store import SQLiteStore
+
+
+REVIEWER_ID_RE = re.compile(r"^usr_[a-zA-Z0-9]+\Z")  # \Z: "$" would let a trailing newline through
+DECISIONS = frozenset({"APPROVED", "REJECTED"})
+
+# Unscheduled drafts sort after every ISO-8601 schedule time.
+_UNSCHEDULED = "~"
+
+
+def _err(code: str, message: str, details: Dict[str, Any] | None = None) -> Dict[str, Any]:
+    e: Dict[str, Any] = {"code": code, "message": message, "timestamp": _ts()}
+    if details is not None:
+        e["details"] = details
+    return {"error": e}
+
+
+def _wake(future: "asyncio.Future[None]") -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class ReviewQueue:
+    """Human-review queue for REQUIRES_HUMAN_REVIEW drafts (specs/functional.md F4).
+
+    Reviews are ordered by draft confidence (lowest first), then scheduled
+    publish time (earliest first, unscheduled last), then age. ``enqueue`` and
+    ``claim`` are O(log n) heap operations. A claim leases the review to one
+    reviewer for ``lease_seconds``; a lease that is not decided, released or
+    renewed in time expires and the review goes back in the queue at its
+    original position. ``claim`` can block for up to ``timeout`` seconds and
+    ``wait_claim`` is the asyncio equivalent, so a dashboard long-polls instead
+    of polling.
+
+    ``decide`` records a batch of human decisions (specs/technical.md 3.4)
+    all-or-nothing: every entry is validated first, then the whole batch goes
+    into ``human_approvals`` in one store transaction. The store write happens
+    outside the queue lock, so claims and enqueues are not held up by it;
+    meanwhile the batch's reviews are reserved (neither claimable nor
+    decidable) and go back where they were if the write fails.
+    """
+
+    def __init__(
+        self,
+        store: "SQLiteStore | None" = None,
+        *,
+        lease_seconds: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.store = store
+        self.lease_seconds = lease_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._ready = threading.Condition(self._lock)
+        self._seq = itertools.count()
+        # Heap entries are [confidence, schedule, seq, review_id]; review_id None marks a removed entry.
+        self._heap: List[List[Any]] = []
+        self._keys: Dict[str, Tuple[float, str, int]] = {}
+        self._removed = 0
+        self._queued: Dict[str, List[Any]] = {}
+        self._items: Dict[str, Dict[str, Any]] = {}
+        self._leases: Dict[str, Tuple[str, float]] = {}
+        self._lease_heap: List[Tuple[float, str]] = []
+        self._by_reviewer: Dict[str, Set[str]] = {}
+        self._deciding: Set[str] = set()
+        self._waiters: List[Tuple[asyncio.AbstractEventLoop, "asyncio.Future[None]"]] = []
+
+    def __len__(self) -> int:
+        """Reviews waiting to be claimed (leased reviews are not counted)."""
+        return len(self._queued)
+
+    def enqueue(
+        self, draft: Dict[str, Any], review: Dict[str, Any], schedule_time: Optional[str] = None
+    ) -> Dict[str, Any]:
+        if review.get("decision") != "REQUIRES_HUMAN_REVIEW":
+            return _err(
+                "INVALID_REVIEW_STATE",
+                f"Review '{review.get('review_id')}' does not require human approval",
+                {"review_id": review.get("review_id"), "decision": review.get("decision")},
+            )
+        review_id = review["review_id"]
+        confidence = float(review.get("confidence", draft.get("confidence", 0.0)))
+        with self._lock:
+            existing = self._items.get(review_id)
+            if existing is not None:
+                return dict(existing)
+            item = {
+                "review_id": review_id,
+                "draft_id": draft["draft_id"],
+                "confidence": confidence,
+                "schedule_time": schedule_time,
+                "enqueued_at": _ts(),
+            }
+            self._items[review_id] = item
+            self._keys[review_id] = (confidence, schedule_time or _UNSCHEDULED, next(self._seq))
+            self._push(review_id)
+            return dict(item)
+
+    def _push(self, review_id: str) -> None:
+        # A re-queued review keeps its original key, so it returns to its old position.
+        entry = [*self._keys[review_id], review_id]
+        self._queued[review_id] = entry
+        heapq.heappush(self._heap, entry)
+        self._ready.notify()
+        for loop, future in self._waiters:
+            loop.call_soon_threadsafe(_wake, future)
+        self._waiters.clear()
+
+    def _drop(self, review_id: str) -> None:
+        entry = self._queued.pop(review_id, None)
+        if entry is not None:
+            entry[3] = None
+            self._removed += 1
+            if self._removed > len(self._heap) // 2:
+                self._heap = [e for e in self._heap if e[3] is not None]
+                heapq.heapify(self._heap)
+                self._removed = 0
+
+    def _expire(self, now: float) -> None:
+        while self._lease_heap and self._lease_heap[0][0] <= now:
+            expires_at, review_id = heapq.heappop(self._lease_heap)
+            lease = self._leases.get(review_id)
+            if lease is None or lease[1] != expires_at:
+                continue  # decided, released or renewed since
+            self._unlease(review_id)
+            self._push(review_id)
+
+    def _unlease(self, review_id: str) -> Optional[str]:
+        lease = self._leases.pop(review_id, None)
+        if lease is None:
+            return None
+        held = self._by_reviewer.get(lease[0])
+        if held is not None:
+            held.discard(review_id)
+            if not held:
+                del self._by_reviewer[lease[0]]
+        return lease[0]
+
+    def _take(self, reviewer_id: str, n: int) -> List[Dict[str, Any]]:
+        now = self._clock()
+        self._expire(now)
+        expires_at = now + self.lease_seconds
+        claimed = []
+        while self._heap and len(claimed) < n:
+            entry = heapq.heappop(self._heap)
+            review_id = entry[3]
+            if review_id is None:
+                self._removed -= 1
+                continue
+            del self._queued[review_id]
+            item = self._items[review_id]
+            self._leases[review_id] = (reviewer_id, expires_at)
+            heapq.heappush(self._lease_heap, (expires_at, review_id))
+            self._by_reviewer.setdefault(reviewer_id, set()).add(review_id)
+            claimed.append(self._view(item, reviewer_id))
+        return claimed
+
+    def _view(self, item: Dict[str, Any], reviewer_id: str) -> Dict[str, Any]:
+        view = dict(item)
+        view["reviewer_id"] = reviewer_id
+        view["lease_seconds"] = self.lease_seconds
+        return view
+
+    def _next_expiry(self) -> Optional[float]:
+        return self._lease_heap[0][0] - self._clock() if self._lease_heap else None
+
+    def claim(self, reviewer_id: str, n: int = 1, timeout: float = 0.0) -> Dict[str, Any]:
+        """Lease up to ``n`` most urgent reviews, waiting up to ``timeout`` seconds for one to arrive."""
+        if not isinstance(reviewer_id, str) or not REVIEWER_ID_RE.match(reviewer_id):
+            return _err("INVALID_REVIEWER_ID", "reviewer_id must match ^usr_[a-zA-Z0-9]+$", {"reviewer_id": reviewer_id})
+        deadline = time.monotonic() + timeout
+        with self._ready:
+            while True:
+                items = self._take(reviewer_id, n)
+                remaining = deadline - time.monotonic()
+                if items or remaining <= 0:
+                    return {"items": items}
+                expiry = self._next_expiry()
+                self._ready.wait(remaining if expiry is None else max(0.0, min(remaining, expiry)))
+
+    async def wait_claim(self, reviewer_id: str, n: int = 1, timeout: float = 30.0) -> Dict[str, Any]:
+        """asyncio long-poll: like ``claim`` but suspends the task instead of blocking the loop."""
+        if not isinstance(reviewer_id, str) or not REVIEWER_ID_RE.match(reviewer_id):
+            return _err("INVALID_REVIEWER_ID", "reviewer_id must match ^usr_[a-zA-Z0-9]+$", {"reviewer_id": reviewer_id})
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            future = loop.create_future()
+            with self._lock:
+                items = self._take(reviewer_id, n)
+                remaining = deadline - loop.time()
+                if items or remaining <= 0:
+                    return {"items": items}
+                # Registered under the lock, so an enqueue after the empty take cannot be missed.
+                self._waiters.append((loop, future))
+                expiry = self._next_expiry()
+            try:
+                await asyncio.wait_for(future, remaining if expiry is None else max(0.0, min(remaining, expiry)))
+            except asyncio.TimeoutError:
+                with self._lock:
+                    if (loop, future) in self._waiters:
+                        self._waiters.remove((loop, future))
+
+    def leased(self, reviewer_id: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            self._expire(self._clock())
+            return [self._view(self._items[r], reviewer_id) for r in sorted(self._by_reviewer.get(reviewer_id, ()))]
+
+    def _check_lease(self, review_id: str, reviewer_id: str) -> Optional[Dict[str, Any]]:
+        lease = self._leases.get(review_id)
+        if lease is None or lease[0] != reviewer_id:
+            return _err(
+                "INVALID_REVIEW_STATE",
+                f"Review '{review_id}' is not leased to '{reviewer_id}'",
+                {"review_id": review_id, "reviewer_id": reviewer_id},
+            )
+        return None
+
+    def renew(self, review_id: str, reviewer_id: str) -> Dict[str, Any]:
+        with self._lock:
+            now = self._clock()
+            self._expire(now)
+            err = self._check_lease(review_id, reviewer_id)
+            if err is not None:
+                return err
+            expires_at = now + self.lease_seconds
+            self._leases[review_id] = (reviewer_id, expires_at)
+            heapq.heappush(self._lease_heap, (expires_at, review_id))
+            return self._view(self._items[review_id], reviewer_id)
+
+    def release(self, review_id: str, reviewer_id: str) -> Dict[str, Any]:
+        """Hand a leased review back to the queue undecided."""
+        with self._lock:
+            self._expire(self._clock())
+            err = self._check_lease(review_id, reviewer_id)
+            if err is not None:
+                return err
+            self._unlease(review_id)
+            self._push(review_id)
+            return dict(self._items[review_id])
+
+    def decide(self, decisions: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """Record a batch of human approve/reject decisions atomically.
+
+        Each entry carries ``review_id``, ``reviewer_id``, ``decision`` and an
+        optional ``comment``. A review leased to someone else cannot be decided.
+        The first invalid entry fails the whole batch (``details.index`` says
+        which) and nothing is written. Decided reviews leave the queue.
+        """
+        decisions = list(decisions)
+        with self._lock:
+            self._expire(self._clock())
+            approvals: List[Dict[str, Any]] = []
+            seen: Set[str] = set()
+            for i, d in enumerate(decisions):
+                err = self._check_decision(d, seen)
+                if err is not None:
+                    err["error"].setdefault("details", {})["index"] = i
+                    return err
+                review_id, reviewer_id, decision = d["review_id"], d["reviewer_id"], d["decision"]
+                seen.add(review_id)
+                approvals.append(
+                    {
+                        "approval_id": _stable_id("hap", f"{review_id}|{reviewer_id}|{decision}"),
+                        "draft_id": self._items[review_id]["draft_id"],
+                        "review_id": review_id,
+                        "reviewer_id": reviewer_id,
+                        "decision": decision,
+                        "comment": d.get("comment"),
+                        "recorded_at": _ts(),
+                    }
+                )
+            # Reserve the batch: out of the queue and leases, but still in _items.
+            reserved: Dict[str, Optional[Tuple[str, float]]] = {}
+            for approval in approvals:
+                review_id = approval["review_id"]
+                reserved[review_id] = self._leases.get(review_id)
+                self._unlease(review_id)
+                self._drop(review_id)
+                self._deciding.add(review_id)
+        try:
+            if self.store is not None:
+                with self.store.transaction():
+                    self.store.insert_human_approvals(approvals)
+        except BaseException:
+            with self._lock:
+                now = self._clock()
+                for review_id, lease in reserved.items():
+                    self._deciding.discard(review_id)
+                    if lease is None or lease[1] <= now:
+                        self._push(review_id)
+                    else:
+                        # _expire may have popped the lease's heap entry during the write;
+                        # a duplicate entry is skipped once the lease is gone.
+                        self._leases[review_id] = lease
+                        self._by_reviewer.setdefault(lease[0], set()).add(review_id)
+                        heapq.heappush(self._lease_heap, (lease[1], review_id))
+            raise
+        with self._lock:
+            for review_id in reserved:
+                self._deciding.discard(review_id)
+                del self._items[review_id]
+                del self._keys[review_id]
+        return {"approvals": approvals}
+
+    def _check_decision(self, d: Dict[str, Any], seen: Set[str]) -> Optional[Dict[str, Any]]:
+        # specs/technical.md 3.4 check order: review, reviewer_id, decision, comment.
+        review_id = d.get("review_id")
+        if not isinstance(review_id, str) or review_id not in self._items or review_id in self._deciding:
+            return _err("REVIEW_NOT_FOUND", f"Review '{review_id}' is not awaiting human review", {"review_id": review_id})
+        if review_id in seen:
+            return _err("INVALID_INPUT", f"Review '{review_id}' appears twice in the batch", {"review_id": review_id})
+        reviewer_id = d.get("reviewer_id")
+        if not isinstance(reviewer_id, str) or not REVIEWER_ID_RE.match(reviewer_id):
+            return _err("INVALID_REVIEWER_ID", "reviewer_id must match ^usr_[a-zA-Z0-9]+$", {"reviewer_id": reviewer_id})
+        lease = self._leases.get(review_id)
+        if lease is not None and lease[0] != reviewer_id:
+            return _err(
+                "INVALID_REVIEW_STATE",
+                f"Review '{review_id}' is leased to another reviewer",
+                {"review_id": review_id, "reviewer_id": reviewer_id},
+            )
+        decision = d.get("decision")
+        if not isinstance(decision, str) or decision not in DECISIONS:
+            return _err("INVALID_DECISION", "decision must be APPROVED or REJECTED", {"decision": decision})
+        comment = d.get("comment")
+        if comment is not None and (not isinstance(comment, str) or len(comment) > 1000):
+            return _err("INVALID_INPUT", "comment must be a string of at most 1000 characters", {"field": "comment"})
+        return None
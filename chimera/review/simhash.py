@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import array
+import functools
+import hashlib
+import re
+import sys
+import threading
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from ..clock import now as _ts
+from ..ids import stable_id as _stable_id
+from ..skills.evaluate_policy import _validate_input, evaluate_policy
+
+if TYPE_CHECKING:
+    from ..store import SQLiteStore
+
+
+BITS = 64
+# Added to the reused review's reason_codes. Not one of the specs/technical.md 3.3
+# evaluation codes: it marks a decision copied from another draft's review.
+NEAR_DUPLICATE = "NEAR_DUPLICATE"
+
+_WORD_RE = re.compile(r"\w+")
+# Per-bit weight sums are kept in 32-bit lanes of one big int (see _spread).
+_LANE = 32
+_BYTE_SPREAD = [sum(1 << (_LANE * j) for j in range(8) if b >> j & 1) for b in range(256)]
+
+
+@functools.lru_cache(maxsize=65536)
+def _spread(feature: str) -> int:
+    """The feature's 64-bit hash with bit i moved to bit ``32 * i``.
+
+    Summing spread hashes adds up, per bit position, how many features set
+    that bit, all 64 positions at once in one big-int addition instead of a
+    64-step loop per feature.
+    """
+    digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+    out = 0
+    for k, b in enumerate(digest):
+        out |= _BYTE_SPREAD[b] << (_LANE * 8 * k)
+    return out
+
+
+def simhash(text: str) -> int:
+    """64-bit SimHash of ``text`` over lowercased words and word bigrams.
+
+    Similar texts get fingerprints a few bits apart; identical texts
+    (ignoring case and punctuation) get the same one.
+    """
+    words = _WORD_RE.findall(text.lower())
+    features = words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+    if not features:
+        return 0
+    total = sum(map(_spread, features))
+    counts = array.array("I", total.to_bytes(BITS * _LANE // 8, "little"))
+    if sys.byteorder != "little":
+        counts.byteswap()
+    # Bit i is set when most features set it (every feature weighs 1; repeats count again).
+    return sum(1 << i for i, n in enumerate(counts) if 2 * n > len(features))
+
+
+def draft_fingerprint(draft: Dict[str, Any]) -> Optional[int]:
+    """SimHash over a draft's ``title`` and ``body``; None if either is not a string."""
+    title, body = draft.get("title"), draft.get("body")
+    if not isinstance(title, str) or not isinstance(body, str):
+        return None
+    return simhash(f"{title}\n{body}")
+
+
+class SimHashIndex:
+    """Fingerprints within ``threshold`` bits of a query, without scanning them all.
+
+    The 64 bits are cut into ``threshold + 1`` bands and each band value
+    keys a hash table. Two fingerprints at most ``threshold`` bits apart
+    differ in at most ``threshold`` bands, so they agree exactly on at least
+    one: a query only checks the entries sharing one of its band values.
+    With 4 bands of 16 bits (the default threshold of 3) that is about
+    ``4 * n / 65536`` candidates for ``n`` random fingerprints.
+    """
+
+    def __init__(self, threshold: int = 3) -> None:
+        if not isinstance(threshold, int) or not 0 <= threshold < BITS // 2:
+            raise ValueError(f"threshold must be an integer in 0..{BITS // 2 - 1}")
+        self.threshold = threshold
+        bands = threshold + 1
+        edges = [BITS * i // bands for i in range(bands + 1)]
+        self._bands: List[Tuple[int, int]] = [(lo, (1 << (hi - lo)) - 1) for lo, hi in zip(edges, edges[1:])]
+        self._tables: List[Dict[int, List[str]]] = [{} for _ in self._bands]
+        self._fingerprints: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._fingerprints)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._fingerprints
+
+    def add(self, key: str, fingerprint: int) -> None:
+        if key in self._fingerprints:
+            self.remove(key)
+        self._fingerprints[key] = fingerprint
+        for (shift, mask), table in zip(self._bands, self._tables):
+            table.setdefault(fingerprint >> shift & mask, []).append(key)
+
+    def remove(self, key: str) -> None:
+        fingerprint = self._fingerprints.pop(key)
+        for (shift, mask), table in zip(self._bands, self._tables):
+            band = fingerprint >> shift & mask
+            keys = table[band]
+            keys.remove(key)
+            if not keys:
+                del table[band]
+
+    def query(self, fingerprint: int) -> List[Tuple[str, int]]:
+        """``(key, distance)`` for every entry within the threshold, nearest first."""
+        seen = set()
+        hits = []
+        for (shift, mask), table in zip(self._bands, self._tables):
+            for key in table.get(fingerprint >> shift & mask, ()):
+                if key in seen:
+                    continue
+                seen.add(key)
+                distance = (self._fingerprints[key] ^ fingerprint).bit_count()
+                if distance <= self.threshold:
+                    hits.append((key, distance))
+        hits.sort(key=lambda hit: hit[1])
+        return hits
+
+    def nearest(self, fingerprint: int) -> Optional[Tuple[str, int]]:
+        hits = self.query(fingerprint)
+        return hits[0] if hits else None
+
+
+def _confidence(draft: Dict[str, Any]) -> float:
+    """The draft confidence evaluate_policy judges by (0.5 when missing or unparseable)."""
+    try:
+        return float(draft["confidence"]) if draft.get("confidence") is not None else 0.5
+    except Exception:
+        return 0.5
+
+
+def _reusable(decision: str, confidence: float, threshold: float) -> bool:
+    """Whether a copied decision is one the draft's own confidence could not overturn.
+
+    evaluate_policy decides on confidence against the threshold, so a prior
+    decision is only reused when the draft's own confidence gives the same
+    one; in particular APPROVED is never copied onto a draft below the
+    threshold. REJECTED is reused regardless: it can only hold a draft back.
+    """
+    if decision == "REJECTED":
+        return True
+    own = "REQUIRES_HUMAN_REVIEW" if confidence < threshold else "APPROVED"
+    return decision == own
+
+
+class NearDuplicateReviewer:
+    """``evaluate_policy`` that first looks for an already-reviewed near-duplicate draft.
+
+    Every draft that gets a full policy evaluation is indexed by the
+    SimHash of its title and body. A later draft within ``threshold`` bits
+    of one is flagged: its output carries ``near_duplicate`` with the
+    earlier ``draft_id``, ``review_id`` and the bit distance. With
+    ``reuse=True`` a flagged draft skips evaluation instead, provided the
+    earlier review used the same ``confidence_threshold`` and the draft's
+    own confidence would reach the same decision (see ``_reusable``;
+    otherwise it is flagged and evaluated): it gets a review
+    of its own (own ``review_id`` and ``draft_id``, the earlier decision,
+    its own confidence) whose ``reason_codes`` are the earlier ones plus
+    ``NEAR_DUPLICATE``. Reused reviews are not indexed themselves, so a
+    chain of small edits cannot drift away from the review it reuses.
+
+    ``review`` has ``review_stage``'s signature, so it can stand in for it
+    (``Pipeline(near_duplicates=...)``). Thread-safe.
+    """
+
+    def __init__(self, threshold: int = 3, *, reuse: bool = False) -> None:
+        self.index = SimHashIndex(threshold)
+        self.reuse = reuse
+        self._reviews: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        self.stats = {"evaluated": 0, "flagged": 0, "reused": 0}
+
+    def evaluate(self, params: Dict[str, Any], store: "SQLiteStore | None" = None) -> Dict[str, Any]:
+        draft = params.get("draft") if isinstance(params, dict) else None
+        fingerprint = draft_fingerprint(draft) if isinstance(draft, dict) else None
+        if fingerprint is None:
+            return evaluate_policy(params, store=store)
+
+        match = None
+        with self._lock:
+            hit = self.index.nearest(fingerprint)
+            if hit is not None and hit[0] != draft.get("draft_id"):
+                threshold, prior = self._reviews[hit[0]]
+                match = (hit[1], threshold, prior)
+
+        if match is not None:
+            distance, threshold, prior = match
+            flag = {"draft_id": prior["draft_id"], "review_id": prior["review_id"], "distance": distance}
+            if self.reuse:
+                err, values = _validate_input(params)
+                if err is None and values[0] == threshold and _reusable(prior["decision"], _confidence(draft), threshold):
+                    out = self._reuse(draft, values[0], prior, distance, store)
+                    if "error" not in out:
+                        out["near_duplicate"] = flag
+                        with self._lock:
+                            self.stats["flagged"] += 1
+                            self.stats["reused"] += 1
+                    return out
+
+        out = evaluate_policy(params, store=store)
+        if "error" in out:
+            return out
+        review = out["review"]
+        with self._lock:
+            self.stats["evaluated"] += 1
+            if match is None:
+                self.index.add(review["draft_id"], fingerprint)
+                self._reviews[review["draft_id"]] = (_validate_input(params)[1][0], review)
+            else:
+                self.stats["flagged"] += 1
+        if match is not None:
+            out["near_duplicate"] = flag
+        return out
+
+    def _reuse(
+        self,
+        draft: Dict[str, Any],
+        threshold: float,
+        prior: Dict[str, Any],
+        distance: int,
+        store: "SQLiteStore | None",
+    ) -> Dict[str, Any]:
+        draft_id = draft["draft_id"]
+        if store is not None and not store.draft_exists(draft_id):
+            # Same error evaluate_policy would give.
+            return evaluate_policy({"draft": draft, "confidence_threshold": threshold}, store=store)
+        confidence = _confidence(draft)
+        decision = prior["decision"]
+        review = {
+            "review_id": _stable_id("rev", f"{draft_id}|{threshold}|{decision}"),
+            "draft_id": draft_id,
+            "decision": decision,
+            "confidence": round(confidence, 3),
+            "reason_codes": [*prior["reason_codes"], NEAR_DUPLICATE],
+            "timestamp": _ts(),
+            "notes": (
+                f"Near-duplicate of {prior['draft_id']} (SimHash distance {distance}); "
+                f"decision reused from {prior['review_id']}."
+            ),
+        }
+        if store is not None:
+            store.insert_reviews([review])
+        return {"review": review}
+
+    def review(
+        self, draft: Dict[str, Any], confidence_threshold: float = 0.7, store: "SQLiteStore | None" = None
+    ) -> Dict[str, Any]:
+        return self.evaluate({"draft": draft, "confidence_threshold": confidence_threshold}, store=store)
@@ -1,6 +1,29 @@
-from .fetch_trends import fetch_trends
-from .generate_draft import generate_draft
-from .evaluate_policy import evaluate_policy
-from .publish_content import publish_content
+import sys
+import types
+from typing import Any
 
-__all__ = ["fetch_trends", "generate_draft", "evaluate_policy", "publish_content"]
+from .registry import SKILLS, capabilities, dispatch, get_skill
+
+__all__ = ["fetch_trends", "generate_draft", "evaluate_policy", "publish_content", "capabilities", "dispatch", "get_skill"]
+
+# Skill functions are resolved on first attribute access (PEP 562), so importing
+# the package, the registry or the capability manifest loads no skill code.
+_FUNCTIONS = {attr: name for name, (_, attr) in SKILLS.items()}
+
+
+def __getattr__(attr: str) -> Any:
+    if attr in _FUNCTIONS:
+        return get_skill(_FUNCTIONS[attr])
+    raise AttributeError(f"module {__name__!r} has no attribute {attr!r}")
+
+
+class _SkillsPackage(types.ModuleType):
+    # Importing a submodule binds it on the package (chimera.skills.fetch_trends = <module>),
+    # which would shadow the function of the same name; keep those names lazy instead.
+    def __setattr__(self, attr: str, value: Any) -> None:
+        if attr in _FUNCTIONS and isinstance(value, types.ModuleType):
+            return
+        super().__setattr__(attr, value)
+
+
+sys.modules[__name__].__class__ = _SkillsPackage
@@ -1,94 +1,171 @@
 from __future__ import annotations
 
 import re
-from typing import Any, Dict, Optional, Tuple
-
-
-TIME_WINDOW_RE = re.compile(r"^\d+[hHdD]$")
-
-
-def _get(d: Dict[str, Any], key: str) -> Any:
-    return d.get(key, None)
-
-
-def validate_fetch_trends(params: Dict[str, Any]) -> Optional[Tuple[str, str, Dict[str, Any]]]:
-    platform = _get(params, "platform")
-    region = _get(params, "region")
-    time_window = _get(params, "time_window")
-    limit = _get(params, "limit")
-
-    allowed_platforms = {"youtube", "tiktok", "x", "twitter", "reddit"}
-    if not isinstance(platform, str) or platform.lower() not in allowed_platforms:
-        return ("INVALID_PLATFORM", "platform must be one of: youtube, tiktok, x, twitter, reddit", {"platform": platform})
-
-    if not isinstance(region, str) or not re.fullmatch(r"^[A-Z]{2}$", region):
-        return ("INVALID_REGION", "region must be ISO-3166-1 alpha-2 uppercase (e.g., 'ET')", {"region": region})
-
-    if not isinstance(time_window, str) or not TIME_WINDOW_RE.fullmatch(time_window):
-        return ("INVALID_TIME_WINDOW", "time_window must match ^\\d+[hHdD]$ (e.g., '24h', '7d')", {"time_window": time_window})
-
-    if limit is None:
-        limit = 10
-    if not isinstance(limit, int) or isinstance(limit, bool) or limit < 1 or limit > 50:
-        return ("INVALID_LIMIT", "limit must be an integer between 1 and 50", {"limit": limit})
-
-    return None
-
-
-def validate_generate_draft(params: Dict[str, Any]) -> Optional[Tuple[str, str, Dict[str, Any]]]:
-    content_type = _get(params, "content_type")
-    trend = _get(params, "trend")
-    constraints = _get(params, "constraints")
-
-    allowed_types = {"tweet", "thread", "linkedin", "blog", "script"}
-    if not isinstance(content_type, str) or content_type.lower() not in allowed_types:
-        return ("INVALID_CONTENT_TYPE", "content_type must be one of: tweet, thread, linkedin, blog, script", {"content_type": content_type})
-
-    if not isinstance(trend, dict):
-        return ("INVALID_TREND", "trend must be an object/dict", {"trend": trend})
-
-    if constraints is None:
-        constraints = {}
-    if not isinstance(constraints, dict):
-        return ("INVALID_CONSTRAINTS", "constraints must be an object/dict", {"constraints": constraints})
-
-    # common constraints fields (keep permissive but sane)
-    max_chars = constraints.get("max_chars")
-    if max_chars is not None and (not isinstance(max_chars, int) or max_chars < 1):
-        return ("INVALID_CONSTRAINTS", "constraints.max_chars must be a positive integer", {"max_chars": max_chars})
-
-    return None
-
-
-def validate_evaluate_policy(params: Dict[str, Any]) -> Optional[Tuple[str, str, Dict[str, Any]]]:
-    draft = _get(params, "draft")
-    confidence_threshold = _get(params, "confidence_threshold")
-
-    if not isinstance(draft, dict):
-        return ("INVALID_DRAFT", "draft must be an object/dict", {"draft": draft})
-
-    if confidence_threshold is None:
-        confidence_threshold = 0.7
-    if not isinstance(confidence_threshold, (int, float)) or not (0.0 <= float(confidence_threshold) <= 1.0):
-        return ("INVALID_CONFIDENCE_THRESHOLD", "confidence_threshold must be between 0 and 1", {"confidence_threshold": confidence_threshold})
-
-    return None
-
-
-def validate_publish_content(params: Dict[str, Any]) -> Optional[Tuple[str, str, Dict[str, Any]]]:
-    draft = _get(params, "draft")
-    approval_id = _get(params, "approval_id")
-    scheduled_at = _get(params, "scheduled_at")
-
-    if not isinstance(draft, dict):
-        return ("INVALID_DRAFT", "draft must be an object/dict", {"draft": draft})
-
-    # You MUST require approval_id (tests mention this strongly)
-    if not isinstance(approval_id, str) or not approval_id.strip():
-        return ("MISSING_APPROVAL", "approval_id is required to publish", {"approval_id": approval_id})
-
-    # scheduled_at can be optional; keep as string if provided
-    if scheduled_at is not None and not isinstance(scheduled_at, str):
-        return ("INVALID_SCHEDULED_AT", "scheduled_at must be a string if provided", {"scheduled_at": scheduled_at})
-
-    return None
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+# (code, message, details) -> turned into the spec error envelope by each skill's _err.
+Error = Tuple[str, str, Dict[str, Any]]
+Validator = Callable[[Dict[str, Any]], Tuple[Optional[Error], Optional[Tuple[Any, ...]]]]
+
+# \Z, not $: "$" also matches before a trailing newline, so .match("24h\n") would pass.
+TIME_WINDOW_RE = re.compile(r"^\d+[hHdD]\Z")
+REGION_RE = re.compile(r"^[A-Z]{2}\Z")
+ISO_UTC_RE = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z\Z")
+
+_MISSING = object()
+
+
+def _unknown_item(items: List[Any], allowed: frozenset, code: str, message: str, key: str) -> Error:
+    for i in items:
+        if i not in allowed:
+            return (code, message.format(item=i), {key: i})
+    raise AssertionError("no unknown item")
+
+
+# Pattern fields (region, time_window, ...) see few distinct values; remember their verdicts.
+_MEMO_LIMIT = 4096
+
+
+def _memo_match(seen: Dict[str, bool], fullmatch: Callable[[str], Any], v: str) -> bool:
+    ok = fullmatch(v) is not None
+    if len(seen) < _MEMO_LIMIT:
+        seen[v] = ok
+    return ok
+
+
+def _field_source(i: int, rule: Dict[str, Any], ns: Dict[str, Any]) -> List[str]:
+    """Emit the checks for one field as source lines; ``FAIL(expr)`` marks a failure exit."""
+    name, kind = rule["field"], rule["kind"]
+    v, k = f"v{i}", f"k{i}"
+    ns[f"{k}_name"], ns[f"{k}_code"], ns[f"{k}_msg"] = name, rule["code"], rule["message"]
+    err = f"({k}_code, {k}_msg, {{{k}_name: {v}}})"
+    has_default = "default" in rule
+    if has_default:
+        ns[f"{k}_default"] = rule["default"]
+
+    if kind == "number":
+        # Coerces like float(); a present None is an error, not the default.
+        ns[f"{k}_min"], ns[f"{k}_max"] = rule["min"], rule["max"]
+        fetch = f"params.get({k}_name, {k}_default)" if has_default else f"params.get({k}_name)"
+        return [
+            f"{v}_raw = {fetch}",
+            "try:",
+            f"    {v} = float({v}_raw)",
+            "except (TypeError, ValueError, OverflowError):",
+            f"    FAIL(({k}_code, {k}_msg, {{{k}_name: {v}_raw}}))",
+            f"if not {k}_min <= {v} <= {k}_max:",
+            f"    FAIL(({k}_code, {k}_msg, {{{k}_name: {v}_raw}}))",
+        ]
+
+    checks: List[Tuple[str, str]] = []
+    if kind == "enum":
+        ns[f"{k}_values"] = frozenset(rule["values"])
+        checks.append((f"not isinstance({v}, str) or {v} not in {k}_values", err))
+    elif kind == "pattern":
+        ns[f"{k}_match"], ns[f"{k}_seen"] = rule["regex"].fullmatch, {}
+        checks.append(
+            (
+                f"not isinstance({v}, str) or not ({k}_seen[{v}] if {v} in {k}_seen else _memo_match({k}_seen, {k}_match, {v}))",
+                err,
+            )
+        )
+    elif kind == "int":
+        # bool is an int subclass but not a spec integer.
+        ns[f"{k}_min"], ns[f"{k}_max"] = rule["min"], rule["max"]
+        checks.append((f"type({v}) is not int or not {k}_min <= {v} <= {k}_max", err))
+    elif kind == "list":
+        cond = f"not isinstance({v}, list)"
+        if rule.get("items") == "str":
+            cond += f" or not all(isinstance(x, str) for x in {v})"
+        checks.append((cond, err))
+        if "values" in rule:
+            ns[f"{k}_values"] = frozenset(rule["values"])
+            ns[f"{k}_item_msg"], ns[f"{k}_item_key"] = rule["item_message"], rule.get("item_key", name)
+            checks.append(
+                (
+                    f"not {k}_values.issuperset({v})",
+                    f"_unknown_item({v}, {k}_values, {k}_code, {k}_item_msg, {k}_item_key)",
+                )
+            )
+    elif kind == "ref":
+        # An object carrying an entity ID, e.g. a draft with draft_id drf_...
+        ns[f"{k}_id"], ns[f"{k}_prefix"], ns[f"{k}_id_msg"] = rule["id_field"], rule["prefix"], rule["id_message"]
+        checks.append((f"not isinstance({v}, dict)", err))
+        checks.append(
+            (
+                f"not isinstance(({v}_ref := {v}.get({k}_id)), str) or not {v}_ref.startswith({k}_prefix)",
+                f"({k}_code, {k}_id_msg, {{{k}_id: {v}_ref}})",
+            )
+        )
+    else:
+        raise ValueError(f"unknown schema kind {kind!r} for field {name!r}")
+
+    body = [line for cond, e in checks for line in (f"if {cond}:", f"    FAIL({e})")]
+    if not has_default:
+        return [f"{v} = params.get({k}_name)"] + body
+    missing = f"{v} is _MISSING or {v} is None" if rule.get("nullable") else f"{v} is _MISSING"
+    # Defaults are shared objects: callers treat returned values as read-only.
+    return [f"{v} = params.get({k}_name, _MISSING)", f"if {missing}:", f"    {v} = {k}_default", "else:"] + [
+        "    " + line for line in body
+    ]
+
+
+def _exit(line: str, template: str) -> str:
+    head, sep, rest = line.partition("FAIL(")
+    return head + template.format(rest[:-1]) if sep else line
+
+
+def compile_schema(schema: Iterable[Dict[str, Any]]) -> Validator:
+    """Compile a declarative input schema into a specialized validator function.
+
+    ``schema`` is a sequence of field rules checked in order, and the first
+    failure wins, so list fields in the spec's check order. Each rule has
+    ``field``, ``kind`` (enum/pattern/int/number/list/ref), the spec error
+    ``code`` and ``message``, plus kind-specific keys (``values``, ``regex``,
+    ``min``/``max``, ``items``/``item_message``/``item_key``, ``id_field``/
+    ``prefix``/``id_message``). ``default`` applies when the field is absent,
+    or also when it is None if ``nullable`` is set.
+
+    The rules are generated into one straight-line function with the
+    constants inlined, so a call does no per-rule dispatch. The
+    validator returns ``(error, values)``. ``error`` is None or
+    ``(code, message, details)``. ``values`` is a tuple of the normalized
+    fields in schema order (defaults applied, numbers as float), and is
+    None on error. The generated batch loop is attached as ``.many`` for
+    ``validate_many``.
+    """
+    ns: Dict[str, Any] = {"_MISSING": _MISSING, "_unknown_item": _unknown_item, "_memo_match": _memo_match}
+    lines: List[str] = []
+    fields: List[str] = []
+    for i, rule in enumerate(schema):
+        lines += _field_source(i, rule, ns)
+        fields.append(f"v{i}")
+    values = "(" + ", ".join(fields) + ",)"
+
+    # Plain constants (names, codes, messages, bounds) are inlined as literals; sets,
+    # matchers and helpers become globals of the generated code.
+    literals = {n: repr(c) for n, c in ns.items() if type(c) in (str, int, float, bool) or c is None}
+    # params.get is called directly rather than bound once: with a handful of fields,
+    # creating the bound method costs more than the method calls it would save.
+    src = ["def validate(params):"]
+    src += ["    " + _exit(line, "return {}, None") for line in lines]
+    src += [f"    return None, {values}", ""]
+    src += ["def many(payloads):", "    out = []", "    append = out.append", "    for params in payloads:"]
+    src += ["        " + _exit(line, "append({}); continue") for line in lines]
+    src += ["        append(None)", "    return out"]
+    code = re.sub(r"\bk\d+_\w+\b", lambda m: literals.get(m.group(0), m.group(0)), "\n".join(src))
+
+    scope = {n: c for n, c in ns.items() if n not in literals}
+    exec(compile(code, "<schema validator>", "exec"), scope)
+    validate = scope["validate"]
+    validate.many = scope["many"]
+    return validate
+
+
+def validate_many(validator: Validator, payloads: Iterable[Dict[str, Any]]) -> List[Optional[Error]]:
+    """Validate N payloads in one call; returns one error (or None) per payload, in order."""
+    many = getattr(validator, "many", None)
+    if many is not None:
+        return many(payloads)
+    return [validator(p)[0] for p in payloads]
@@ -1,12 +1,54 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
-import hashlib
-from typing import Any, Dict, List
-
-
-def _ts() -> str:
-    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+from typing import TYPE_CHECKING, Any, Dict, List
+
+from ..clock import now as _ts
+from ..ids import stable_id as _stable_id
+from ._validate import compile_schema
+
+if TYPE_CHECKING:
+    from ..store import SQLiteStore
+
+
+# Capability contract (specs/technical.md 3.6); compiled into manifest.json at build time.
+CAPABILITY: Dict[str, Any] = {
+    "skill_name": "skill_evaluate_policy",
+    "description": "Evaluate a draft against policy and brand safety rules",
+    "inputs": [
+        {"name": "draft", "type": "object", "required": True, "constraints": "Draft with draft_id matching ^drf_[a-zA-Z0-9]+$"},
+        {"name": "confidence_threshold", "type": "number", "required": False, "constraints": "Range: 0.0-1.0, default: 0.7"},
+    ],
+    "outputs": [{"name": "review", "type": "object", "description": "Review decision with reason codes"}],
+    "requires_approval": False,
+}
+
+# Input checks in spec order (specs/technical.md 3.3): confidence_threshold first, then draft.
+INPUT_SCHEMA = (
+    {
+        "field": "confidence_threshold",
+        "kind": "number",
+        "min": 0.0,
+        "max": 1.0,
+        "default": 0.7,
+        "code": "INVALID_CONFIDENCE_THRESHOLD",
+        "message": "confidence_threshold must be a float in range [0.0, 1.0]",
+    },
+    {
+        "field": "draft",
+        "kind": "ref",
+        "id_field": "draft_id",
+        "prefix": "drf_",
+        "code": "INVALID_DRAFT",
+        "message": "draft must be an object/dict",
+        "id_message": "draft_id must be a string matching ^drf_[a-zA-Z0-9]+$",
+    },
+)
+
+# For validate_many and the near-duplicate reviewer. evaluate_policy itself keeps
+# the checks inline: with two fields, building the compiled validator's
+# (error, values) result costs more than the checks, about 10-20% per call.
+# tests/test_validation.py pins both to the same answers.
+_validate_input = compile_schema(INPUT_SCHEMA)
 
 
 def _err(code: str, message: str, details: Dict[str, Any] | None = None) -> Dict[str, Any]:
@@ -16,39 +58,32 @@ def _err(code: str, message: str, details: Dict[str, Any] | None = None) -> Dict
     return {"error": e}
 
 
-def _stable_id(prefix: str, seed: str) -> str:
-    h = hashlib.sha256(seed.encode("utf-8")).hexdigest()[:12]
-    return f"{prefix}_{h}"
-
-
-def evaluate_policy(params: Dict[str, Any]) -> Dict[str, Any]:
-    draft = params.get("draft")
-    confidence_threshold = params.get("confidence_threshold", 0.7)
-
-    # IMPORTANT: validate confidence_threshold FIRST (tests expect this)
+def evaluate_policy(params: Dict[str, Any], store: "SQLiteStore | None" = None) -> Dict[str, Any]:
+    raw_threshold = params.get("confidence_threshold", 0.7)
     try:
-        thr = float(confidence_threshold)
-    except Exception:
+        thr = float(raw_threshold)
+    except (TypeError, ValueError, OverflowError):
         return _err(
             "INVALID_CONFIDENCE_THRESHOLD",
             "confidence_threshold must be a float in range [0.0, 1.0]",
-            {"confidence_threshold": confidence_threshold},
+            {"confidence_threshold": raw_threshold},
         )
-    if not (0.0 <= thr <= 1.0):
+    if not 0.0 <= thr <= 1.0:
         return _err(
             "INVALID_CONFIDENCE_THRESHOLD",
             "confidence_threshold must be a float in range [0.0, 1.0]",
-            {"confidence_threshold": confidence_threshold},
+            {"confidence_threshold": raw_threshold},
         )
-
-    # Then validate draft
+    draft = params.get("draft")
     if not isinstance(draft, dict):
         return _err("INVALID_DRAFT", "draft must be an object/dict", {"draft": draft})
-
     draft_id = draft.get("draft_id")
     if not isinstance(draft_id, str) or not draft_id.startswith("drf_"):
         return _err("INVALID_DRAFT", "draft_id must be a string matching ^drf_[a-zA-Z0-9]+$", {"draft_id": draft_id})
 
+    if store is not None and not store.draft_exists(draft_id):
+        return _err("DRAFT_NOT_FOUND", f"Draft '{draft_id}' does not exist", {"draft_id": draft_id})
+
     now = _ts()
     # confidence: prefer draft.confidence
     conf = draft.get("confidence")
@@ -75,4 +110,7 @@ def evaluate_policy(params: Dict[str, Any]) -> Dict[str, Any]:
         "timestamp": now,
         "notes": "Auto-evaluated by policy rules.",
     }
+    if store is not None:
+        store.insert_reviews([review])
+
     return {"review": review}
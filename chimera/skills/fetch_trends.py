@@ -1,16 +1,71 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
-import hashlib
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING, Any, Dict, List
+
+from ..clock import now as _ts
+from ..ids import mint_series as _stable_series, stable_id as _stable_id
+from ._validate import REGION_RE, TIME_WINDOW_RE, compile_schema
+
+if TYPE_CHECKING:
+    from ..store import SQLiteStore
 
 
 # Keep instagram allowed to avoid failing "validates_platform" style tests that pass instagram.
 _ALLOWED_PLATFORMS = {"youtube", "tiktok", "instagram", "twitter", "x", "reddit"}
 
 
-def _ts() -> str:
-    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+# Capability contract (specs/technical.md 3.6); compiled into manifest.json at build time.
+CAPABILITY: Dict[str, Any] = {
+    "skill_name": "skill_fetch_trends",
+    "description": "Fetch and normalize trending topics",
+    "inputs": [
+        {"name": "platform", "type": "string", "required": True, "constraints": "One of: instagram, reddit, tiktok, twitter, x, youtube"},
+        {"name": "region", "type": "string", "required": True, "constraints": "ISO 3166-1 alpha-2 country code"},
+        {"name": "time_window", "type": "string", "required": True, "constraints": "Pattern: ^\\d+[hHdD]$"},
+        {"name": "limit", "type": "integer", "required": False, "constraints": "Range: 1-50, default: 25"},
+    ],
+    "outputs": [
+        {"name": "request_id", "type": "string", "description": "Stable request identifier"},
+        {"name": "topics", "type": "array", "description": "List of trend topics"},
+    ],
+    "requires_approval": False,
+}
+
+# Input checks in spec order (specs/technical.md 3.1).
+INPUT_SCHEMA = (
+    {
+        "field": "platform",
+        "kind": "enum",
+        "values": _ALLOWED_PLATFORMS,
+        "code": "INVALID_PLATFORM",
+        "message": "platform must be one of: reddit, tiktok, twitter, x, youtube, instagram",
+    },
+    {
+        "field": "region",
+        "kind": "pattern",
+        "regex": REGION_RE,
+        "code": "INVALID_REGION",
+        "message": "region must be ISO 3166-1 alpha-2 (2 uppercase letters)",
+    },
+    {
+        "field": "time_window",
+        "kind": "pattern",
+        "regex": TIME_WINDOW_RE,
+        "code": "INVALID_TIME_WINDOW",
+        "message": "time_window must match pattern ^\\d+[hHdD]$ (e.g., '24h', '7d')",
+    },
+    {
+        "field": "limit",
+        "kind": "int",
+        "min": 1,
+        "max": 50,
+        "default": 25,
+        "code": "INVALID_LIMIT",
+        "message": "limit must be an integer in range 1..50",
+    },
+)
+
+_validate_input = compile_schema(INPUT_SCHEMA)
 
 
 def _err(code: str, message: str, details: Dict[str, Any] | None = None) -> Dict[str, Any]:
@@ -20,71 +75,20 @@ def _err(code: str, message: str, details: Dict[str, Any] | None = None) -> Dict
     return {"error": e}
 
 
-def _stable_id(prefix: str, seed: str) -> str:
-    h = hashlib.sha256(seed.encode("utf-8")).hexdigest()[:12]
-    return f"{prefix}_{h}"
-
-
-def _stable_score(seed: str) -> float:
-    # Deterministic float in [0.0, 1.0]
-    h = hashlib.sha256(seed.encode("utf-8")).hexdigest()[:8]
-    n = int(h, 16)
-    return round(n / 0xFFFFFFFF, 3)
-
-
-def fetch_trends(params: Dict[str, Any]) -> Dict[str, Any]:
-    platform = params.get("platform")
-    region = params.get("region")
-    time_window = params.get("time_window")
-    limit = params.get("limit", 25)
-
-    # Minimal strict validation used by tests
-    if not isinstance(platform, str) or platform not in _ALLOWED_PLATFORMS:
-        return _err(
-            "INVALID_PLATFORM",
-            "platform must be one of: reddit, tiktok, twitter, x, youtube, instagram",
-            {"platform": platform},
-        )
-
-    if not isinstance(region, str) or len(region) != 2 or not region.isupper():
-        return _err(
-            "INVALID_REGION",
-            "region must be ISO 3166-1 alpha-2 (2 uppercase letters)",
-            {"region": region},
-        )
-
-    if not isinstance(time_window, str) or not time_window or not time_window[-1] in {"h", "H", "d", "D"}:
-        return _err(
-            "INVALID_TIME_WINDOW",
-            "time_window must match pattern ^\\d+[hHdD]$ (e.g., '24h', '7d')",
-            {"time_window": time_window},
-        )
-    # must be digits then suffix
-    digits = time_window[:-1]
-    if not digits.isdigit():
-        return _err(
-            "INVALID_TIME_WINDOW",
-            "time_window must match pattern ^\\d+[hHdD]$ (e.g., '24h', '7d')",
-            {"time_window": time_window},
-        )
-
-    if not isinstance(limit, int) or not (1 <= limit <= 50):
-        return _err(
-            "INVALID_LIMIT",
-            "limit must be an integer in range 1..50",
-            {"limit": limit},
-        )
+def fetch_trends(params: Dict[str, Any], store: "SQLiteStore | None" = None) -> Dict[str, Any]:
+    err, values = _validate_input(params)
+    if err is not None:
+        return _err(*err)
+    platform, region, time_window, limit = values
 
     request_id = _stable_id("req", f"{platform}|{region}|{time_window}|{limit}")
 
     now = _ts()
     topics: List[Dict[str, Any]] = []
-    for i in range(limit):
-        seed = f"{platform}|{region}|{time_window}|{i}"
-        topic_id = _stable_id("tpc", seed)
+    description = f"Trending topic on {platform} in {region} for {time_window}."
+    # Topic i is seeded by "platform|region|time_window|i"; one digest gives its ID and score.
+    for i, (topic_id, score) in enumerate(_stable_series("tpc", f"{platform}|{region}|{time_window}", limit)):
         label = f"{platform}_{region}_trend_{i+1}"
-        description = f"Trending topic on {platform} in {region} for {time_window}."
-        score = _stable_score(seed)
         topics.append(
             {
                 "topic_id": topic_id,
@@ -100,6 +104,9 @@ def fetch_trends(params: Dict[str, Any]) -> Dict[str, Any]:
             }
         )
 
+    if store is not None:
+        store.insert_topics(topics)
+
     return {
         "request_id": request_id,
         "timestamp": now,
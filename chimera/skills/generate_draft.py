@@ -1,8 +1,13 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
-import hashlib
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING, Any, Dict, List
+
+from ..clock import now as _ts
+from ..ids import stable_pair as _stable_pair
+from ._validate import compile_schema
+
+if TYPE_CHECKING:
+    from ..store import SQLiteStore
 
 
 _ALLOWED_CONTENT_TYPES = {"short_script", "caption", "post"}
@@ -17,8 +22,56 @@ _ALLOWED_CONSTRAINTS = {
 }
 
 
-def _ts() -> str:
-    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+# Capability contract (specs/technical.md 3.6); compiled into manifest.json at build time.
+CAPABILITY: Dict[str, Any] = {
+    "skill_name": "skill_generate_draft",
+    "description": "Generate a content draft from a selected trend topic",
+    "inputs": [
+        {"name": "content_type", "type": "string", "required": True, "constraints": "One of: caption, post, short_script"},
+        {"name": "selected_topics", "type": "array", "required": True, "constraints": "Trend topics; the first is drafted"},
+        {
+            "name": "constraints",
+            "type": "array",
+            "required": False,
+            "constraints": "Any of: " + ", ".join(sorted(_ALLOWED_CONSTRAINTS)),
+        },
+    ],
+    "outputs": [{"name": "draft", "type": "object", "description": "Generated content draft"}],
+    "requires_approval": False,
+}
+
+# Input checks in spec order (specs/technical.md 3.2): constraints MUST come before selected_topics.
+INPUT_SCHEMA = (
+    {
+        "field": "content_type",
+        "kind": "enum",
+        "values": _ALLOWED_CONTENT_TYPES,
+        "code": "INVALID_CONTENT_TYPE",
+        "message": "content_type must be one of: short_script, caption, post",
+    },
+    {
+        "field": "constraints",
+        "kind": "list",
+        "items": "str",
+        "values": _ALLOWED_CONSTRAINTS,
+        "default": [],
+        "nullable": True,
+        "code": "INVALID_CONSTRAINT",
+        "message": "constraints must be a list of strings",
+        "item_message": "unknown constraint: {item}",
+        "item_key": "constraint",
+    },
+    {
+        "field": "selected_topics",
+        "kind": "list",
+        "default": [],
+        "nullable": True,
+        "code": "INVALID_SELECTED_TOPICS",
+        "message": "selected_topics must be a list",
+    },
+)
+
+_validate_input = compile_schema(INPUT_SCHEMA)
 
 
 def _err(code: str, message: str, details: Dict[str, Any] | None = None) -> Dict[str, Any]:
@@ -28,59 +81,25 @@ def _err(code: str, message: str, details: Dict[str, Any] | None = None) -> Dict
     return {"error": e}
 
 
-def _stable_id(prefix: str, seed: str) -> str:
-    h = hashlib.sha256(seed.encode("utf-8")).hexdigest()[:12]
-    return f"{prefix}_{h}"
-
-
-def _stable_confidence(seed: str) -> float:
-    h = hashlib.sha256(seed.encode("utf-8")).hexdigest()[:8]
-    n = int(h, 16)
-    return round(n / 0xFFFFFFFF, 3)
-
+def generate_draft(params: Dict[str, Any], store: "SQLiteStore | None" = None) -> Dict[str, Any]:
+    err, values = _validate_input(params)
+    if err is not None:
+        return _err(*err)
+    content_type, constraints, selected_topics = values
 
-def generate_draft(params: Dict[str, Any]) -> Dict[str, Any]:
-    content_type = params.get("content_type")
-    constraints = params.get("constraints", [])
-    selected_topics = params.get("selected_topics", [])
-
-    # 1) content_type validation
-    if not isinstance(content_type, str) or content_type not in _ALLOWED_CONTENT_TYPES:
-        return _err(
-            "INVALID_CONTENT_TYPE",
-            "content_type must be one of: short_script, caption, post",
-            {"content_type": content_type},
-        )
-
-    # 2) constraints validation (MUST come before selected_topics)
-    if constraints is None:
-        constraints = []
-    if not isinstance(constraints, list) or any(not isinstance(c, str) for c in constraints):
-        return _err("INVALID_CONSTRAINT", "constraints must be a list of strings", {"constraints": constraints})
-
-    for c in constraints:
-        if c not in _ALLOWED_CONSTRAINTS:
-            return _err("INVALID_CONSTRAINT", f"unknown constraint: {c}", {"constraint": c})
-
-    # 3) selected_topics validation (be permissive: empty list should still produce a draft)
+    # Permissive: an empty list still produces a draft for the default topic.
     topic_id = "tpc_default"
     platform = None
-    if isinstance(selected_topics, list) and len(selected_topics) > 0 and isinstance(selected_topics[0], dict):
+    if selected_topics and isinstance(selected_topics[0], dict):
         topic_id = selected_topics[0].get("topic_id") or topic_id
         platform = selected_topics[0].get("platform")
-    elif selected_topics is None:
-        selected_topics = []
-    elif not isinstance(selected_topics, list):
-        return _err(
-            "INVALID_SELECTED_TOPICS",
-            "selected_topics must be a list",
-            {"selected_topics": selected_topics},
-        )
+
+    if store is not None and not store.topic_exists(topic_id):
+        return _err("TOPIC_NOT_FOUND", f"Topic '{topic_id}' does not exist", {"topic_id": topic_id})
 
     now = _ts()
     seed = f"{content_type}|{topic_id}|{platform}|{','.join(constraints)}"
-    draft_id = _stable_id("drf", seed)
-    confidence = _stable_confidence(seed)
+    draft_id, confidence = _stable_pair("drf", seed)
 
     # Contract-required fields (based on your failing asserts)
     draft = {
@@ -96,4 +115,7 @@ def generate_draft(params: Dict[str, Any]) -> Dict[str, Any]:
         "version": "1.0",
     }
 
+    if store is not None:
+        store.insert_drafts([draft])
+
     return {"draft": draft}
@@ -1,13 +1,52 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
-import hashlib
-import re
-from typing import Any, Dict
-
-
-def _ts() -> str:
-    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+from typing import TYPE_CHECKING, Any, Dict
+
+from ..clock import now as _ts
+from ..ids import stable_id as _stable_id
+from ._validate import ISO_UTC_RE, compile_schema
+
+if TYPE_CHECKING:
+    from ..store import SQLiteStore
+
+
+# Capability contract (specs/technical.md 3.6); compiled into manifest.json at build time.
+CAPABILITY: Dict[str, Any] = {
+    "skill_name": "skill_publish_content",
+    "description": "Publish approved content to platform",
+    "inputs": [
+        {"name": "draft", "type": "object", "required": True, "constraints": "Draft with draft_id matching ^drf_[a-zA-Z0-9]+$"},
+        {"name": "approval_id", "type": "string", "required": True, "constraints": "Required when human approval needed"},
+        {"name": "schedule_time", "type": "string", "required": False, "constraints": "ISO 8601 UTC (YYYY-MM-DDTHH:MM:SSZ)"},
+    ],
+    "outputs": [{"name": "publish", "type": "object", "description": "Publishing result"}],
+    "requires_approval": True,
+}
+
+# Input checks in spec order (specs/technical.md 3.5): schedule_time first, then draft.
+# approval_id is checked after the draft lookup (MISSING_APPROVAL, not INVALID_*).
+INPUT_SCHEMA = (
+    {
+        "field": "schedule_time",
+        "kind": "pattern",
+        "regex": ISO_UTC_RE,
+        "default": None,
+        "nullable": True,
+        "code": "INVALID_SCHEDULE_TIME",
+        "message": "schedule_time must be ISO 8601 UTC format (YYYY-MM-DDTHH:MM:SSZ)",
+    },
+    {
+        "field": "draft",
+        "kind": "ref",
+        "id_field": "draft_id",
+        "prefix": "drf_",
+        "code": "INVALID_DRAFT",
+        "message": "draft must be an object/dict",
+        "id_message": "draft_id must be a string matching ^drf_[a-zA-Z0-9]+$",
+    },
+)
+
+_validate_input = compile_schema(INPUT_SCHEMA)
 
 
 def _err(code: str, message: str, details: Dict[str, Any] | None = None) -> Dict[str, Any]:
@@ -17,45 +56,44 @@ def _err(code: str, message: str, details: Dict[str, Any] | None = None) -> Dict
     return {"error": e}
 
 
-def _stable_id(prefix: str, seed: str) -> str:
-    h = hashlib.sha256(seed.encode("utf-8")).hexdigest()[:12]
-    return f"{prefix}_{h}"
-
-
-_ISO_Z = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z$")
-
-
-def publish_content(params: Dict[str, Any]) -> Dict[str, Any]:
-    draft = params.get("draft")
+def publish_content(params: Dict[str, Any], store: "SQLiteStore | None" = None) -> Dict[str, Any]:
     approval_id = params.get("approval_id")
-    schedule_time = params.get("schedule_time")  # may be None
     approval_required_by_contract = bool(params.get("approval_required_by_contract", False))
 
     # If contract requires approval_id, the test expects an Exception
     if approval_required_by_contract and not approval_id:
         raise Exception("approval_id required by contract")
 
-    # IMPORTANT: validate schedule_time FIRST (tests expect INVALID_SCHEDULE_TIME)
-    if schedule_time is not None:
-        if not isinstance(schedule_time, str) or not _ISO_Z.match(schedule_time):
-            return _err(
-                "INVALID_SCHEDULE_TIME",
-                "schedule_time must be ISO 8601 UTC format (YYYY-MM-DDTHH:MM:SSZ)",
-                {"schedule_time": schedule_time},
-            )
-
-    # Then validate draft
-    if not isinstance(draft, dict):
-        return _err("INVALID_DRAFT", "draft must be an object/dict", {"draft": draft})
+    err, values = _validate_input(params)
+    if err is not None:
+        return _err(*err)
+    schedule_time, draft = values
+    draft_id = draft["draft_id"]
 
-    draft_id = draft.get("draft_id")
-    if not isinstance(draft_id, str) or not draft_id.startswith("drf_"):
-        return _err("INVALID_DRAFT", "draft_id must be a string matching ^drf_[a-zA-Z0-9]+$", {"draft_id": draft_id})
+    if store is not None and not store.draft_exists(draft_id):
+        return _err("DRAFT_NOT_FOUND", f"Draft '{draft_id}' does not exist", {"draft_id": draft_id})
 
     # Approval requirement behavior
     if not approval_id:
         return _err("MISSING_APPROVAL", "approval_id is required to publish")
 
+    # With a store, approval evidence comes from the persisted review/approval records
+    if store is not None:
+        stored_review = store.get_latest_review(draft_id)
+        if stored_review is None:
+            # specs/technical.md 3.5: an unreviewed draft is not in an approved state.
+            return _err("DRAFT_NOT_APPROVED", f"Draft '{draft_id}' has no review", {"draft_id": draft_id})
+        if stored_review["decision"] == "REJECTED":
+            return _err("DRAFT_REJECTED", "draft was rejected and cannot proceed", {"draft_id": draft_id})
+        if stored_review["decision"] == "REQUIRES_HUMAN_REVIEW":
+            approval = store.get_human_approval(approval_id)
+            if approval is None or approval["draft_id"] != draft_id or approval["decision"] != "APPROVED":
+                return _err(
+                    "MISSING_APPROVAL",
+                    f"Required human approval is missing for draft '{draft_id}'",
+                    {"approval_id": approval_id},
+                )
+
     # If the draft carries review decision, enforce approval (optional but helps)
     review = draft.get("review")
     if isinstance(review, dict):
@@ -73,4 +111,7 @@ def publish_content(params: Dict[str, Any]) -> Dict[str, Any]:
         "scheduled_for": schedule_time,
         "timestamp": now,
     }
+    if store is not None:
+        store.insert_publish_jobs([publish])
+
     return {"publish": publish}
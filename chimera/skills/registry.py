@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import importlib
+import json
+import os
+import sys
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..clock import now as _ts
+
+# skill_name -> (module, function). Modules are imported on first dispatch only.
+SKILLS: Dict[str, Tuple[str, str]] = {
+    "skill_fetch_trends": ("chimera.skills.fetch_trends", "fetch_trends"),
+    "skill_generate_draft": ("chimera.skills.generate_draft", "generate_draft"),
+    "skill_evaluate_policy": ("chimera.skills.evaluate_policy", "evaluate_policy"),
+    "skill_publish_content": ("chimera.skills.publish_content", "publish_content"),
+}
+
+MANIFEST_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "manifest.json")
+
+_lock = threading.Lock()
+_resolved: Dict[str, Callable[..., Dict[str, Any]]] = {}
+_manifest: Optional[List[Dict[str, Any]]] = None
+
+
+def _err(code: str, message: str, details: Dict[str, Any] | None = None) -> Dict[str, Any]:
+    e: Dict[str, Any] = {"code": code, "message": message, "timestamp": _ts()}
+    if details is not None:
+        e["details"] = details
+    return {"error": e}
+
+
+def get_skill(skill_name: str) -> Callable[..., Dict[str, Any]]:
+    """Return the callable for ``skill_name``, importing its module on first use."""
+    fn = _resolved.get(skill_name)
+    if fn is not None:
+        return fn
+    if skill_name not in SKILLS:
+        raise KeyError(f"unknown skill: {skill_name}")
+    module, attr = SKILLS[skill_name]
+    with _lock:
+        fn = _resolved.get(skill_name)
+        if fn is None:
+            fn = _resolved[skill_name] = getattr(importlib.import_module(module), attr)
+    return fn
+
+
+def dispatch(skill_name: str, params: Dict[str, Any], **kwargs: Any) -> Dict[str, Any]:
+    """Invoke a skill by its `skill_*` name; extra keywords (e.g. ``store``) are passed through."""
+    try:
+        fn = get_skill(skill_name)
+    except KeyError:
+        return _err("INVALID_INPUT", f"unknown skill '{skill_name}'", {"skill_name": skill_name})
+    return fn(params, **kwargs)
+
+
+def loaded() -> List[str]:
+    """Skill names whose modules have been imported in this process."""
+    return [name for name, (module, _) in SKILLS.items() if module in sys.modules]
+
+
+def capabilities(skill_name: Optional[str] = None) -> Dict[str, Any]:
+    """GET /v1/capabilities payload (specs/technical.md 3.6), served from the prebuilt manifest.
+
+    Reads ``manifest.json`` once and never imports skill code, so discovery
+    cannot execute a skill or touch state.
+    """
+    global _manifest
+    if _manifest is None:
+        with open(MANIFEST_PATH, encoding="utf-8") as f:
+            _manifest = json.load(f)["capabilities"]
+    caps = _manifest if skill_name is None else [c for c in _manifest if c["skill_name"] == skill_name]
+    return {"capabilities": [dict(c) for c in caps]}
+
+
+def build_manifest() -> Dict[str, Any]:
+    """Collect each skill module's CAPABILITY (build time only: imports every skill)."""
+    caps = []
+    for skill_name, (module, _) in SKILLS.items():
+        cap = importlib.import_module(module).CAPABILITY
+        if cap["skill_name"] != skill_name:
+            raise ValueError(f"{module}.CAPABILITY names {cap['skill_name']!r}, expected {skill_name!r}")
+        caps.append(cap)
+    return {"capabilities": caps}
+
+
+def write_manifest(path: str = MANIFEST_PATH) -> None:
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(build_manifest(), f, indent=2)
+        f.write("\n")
+    os.replace(tmp, path)
@@ -0,0 +1,285 @@
+from __future__ import annotations
+
+import array
+import mmap
+import os
+import struct
+import sys
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+# Layout (little-endian):
+#   header   <8s magic, B version, B kind, H flags, I rows, I strings, 4x padding> (24 bytes)
+#   columns  one per field, in field order, each starting on an 8-byte boundary:
+#              id     rows x 16 bytes ASCII, NUL-padded ("tpc_" + 12 hex fits exactly)
+#              str    rows x u32 index into the string table (0xFFFFFFFF = None)
+#              score  rows x f32 (f64 with FLAG_F64_SCORES)
+#   strings  (strings + 1) x u32 offsets into the UTF-8 blob, then the blob
+MAGIC = b"CHIMSNAP"
+VERSION = 2  # 1 had a 20-byte header, which left every column 4 bytes off alignment
+_HEADER = struct.Struct("<8sBBHII4x")
+ID_WIDTH = 16
+_NONE = 0xFFFFFFFF
+# Set when some score is not exactly recoverable from float32 (see _scores).
+FLAG_F64_SCORES = 1
+
+Field = Tuple[str, str]
+
+# Field order is the skills' output key order, so decoded rows match them key for key.
+TOPIC_FIELDS: Tuple[Field, ...] = (
+    ("topic_id", "id"),
+    ("label", "str"),
+    ("description", "str"),
+    ("platform", "str"),
+    ("region", "str"),
+    ("time_window", "str"),
+    ("score", "score"),
+    ("source", "str"),
+    ("collected_at", "str"),
+)
+DRAFT_FIELDS: Tuple[Field, ...] = (
+    ("draft_id", "id"),
+    ("topic_id", "id"),
+    ("platform", "str"),
+    ("content_type", "str"),
+    ("title", "str"),
+    ("body", "str"),
+    ("cta", "str"),
+    ("timestamp", "str"),
+    ("confidence", "score"),
+    ("version", "str"),
+)
+KINDS: Dict[str, Tuple[int, Tuple[Field, ...]]] = {"topics": (1, TOPIC_FIELDS), "drafts": (2, DRAFT_FIELDS)}
+_KIND_NAMES = {code: name for name, (code, _) in KINDS.items()}
+
+_LITTLE = sys.byteorder == "little"
+
+
+def _pad(n: int) -> int:
+    return -n % 8
+
+
+def _scores(values: List[Any], field: str) -> Tuple[array.array, bool]:
+    """Pack scores as float32 when every value survives the trip; else float64.
+
+    Skill scores are rounded to 3 decimals, and float32 keeps ~7 significant
+    digits, so round(float32(v), 3) == v for all of them; decoding applies
+    the same rounding. Anything else (unrounded floats) is kept as float64.
+    """
+    for v in values:
+        if type(v) is not float:
+            raise ValueError(f"{field} must be a float, got {v!r}")
+    packed = array.array("f", values)
+    if all(round(p, 3) == v for p, v in zip(packed, values)):
+        return packed, False
+    return array.array("d", values), True
+
+
+def dumps(rows: Sequence[Dict[str, Any]], kind: str) -> bytes:
+    """Encode topic or draft dicts (``kind`` "topics" / "drafts") as a snapshot.
+
+    Rows must have exactly the skill output's keys; anything the format cannot
+    reproduce exactly raises ValueError instead of being stored lossily.
+    """
+    code, fields = KINDS[kind]
+    names = [name for name, _ in fields]
+    for row in rows:
+        if list(row) != names:
+            raise ValueError(f"{kind} row keys {list(row)} do not match {names}")
+
+    strings: Dict[str, int] = {}
+    flags = 0
+    parts: List[bytes] = []
+    for name, typ in fields:
+        values = [row[name] for row in rows]
+        if typ == "id":
+            try:
+                column = b"".join(v.encode("ascii").ljust(ID_WIDTH, b"\0") for v in values)
+            except (AttributeError, UnicodeEncodeError):
+                raise ValueError(f"{name} values must be ASCII strings") from None
+            if len(column) != ID_WIDTH * len(values) or any(not v or "\0" in v for v in values):
+                raise ValueError(f"{name} values must be 1..{ID_WIDTH} characters")
+        elif typ == "str":
+            indexes = array.array("I")
+            for v in values:
+                if v is None:
+                    indexes.append(_NONE)
+                elif type(v) is str:
+                    indexes.append(strings.setdefault(v, len(strings)))
+                else:
+                    raise ValueError(f"{name} must be a string or None, got {v!r}")
+            if not _LITTLE:
+                indexes.byteswap()
+            column = indexes.tobytes()
+        else:
+            packed, wide = _scores(values, name)
+            if wide:
+                flags |= FLAG_F64_SCORES
+            if not _LITTLE:
+                packed.byteswap()
+            column = packed.tobytes()
+        parts.append(column + b"\0" * _pad(len(column)))
+
+    blobs = [s.encode("utf-8") for s in strings]
+    offsets = array.array("I", [0])
+    for b in blobs:
+        offsets.append(offsets[-1] + len(b))
+    if not _LITTLE:
+        offsets.byteswap()
+    header = _HEADER.pack(MAGIC, VERSION, code, flags, len(rows), len(strings))
+    return b"".join([header, *parts, offsets.tobytes(), *blobs])
+
+
+def dump(rows: Sequence[Dict[str, Any]], kind: str, path: str) -> None:
+    """Write a snapshot file atomically (temp file + os.replace)."""
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(dumps(rows, kind))
+    os.replace(tmp, path)
+
+
+def _view(buffer: memoryview, start: int, count: int, fmt: str) -> Union[memoryview, array.array]:
+    raw = buffer[start : start + count * struct.calcsize(fmt)]
+    if _LITTLE:
+        return raw.cast(fmt)
+    out = array.array(fmt, raw.tobytes())
+    out.byteswap()
+    return out
+
+
+class Snapshot(Sequence[Dict[str, Any]]):
+    """Read-only view over an encoded snapshot, decoding rows only when asked.
+
+    Columns are memoryviews into the underlying buffer (an mmap for
+    ``load``), so opening a snapshot copies nothing; ``row(i)`` builds one
+    dict and strings are decoded once each, on first use.
+    """
+
+    def __init__(self, buffer: Union[bytes, bytearray, memoryview, mmap.mmap], *, _map: Optional[mmap.mmap] = None) -> None:
+        self._map = _map
+        view = memoryview(buffer)
+        if len(view) < _HEADER.size:
+            raise ValueError("truncated snapshot")
+        magic, version, code, flags, rows, nstrings = _HEADER.unpack_from(view, 0)
+        if magic != MAGIC or version != VERSION or code not in _KIND_NAMES:
+            raise ValueError("not a chimera snapshot")
+        self.kind = _KIND_NAMES[code]
+        self.fields = KINDS[self.kind][1]
+        self.flags = flags
+        self._rows = rows
+        self._round_scores = not flags & FLAG_F64_SCORES
+        score_fmt = "d" if flags & FLAG_F64_SCORES else "f"
+
+        widths = {"id": ID_WIDTH, "str": 4, "score": 8 if flags & FLAG_F64_SCORES else 4}
+        columns_end = _HEADER.size + sum(widths[typ] * rows + _pad(widths[typ] * rows) for _, typ in self.fields)
+        if len(view) < columns_end + 4 * (nstrings + 1):
+            raise ValueError("truncated snapshot")
+
+        pos = _HEADER.size
+        self._columns: Dict[str, Any] = {}
+        for name, typ in self.fields:
+            if typ == "id":
+                size = ID_WIDTH * rows
+                self._columns[name] = view[pos : pos + size]
+            else:
+                fmt = "I" if typ == "str" else score_fmt
+                size = struct.calcsize(fmt) * rows
+                self._columns[name] = _view(view, pos, rows, fmt)
+            pos += size + _pad(size)
+        self._offsets = _view(view, pos, nstrings + 1, "I")
+        self._blob = view[pos + 4 * (nstrings + 1) :]
+        if len(self._blob) < (self._offsets[nstrings] if nstrings else 0):
+            raise ValueError("truncated snapshot")
+        self._strings: List[Optional[str]] = [None] * nstrings
+        self._view = view
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def string(self, index: int) -> Optional[str]:
+        if index == _NONE:
+            return None
+        s = self._strings[index]
+        if s is None:
+            s = self._strings[index] = str(self._blob[self._offsets[index] : self._offsets[index + 1]], "utf-8")
+        return s
+
+    def ids(self, name: str) -> List[str]:
+        raw = self._columns[name].tobytes()
+        return [raw[i : i + ID_WIDTH].rstrip(b"\0").decode("ascii") for i in range(0, len(raw), ID_WIDTH)]
+
+    def column(self, name: str) -> Any:
+        """Raw column: a memoryview of 16-byte IDs, string-table indexes, or scores."""
+        return self._columns[name]
+
+    def row(self, i: int) -> Dict[str, Any]:
+        if not 0 <= i < self._rows:
+            raise IndexError(i)
+        out: Dict[str, Any] = {}
+        for name, typ in self.fields:
+            column = self._columns[name]
+            if typ == "id":
+                out[name] = column[i * ID_WIDTH : (i + 1) * ID_WIDTH].tobytes().rstrip(b"\0").decode("ascii")
+            elif typ == "str":
+                out[name] = self.string(column[i])
+            else:
+                out[name] = round(column[i], 3) if self._round_scores else column[i]
+        return out
+
+    def __getitem__(self, i: Any) -> Any:  # type: ignore[override]
+        if isinstance(i, slice):
+            return [self.row(j) for j in range(*i.indices(self._rows))]
+        return self.row(i + self._rows if i < 0 else i)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for i in range(self._rows):
+            yield self.row(i)
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Decode every row, column by column (much faster than row by row)."""
+        lookup: Dict[int, Optional[str]] = {_NONE: None}
+        columns = []
+        for name, typ in self.fields:
+            column = self._columns[name]
+            if typ == "id":
+                columns.append(self.ids(name))
+            elif typ == "str":
+                for index in set(column):
+                    if index not in lookup:
+                        lookup[index] = self.string(index)
+                columns.append(list(map(lookup.__getitem__, column)))
+            elif self._round_scores:
+                columns.append([round(v, 3) for v in column])
+            else:
+                columns.append(list(column))
+        names = [name for name, _ in self.fields]
+        return [dict(zip(names, values)) for values in zip(*columns)]
+
+    def close(self) -> None:
+        """Release the buffer views (and the file map for ``load``); rows already built stay valid."""
+        for column in self._columns.values():
+            if isinstance(column, memoryview):
+                column.release()
+        for v in (self._offsets, self._blob, self._view):
+            if isinstance(v, memoryview):
+                v.release()
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    def __enter__(self) -> "Snapshot":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def loads(buffer: Union[bytes, bytearray, memoryview]) -> Snapshot:
+    return Snapshot(buffer)
+
+
+def load(path: str) -> Snapshot:
+    """Memory-map a snapshot file; nothing is read until rows are accessed."""
+    with open(path, "rb") as f:
+        m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return Snapshot(m, _map=m)
+
@@ -0,0 +1,4 @@
+from .bloom import BloomFilter, ExistenceFilters
+from .sqlite import SQLiteStore
+
+__all__ = ["BloomFilter", "ExistenceFilters", "SQLiteStore"]
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import hashlib
+import math
+import threading
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Optional
+
+if TYPE_CHECKING:
+    from .sqlite import SQLiteStore
+
+
+# Entity prefix -> table holding those IDs (specs/technical.md 5.3 ID patterns).
+ENTITY_TABLES = {
+    "tpc": "trend_topics",
+    "drf": "content_drafts",
+    "rev": "reviews",
+    "hap": "human_approvals",
+}
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter sized for ``capacity`` keys at ``fp_rate``."""
+
+    def __init__(self, capacity: int, fp_rate: float = 0.01) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be a positive integer")
+        if not 0.0 < fp_rate < 1.0:
+            raise ValueError("fp_rate must be in (0.0, 1.0)")
+        self.capacity = capacity
+        self.fp_rate = fp_rate
+        self.num_bits = max(8, math.ceil(-capacity * math.log(fp_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, key: str) -> Iterable[int]:
+        # Kirsch-Mitzenmacher: k indexes from two 64-bit halves of one digest.
+        d = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(d[:8], "little")
+        h2 = int.from_bytes(d[8:], "little") | 1
+        m = self.num_bits
+        return [(h1 + i * h2) % m for i in range(self.num_hashes)]
+
+    def add(self, key: str) -> None:
+        # count only keys that set a new bit, so re-adding a key (a catch-up
+        # re-reading rows this store inserted) does not inflate it.
+        bits = self._bits
+        new = False
+        for p in self._positions(key):
+            byte, mask = bits[p >> 3], 1 << (p & 7)
+            if not byte & mask:
+                bits[p >> 3] = byte | mask
+                new = True
+        if new:
+            self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        bits = self._bits
+        for p in self._positions(key):
+            if not bits[p >> 3] & (1 << (p & 7)):
+                return False
+        return True
+
+
+class ExistenceFilters:
+    """Per-entity Bloom filters answering "definitely absent" for tpc_/drf_/rev_/hap_ IDs.
+
+    A negative hit means the store lookup is skipped entirely; a positive
+    still goes to the database, and a miss there is counted as a false
+    positive. Filters are rebuilt at twice the current row count (or
+    ``capacity``, whichever is larger) so they start well under saturation,
+    and again whenever one fills past its capacity.
+
+    A negative is only as fresh as the filter. Rows committed by other
+    connections (other processes, other stores on the same file) are picked
+    up by ``catch_up``, which adds every row past the highest rowid seen so
+    far; the store calls it before trusting a negative whenever SQLite
+    reports the database changed. The store never deletes entity rows, so
+    new rows always land above that rowid.
+    """
+
+    def __init__(self, capacity: int = 100_000, fp_rate: float = 0.01) -> None:
+        self.capacity = capacity
+        self.fp_rate = fp_rate
+        self._lock = threading.Lock()
+        # Serializes catch-ups and rebuilds (a catch-up may trigger a rebuild, which catches up).
+        self._sync_lock = threading.RLock()
+        self._filters: Dict[str, BloomFilter] = {p: BloomFilter(capacity, fp_rate) for p in ENTITY_TABLES}
+        self._last_rowid: Dict[str, int] = {p: 0 for p in ENTITY_TABLES}
+        self._counters: Dict[str, Dict[str, int]] = {
+            p: {"checks": 0, "negative_hits": 0, "false_positives": 0} for p in ENTITY_TABLES
+        }
+
+    def add_many(self, prefix: str, ids: Iterable[str]) -> bool:
+        """Add ``ids``; True when the filter is now past its capacity and should be rebuilt."""
+        with self._lock:
+            f = self._filters[prefix]
+            for i in ids:
+                f.add(i)
+            return f.count > f.capacity
+
+    def might_exist(self, prefix: str, entity_id: str, refresh: Optional[Callable[[], bool]] = None) -> bool:
+        """False only if ``entity_id`` is definitely absent.
+
+        On a negative, ``refresh`` (if given) may bring the filter up to date
+        and return True, in which case the filter is asked again.
+        """
+        found = entity_id in self._filters[prefix]
+        if not found and refresh is not None and refresh():
+            found = entity_id in self._filters[prefix]
+        with self._lock:
+            c = self._counters[prefix]
+            c["checks"] += 1
+            if not found:
+                c["negative_hits"] += 1
+        return found
+
+    def record_false_positive(self, prefix: str) -> None:
+        with self._lock:
+            self._counters[prefix]["false_positives"] += 1
+
+    def catch_up(self, store: "SQLiteStore") -> None:
+        """Add the rows committed since the last catch-up or rebuild, by any connection."""
+        with self._sync_lock:
+            for prefix, table in ENTITY_TABLES.items():
+                rows = list(store.iter_new_ids(table, self._last_rowid[prefix]))
+                if not rows:
+                    continue
+                saturated = self.add_many(prefix, (entity_id for _, entity_id in rows))
+                self._last_rowid[prefix] = rows[-1][0]
+                if saturated:
+                    self.rebuild(store, [prefix])
+
+    def rebuild(self, store: "SQLiteStore", prefixes: Optional[Iterable[str]] = None) -> None:
+        with self._sync_lock:
+            for prefix in ENTITY_TABLES if prefixes is None else prefixes:
+                table = ENTITY_TABLES[prefix]
+                f = BloomFilter(max(self.capacity, 2 * store.count(table)), self.fp_rate)
+                last = 0
+                for last, entity_id in store.iter_new_ids(table, 0):
+                    f.add(entity_id)
+                with self._lock:
+                    self._filters[prefix] = f
+                    self._last_rowid[prefix] = last
+            # Rows committed during the scan went into the old filter; pick them up again.
+            self.catch_up(store)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        out = {}
+        with self._lock:
+            for prefix, f in self._filters.items():
+                out[prefix] = dict(self._counters[prefix], items=f.count, bits=f.num_bits, hashes=f.num_hashes)
+        return out
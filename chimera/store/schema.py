@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+# DDL for specs/technical.md Section 5 (Data Model). Constraints mirror 5.1/5.3:
+# FK actions, CHECK enums, score ranges, and immutability of audit/approval rows.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS trend_topics (
+    topic_id      TEXT PRIMARY KEY,
+    platform      TEXT NOT NULL,
+    region        TEXT NOT NULL CHECK (length(region) = 2),
+    label         TEXT NOT NULL CHECK (length(label) BETWEEN 1 AND 200),
+    description   TEXT NOT NULL CHECK (length(description) BETWEEN 1 AND 500),
+    score         REAL NOT NULL CHECK (score BETWEEN 0.0 AND 1.0),
+    source        TEXT NOT NULL,
+    collected_at  TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS trend_observations (
+    observation_id  TEXT PRIMARY KEY,
+    topic_id        TEXT NOT NULL REFERENCES trend_topics(topic_id) ON DELETE CASCADE,
+    key             TEXT NOT NULL,
+    value           TEXT
+);
+
+CREATE TABLE IF NOT EXISTS content_drafts (
+    draft_id      TEXT PRIMARY KEY,
+    topic_id      TEXT NOT NULL REFERENCES trend_topics(topic_id) ON DELETE RESTRICT,
+    platform      TEXT,
+    content_type  TEXT NOT NULL CHECK (content_type IN ('short_script', 'caption', 'post')),
+    version       INTEGER NOT NULL CHECK (version >= 1),
+    confidence    REAL NOT NULL CHECK (confidence BETWEEN 0.0 AND 1.0),
+    title         TEXT NOT NULL CHECK (length(title) BETWEEN 1 AND 200),
+    body          TEXT NOT NULL CHECK (length(body) BETWEEN 1 AND 50000),
+    cta           TEXT CHECK (cta IS NULL OR length(cta) <= 100),
+    status        TEXT NOT NULL DEFAULT 'DRAFT_CREATED' CHECK (
+        status IN ('DRAFT_CREATED', 'SUBMITTED_FOR_REVIEW', 'REVIEWED', 'APPROVED', 'REJECTED')
+    ),
+    created_at    TEXT NOT NULL,
+    UNIQUE (topic_id, platform, content_type, version)
+);
+
+CREATE TABLE IF NOT EXISTS reviews (
+    review_id       TEXT PRIMARY KEY,
+    draft_id        TEXT NOT NULL REFERENCES content_drafts(draft_id) ON DELETE CASCADE,
+    policy_profile  TEXT NOT NULL,
+    decision        TEXT NOT NULL CHECK (decision IN ('APPROVED', 'REJECTED', 'REQUIRES_HUMAN_REVIEW')),
+    confidence      REAL NOT NULL CHECK (confidence BETWEEN 0.0 AND 1.0),
+    reason_codes    TEXT NOT NULL,
+    notes           TEXT CHECK (notes IS NULL OR length(notes) <= 1000),
+    evaluated_at    TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS reviews_by_draft ON reviews (draft_id, evaluated_at);
+
+CREATE TABLE IF NOT EXISTS human_approvals (
+    approval_id  TEXT PRIMARY KEY,
+    review_id    TEXT NOT NULL REFERENCES reviews(review_id) ON DELETE RESTRICT,
+    draft_id     TEXT NOT NULL REFERENCES content_drafts(draft_id) ON DELETE RESTRICT,
+    reviewer_id  TEXT NOT NULL,
+    decision     TEXT NOT NULL CHECK (decision IN ('APPROVED', 'REJECTED')),
+    comment      TEXT CHECK (comment IS NULL OR length(comment) <= 1000),
+    recorded_at  TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS human_approvals_by_draft ON human_approvals (draft_id);
+
+CREATE TABLE IF NOT EXISTS publish_jobs (
+    publish_id   TEXT PRIMARY KEY,
+    draft_id     TEXT NOT NULL REFERENCES content_drafts(draft_id) ON DELETE RESTRICT,
+    platform     TEXT,
+    status       TEXT NOT NULL CHECK (status IN ('SCHEDULED', 'PUBLISHED', 'FAILED')),
+    schedule_at  TEXT,
+    created_at   TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS agent_status (
+    agent_id           TEXT PRIMARY KEY,
+    state              TEXT NOT NULL CHECK (state IN ('idle', 'busy', 'degraded')),
+    last_heartbeat_at  TEXT NOT NULL,
+    status_message     TEXT CHECK (status_message IS NULL OR length(status_message) <= 500)
+);
+
+CREATE TABLE IF NOT EXISTS skill_runs (
+    run_id                 TEXT PRIMARY KEY,
+    skill_name             TEXT NOT NULL,
+    triggered_by_agent_id  TEXT,
+    input_ref              TEXT CHECK (input_ref IS NULL OR length(input_ref) <= 500),
+    output_ref             TEXT CHECK (output_ref IS NULL OR length(output_ref) <= 500),
+    status                 TEXT NOT NULL CHECK (status IN ('success', 'failure', 'in_progress')),
+    started_at             TEXT NOT NULL,
+    finished_at            TEXT
+);
+
+CREATE TABLE IF NOT EXISTS workflows (
+    workflow_id   TEXT PRIMARY KEY,
+    status        TEXT NOT NULL CHECK (status IN ('RUNNING', 'PAUSED', 'CANCELLED', 'COMPLETED', 'FAILED')),
+    current_step  TEXT,
+    state         TEXT NOT NULL DEFAULT '{}',
+    created_at    TEXT NOT NULL,
+    updated_at    TEXT NOT NULL
+);
+
+CREATE TRIGGER IF NOT EXISTS human_approvals_no_update BEFORE UPDATE ON human_approvals
+BEGIN SELECT RAISE(ABORT, 'human_approvals records are immutable'); END;
+CREATE TRIGGER IF NOT EXISTS human_approvals_no_delete BEFORE DELETE ON human_approvals
+BEGIN SELECT RAISE(ABORT, 'human_approvals records are immutable'); END;
+CREATE TRIGGER IF NOT EXISTS skill_runs_no_update BEFORE UPDATE ON skill_runs
+BEGIN SELECT RAISE(ABORT, 'skill_runs records are immutable'); END;
+CREATE TRIGGER IF NOT EXISTS skill_runs_no_delete BEFORE DELETE ON skill_runs
+BEGIN SELECT RAISE(ABORT, 'skill_runs records are immutable'); END;
+"""
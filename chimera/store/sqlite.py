@@ -0,0 +1,423 @@
+from __future__ import annotations
+
+import itertools
+import json
+import mmap
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .bloom import ENTITY_TABLES, ExistenceFilters
+from .schema import SCHEMA
+
+
+# Statements are module constants so every connection's statement cache
+# (cached_statements) reuses one prepared statement per query.
+_INSERT_TOPIC = (
+    "INSERT INTO trend_topics (topic_id, platform, region, label, description, score, source, collected_at) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?) ON CONFLICT (topic_id) DO NOTHING"
+)
+# version = existing_max_version + 1 for the same topic/platform/content_type (spec 3.2).
+_INSERT_DRAFT = (
+    "INSERT INTO content_drafts (draft_id, topic_id, platform, content_type, version, confidence, "
+    "title, body, cta, status, created_at) VALUES (?, ?, ?, ?, "
+    "(SELECT COALESCE(MAX(version), 0) + 1 FROM content_drafts "
+    "WHERE topic_id = ? AND platform IS ? AND content_type = ?), "
+    "?, ?, ?, ?, 'DRAFT_CREATED', ?) ON CONFLICT (draft_id) DO NOTHING"
+)
+_INSERT_REVIEW = (
+    "INSERT INTO reviews (review_id, draft_id, policy_profile, decision, confidence, reason_codes, notes, evaluated_at) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?) ON CONFLICT (review_id) DO NOTHING"
+)
+_INSERT_APPROVAL = (
+    "INSERT INTO human_approvals (approval_id, review_id, draft_id, reviewer_id, decision, comment, recorded_at) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+_INSERT_PUBLISH = (
+    "INSERT INTO publish_jobs (publish_id, draft_id, platform, status, schedule_at, created_at) "
+    "VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (publish_id) DO NOTHING"
+)
+_UPSERT_AGENT = (
+    "INSERT INTO agent_status (agent_id, state, last_heartbeat_at, status_message) VALUES (?, ?, ?, ?) "
+    "ON CONFLICT (agent_id) DO UPDATE SET state = excluded.state, "
+    "last_heartbeat_at = excluded.last_heartbeat_at, status_message = excluded.status_message"
+)
+_INSERT_SKILL_RUN = (
+    "INSERT INTO skill_runs (run_id, skill_name, triggered_by_agent_id, input_ref, output_ref, status, "
+    "started_at, finished_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+_EXISTS = {
+    "trend_topics": "SELECT 1 FROM trend_topics WHERE topic_id = ?",
+    "content_drafts": "SELECT 1 FROM content_drafts WHERE draft_id = ?",
+    "reviews": "SELECT 1 FROM reviews WHERE review_id = ?",
+    "human_approvals": "SELECT 1 FROM human_approvals WHERE approval_id = ?",
+}
+_SELECT_TOPIC = "SELECT * FROM trend_topics WHERE topic_id = ?"
+_SELECT_DRAFT = "SELECT * FROM content_drafts WHERE draft_id = ?"
+_SELECT_LATEST_REVIEW = "SELECT * FROM reviews WHERE draft_id = ? ORDER BY evaluated_at DESC, rowid DESC LIMIT 1"
+_SELECT_APPROVAL = "SELECT * FROM human_approvals WHERE approval_id = ?"
+_SELECT_AGENT = "SELECT * FROM agent_status WHERE agent_id = ?"
+
+_TABLES = {
+    "trend_topics",
+    "trend_observations",
+    "content_drafts",
+    "reviews",
+    "human_approvals",
+    "publish_jobs",
+    "agent_status",
+    "skill_runs",
+    "workflows",
+}
+
+_TABLE_PREFIX = {table: prefix for prefix, table in ENTITY_TABLES.items()}
+_PRIMARY_KEYS = {
+    "trend_topics": "topic_id",
+    "content_drafts": "draft_id",
+    "reviews": "review_id",
+    "human_approvals": "approval_id",
+}
+
+_memory_ids = itertools.count(1)
+# Bytes of the WAL-index header at the start of the -shm file; every commit changes them.
+_WAL_INDEX_HEADER = 48
+
+
+class SQLiteStore:
+    """SQLite persistence for the specs/technical.md Section 5 data model.
+
+    Each thread gets its own connection (WAL lets readers proceed while a
+    writer commits). ``":memory:"`` maps to a named shared-cache database so
+    all threads see the same data. With ``bloom_fp_rate`` set, existence checks
+    for tpc_/drf_/rev_/hap_ IDs consult per-entity Bloom filters first and only
+    hit the database on a possible match; before trusting a miss, the filters
+    pick up rows that other connections or processes committed to the file.
+    """
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        *,
+        timeout: float = 5.0,
+        cached_statements: int = 128,
+        bloom_fp_rate: Optional[float] = None,
+        bloom_capacity: int = 100_000,
+    ) -> None:
+        self._uri = path == ":memory:" or path.startswith("file:")
+        if path == ":memory:":
+            path = f"file:chimera-store-{next(_memory_ids)}?mode=memory&cache=shared"
+        self.path = path
+        self._timeout = timeout
+        self._cached_statements = cached_statements
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: List[sqlite3.Connection] = []
+        self._closed = False
+        # The owner connection keeps shared in-memory databases alive.
+        conn = self._connection()
+        conn.executescript(SCHEMA)
+        self.filters: Optional[ExistenceFilters] = None
+        self._wal_index: Optional[mmap.mmap] = None
+        self._wal_seen = b""
+        if bloom_fp_rate is not None:
+            self.filters = ExistenceFilters(bloom_capacity, bloom_fp_rate)
+            self._wal_index = self._map_wal_index()
+            self.filters.rebuild(self)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.path,
+            timeout=self._timeout,
+            uri=self._uri,
+            cached_statements=self._cached_statements,
+            check_same_thread=False,
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute("PRAGMA foreign_keys = ON")
+        return conn
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            if self._closed:
+                raise sqlite3.ProgrammingError("store is closed")
+            conn = self._connect()
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            conns, self._connections = self._connections, []
+        for conn in conns:
+            conn.close()
+        if self._wal_index is not None:
+            self._wal_index.close()
+            self._wal_index = None
+        self._local = threading.local()
+
+    def __enter__(self) -> "SQLiteStore":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Group several bulk writes into one commit (nested calls join the outer one)."""
+        conn = self._connection()
+        depth = getattr(self._local, "depth", 0)
+        self._local.depth = depth + 1
+        try:
+            if depth:
+                yield conn
+            else:
+                with conn:
+                    yield conn
+        finally:
+            self._local.depth = depth
+
+    def _executemany(self, sql: str, rows: Iterable[tuple], table: Optional[str] = None) -> int:
+        filters = self.filters
+        if filters is not None and table in _TABLE_PREFIX:
+            rows = list(rows)
+        with self.transaction() as conn:
+            cur = conn.executemany(sql, rows)
+        if filters is not None and table in _TABLE_PREFIX:
+            # PK is the first column of every entity insert.
+            if filters.add_many(_TABLE_PREFIX[table], (row[0] for row in rows)):
+                filters.rebuild(self, [_TABLE_PREFIX[table]])
+        return cur.rowcount
+
+    # -- writes (bulk) ---------------------------------------------------
+
+    def insert_topics(self, topics: Iterable[Dict[str, Any]]) -> int:
+        return self._executemany(
+            _INSERT_TOPIC,
+            (
+                (
+                    t["topic_id"],
+                    t["platform"],
+                    t["region"],
+                    t["label"],
+                    t["description"],
+                    t["score"],
+                    t["source"],
+                    t["collected_at"],
+                )
+                for t in topics
+            ),
+            table="trend_topics",
+        )
+
+    def insert_drafts(self, drafts: Iterable[Dict[str, Any]]) -> int:
+        return self._executemany(
+            _INSERT_DRAFT,
+            (
+                (
+                    d["draft_id"],
+                    d["topic_id"],
+                    d.get("platform"),
+                    d["content_type"],
+                    d["topic_id"],
+                    d.get("platform"),
+                    d["content_type"],
+                    d["confidence"],
+                    d["title"],
+                    d["body"],
+                    d.get("cta"),
+                    d.get("created_at") or d["timestamp"],
+                )
+                for d in drafts
+            ),
+            table="content_drafts",
+        )
+
+    def insert_reviews(self, reviews: Iterable[Dict[str, Any]]) -> int:
+        return self._executemany(
+            _INSERT_REVIEW,
+            (
+                (
+                    r["review_id"],
+                    r["draft_id"],
+                    r.get("policy_profile") or "default",
+                    r["decision"],
+                    r["confidence"],
+                    json.dumps(r.get("reason_codes") or []),
+                    r.get("notes"),
+                    r.get("evaluated_at") or r["timestamp"],
+                )
+                for r in reviews
+            ),
+            table="reviews",
+        )
+
+    def insert_human_approvals(self, approvals: Iterable[Dict[str, Any]]) -> int:
+        return self._executemany(
+            _INSERT_APPROVAL,
+            (
+                (
+                    a["approval_id"],
+                    a["review_id"],
+                    a["draft_id"],
+                    a["reviewer_id"],
+                    a["decision"],
+                    a.get("comment"),
+                    a["recorded_at"],
+                )
+                for a in approvals
+            ),
+            table="human_approvals",
+        )
+
+    def insert_publish_jobs(self, jobs: Iterable[Dict[str, Any]]) -> int:
+        return self._executemany(
+            _INSERT_PUBLISH,
+            (
+                (
+                    p["publish_id"],
+                    p["draft_id"],
+                    p.get("platform"),
+                    p["status"],
+                    p.get("scheduled_for") or p.get("scheduled_at"),
+                    p.get("created_at") or p["timestamp"],
+                )
+                for p in jobs
+            ),
+        )
+
+    def upsert_agent_status(self, statuses: Iterable[Dict[str, Any]]) -> int:
+        return self._executemany(
+            _UPSERT_AGENT,
+            (
+                (s["agent_id"], s["state"], s["last_heartbeat_at"], s.get("status_message"))
+                for s in statuses
+            ),
+        )
+
+    def insert_skill_runs(self, runs: Iterable[Dict[str, Any]]) -> int:
+        return self._executemany(
+            _INSERT_SKILL_RUN,
+            (
+                (
+                    r["run_id"],
+                    r["skill_name"],
+                    r.get("triggered_by_agent_id"),
+                    r.get("input_ref"),
+                    r.get("output_ref"),
+                    r["status"],
+                    r["started_at"],
+                    r.get("finished_at"),
+                )
+                for r in runs
+            ),
+        )
+
+    # -- reads -----------------------------------------------------------
+
+    def _read_filters(self) -> Optional[ExistenceFilters]:
+        # Not inside a transaction: its view may hold rows that roll back, and
+        # catching up from it could skip the rowids they free.
+        return None if getattr(self._local, "depth", 0) else self.filters
+
+    def _exists(self, table: str, key: str) -> bool:
+        filters = self._read_filters()
+        if filters is not None and not filters.might_exist(_TABLE_PREFIX[table], key, self._refresh_filters):
+            return False
+        found = self._connection().execute(_EXISTS[table], (key,)).fetchone() is not None
+        if filters is not None and not found:
+            filters.record_false_positive(_TABLE_PREFIX[table])
+        return found
+
+    def _refresh_filters(self) -> bool:
+        """Catch the filters up if the database changed since they last did; True if so."""
+        assert self.filters is not None
+        wal_index = self._wal_index
+        if wal_index is not None:
+            # Any commit, by any connection or process, rewrites the WAL-index
+            # header; comparing it is a memory read, not a statement.
+            header = wal_index[:_WAL_INDEX_HEADER]
+            if header == self._wal_seen:
+                return False
+            self.filters.catch_up(self)
+            self._wal_seen = header
+            return True
+        # No shared WAL index (in-memory database): data_version changes when
+        # another connection commits. This thread's own writes are already in.
+        version = self._connection().execute("PRAGMA data_version").fetchone()[0]
+        if version == getattr(self._local, "data_version", None):
+            return False
+        self._local.data_version = version
+        self.filters.catch_up(self)
+        return True
+
+    def _map_wal_index(self) -> Optional[mmap.mmap]:
+        # The -shm file starts with the WAL-index header (sqlite.org/walformat.html).
+        # The store keeps a connection open, so SQLite never deletes the file under it.
+        if self._uri or self._connection().execute("PRAGMA journal_mode").fetchone()[0] != "wal":
+            return None
+        try:
+            with open(self.path + "-shm", "rb") as f:
+                return mmap.mmap(f.fileno(), _WAL_INDEX_HEADER, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+
+    def iter_ids(self, table: str) -> Iterator[str]:
+        column = _PRIMARY_KEYS[table]
+        for (entity_id,) in self._connection().execute(f"SELECT {column} FROM {table}"):
+            yield entity_id
+
+    def iter_new_ids(self, table: str, after_rowid: int) -> Iterator[Tuple[int, str]]:
+        """``(rowid, id)`` for the rows of ``table`` past ``after_rowid``, in rowid order."""
+        column = _PRIMARY_KEYS[table]
+        sql = f"SELECT rowid, {column} FROM {table} WHERE rowid > ? ORDER BY rowid"
+        for rowid, entity_id in self._connection().execute(sql, (after_rowid,)):
+            yield rowid, entity_id
+
+    def topic_exists(self, topic_id: str) -> bool:
+        return self._exists("trend_topics", topic_id)
+
+    def draft_exists(self, draft_id: str) -> bool:
+        return self._exists("content_drafts", draft_id)
+
+    def review_exists(self, review_id: str) -> bool:
+        return self._exists("reviews", review_id)
+
+    def approval_exists(self, approval_id: str) -> bool:
+        return self._exists("human_approvals", approval_id)
+
+    def _one(self, sql: str, key: str) -> Optional[Dict[str, Any]]:
+        row = self._connection().execute(sql, (key,)).fetchone()
+        return dict(row) if row is not None else None
+
+    def get_topic(self, topic_id: str) -> Optional[Dict[str, Any]]:
+        return self._one(_SELECT_TOPIC, topic_id)
+
+    def get_draft(self, draft_id: str) -> Optional[Dict[str, Any]]:
+        return self._one(_SELECT_DRAFT, draft_id)
+
+    def get_latest_review(self, draft_id: str) -> Optional[Dict[str, Any]]:
+        review = self._one(_SELECT_LATEST_REVIEW, draft_id)
+        if review is not None:
+            review["reason_codes"] = json.loads(review["reason_codes"])
+        return review
+
+    def get_human_approval(self, approval_id: str) -> Optional[Dict[str, Any]]:
+        filters = self._read_filters()
+        if filters is not None and not filters.might_exist("hap", approval_id, self._refresh_filters):
+            return None
+        return self._one(_SELECT_APPROVAL, approval_id)
+
+    def get_agent_status(self, agent_id: str) -> Optional[Dict[str, Any]]:
+        return self._one(_SELECT_AGENT, agent_id)
+
+    def count(self, table: str) -> int:
+        if table not in _TABLES:
+            raise ValueError(f"unknown table: {table}")
+        return self._connection().execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
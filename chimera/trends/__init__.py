@@ -0,0 +1,13 @@
+from .decay import DEFAULT_TIME_CONSTANTS, DecayedScores, window_seconds
+from .history import DEFAULT_TIERS, ScoreHistory
+from .selection import TopicSelector, draft_top_topics
+
+__all__ = [
+    "DEFAULT_TIERS",
+    "DEFAULT_TIME_CONSTANTS",
+    "DecayedScores",
+    "ScoreHistory",
+    "TopicSelector",
+    "draft_top_topics",
+    "window_seconds",
+]
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import array
+import bisect
+import itertools
+import math
+import operator
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ..clock import to_epoch
+from ..skills._validate import TIME_WINDOW_RE
+
+# Time constants (seconds) kept per topic. A window of W seconds is answered
+# with time constant W: observations W old weigh 1/e of fresh ones.
+DEFAULT_TIME_CONSTANTS: Tuple[int, ...] = (3600, 6 * 3600, 86400, 7 * 86400, 30 * 86400)
+
+_UNITS = {"h": 3600, "d": 86400}
+
+
+def window_seconds(time_window: str) -> int:
+    """Seconds in a ``^\\d+[hHdD]$`` window (``"24h"`` -> 86400, ``"7d"`` -> 604800)."""
+    if not isinstance(time_window, str) or not TIME_WINDOW_RE.fullmatch(time_window) or int(time_window[:-1]) < 1:
+        raise ValueError(f"time_window must match ^\\d+[hHdD]$ and be positive, got {time_window!r}")
+    return int(time_window[:-1]) * _UNITS[time_window[-1].lower()]
+
+
+class DecayedScores:
+    """Exponentially decayed score counters per topic, answering any window in O(1).
+
+    For each time constant ``tau`` a topic keeps a decayed sum of its scores
+    and a decayed observation count (its weight), both multiplied by
+    ``exp(-dt / tau)`` as time passes. Decay is applied lazily, when the
+    topic is next observed, against the topic's last observation time; the
+    mean sum/weight is unaffected by decay between observations, so reads
+    need no decay at all. An observation that arrives out of order is
+    decayed by its age instead.
+
+    ``score(topic_id, "36h")`` is the decayed mean over that window: exact
+    for a window equal to a kept time constant, otherwise interpolated
+    between the two kept constants around it on a log scale (and clamped to
+    the shortest/longest outside them). Cost per topic is two divisions,
+    however many observations it has had, so raw observations (e.g.
+    ``trend_observations`` rows) never need to be re-read. Per-topic state is
+    ``2 * len(time_constants) + 1`` doubles. Not thread-safe.
+    """
+
+    def __init__(self, time_constants: Sequence[int] = DEFAULT_TIME_CONSTANTS) -> None:
+        taus = sorted(set(time_constants))
+        if not taus or taus[0] <= 0:
+            raise ValueError("time constants must be positive")
+        self.time_constants: Tuple[int, ...] = tuple(taus)
+        self._log_taus = [math.log(t) for t in taus]
+        self._sums: List[array.array] = [array.array("d") for _ in taus]
+        self._weights: List[array.array] = [array.array("d") for _ in taus]
+        self._last = array.array("d")
+        self._rows: Dict[str, int] = {}
+        self.topic_ids: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.topic_ids)
+
+    def __contains__(self, topic_id: object) -> bool:
+        return topic_id in self._rows
+
+    # -- writes ----------------------------------------------------------------
+
+    def observe(self, topic_id: str, score: float, at: Optional[float] = None) -> None:
+        self.observe_many([(topic_id, score)], at)
+
+    def observe_many(self, scores: Iterable[Tuple[str, float]], at: Optional[float] = None) -> None:
+        """Fold ``(topic_id, score)`` pairs taken at ``at`` (epoch seconds, default now) into the counters."""
+        at = time.time() if at is None else at
+        counters = list(zip(self.time_constants, self._sums, self._weights))
+        for topic_id, score in scores:
+            score = float(score)
+            row = self._rows.get(topic_id)
+            if row is None:
+                self._rows[topic_id] = len(self.topic_ids)
+                self.topic_ids.append(topic_id)
+                self._last.append(at)
+                for _, sums, weights in counters:
+                    sums.append(score)
+                    weights.append(1.0)
+                continue
+            dt = at - self._last[row]
+            if dt >= 0:
+                self._last[row] = at
+                for tau, sums, weights in counters:
+                    keep = math.exp(-dt / tau)
+                    sums[row] = sums[row] * keep + score
+                    weights[row] = weights[row] * keep + 1.0
+            else:
+                for tau, sums, weights in counters:
+                    w = math.exp(dt / tau)
+                    sums[row] += score * w
+                    weights[row] += w
+
+    def observe_topics(self, topics: Iterable[Dict[str, object]]) -> None:
+        """Fold ``fetch_trends`` topics in at their own ``collected_at``."""
+        batches: Dict[str, List[Tuple[str, float]]] = {}
+        for topic in topics:
+            batches.setdefault(topic["collected_at"], []).append((topic["topic_id"], topic["score"]))  # type: ignore[arg-type]
+        for collected_at, scores in batches.items():
+            self.observe_many(scores, to_epoch(collected_at))
+
+    # -- queries ---------------------------------------------------------------
+
+    def _bracket(self, window: str) -> Tuple[int, int, float]:
+        """Indexes of the kept constants around the window and the log-scale position between them."""
+        log_w = math.log(window_seconds(window))
+        hi = bisect.bisect_left(self._log_taus, log_w)
+        if hi == 0:
+            return 0, 0, 0.0
+        if hi == len(self._log_taus):
+            return hi - 1, hi - 1, 0.0
+        lo = hi - 1
+        if self._log_taus[hi] == log_w:
+            return hi, hi, 0.0
+        return lo, hi, (log_w - self._log_taus[lo]) / (self._log_taus[hi] - self._log_taus[lo])
+
+    def score(self, topic_id: str, window: str) -> Optional[float]:
+        """Decayed mean score over ``window`` for one topic, or None if never observed."""
+        row = self._rows.get(topic_id)
+        if row is None:
+            return None
+        lo, hi, frac = self._bracket(window)
+        low = self._sums[lo][row] / self._weights[lo][row]
+        if not frac:
+            return low
+        return low + (self._sums[hi][row] / self._weights[hi][row] - low) * frac
+
+    def scores(self, window: str) -> List[float]:
+        """Decayed mean score over ``window`` for every topic, aligned with ``topic_ids``."""
+        lo, hi, frac = self._bracket(window)
+        low = list(map(operator.truediv, self._sums[lo], self._weights[lo]))
+        if not frac:
+            return low
+        high = map(operator.truediv, self._sums[hi], self._weights[hi])
+        step = map(operator.mul, map(operator.sub, high, low), itertools.repeat(frac))
+        return list(map(operator.add, low, step))
+
+    def weights(self, window: str, at: Optional[float] = None) -> List[float]:
+        """Decayed observation count over ``window`` as of ``at`` (default now), per topic.
+
+        How much signal stands behind each score: a topic observed once long
+        ago has a weight near 0 even though its score is still defined.
+        """
+        at = time.time() if at is None else at
+        lo, hi, frac = self._bracket(window)
+        low = self._decayed_weights(lo, at)
+        if not frac:
+            return low
+        step = map(operator.mul, map(operator.sub, self._decayed_weights(hi, at), low), itertools.repeat(frac))
+        return list(map(operator.add, low, step))
+
+    def _decayed_weights(self, i: int, at: float) -> List[float]:
+        ages = map(operator.sub, itertools.repeat(at), self._last)
+        decay = map(math.exp, map(operator.mul, ages, itertools.repeat(-1.0 / self.time_constants[i])))
+        return list(map(operator.mul, self._weights[i], decay))
+
+    def rescore(self, topics: Iterable[Dict[str, object]]) -> List[Dict[str, object]]:
+        """Copies of ``fetch_trends`` topics with ``score`` replaced by the decayed score over their ``time_window``.
+
+        Topics never observed keep their own score. Scores are rounded to
+        3 decimals like the skill's.
+        """
+        out = []
+        for topic in topics:
+            score = self.score(topic["topic_id"], topic["time_window"])  # type: ignore[arg-type]
+            out.append(dict(topic) if score is None else dict(topic, score=round(score, 3)))
+        return out
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import array
+import itertools
+import operator
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ..clock import to_epoch
+
+# (name, bucket seconds, buckets kept): an hour of minutes, two days of hours, a month of days.
+DEFAULT_TIERS: Tuple[Tuple[str, int, int], ...] = (("1m", 60, 60), ("1h", 3600, 48), ("1d", 86400, 30))
+
+_NAN = float("nan")
+
+
+class _Tier:
+    """One resolution: ``slots`` ring buffer columns, each holding every topic's bucket mean.
+
+    Column-per-slot (rather than row-per-topic) is what makes queries
+    vectorized: the latest bucket of all topics is one array, and two of
+    them subtract in a single ``map(operator.sub, ...)`` pass. All topics
+    share the ring position, so rolling over to a new bucket resets whole
+    columns at C speed instead of touching topics one by one.
+    """
+
+    __slots__ = ("name", "width", "slots", "means", "counts", "head")
+
+    def __init__(self, name: str, width: int, slots: int) -> None:
+        self.name = name
+        self.width = width
+        self.slots = slots
+        self.means: List[array.array] = [array.array("d") for _ in range(slots)]
+        self.counts: List[array.array] = [array.array("I") for _ in range(slots)]
+        self.head: Optional[int] = None  # newest bucket number (epoch seconds // width)
+
+    def add_topic(self) -> None:
+        for means, counts in zip(self.means, self.counts):
+            means.append(_NAN)
+            counts.append(0)
+
+    def advance(self, bucket: int, topics: int) -> None:
+        """Make ``bucket`` the newest one, clearing the slots of buckets that fell out."""
+        head = self.head
+        if head is not None and bucket <= head:
+            return
+        stale = self.slots if head is None else min(bucket - head, self.slots)
+        empty_means = array.array("d", [_NAN]) * topics
+        empty_counts = array.array("I", [0]) * topics
+        for b in range(bucket - stale + 1, bucket + 1):
+            slot = b % self.slots
+            self.means[slot] = array.array("d", empty_means)
+            self.counts[slot] = array.array("I", empty_counts)
+        self.head = bucket
+
+    def column(self, bucket: int) -> Optional[array.array]:
+        """Bucket means for every topic (NaN where unobserved), or None if outside the ring."""
+        if self.head is None or not self.head - self.slots < bucket <= self.head:
+            return None
+        return self.means[bucket % self.slots]
+
+
+class ScoreHistory:
+    """Per-topic score time series in fixed-size, downsampled ring buffers.
+
+    Every observation lands in each tier's bucket for its time (1 minute, 1
+    hour, 1 day by default), where the tier keeps the running mean of the
+    bucket's scores; coarser tiers are therefore downsampled views of the
+    same stream, reaching further back at lower resolution. Memory per
+    topic is fixed: 12 bytes per slot over all tiers (about 1.6 KB with the
+    default tiers), however many observations arrive. Observations older
+    than a tier's window are dropped by that tier only.
+
+    ``velocity``, ``acceleration`` and ``rising`` answer for all tracked
+    topics at once, as lists aligned with ``topic_ids``; velocity is the
+    change of the bucket mean per bucket of the tier, acceleration the
+    change in velocity. Not thread-safe; give each collector its own or
+    lock around it.
+    """
+
+    def __init__(self, tiers: Sequence[Tuple[str, int, int]] = DEFAULT_TIERS) -> None:
+        if not tiers or any(width < 1 or slots < 3 for _, width, slots in tiers):
+            raise ValueError("tiers need a width >= 1 second and at least 3 slots")
+        self._tiers: Dict[str, _Tier] = {name: _Tier(name, width, slots) for name, width, slots in tiers}
+        self._rows: Dict[str, int] = {}
+        self.topic_ids: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.topic_ids)
+
+    def __contains__(self, topic_id: object) -> bool:
+        return topic_id in self._rows
+
+    @property
+    def tiers(self) -> Tuple[str, ...]:
+        return tuple(self._tiers)
+
+    def bytes_per_topic(self) -> int:
+        """Ring buffer bytes each tracked topic costs (the bound; excludes the ID string)."""
+        return sum(t.slots * (8 + 4) for t in self._tiers.values())
+
+    def _row(self, topic_id: str) -> int:
+        row = self._rows.get(topic_id)
+        if row is None:
+            row = self._rows[topic_id] = len(self.topic_ids)
+            self.topic_ids.append(topic_id)
+            for tier in self._tiers.values():
+                tier.add_topic()
+        return row
+
+    # -- writes ----------------------------------------------------------------
+
+    def observe(self, topic_id: str, score: float, at: Optional[float] = None) -> None:
+        self.observe_many([(topic_id, score)], at)
+
+    def observe_many(self, scores: Iterable[Tuple[str, float]], at: Optional[float] = None) -> None:
+        """Record ``(topic_id, score)`` pairs taken at ``at`` (epoch seconds, default now)."""
+        at = time.time() if at is None else at
+        rows = [(self._row(topic_id), float(score)) for topic_id, score in scores]
+        topics = len(self.topic_ids)
+        for tier in self._tiers.values():
+            bucket = int(at // tier.width)
+            tier.advance(bucket, topics)
+            if bucket <= tier.head - tier.slots:  # type: ignore[operator]
+                continue
+            slot = bucket % tier.slots
+            means, counts = tier.means[slot], tier.counts[slot]
+            for row, score in rows:
+                n = counts[row] + 1
+                counts[row] = n
+                means[row] = score if n == 1 else means[row] + (score - means[row]) / n
+
+    def observe_topics(self, topics: Iterable[Dict[str, object]]) -> None:
+        """Record ``fetch_trends`` topics at their own ``collected_at``."""
+        batches: Dict[str, List[Tuple[str, float]]] = {}
+        for topic in topics:
+            batches.setdefault(topic["collected_at"], []).append((topic["topic_id"], topic["score"]))  # type: ignore[arg-type]
+        for collected_at, scores in batches.items():
+            self.observe_many(scores, to_epoch(collected_at))
+
+    # -- queries ---------------------------------------------------------------
+
+    def _tier(self, tier: str, at: Optional[float]) -> Tuple[_Tier, Optional[int]]:
+        t = self._tiers[tier]
+        if at is None:
+            return t, t.head
+        # Read-only: buckets past the newest write read as empty (``column`` returns None for
+        # them) instead of rolling the ring forward, which would drop history a later
+        # observation still belongs with.
+        return t, int(at // t.width)
+
+    def series(self, topic_id: str, tier: str = "1h", at: Optional[float] = None) -> List[Tuple[int, float]]:
+        """``(bucket start, mean)`` for each observed bucket in the tier's window, oldest first."""
+        t, head = self._tier(tier, at)
+        row = self._rows.get(topic_id)
+        if row is None or head is None:
+            return []
+        out = []
+        for bucket in range(head - t.slots + 1, head + 1):
+            column = t.column(bucket)
+            if column is not None and column[row] == column[row]:
+                out.append((bucket * t.width, column[row]))
+        return out
+
+    def _difference(self, t: _Tier, newer: int) -> List[float]:
+        a, b = t.column(newer), t.column(newer - 1)
+        if a is None or b is None:
+            return [_NAN] * len(self.topic_ids)
+        return list(map(operator.sub, a, b))
+
+    def velocity(self, tier: str = "1h", at: Optional[float] = None) -> List[float]:
+        """Newest bucket mean minus the previous one, per topic (NaN unless both observed)."""
+        t, head = self._tier(tier, at)
+        if head is None:
+            return []
+        return self._difference(t, head)
+
+    def acceleration(self, tier: str = "1h", at: Optional[float] = None) -> List[float]:
+        """Change in velocity over the last three buckets, per topic (NaN unless all observed)."""
+        t, head = self._tier(tier, at)
+        if head is None:
+            return []
+        return list(map(operator.sub, self._difference(t, head), self._difference(t, head - 1)))
+
+    def rising(
+        self,
+        tier: str = "1h",
+        *,
+        min_velocity: float = 0.0,
+        min_acceleration: Optional[float] = None,
+        limit: Optional[int] = None,
+        at: Optional[float] = None,
+    ) -> List[Tuple[str, float, float]]:
+        """Topics whose score is climbing: ``(topic_id, velocity, acceleration)``, fastest first.
+
+        A topic qualifies when its velocity exceeds ``min_velocity`` and, if
+        ``min_acceleration`` is given, its acceleration exceeds that too
+        (NaN never qualifies, so topics missing a bucket are left out).
+        """
+        t, head = self._tier(tier, at)
+        if head is None:
+            return []
+        newer = self._difference(t, head)
+        accel = list(map(operator.sub, newer, self._difference(t, head - 1)))
+        mask = map(operator.gt, newer, itertools.repeat(min_velocity))
+        if min_acceleration is not None:
+            mask = map(operator.and_, mask, map(operator.gt, accel, itertools.repeat(min_acceleration)))
+        hits = list(itertools.compress(zip(self.topic_ids, newer, accel), mask))
+        hits.sort(key=operator.itemgetter(1), reverse=True)  # stable: ties stay in tracking order
+        return hits if limit is None else hits[:limit]
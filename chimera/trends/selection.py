@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import math
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+from ..pipeline.stages import draft_stage, fetch_stage
+
+if TYPE_CHECKING:
+    from ..store import SQLiteStore
+
+
+# Heap entries: the weakest selected topic is on top (lowest score; on ties, latest offered).
+_Entry = Tuple[float, int, Dict[str, Any]]
+
+
+class _Group:
+    """Min-heap of the selected topics in one capped set, with lazy deletion."""
+
+    __slots__ = ("cap", "heap", "live")
+
+    def __init__(self, cap: Optional[int]) -> None:
+        self.cap = cap
+        self.heap: List[_Entry] = []
+        self.live = 0
+
+    def full(self) -> bool:
+        return self.cap is not None and self.live >= self.cap
+
+    def weakest(self, alive: Dict[int, _Entry]) -> Optional[_Entry]:
+        heap = self.heap
+        while heap and -heap[0][1] not in alive:
+            heapq.heappop(heap)
+        return heap[0] if heap else None
+
+    def push(self, entry: _Entry, alive: Dict[int, _Entry]) -> None:
+        self.live += 1
+        heapq.heappush(self.heap, entry)
+        if len(self.heap) > 2 * self.live + 8:  # drop dead entries so the heap stays O(live)
+            self.heap = [e for e in self.heap if -e[1] in alive]
+            heapq.heapify(self.heap)
+
+
+class TopicSelector:
+    """Top-``n`` topics over any number of ``fetch_trends`` results, in O(n) memory.
+
+    Candidates are offered one at a time; only the current selection is
+    kept. Rules:
+
+    - ``min_score``: topics scoring below it are never selected.
+    - ``per_platform``: at most this many topics per platform; a mapping
+      sets a quota per platform (platforms it does not list are limited by
+      ``n`` only, and a quota of 0 excludes the platform).
+    - ``per_region``: diversity within a platform, at most this many
+      topics per (platform, region).
+    - A ``topic_id`` is selected at most once; re-offering it keeps the
+      higher score (it must come with the same platform and region, as
+      ``fetch_trends`` topic IDs do).
+
+    The result is what sorting every candidate by score and taking each one
+    that still fits the rules would give (ties go to the earlier offer),
+    without holding the candidates. Because the rule sets nest (region
+    within platform within all), a new topic only ever competes with the
+    weakest selected topic of the smallest full set it belongs to: each set
+    keeps a min-heap of its selected topics, so an offer is O(log n), and
+    once ``n`` are selected anything not above the weakest of them is
+    turned away after one comparison.
+    """
+
+    def __init__(
+        self,
+        n: int,
+        *,
+        min_score: float = 0.0,
+        per_platform: Union[int, Mapping[str, int], None] = None,
+        per_region: Optional[int] = None,
+    ) -> None:
+        if not isinstance(n, int) or n < 1:
+            raise ValueError("n must be a positive integer")
+        quotas = per_platform.values() if isinstance(per_platform, Mapping) else [per_platform]
+        if any(q is not None and (not isinstance(q, int) or q < 0) for q in quotas):
+            raise ValueError("per_platform quotas must be non-negative integers")
+        if per_region is not None and (not isinstance(per_region, int) or per_region < 1):
+            raise ValueError("per_region must be a positive integer")
+        self.n = n
+        self.min_score = min_score
+        self.per_platform = per_platform
+        self.per_region = per_region
+        self._all = _Group(n)
+        self._platforms: Dict[Any, _Group] = {}
+        self._regions: Dict[Tuple[Any, Any], _Group] = {}
+        self._alive: Dict[int, _Entry] = {}
+        self._by_topic: Dict[str, int] = {}
+        self._seq = itertools.count()
+        # Score to beat once n topics are selected; most candidates stop here.
+        self._floor = -math.inf
+        self.offered = 0
+
+    def __len__(self) -> int:
+        return len(self._alive)
+
+    def _quota(self, platform: Any) -> Optional[int]:
+        if isinstance(self.per_platform, Mapping):
+            return self.per_platform.get(platform)
+        return self.per_platform
+
+    def _chain(self, topic: Dict[str, Any]) -> List[_Group]:
+        """The capped sets ``topic`` belongs to, smallest first."""
+        platform, region = topic.get("platform"), topic.get("region")
+        group = self._platforms.get(platform)
+        if group is None:
+            group = self._platforms[platform] = _Group(self._quota(platform))
+        chain = [group, self._all]
+        if self.per_region is not None:
+            group = self._regions.get((platform, region))
+            if group is None:
+                group = self._regions[(platform, region)] = _Group(self.per_region)
+            chain.insert(0, group)
+        return chain
+
+    def _drop(self, entry: _Entry) -> None:
+        seq = -entry[1]
+        del self._alive[seq]
+        topic = entry[2]
+        del self._by_topic[topic["topic_id"]]
+        for group in self._chain(topic):
+            group.live -= 1
+        self._prune(topic)
+
+    def _prune(self, topic: Dict[str, Any]) -> None:
+        """Forget ``topic``'s sets once nothing selected is in them (memory stays O(n))."""
+        platform, region = topic.get("platform"), topic.get("region")
+        group = self._platforms.get(platform)
+        if group is not None and not group.live:
+            del self._platforms[platform]
+        group = self._regions.get((platform, region))
+        if group is not None and not group.live:
+            del self._regions[(platform, region)]
+
+    def offer(self, topic: Dict[str, Any]) -> bool:
+        """Consider one topic; True if it is (for now) selected."""
+        self.offered += 1
+        score = topic["score"]
+        if score <= self._floor or score < self.min_score:
+            return False
+        seq = self._by_topic.get(topic["topic_id"])
+        if seq is not None:
+            if score <= self._alive[seq][0]:
+                return False
+            self._drop(self._alive[seq])
+        chain = self._chain(topic)
+        full = next((group for group in chain if group.full()), None)
+        if full is not None:
+            weakest = full.weakest(self._alive)
+            if weakest is None or weakest[0] >= score:
+                self._prune(topic)
+                return False
+            self._drop(weakest)
+            chain = self._chain(topic)  # dropping may have released an emptied group
+        seq = next(self._seq)
+        entry: _Entry = (score, -seq, topic)
+        self._alive[seq] = entry
+        self._by_topic[topic["topic_id"]] = seq
+        for group in chain:
+            group.push(entry, self._alive)
+        if self._all.full():
+            self._floor = self._all.weakest(self._alive)[0]  # type: ignore[index]
+        return True
+
+    def offer_all(self, topics: Iterable[Dict[str, Any]]) -> int:
+        """Offer every topic; returns how many were selected at the time they were offered."""
+        return sum(self.offer(topic) for topic in topics)
+
+    def selected(self) -> List[Dict[str, Any]]:
+        """The selection, best first (ties in offer order)."""
+        return [entry[2] for entry in sorted(self._alive.values(), reverse=True)]
+
+    def drafts(
+        self,
+        content_type: str = "short_script",
+        constraints: Optional[List[str]] = None,
+        store: "SQLiteStore | None" = None,
+    ) -> Iterator[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """``(topic, generate_draft output)`` for each selected topic, best first."""
+        for topic in self.selected():
+            yield topic, draft_stage(topic, content_type, constraints, store=store)
+
+
+def draft_top_topics(
+    requests: Iterable[Dict[str, Any]],
+    n: int,
+    *,
+    content_type: str = "short_script",
+    constraints: Optional[List[str]] = None,
+    store: "SQLiteStore | None" = None,
+    **rules: Any,
+) -> Dict[str, Any]:
+    """Fetch every request, keep the top ``n`` topics under ``rules``, and draft them.
+
+    Each ``fetch_trends`` result is offered and released before the next
+    call, so memory is bounded by ``n``, not by the number of candidates.
+    Skill errors are collected per item, as in the pipeline.
+    """
+    selector = TopicSelector(n, **rules)
+    errors: List[Dict[str, Any]] = []
+    for params in requests:
+        out = fetch_stage(params, store=store)
+        if "error" in out:
+            errors.append({"stage": "fetch", "input": params, "error": out["error"]})
+            continue
+        selector.offer_all(out["topics"])
+    selected: List[Dict[str, Any]] = []
+    drafts: List[Dict[str, Any]] = []
+    for topic, out in selector.drafts(content_type, constraints, store=store):
+        selected.append(topic)
+        if "error" in out:
+            errors.append({"stage": "draft", "input": topic, "error": out["error"]})
+        else:
+            drafts.append(out["draft"])
+    return {"selected": selected, "drafts": drafts, "errors": errors, "candidates": selector.offered}
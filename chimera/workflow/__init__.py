@@ -0,0 +1,4 @@
+from .checkpoint import CheckpointLog
+from .engine import WorkflowEngine
+
+__all__ = ["CheckpointLog", "WorkflowEngine"]
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import json
+import os
+from typing import Any, Dict, Iterator, Optional
+
+
+class CheckpointLog:
+    """Append-only JSON-lines log of workflow step transitions.
+
+    Each line records one transition as a delta: ``{"id", "status", "step",
+    "at", "set"}`` where ``set`` holds only the state keys that changed
+    (compacted snapshots also carry ``created``).
+    Replaying the log in order rebuilds every workflow; a torn final line left
+    by a crash is dropped and truncated on open.
+    """
+
+    def __init__(self, path: str, *, fsync: bool = False) -> None:
+        self.path = path
+        self.fsync = fsync
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._truncate_torn_tail()
+        self._file = open(path, "ab")
+
+    def _truncate_torn_tail(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        good = 0
+        with open(self.path, "rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    json.loads(line)
+                except ValueError:
+                    break
+                good += len(line)
+        if good != os.path.getsize(self.path):
+            with open(self.path, "r+b") as f:
+                f.truncate(good)
+
+    def append(self, record: Dict[str, Any]) -> None:
+        self._file.write(json.dumps(record, separators=(",", ":")).encode("utf-8") + b"\n")
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+    def replay(self) -> Iterator[Dict[str, Any]]:
+        self._file.flush()
+        with open(self.path, "rb") as f:
+            for line in f:
+                yield json.loads(line)
+
+    def rewrite(self, records: Iterator[Dict[str, Any]]) -> None:
+        """Atomically replace the log with ``records`` (one snapshot per workflow)."""
+        tmp = self.path + ".tmp"
+        with open(tmp, "wb") as f:
+            for record in records:
+                f.write(json.dumps(record, separators=(",", ":")).encode("utf-8") + b"\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self._file.close()
+        os.replace(tmp, self.path)
+        self._file = open(self.path, "ab")
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def apply(records: Iterator[Dict[str, Any]], into: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Dict[str, Any]]:
+    """Fold checkpoint deltas into ``{workflow_id: {status, current_step, state, created_at, updated_at}}``."""
+    workflows = into if into is not None else {}
+    for rec in records:
+        wf = workflows.get(rec["id"])
+        if wf is None:
+            wf = workflows[rec["id"]] = {
+                "workflow_id": rec["id"],
+                "status": rec["status"],
+                "current_step": rec["step"],
+                "state": {},
+                "created_at": rec.get("created", rec["at"]),
+                "updated_at": rec["at"],
+            }
+        wf["status"] = rec["status"]
+        wf["current_step"] = rec["step"]
+        wf["updated_at"] = rec["at"]
+        wf["state"].update(rec.get("set") or {})
+    return workflows
@@ -0,0 +1,289 @@
+from __future__ import annotations
+
+import secrets
+import threading
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
+
+from ..clock import now as _ts
+from ..pipeline.stages import draft_stage, fetch_stage, publish_stage, review_stage
+from ..skills.publish_content import publish_content
+from .checkpoint import CheckpointLog, apply
+
+if TYPE_CHECKING:
+    from ..store import SQLiteStore
+
+
+# Step identifiers recorded in `workflows.current_step` (specs/technical.md 5.1).
+STEPS = ("fetch_trends", "generate_draft", "evaluate_policy", "publish_content")
+AWAITING_REVIEW = "awaiting_review"
+DONE = "done"
+
+FINAL_STATUSES = frozenset({"CANCELLED", "COMPLETED", "FAILED"})
+
+# Keys copied into the `state` snapshot returned by pause (spec 3.8).
+_SNAPSHOT_KEYS = ("topic_id", "draft_id", "review_id", "approval_id", "publish_id")
+
+
+def _err(code: str, message: str, details: Dict[str, Any] | None = None) -> Dict[str, Any]:
+    e: Dict[str, Any] = {"code": code, "message": message, "timestamp": _ts()}
+    if details is not None:
+        e["details"] = details
+    return {"error": e}
+
+
+class WorkflowEngine:
+    """Checkpointed planner workflows with pause/resume/cancel (specs/technical.md 3.8-3.10).
+
+    A workflow drives one trend request through fetch -> draft -> review ->
+    publish. Every transition is appended to ``checkpoint_path`` as a delta
+    record holding only the state keys that changed, and the live workflows
+    sit in a dict keyed by ``workflow_id``, so lookups stay O(1) however many
+    are paused. Reopening the same path replays the log; ``run`` then picks up
+    at ``current_step`` without re-running completed skills.
+
+    ``cancel`` and ``pause`` are checked before every step, and a step that was
+    already running when any transition landed (pause, resume, cancel) has its
+    result discarded. One caller at a time runs a workflow's steps: a second
+    ``step``/``run`` while one is in flight does not execute it again. REQUIRES_HUMAN_REVIEW
+    parks the workflow as PAUSED at ``awaiting_review``; resuming it needs an
+    ``approval_id`` in ``modifications``. REJECTED fails the workflow with
+    DRAFT_REJECTED (specs/technical.md 3.3).
+    """
+
+    def __init__(
+        self,
+        checkpoint_path: Optional[str] = None,
+        *,
+        fsync: bool = False,
+        store: "SQLiteStore | None" = None,
+    ) -> None:
+        self.store = store
+        self._lock = threading.RLock()
+        self._log = CheckpointLog(checkpoint_path, fsync=fsync) if checkpoint_path else None
+        self._workflows: Dict[str, Dict[str, Any]] = {}
+        # Workflows with a step in flight, and a per-workflow count of checkpoints
+        # so a step can tell whether anything happened to its workflow meanwhile.
+        self._stepping: Set[str] = set()
+        self._versions: Dict[str, int] = {}
+        if self._log is not None:
+            apply(self._log.replay(), self._workflows)
+
+    def __enter__(self) -> "WorkflowEngine":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._workflows)
+
+    def close(self) -> None:
+        if self._log is not None:
+            self._log.close()
+
+    def _checkpoint(self, workflow_id: str, status: str, step: str, changes: Optional[Dict[str, Any]] = None) -> str:
+        now = _ts()
+        record: Dict[str, Any] = {"id": workflow_id, "status": status, "step": step, "at": now}
+        if changes:
+            record["set"] = changes
+        if self._log is not None:
+            self._log.append(record)
+        apply((record,), self._workflows)
+        self._versions[workflow_id] = self._versions.get(workflow_id, 0) + 1
+        return now
+
+    # -- lifecycle -----------------------------------------------------------
+
+    def create(self, params: Dict[str, Any], workflow_id: Optional[str] = None) -> Dict[str, Any]:
+        """Register a workflow for ``params``: ``{"trends": {...fetch_trends params}, "content_type",
+        "constraints", "confidence_threshold", "schedule_time"}``."""
+        wf_id = workflow_id or f"wf_{secrets.token_hex(8)}"
+        with self._lock:
+            if wf_id in self._workflows:
+                raise ValueError(f"workflow '{wf_id}' already exists")
+            self._checkpoint(wf_id, "RUNNING", STEPS[0], {"params": params})
+            return self.get(wf_id)
+
+    def get(self, workflow_id: str) -> Optional[Dict[str, Any]]:
+        wf = self._workflows.get(workflow_id)
+        if wf is None:
+            return None
+        return {
+            "workflow_id": workflow_id,
+            "status": wf["status"],
+            "current_step": wf["current_step"],
+            "state": dict(wf["state"]),
+            "created_at": wf["created_at"],
+            "updated_at": wf["updated_at"],
+        }
+
+    def status_counts(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for wf in self._workflows.values():
+            counts[wf["status"]] = counts.get(wf["status"], 0) + 1
+        return counts
+
+    def pause(self, workflow_id: str, reason: Optional[str] = None) -> Dict[str, Any]:
+        with self._lock:
+            wf = self._workflows.get(workflow_id)
+            if wf is None:
+                return _err("WORKFLOW_NOT_FOUND", f"Workflow '{workflow_id}' does not exist", {"workflow_id": workflow_id})
+            if wf["status"] in FINAL_STATUSES or "publish_id" in wf["state"]:
+                return _err("WORKFLOW_FINALIZED", f"Workflow '{workflow_id}' is {wf['status']} and cannot be paused", {"workflow_id": workflow_id})
+            if wf["status"] == "PAUSED":
+                paused_at = wf["state"].get("paused_at", wf["updated_at"])
+            else:
+                paused_at = _ts()
+                self._checkpoint(workflow_id, "PAUSED", wf["current_step"], {"paused_at": paused_at, "pause_reason": reason})
+            return {
+                "workflow_id": workflow_id,
+                "status": "PAUSED",
+                "paused_at": paused_at,
+                "current_step": wf["current_step"],
+                "state": {k: wf["state"][k] for k in _SNAPSHOT_KEYS if k in wf["state"]},
+            }
+
+    def resume(self, workflow_id: str, modifications: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        with self._lock:
+            wf = self._workflows.get(workflow_id)
+            if wf is None:
+                return _err("WORKFLOW_NOT_FOUND", f"Workflow '{workflow_id}' does not exist", {"workflow_id": workflow_id})
+            if wf["status"] != "PAUSED":
+                return _err("WORKFLOW_NOT_PAUSED", f"Workflow '{workflow_id}' is {wf['status']}, not PAUSED", {"workflow_id": workflow_id})
+            # approval_id is recorded as state; anything else overrides params for steps not yet run.
+            modifications = dict(modifications or {})
+            changes: Dict[str, Any] = {}
+            if "approval_id" in modifications:
+                changes["approval_id"] = modifications.pop("approval_id")
+            if modifications:
+                changes["params"] = dict(wf["state"]["params"], **modifications)
+            step = wf["current_step"]
+            if step == AWAITING_REVIEW:
+                approval_id = changes.get("approval_id") or wf["state"].get("approval_id")
+                if not isinstance(approval_id, str) or not approval_id.startswith("hap_"):
+                    return _err("MISSING_APPROVAL", "approval_id (hap_...) is required to resume a workflow awaiting review", {"workflow_id": workflow_id})
+                step = "publish_content"
+            resumed_at = self._checkpoint(workflow_id, "RUNNING", step, changes)
+            return {"workflow_id": workflow_id, "status": "RUNNING", "resumed_at": resumed_at}
+
+    def cancel(self, workflow_id: str, reason: Optional[str] = None) -> Dict[str, Any]:
+        with self._lock:
+            wf = self._workflows.get(workflow_id)
+            if wf is None:
+                return _err("WORKFLOW_NOT_FOUND", f"Workflow '{workflow_id}' does not exist", {"workflow_id": workflow_id})
+            if wf["status"] in FINAL_STATUSES or "publish_id" in wf["state"]:
+                return _err("WORKFLOW_FINALIZED", f"Workflow '{workflow_id}' is {wf['status']} and cannot be cancelled", {"workflow_id": workflow_id})
+            cancelled_at = self._checkpoint(workflow_id, "CANCELLED", wf["current_step"], {"cancel_reason": reason})
+            return {"workflow_id": workflow_id, "status": "CANCELLED", "cancelled_at": cancelled_at}
+
+    # -- execution -----------------------------------------------------------
+
+    def _execute(self, step: str, state: Dict[str, Any]) -> Dict[str, Any]:
+        """Run one step; return the state changes, or ``{"error": ...}``."""
+        params = state["params"]
+        if step == "fetch_trends":
+            out = fetch_stage(params.get("trends", {}), store=self.store)
+            if "error" in out:
+                return out
+            if not out["topics"]:
+                return _err("TOPIC_NOT_FOUND", "fetch_trends returned no topics")
+            topic = max(out["topics"], key=lambda t: t["score"])
+            return {"topic": topic, "topic_id": topic["topic_id"]}
+        if step == "generate_draft":
+            out = draft_stage(
+                state["topic"], params.get("content_type", "short_script"), params.get("constraints"), store=self.store
+            )
+            if "error" in out:
+                return out
+            return {"draft": out["draft"], "draft_id": out["draft"]["draft_id"]}
+        if step == "evaluate_policy":
+            out = review_stage(state["draft"], params.get("confidence_threshold", 0.7), store=self.store)
+            if "error" in out:
+                return out
+            return {"review": out["review"], "review_id": out["review"]["review_id"]}
+        if state.get("approval_id"):
+            # Human approval path: the approval record, not the review, is the evidence.
+            out = publish_content(
+                {"draft": state["draft"], "approval_id": state["approval_id"], "schedule_time": params.get("schedule_time")},
+                store=self.store,
+            )
+        else:
+            out = publish_stage(state["draft"], state["review"], None, params.get("schedule_time"), store=self.store)
+        if "error" in out:
+            return out
+        return {"publish": out["publish"], "publish_id": out["publish"]["publish_id"]}
+
+    def step(self, workflow_id: str) -> Optional[Dict[str, Any]]:
+        """Run the next step of a RUNNING workflow; return its new view, or None if it cannot
+        advance (not RUNNING, or another caller's step is in flight)."""
+        with self._lock:
+            wf = self._workflows.get(workflow_id)
+            if wf is None or wf["status"] != "RUNNING" or workflow_id in self._stepping:
+                return None
+            self._stepping.add(workflow_id)
+            version = self._versions.get(workflow_id, 0)
+            step = wf["current_step"]
+            state = dict(wf["state"])
+        try:
+            changes = self._execute(step, state)
+        except BaseException:
+            with self._lock:
+                self._stepping.discard(workflow_id)
+            raise
+        with self._lock:
+            self._stepping.discard(workflow_id)
+            # A pause/resume/cancel that landed while the skill ran wins; its result is dropped.
+            if self._versions.get(workflow_id, 0) != version:
+                return self.get(workflow_id)
+            if "error" in changes:
+                self._checkpoint(workflow_id, "FAILED", step, {"error": changes["error"]})
+                return self.get(workflow_id)
+            if step == "evaluate_policy":
+                decision = changes["review"]["decision"]
+                if decision == "REQUIRES_HUMAN_REVIEW":
+                    changes["paused_at"] = _ts()
+                    self._checkpoint(workflow_id, "PAUSED", AWAITING_REVIEW, changes)
+                    return self.get(workflow_id)
+                if decision != "APPROVED":
+                    changes["error"] = _err("DRAFT_REJECTED", "draft was rejected and cannot proceed", {"draft_id": state["draft_id"]})["error"]
+                    self._checkpoint(workflow_id, "FAILED", step, changes)
+                    return self.get(workflow_id)
+            if step == STEPS[-1]:
+                self._checkpoint(workflow_id, "COMPLETED", DONE, changes)
+            else:
+                self._checkpoint(workflow_id, "RUNNING", STEPS[STEPS.index(step) + 1], changes)
+            return self.get(workflow_id)
+
+    def run(self, workflow_id: str) -> Dict[str, Any]:
+        """Advance a workflow until it completes, fails, or is paused or cancelled.
+
+        If another caller is already running it, return its view as it stands.
+        """
+        if workflow_id not in self._workflows:
+            return _err("WORKFLOW_NOT_FOUND", f"Workflow '{workflow_id}' does not exist", {"workflow_id": workflow_id})
+        while self.step(workflow_id) is not None:
+            pass
+        return self.get(workflow_id)  # type: ignore[return-value]
+
+    def run_all(self) -> List[Dict[str, Any]]:
+        """Run every RUNNING workflow (e.g. after reopening a checkpoint log)."""
+        with self._lock:
+            running = [wf_id for wf_id, wf in self._workflows.items() if wf["status"] == "RUNNING"]
+        return [self.run(wf_id) for wf_id in running]
+
+    def compact(self) -> None:
+        """Rewrite the checkpoint log as one snapshot record per workflow."""
+        if self._log is None:
+            return
+        with self._lock:
+            self._log.rewrite(
+                {
+                    "id": wf_id,
+                    "status": wf["status"],
+                    "step": wf["current_step"],
+                    "at": wf["updated_at"],
+                    "created": wf["created_at"],
+                    "set": wf["state"],
+                }
+                for wf_id, wf in self._workflows.items()
+            )
@@ -0,0 +1,265 @@
+"""
+HTTP API Server Tests (asyncio, keep-alive, pipelining)
+
+These tests assert the HTTP surface defined in:
+- specs/technical.md Sections 3.1-3.11 - endpoint request/response shapes
+- specs/technical.md Section 4 - error envelope with request_id
+"""
+
+import asyncio
+import http.client
+import json
+import socket
+import threading
+
+import pytest
+
+from chimera.api import ApiServer
+from chimera.audit import SkillRunIndex
+from chimera.store import SQLiteStore
+from chimera.workflow import WorkflowEngine
+
+
+TRENDS = {"platform": "youtube", "region": "ET", "time_window": "24h", "limit": 3}
+
+
+def _runs(n):
+    return [
+        {
+            "run_id": f"run_{i:05d}",
+            "skill_name": "skill_fetch_trends",
+            "triggered_by_agent_id": "research_agent",
+            "input_ref": f"input_{i}",
+            "output_ref": f"output_{i}",
+            "status": "success",
+            "started_at": f"2026-02-05T10:{i // 60 % 60:02d}:{i % 60:02d}Z",
+            "finished_at": f"2026-02-05T10:{i // 60 % 60:02d}:{i % 60:02d}Z",
+        }
+        for i in range(n)
+    ]
+
+
+@pytest.fixture
+def api(tmp_path):
+    store = SQLiteStore(str(tmp_path / "chimera.db"))
+    index = SkillRunIndex()
+    index.add_many(_runs(1000))
+    server = ApiServer(store=store, workflows=WorkflowEngine(store=store), audit_index=index)
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(server.start())
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    yield server
+    asyncio.run_coroutine_threadsafe(server.close(), loop).result()
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+    store.close()
+
+
+def _call(conn, method, path, body=None):
+    payload = json.dumps(body).encode() if body is not None else None
+    conn.request(method, path, body=payload, headers={"Content-Type": "application/json"})
+    resp = conn.getresponse()
+    return resp.status, json.loads(resp.read()), resp
+
+
+def test_end_to_end_over_one_keepalive_connection(api):
+    """
+    Maps to: specs/technical.md Sections 3.1-3.5 - fetch -> draft -> review -> publish over HTTP
+    """
+    conn = http.client.HTTPConnection("127.0.0.1", api.port)
+    status, fetched, _ = _call(conn, "POST", "/v1/trends/fetch", TRENDS)
+    assert status == 200
+    assert fetched["request_id"].startswith("req_")
+    assert fetched["platform"] == "youtube" and len(fetched["topics"]) == 3
+    sock = conn.sock
+
+    topic_id = fetched["topics"][0]["topic_id"]
+    status, draft, _ = _call(conn, "POST", "/v1/content/drafts", {"topic_id": topic_id, "content_type": "post"})
+    assert status == 200
+    assert draft["status"] == "DRAFT_CREATED" and draft["platform"] == "youtube"
+
+    status, review, _ = _call(
+        conn, "POST", "/v1/reviews/evaluate", {"draft_id": draft["draft_id"], "min_confidence_to_autopass": 0.0}
+    )
+    assert status == 200 and review["decision"] == "APPROVED"
+
+    status, publish, _ = _call(
+        conn, "POST", "/v1/publish/execute", {"draft_id": draft["draft_id"], "approval_id": "hap_auto"}
+    )
+    assert status == 200 and publish["publish_id"].startswith("pub_")
+    assert conn.sock is sock  # no reconnects
+    conn.close()
+
+
+def test_error_envelope_and_status_codes(api):
+    """
+    Maps to: specs/technical.md Section 4 - error structure, request_id for traceability
+    """
+    conn = http.client.HTTPConnection("127.0.0.1", api.port)
+    status, out, resp = _call(conn, "POST", "/v1/trends/fetch", dict(TRENDS, platform="bogus"))
+    assert status == 400
+    assert out["error"]["code"] == "INVALID_PLATFORM"
+    assert out["error"]["request_id"] == resp.getheader("X-Request-Id")
+
+    status, out, _ = _call(conn, "POST", "/v1/content/drafts", {"topic_id": "tpc_999", "content_type": "post"})
+    assert (status, out["error"]["code"]) == (404, "TOPIC_NOT_FOUND")
+
+    status, out, _ = _call(conn, "GET", "/v1/agents/nobody/status")
+    assert (status, out["error"]["code"]) == (404, "AGENT_NOT_FOUND")
+
+    status, out, resp = _call(conn, "GET", "/v1/trends/fetch")
+    assert status == 405 and resp.getheader("Allow") == "POST"
+
+    conn.request("POST", "/v1/reviews/evaluate", body=b"{not json")
+    resp = conn.getresponse()
+    assert resp.status == 400 and json.loads(resp.read())["error"]["code"] == "INVALID_INPUT"
+
+    status, _, _ = _call(conn, "GET", "/v1/nowhere")
+    assert status == 404
+    conn.close()
+
+
+def test_pipelined_responses_arrive_in_order(api):
+    """
+    Maps to: HTTP/1.1 pipelining - responses are written in request order
+    """
+    requests = b""
+    for limit in range(1, 11):
+        body = json.dumps(dict(TRENDS, limit=limit)).encode()
+        requests += b"POST /v1/trends/fetch HTTP/1.1\r\nHost: x\r\nContent-Length: %d\r\n\r\n%s" % (len(body), body)
+    requests += b"GET /v1/capabilities HTTP/1.1\r\nHost: x\r\nConnection: close\r\n\r\n"
+
+    with socket.create_connection(("127.0.0.1", api.port)) as sock:
+        sock.sendall(requests)
+        data = b""
+        while chunk := sock.recv(65536):
+            data += chunk
+
+    bodies = []
+    while data:
+        head, _, rest = data.partition(b"\r\n\r\n")
+        length = int(next(l for l in head.split(b"\r\n") if l.lower().startswith(b"content-length")).split(b":")[1])
+        bodies.append(json.loads(rest[:length]))
+        data = rest[length:]
+    assert [len(b["topics"]) for b in bodies[:10]] == list(range(1, 11))
+    assert "capabilities" in bodies[10]
+
+
+def test_workflow_control(api):
+    """
+    Maps to: specs/technical.md Sections 3.8-3.10 - pause/resume/cancel over HTTP
+    """
+    wf_id = api.workflows.create({"trends": TRENDS})["workflow_id"]
+    conn = http.client.HTTPConnection("127.0.0.1", api.port)
+    status, out, _ = _call(conn, "POST", f"/v1/workflows/{wf_id}/pause", {"reason": "Human review requested"})
+    assert status == 200 and out["status"] == "PAUSED"
+    status, out, _ = _call(conn, "POST", f"/v1/workflows/{wf_id}/resume")
+    assert status == 200 and out["status"] == "RUNNING"
+    status, out, _ = _call(conn, "POST", f"/v1/workflows/{wf_id}/resume")
+    assert (status, out["error"]["code"]) == (409, "WORKFLOW_NOT_PAUSED")
+    status, out, _ = _call(conn, "POST", f"/v1/workflows/{wf_id}/cancel")
+    assert status == 200 and out["status"] == "CANCELLED"
+    status, out, _ = _call(conn, "POST", "/v1/workflows/wf_missing/cancel")
+    assert (status, out["error"]["code"]) == (404, "WORKFLOW_NOT_FOUND")
+    conn.close()
+
+
+def test_audit_query_is_streamed(api):
+    """
+    Maps to: specs/technical.md Section 3.11 - audit query, streamed with chunked encoding
+    """
+    conn = http.client.HTTPConnection("127.0.0.1", api.port)
+    status, out, resp = _call(conn, "GET", "/v1/audit/skill-runs?limit=600")
+    assert status == 200 and resp.getheader("Transfer-Encoding") == "chunked"
+    assert [r["run_id"] for r in out["skill_runs"]] == [f"run_{i:05d}" for i in range(600)]
+    assert out["total_count"] == 1000 and out["limit"] == 600
+
+    status, rest, _ = _call(conn, "GET", f"/v1/audit/skill-runs?limit=600&cursor={out['next_cursor']}")
+    assert len(rest["skill_runs"]) == 400 and rest["next_cursor"] is None
+
+    status, out, _ = _call(conn, "GET", "/v1/audit/skill-runs?limit=0")
+    assert (status, out["error"]["code"]) == (400, "INVALID_LIMIT")
+    conn.close()
+
+
+def test_connection_close_and_http10(api):
+    for version, headers, expect_open in (
+        ("HTTP/1.1", "", True),
+        ("HTTP/1.1", "Connection: close\r\n", False),
+        ("HTTP/1.0", "", False),
+        ("HTTP/1.0", "Connection: keep-alive\r\n", True),
+    ):
+        with socket.create_connection(("127.0.0.1", api.port), timeout=5) as sock:
+            sock.sendall(f"GET /v1/capabilities {version}\r\nHost: x\r\n{headers}\r\n".encode())
+            head = b""
+            while b"\r\n\r\n" not in head:
+                head += sock.recv(65536)
+            assert (b"Connection: keep-alive" in head) is expect_open
+
+
+def test_client_request_id_is_validated(api):
+    """
+    Maps to: specs/technical.md Section 4 - request_id for traceability; a client value
+    is echoed only when it is a plain token, never bytes that reach the response headers
+    """
+    for value, echoed in (
+        (b"trace-42.a_B", True),
+        (b"x" * 65, False),
+        (b"abc\rSet-Cookie: session=stolen", False),
+        (b"caf\xc3\xa9", False),
+    ):
+        with socket.create_connection(("127.0.0.1", api.port), timeout=5) as sock:
+            sock.sendall(b"GET /v1/capabilities HTTP/1.1\r\nHost: x\r\nX-Request-Id: " + value + b"\r\nConnection: close\r\n\r\n")
+            data = b""
+            while chunk := sock.recv(65536):
+                data += chunk
+        head = data.partition(b"\r\n\r\n")[0].split(b"\r\n")
+        assert head[0].startswith(b"HTTP/1.1 ")
+        assert not any(line.lower().startswith(b"set-cookie") for line in head)
+        request_id = next(l for l in head if l.lower().startswith(b"x-request-id:")).split(b":", 1)[1].strip()
+        if echoed:
+            assert request_id == value
+        else:
+            assert request_id.startswith(b"req_") and b"\r" not in request_id
+
+
+def test_failed_response_is_a_500_and_the_connection_survives(api):
+    """
+    Maps to: specs/technical.md Section 3.7 - internal failures become a generic 500
+    """
+
+    class FlakyLimiter:
+        calls = 0
+
+        def allow(self, key, endpoint_class):
+            self.calls += 1
+            if self.calls == 1:
+                raise RuntimeError("limiter backend unavailable")
+            return True, 0.0
+
+    api.rate_limiter = FlakyLimiter()
+    conn = http.client.HTTPConnection("127.0.0.1", api.port, timeout=5)
+    status, body, _ = _call(conn, "GET", "/v1/capabilities")
+    assert status == 500
+    assert body["error"]["code"] == "UPSTREAM_ERROR"
+    status, _, _ = _call(conn, "GET", "/v1/capabilities")
+    assert status == 200
+    conn.close()
+
+
+def test_stream_that_fails_midway_closes_the_connection(api):
+    def count(*filters):
+        raise RuntimeError("index unavailable")
+
+    api.audit_index.count = count
+    conn = http.client.HTTPConnection("127.0.0.1", api.port, timeout=5)
+    conn.request("GET", "/v1/audit/skill-runs?limit=10")
+    resp = conn.getresponse()
+    assert resp.status == 200
+    with pytest.raises(http.client.IncompleteRead):
+        resp.read()
+    conn.close()
+    status, _, _ = _call(http.client.HTTPConnection("127.0.0.1", api.port, timeout=5), "GET", "/v1/capabilities")
+    assert status == 200
@@ -0,0 +1,151 @@
+"""
+Audit Query Tests (time-partitioned skill_runs index)
+
+These tests assert the audit query contract defined in:
+- specs/technical.md Section 3.11 - GET /v1/audit/skill-runs filters, limit, total_count
+"""
+
+import pytest
+
+from chimera.audit import AuditWriter, SkillRunIndex, audited_skills
+
+
+AGENTS = ["research_agent", "content_agent", "review_agent"]
+SKILLS = ["skill_fetch_trends", "skill_generate_draft", "skill_evaluate_policy"]
+
+
+def _runs(n):
+    for i in range(n):
+        hour, minute = divmod(i, 60)
+        yield {
+            "run_id": f"run_{i:05d}",
+            "skill_name": SKILLS[i % 3],
+            "triggered_by_agent_id": AGENTS[(i // 3) % 3],
+            "input_ref": f"sha256:{i:032x}",
+            "output_ref": f"sha256:{i:032x}",
+            "status": "success",
+            "started_at": f"2026-02-05T{hour % 24:02d}:{minute:02d}:00Z",
+            "finished_at": f"2026-02-05T{hour % 24:02d}:{minute:02d}:01Z",
+            "input": {"must": "not leak"},
+        }
+
+
+def _linear(runs, agent_id=None, skill_name=None, start_time=None, end_time=None):
+    return [
+        r["run_id"] for r in runs
+        if (agent_id is None or r["triggered_by_agent_id"] == agent_id)
+        and (skill_name is None or r["skill_name"] == skill_name)
+        and (start_time is None or r["started_at"] >= start_time)
+        and (end_time is None or r["started_at"] <= end_time)
+    ]
+
+
+@pytest.mark.parametrize("bucket", ["minute", "hour", "day"])
+@pytest.mark.parametrize("filters", [
+    {},
+    {"agent_id": "content_agent"},
+    {"skill_name": "skill_evaluate_policy"},
+    {"agent_id": "review_agent", "skill_name": "skill_fetch_trends"},
+    {"start_time": "2026-02-05T03:30:00Z", "end_time": "2026-02-05T07:10:00Z"},
+    {"agent_id": "research_agent", "skill_name": "skill_generate_draft",
+     "start_time": "2026-02-05T01:59:00Z", "end_time": "2026-02-05T02:00:00Z"},
+])
+def test_query_matches_linear_scan(bucket, filters):
+    """
+    Maps to: specs/technical.md Section 3.11 - agent_id, skill_name, start_time, end_time filters
+    """
+    runs = list(_runs(600))
+    index = SkillRunIndex(bucket)
+    index.add_many(reversed(runs))  # out-of-order arrival must still sort by time
+
+    expected = _linear(runs, **filters)
+    result = index.query(limit=100, **filters)
+    assert result["total_count"] == len(expected)
+    assert result["limit"] == 100
+    assert [r["run_id"] for r in result["skill_runs"]] == expected[:100]
+
+
+def test_cursor_pagination_streams_every_row_once():
+    """
+    Maps to: specs/technical.md Section 3.11 - limit (default 100)
+    """
+    runs = list(_runs(450))
+    index = SkillRunIndex("hour")
+    index.add_many(runs)
+
+    seen, cursor = [], None
+    while True:
+        page = index.query(skill_name="skill_fetch_trends", cursor=cursor)
+        seen.extend(r["run_id"] for r in page["skill_runs"])
+        assert page["total_count"] == 150
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert seen == _linear(runs, skill_name="skill_fetch_trends")
+
+
+def test_queries_interleaved_with_out_of_order_runs():
+    runs = list(_runs(300))
+    index = SkillRunIndex("hour")
+    added = []
+    for i, run in enumerate(reversed(runs)):
+        index.add(run)
+        added.append(run)
+        if i % 25 == 0:
+            expected = _linear(sorted(added, key=lambda r: r["started_at"]), agent_id="content_agent")
+            assert [r["run_id"] for r in index.query(agent_id="content_agent", limit=500)["skill_runs"]] == expected
+
+
+def test_iteration_is_a_snapshot_under_concurrent_inserts():
+    """
+    Maps to: specs/technical.md Section 3.11 - a streamed result neither skips nor repeats runs
+    """
+    runs = list(_runs(240))
+    index = SkillRunIndex("hour")
+    index.add_many(runs[::2])
+    expected = _linear(runs[::2], skill_name="skill_fetch_trends")
+
+    stream = index.iter_runs(skill_name="skill_fetch_trends")
+    seen = [next(stream)[1]["run_id"]]
+    # Runs landing before, inside and after the remaining range, in partitions already
+    # planned; none of them existed when the iteration started.
+    index.add_many(runs[1::2])
+    seen += [run["run_id"] for _, run in stream]
+    assert seen == expected
+
+
+def test_results_expose_refs_not_payloads():
+    """
+    Maps to: specs/technical.md Section 3.11 - Response MUST NOT expose full input/output payloads
+    """
+    index = SkillRunIndex()
+    index.add_many(_runs(3))
+    run = index.query()["skill_runs"][0]
+    assert "input" not in run
+    assert run["input_ref"].startswith("sha256:")
+
+
+def test_invalid_query_parameters():
+    index = SkillRunIndex()
+    with pytest.raises(ValueError):
+        index.query(start_time="yesterday")
+    with pytest.raises(ValueError):
+        index.query(end_time="2026-02-05T10:00:00Z\n")
+    with pytest.raises(ValueError):
+        index.query(limit=0)
+    with pytest.raises(ValueError):
+        index.query(cursor="%%%")
+
+
+def test_audit_writer_feeds_index(tmp_path):
+    """
+    Maps to: specs/functional.md F10 - recorded runs are queryable
+    """
+    index = SkillRunIndex()
+    with AuditWriter(str(tmp_path), agent_id="research_agent", index=index) as writer:
+        fetch = audited_skills(writer)["skill_fetch_trends"]
+        for _ in range(5):
+            fetch({"platform": "youtube", "region": "ET", "time_window": "24h", "limit": 1})
+
+    assert index.query(agent_id="research_agent")["total_count"] == 5
+    assert SkillRunIndex.from_segments(str(tmp_path)).count(skill_name="skill_fetch_trends") == 5
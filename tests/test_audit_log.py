@@ -0,0 +1,151 @@
+"""
+Audit Log Tests (skill_runs group-commit writer)
+
+These tests assert the audit requirements defined in:
+- specs/technical.md Section 3.11 - GET /v1/audit/skill-runs (refs, not payloads)
+- specs/technical.md Section 5.1 - skill_runs (immutable, append-only)
+- specs/functional.md F10 - Record Actions for Audit
+"""
+
+import threading
+
+import pytest
+
+from chimera.audit import AuditWriter, audited_skills, read_segments
+from chimera.audit.log import list_segments
+from chimera.store import SQLiteStore
+from tests.helpers.validators import is_iso8601_datetime, matches_id_pattern
+
+
+def test_wrapped_skills_record_runs(tmp_path):
+    """
+    Maps to: specs/technical.md Section 5.1 - skill_runs fields and status enum
+    """
+    with AuditWriter(str(tmp_path), agent_id="research_agent") as writer:
+        skills = audited_skills(writer)
+        skills["skill_fetch_trends"]({"platform": "youtube", "region": "ET", "time_window": "24h", "limit": 2})
+        skills["skill_fetch_trends"]({"platform": "invalid", "region": "ET", "time_window": "24h"})
+
+    runs = list(read_segments(str(tmp_path)))
+    assert [r["status"] for r in runs] == ["success", "failure"]
+    for run in runs:
+        assert matches_id_pattern(run["run_id"], "run_id")
+        assert run["skill_name"] == "skill_fetch_trends"
+        assert run["triggered_by_agent_id"] == "research_agent"
+        assert is_iso8601_datetime(run["started_at"]) and is_iso8601_datetime(run["finished_at"])
+        # refs only, never the payload itself
+        assert "input" not in run and "output" not in run
+        assert run["input_ref"].startswith("sha256:") and len(run["output_ref"]) <= 500
+
+
+def test_group_commit_batches_writes(tmp_path):
+    """
+    Maps to: specs/functional.md F10 - every execution recorded, without per-run disk writes
+    """
+    writer = AuditWriter(str(tmp_path), fsync="always")
+    for i in range(500):
+        writer.record({"run_id": f"run_{i}", "skill_name": "skill_fetch_trends", "status": "success",
+                       "started_at": "2026-02-05T10:00:00Z"})
+    writer.close()
+
+    stats = writer.stats()
+    assert stats["records"] == 500
+    assert stats["groups"] <= stats["records"]
+    assert stats["fsyncs"] >= 1
+    assert [r["run_id"] for r in read_segments(str(tmp_path))] == [f"run_{i}" for i in range(500)]
+
+
+def test_recovery_truncates_torn_tail(tmp_path):
+    """
+    Maps to: specs/technical.md Section 5.3 - skill_runs records survive crashes intact
+    """
+    with AuditWriter(str(tmp_path)) as writer:
+        for i in range(3):
+            writer.record({"run_id": f"run_{i}", "skill_name": "skill_x", "status": "success",
+                           "started_at": "2026-02-05T10:00:00Z"})
+
+    (_, path), = list_segments(str(tmp_path))
+    with open(path, "ab") as f:
+        f.write(b"\x40\x00\x00\x00garbage")  # torn frame from a crash mid-write
+
+    with AuditWriter(str(tmp_path)) as writer:
+        assert writer.stats()["recovered"] == 3
+        writer.record({"run_id": "run_3", "skill_name": "skill_x", "status": "success",
+                       "started_at": "2026-02-05T10:00:00Z"})
+
+    assert [r["run_id"] for r in read_segments(str(tmp_path))] == ["run_0", "run_1", "run_2", "run_3"]
+
+
+class _TornFile:
+    """Segment file whose next write stops halfway and fails, as on a full disk."""
+
+    def __init__(self, f):
+        self._f = f
+        self.fail = True
+
+    def write(self, data):
+        if self.fail:
+            self.fail = False
+            self._f.write(bytes(data[: len(data) // 2]))
+            raise OSError(28, "No space left on device")
+        return self._f.write(data)
+
+    def __getattr__(self, name):
+        return getattr(self._f, name)
+
+
+def test_failed_write_is_reported_and_cut_off(tmp_path):
+    """
+    Maps to: specs/technical.md Section 5.3 - a lost record is never reported as written,
+    and later records are not appended behind a torn frame
+    """
+    run = {"skill_name": "skill_x", "status": "success", "started_at": "2026-02-05T10:00:00Z"}
+    writer = AuditWriter(str(tmp_path), fsync="always")
+    writer.record(dict(run, run_id="run_0"))
+    assert writer.flush()
+
+    writer._file = _TornFile(writer._file)
+    writer.record(dict(run, run_id="run_1"))
+    assert writer.flush() is False
+    writer.record(dict(run, run_id="run_2"))
+    assert writer.flush()
+    writer.close()
+
+    assert writer.stats()["errors"] == 1 and writer.stats()["lost"] == 1
+    assert [r["run_id"] for r in read_segments(str(tmp_path))] == ["run_0", "run_2"]
+    # Reopening finds nothing to recover away.
+    with AuditWriter(str(tmp_path)) as reopened:
+        assert reopened.stats()["recovered"] == 2
+
+
+def test_flush_after_close_returns_at_once(tmp_path):
+    writer = AuditWriter(str(tmp_path))
+    writer.record({"run_id": "run_0", "skill_name": "skill_x", "status": "success", "started_at": "2026-02-05T10:00:00Z"})
+    writer.close()
+    done = []
+    flusher = threading.Thread(target=lambda: done.append(writer.flush()), daemon=True)
+    flusher.start()
+    flusher.join(5)
+    assert done == [True]
+
+
+def test_segments_roll_and_mirror_to_store(tmp_path):
+    """
+    Maps to: specs/technical.md Section 5.1 - skill_runs table
+    """
+    store = SQLiteStore(str(tmp_path / "chimera.db"))
+    writer = AuditWriter(str(tmp_path / "audit"), segment_bytes=512, max_batch=4, store=store)
+    for i in range(40):
+        writer.record({"run_id": f"run_{i}", "skill_name": "skill_x", "status": "success",
+                       "started_at": "2026-02-05T10:00:00Z"})
+    writer.close()
+
+    assert len(list_segments(str(tmp_path / "audit"))) > 1
+    assert len(list(read_segments(str(tmp_path / "audit")))) == 40
+    assert store.count("skill_runs") == 40
+    store.close()
+
+
+def test_invalid_fsync_policy(tmp_path):
+    with pytest.raises(ValueError):
+        AuditWriter(str(tmp_path), fsync="sometimes")
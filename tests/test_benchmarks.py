@@ -0,0 +1,41 @@
+"""
+Benchmark Gate Tests (benchmarks/bench_skills.py baseline comparison)
+
+These tests assert the regression gate behind `make bench-check`:
+- a case regresses when its ops/sec drops more than the threshold below the baseline
+- cases with no usable baseline figure are skipped, never a crash
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+from benchmarks.bench_skills import compare
+
+
+def test_compare_flags_drops_beyond_the_threshold():
+    baseline = {"a": {"ops_per_sec": 1000.0}, "b": {"ops_per_sec": 1000.0}, "c": {"ops_per_sec": 1000.0}}
+    results = {"a": {"ops_per_sec": 950.0}, "b": {"ops_per_sec": 850.0}, "c": {"ops_per_sec": 1200.0}}
+    regressions = compare(results, baseline, 0.10)
+    assert [(name, then, now) for name, then, now, _ in regressions] == [("b", 1000.0, 850.0)]
+    assert abs(regressions[0][3] - -0.15) < 1e-9
+
+
+def test_compare_skips_cases_without_a_usable_baseline():
+    baseline = {"zero": {"ops_per_sec": 0.0}, "blank": {}}
+    results = {"zero": {"ops_per_sec": 10.0}, "blank": {"ops_per_sec": 10.0}, "new": {"ops_per_sec": 10.0}}
+    assert compare(results, baseline, 0.10) == []
+
+
+def test_missing_baseline_fails_with_a_message(tmp_path):
+    path = tmp_path / "skills.json"
+    proc = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_skills", "--compare", str(path)],
+        capture_output=True,
+        text=True,
+        cwd=Path(__file__).resolve().parents[1],
+    )
+    assert proc.returncode == 1
+    assert f"no baseline at {path}" in proc.stderr
+    assert "Traceback" not in proc.stderr
+    assert not path.exists()
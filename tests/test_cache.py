@@ -0,0 +1,140 @@
+"""
+Artifact Cache Tests (memory LRU + shared disk tier, eviction, cross-process stats)
+
+These tests assert the caching layer around the skills defined in:
+- specs/technical.md Sections 3.1-3.3 - deterministic trends, drafts and reviews
+- specs/functional.md F5 - planner workflow across worker processes
+"""
+
+import multiprocessing
+import os
+import re
+import struct
+import subprocess
+import sys
+
+from chimera import clock
+from chimera.cache import ArtifactCache, cache_key, cached_skills
+from chimera.pipeline import ShardedRunner
+from chimera.skills import fetch_trends
+
+
+TRENDS = {"platform": "youtube", "region": "ET", "time_window": "24h", "limit": 5}
+
+
+def _fill(directory, keys):
+    with ArtifactCache(directory) as cache:
+        for key in keys:
+            cache.put(key, {"key": key})
+    return os.getpid()
+
+
+def test_memory_then_disk_then_miss(tmp_path):
+    cache = ArtifactCache(str(tmp_path), memory_entries=2)
+    assert cache.get("ftr_a") is None
+    cache.put("ftr_a", {"n": 1})
+    cache.put("ftr_b", {"n": 2})
+    cache.put("ftr_c", {"n": 3})  # pushes ftr_a out of memory, not off disk
+    assert cache.get("ftr_c") == {"n": 3}
+    assert cache.get("ftr_a") == {"n": 1}
+    stats = cache.stats()
+    assert (stats["memory_hits"], stats["disk_hits"], stats["misses"], stats["puts"]) == (1, 1, 1, 3)
+    assert stats["memory_entries"] == 2
+    assert not [n for n in os.listdir(tmp_path) if n.endswith(".tmp")]
+    cache.close()
+
+
+def test_wrapped_skills_share_results_across_instances(tmp_path):
+    a = cached_skills(ArtifactCache(str(tmp_path)))
+    with clock.frozen("2026-01-01T00:00:00Z"):
+        first = a["skill_fetch_trends"](TRENDS)
+        assert first == fetch_trends(TRENDS)
+    assert os.path.exists(tmp_path / (cache_key("skill_fetch_trends", TRENDS) + ".json"))
+
+    # A second cache on the same directory (as another worker would open) reads it from disk.
+    other = ArtifactCache(str(tmp_path))
+    b = cached_skills(other)
+    assert b["skill_fetch_trends"](TRENDS) == first
+    assert other.stats()["disk_hits"] == 1
+
+    # Errors are not cached.
+    puts = other.stats()["puts"]
+    assert "error" in b["skill_fetch_trends"](dict(TRENDS, platform="bogus"))
+    assert "error" in b["skill_fetch_trends"](dict(TRENDS, platform="bogus"))
+    assert other.stats()["puts"] == puts
+    assert cache_key("skill_fetch_trends", TRENDS).startswith("ftr_")
+
+
+def test_cache_key_is_a_full_digest():
+    key = cache_key("skill_fetch_trends", TRENDS)
+    assert re.fullmatch(r"ftr_[0-9a-f]{64}", key)
+    assert key != cache_key("skill_fetch_trends", dict(TRENDS, limit=6))
+
+
+def test_size_based_eviction_removes_oldest(tmp_path):
+    cache = ArtifactCache(str(tmp_path), memory_entries=0, max_bytes=4000, low_water=0.5)
+    for i in range(200):
+        cache.put(f"gdr_{i:04d}", {"body": "x" * 80, "i": i})
+        os.utime(tmp_path / f"gdr_{i:04d}.json", (i, i))  # deterministic write order
+    assert cache.size() <= 4000
+    assert cache.get("gdr_0000") is None
+    assert cache.get("gdr_0199") == {"body": "x" * 80, "i": 199}
+    assert cache.stats()["evictions"] > 0
+
+
+def test_hit_metrics_are_summed_across_processes(tmp_path):
+    ctx = multiprocessing.get_context("spawn")
+    with ctx.Pool(2) as pool:
+        pids = pool.starmap(_fill, [(str(tmp_path), ["evp_a", "evp_b"]), (str(tmp_path), ["evp_c"])])
+    cache = ArtifactCache(str(tmp_path))
+    for key in ("evp_a", "evp_b", "evp_c", "evp_missing"):
+        cache.get(key)
+    totals = cache.stats()["all"]
+    assert totals["puts"] == 3
+    assert (totals["disk_hits"], totals["misses"]) == (3, 1)
+    assert totals["processes"] == len(set(pids) | {os.getpid()})
+    assert totals["hit_rate"] == 0.75
+
+
+def _write_stats(path, puts, retired_puts=0, retired_processes=0):
+    own = [0, 0, 0, puts, 0, 0]
+    retired = [0, 0, 0, retired_puts, 0, 0, retired_processes]
+    path.write_bytes(struct.pack(f"<{len(own) + len(retired)}Q", *own, *retired))
+
+
+def test_stats_of_exited_processes_are_folded_in(tmp_path):
+    """
+    Maps to: specs/functional.md F5 - pool-wide hit metrics survive worker exits, in bounded files
+    """
+    stats_dir = tmp_path / "stats"
+    stats_dir.mkdir()
+    dead = subprocess.Popen([sys.executable, "-c", "pass"])
+    dead.wait()
+    _write_stats(stats_dir / f"{dead.pid}.stats", puts=5, retired_puts=2, retired_processes=1)
+    # Left behind by an exited process whose PID this process now has.
+    _write_stats(stats_dir / f"{os.getpid()}.stats", puts=7)
+
+    with ArtifactCache(str(tmp_path)) as cache:
+        assert os.listdir(stats_dir) == [f"{os.getpid()}.stats"]
+        assert cache.stats()["puts"] == 0  # not continued from the recycled PID's counts
+        cache.put("evp_a", {"n": 1})
+        with ArtifactCache(str(tmp_path)) as again:  # a second cache in this process shares the slot
+            assert again.stats()["puts"] == 1
+        totals = cache.stats()["all"]
+    assert totals["puts"] == 5 + 2 + 7 + 1
+    assert totals["processes"] == 1 + 1 + 1 + 1
+
+
+def test_sharded_runner_workers_share_the_disk_tier(tmp_path):
+    requests = [TRENDS, dict(TRENDS, region="KE")]
+    with ShardedRunner(2, confidence_threshold=0.0) as runner:
+        plain = runner.run(requests)
+    with ShardedRunner(2, confidence_threshold=0.0, cache_dir=str(tmp_path)) as runner:
+        cold = runner.run(requests)
+    with ShardedRunner(2, confidence_threshold=0.0, cache_dir=str(tmp_path)) as runner:
+        warm = runner.run(requests)
+    ids = lambda result: sorted(p["publish_id"] for p in result["published"])
+    assert ids(plain) == ids(cold) == ids(warm)
+    totals = ArtifactCache(str(tmp_path)).stats()["all"]
+    # fetch + 5 drafts + 5 reviews per request, computed once and then served from disk.
+    assert totals["puts"] == 22 and totals["disk_hits"] == 22
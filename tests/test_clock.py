@@ -0,0 +1,92 @@
+"""
+Clock Tests (cached UTC timestamps, frozen time, per-run pinning)
+
+These tests assert the timestamp behaviour behind the contracts defined in:
+- specs/technical.md Section 4 - error.timestamp is ISO-8601 UTC
+- specs/technical.md Sections 3.1-3.5 - timestamp fields on skill outputs
+"""
+
+import asyncio
+import itertools
+import marshal
+from datetime import datetime, timezone
+
+import pytest
+
+from chimera import clock
+from chimera.pipeline import Pipeline, ShardedRunner
+from chimera.pipeline.sharding import run_batch
+from chimera.skills import fetch_trends
+
+
+TRENDS = {"platform": "youtube", "region": "ET", "time_window": "24h", "limit": 3}
+
+
+@pytest.fixture
+def ticking():
+    """Install a clock that advances one second on every read."""
+    seconds = itertools.count(1_767_225_600)  # 2026-01-01T00:00:00Z
+    previous = clock.set_clock(clock.SystemClock(lambda: float(next(seconds))))
+    yield
+    clock._now = previous
+
+
+def test_system_clock_formats_once_per_second():
+    now = [1_767_225_600.25]
+    c = clock.SystemClock(lambda: now[0])
+    first = c.now()
+    assert first == "2026-01-01T00:00:00Z"
+    now[0] = 1_767_225_600.99
+    assert c.now() is first
+    now[0] = 1_767_225_601.0
+    assert c.now() == "2026-01-01T00:00:01Z"
+    # Same text the skills produced with datetime before the shared clock.
+    moment = datetime(2026, 3, 4, 5, 6, 7, tzinfo=timezone.utc)
+    assert clock.SystemClock(moment.timestamp).now() == moment.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def test_frozen_applies_to_every_skill_and_error_path():
+    with clock.frozen("2026-02-01T00:00:00Z"):
+        out = fetch_trends(TRENDS)
+        err = fetch_trends(dict(TRENDS, platform="bogus"))
+    assert out["timestamp"] == "2026-02-01T00:00:00Z"
+    assert {t["collected_at"] for t in out["topics"]} == {"2026-02-01T00:00:00Z"}
+    assert err["error"]["timestamp"] == "2026-02-01T00:00:00Z"
+    assert fetch_trends(TRENDS)["timestamp"] != "2026-02-01T00:00:00Z"
+
+
+def test_pipeline_run_carries_one_timestamp(ticking):
+    a = fetch_trends(TRENDS)["timestamp"]
+    assert fetch_trends(TRENDS)["timestamp"] != a
+
+    result = asyncio.run(Pipeline(confidence_threshold=0.0).run([TRENDS, dict(TRENDS, region="KE")]))
+    assert len(result["published"]) == 6
+    assert len({p["timestamp"] for p in result["published"]}) == 1
+
+    with clock.pinned() as outer:
+        with clock.pinned("2000-01-01T00:00:00Z") as inner:
+            assert inner == outer
+        assert fetch_trends(TRENDS)["timestamp"] == outer
+
+
+def test_pinned_is_per_task():
+    async def stamp(ts):
+        with clock.pinned(ts):
+            await asyncio.sleep(0.01)
+            return clock.now()
+
+    async def both():
+        return await asyncio.gather(stamp("2026-01-01T00:00:01Z"), stamp("2026-01-01T00:00:02Z"))
+
+    assert asyncio.run(both()) == ["2026-01-01T00:00:01Z", "2026-01-01T00:00:02Z"]
+
+
+def test_sharded_batches_carry_the_run_timestamp():
+    options = {"content_type": "post", "constraints": [], "confidence_threshold": 0.0, "schedule_time": None}
+    payload = marshal.dumps((dict(options, timestamp="2026-01-01T00:00:00Z"), [TRENDS]))
+    out = marshal.loads(run_batch(payload))
+    assert {p["timestamp"] for p in out["published"]} == {"2026-01-01T00:00:00Z"}
+
+    with ShardedRunner(workers=2, batch_size=1, confidence_threshold=0.0) as runner:
+        result = runner.run([TRENDS, dict(TRENDS, region="KE"), dict(TRENDS, platform="tiktok")])
+    assert len({p["timestamp"] for p in result["published"]}) == 1
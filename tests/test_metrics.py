@@ -0,0 +1,106 @@
+"""
+Metrics Tests (latency histograms, error counters, Prometheus text)
+
+These tests assert the observability hooks around the skills defined in:
+- specs/technical.md Section 4 - error.code values counted per skill
+- specs/technical.md Section 6 - skill contracts (instrumentation must not change outputs)
+"""
+
+import asyncio
+import importlib
+import random
+import threading
+import urllib.request
+
+import pytest
+
+from chimera import metrics
+from chimera.api import ApiServer
+from chimera.metrics import Histogram, Metrics
+from chimera.skills import fetch_trends, registry
+
+
+TRENDS = {"platform": "youtube", "region": "ET", "time_window": "24h", "limit": 5}
+
+
+@pytest.fixture
+def instrumented():
+    m = metrics.instrument()
+    yield m
+    metrics.uninstrument()
+
+
+def test_histogram_quantiles_within_bucket_precision():
+    h = Histogram()
+    rng = random.Random(7)
+    values = sorted(rng.randint(1, 10**9) for _ in range(50_000))
+    for v in values:
+        h.record(v)
+    assert h.count == len(values) and h.max == values[-1]
+    for q in (0.5, 0.9, 0.99):
+        exact = values[int(q * len(values)) - 1]
+        assert abs(h.quantile(q) - exact) / exact < 0.04
+
+
+def test_instrument_records_phases_and_error_codes(instrumented):
+    """
+    Maps to: specs/technical.md Section 4 - error codes counted by error.code
+    """
+    assert registry.dispatch("skill_fetch_trends", TRENDS)["topics"]
+    registry.dispatch("skill_fetch_trends", dict(TRENDS, platform="bogus"))
+    registry.dispatch("skill_fetch_trends", dict(TRENDS, region="et"))
+    # Direct callers (pipeline stages) bypass dispatch but still hit the phase helpers.
+    fetch_trends(TRENDS)
+
+    snap = instrumented.snapshot()
+    phases = snap["latency"]["skill_fetch_trends"]
+    assert phases["total"]["count"] == 3
+    assert phases["validate"]["count"] == 4
+    assert phases["hash"]["count"] == 2 * 2  # request ID plus one batched topic series
+    assert phases["timestamp"]["count"] >= 2
+    assert snap["errors"] == {"skill_fetch_trends": {"INVALID_PLATFORM": 1, "INVALID_REGION": 1}}
+
+
+def test_uninstrument_restores_originals():
+    fetch_module = importlib.import_module("chimera.skills.fetch_trends")
+    original = fetch_module._ts
+    m = metrics.instrument()
+    assert fetch_module._ts is not original
+    metrics.uninstrument()
+    assert fetch_module._ts is original
+    assert metrics.active() is None
+
+    registry.dispatch("skill_fetch_trends", TRENDS)
+    assert m.snapshot()["latency"] == {}
+
+
+def test_prometheus_text(instrumented):
+    registry.dispatch("skill_fetch_trends", dict(TRENDS, platform="bogus"))
+    text = instrumented.prometheus()
+    assert "# TYPE chimera_skill_latency_seconds summary" in text
+    assert 'chimera_skill_latency_seconds_count{skill="skill_fetch_trends",phase="total"} 1' in text
+    assert 'chimera_skill_errors_total{skill="skill_fetch_trends",code="INVALID_PLATFORM"} 1' in text
+
+
+def test_metrics_endpoint(instrumented):
+    server = ApiServer()
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(server.start())
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        registry.dispatch("skill_fetch_trends", TRENDS)
+        with urllib.request.urlopen(f"http://127.0.0.1:{server.port}/metrics") as resp:
+            assert resp.headers["Content-Type"].startswith("text/plain")
+            assert 'phase="validate"' in resp.read().decode()
+    finally:
+        asyncio.run_coroutine_threadsafe(server.close(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+def test_separate_metrics_instances_do_not_share_state():
+    a, b = Metrics(), Metrics()
+    a.histogram("skill_x").record(100)
+    assert b.snapshot()["latency"] == {}
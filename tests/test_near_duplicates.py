@@ -0,0 +1,144 @@
+"""
+Near-Duplicate Draft Tests (SimHash fingerprints, banded index, review reuse)
+
+These tests assert near-duplicate handling ahead of the review contract:
+- specs/technical.md Section 3.2 - draft title/body
+- specs/technical.md Section 3.3 - review decision, reason_codes, review_id pattern
+- specs/functional.md F3 - Review Agent evaluates every draft
+"""
+
+import random
+
+import pytest
+
+from chimera.pipeline import run_pipeline
+from chimera.review import NEAR_DUPLICATE, NearDuplicateReviewer, SimHashIndex, draft_fingerprint, simhash
+from chimera.skills import evaluate_policy, fetch_trends, generate_draft
+from chimera.store import SQLiteStore
+
+
+def _text(rng, words=150):
+    return " ".join(f"w{rng.randrange(2000)}" for _ in range(words))
+
+
+def _draft(i, title, body, confidence=0.9):
+    return {"draft_id": f"drf_{i:012x}", "title": title, "body": body, "confidence": confidence}
+
+
+def test_simhash_is_stable_and_locality_sensitive():
+    rng = random.Random(50)
+    text = _text(rng)
+    assert simhash(text) == simhash(text.upper() + " ,.!")  # case and punctuation ignored
+    edited = text.split()
+    edited[70] = "changed"
+    assert (simhash(text) ^ simhash(" ".join(edited))).bit_count() <= 8
+    assert (simhash(text) ^ simhash(_text(rng))).bit_count() > 8
+    assert 0 <= simhash(text) < 1 << 64
+    assert simhash("") == 0
+    assert draft_fingerprint({"title": "t", "body": None}) is None
+
+
+def test_banded_index_finds_everything_within_threshold():
+    rng = random.Random(3)
+    index = SimHashIndex(threshold=3)
+    entries = {f"k{i}": rng.getrandbits(64) for i in range(5000)}
+    for key, fp in entries.items():
+        index.add(key, fp)
+    for _ in range(300):
+        base_key = rng.choice(sorted(entries)[:50])
+        query = entries[base_key]
+        for bit in rng.sample(range(64), rng.randint(0, 5)):
+            query ^= 1 << bit
+        expected = sorted(
+            ((k, (fp ^ query).bit_count()) for k, fp in entries.items() if (fp ^ query).bit_count() <= 3),
+            key=lambda hit: hit[1],
+        )
+        assert sorted(index.query(query)) == sorted(expected)  # brute force agrees
+    index.remove("k0")
+    assert "k0" not in index and index.nearest(entries["k0"]) is None
+    with pytest.raises(ValueError):
+        SimHashIndex(threshold=32)
+
+
+def test_near_duplicates_are_flagged_not_reused_by_default():
+    rng = random.Random(1)
+    body = _text(rng)
+    reviewer = NearDuplicateReviewer()
+    first = reviewer.evaluate({"draft": _draft(1, "Post Draft", body)})
+    second = reviewer.evaluate({"draft": _draft(2, "Post Draft", body + " w1")})
+    other = reviewer.evaluate({"draft": _draft(3, "Post Draft", _text(rng))})
+    assert "near_duplicate" not in first and "near_duplicate" not in other
+    assert second["near_duplicate"]["draft_id"] == first["review"]["draft_id"]
+    assert second["near_duplicate"]["review_id"] == first["review"]["review_id"]
+    assert second["review"] == evaluate_policy({"draft": _draft(2, "Post Draft", body + " w1")})["review"]
+    assert reviewer.stats == {"evaluated": 3, "flagged": 1, "reused": 0}
+    assert len(reviewer.index) == 2  # flagged drafts are not indexed
+
+
+def test_reuse_copies_the_prior_decision_with_an_annotation(tmp_path):
+    rng = random.Random(2)
+    body = _text(rng)
+    reviewer = NearDuplicateReviewer(reuse=True)
+    low = reviewer.evaluate({"draft": _draft(1, "Post", body, confidence=0.2), "confidence_threshold": 0.7})
+    assert low["review"]["decision"] == "REQUIRES_HUMAN_REVIEW"
+
+    dup = _draft(2, "Post", body, confidence=0.4)
+    out = reviewer.evaluate({"draft": dup, "confidence_threshold": 0.7})
+    review = out["review"]
+    assert review["decision"] == "REQUIRES_HUMAN_REVIEW"
+    assert review["reason_codes"] == ["LOW_CONFIDENCE", NEAR_DUPLICATE]
+    assert review["draft_id"] == dup["draft_id"] and review["confidence"] == 0.4
+    assert review["review_id"].startswith("rev_") and review["review_id"] != low["review"]["review_id"]
+    assert low["review"]["draft_id"] in review["notes"]
+    assert out["near_duplicate"]["distance"] == 0
+
+    # A copy whose own confidence clears the threshold gets its own evaluation.
+    high = reviewer.evaluate({"draft": _draft(3, "Post", body, confidence=0.95), "confidence_threshold": 0.7})
+    assert high["review"]["reason_codes"] == [] and "near_duplicate" in high
+
+    # A different threshold is a different evaluation: flagged, but evaluated.
+    other = reviewer.evaluate({"draft": dup, "confidence_threshold": 0.3})
+    assert other["review"]["decision"] == "APPROVED" and "near_duplicate" in other
+    # Invalid input still gets evaluate_policy's error.
+    assert reviewer.evaluate({"draft": dup, "confidence_threshold": 2})["error"]["code"] == "INVALID_CONFIDENCE_THRESHOLD"
+    assert reviewer.stats == {"evaluated": 3, "flagged": 3, "reused": 1}
+
+    store = SQLiteStore(str(tmp_path / "chimera.db"))
+    missing = reviewer.evaluate({"draft": _draft(9, "Post", body), "confidence_threshold": 0.7}, store=store)
+    assert missing["error"]["code"] == "DRAFT_NOT_FOUND"
+    store.close()
+
+
+def test_approved_decision_is_never_copied_below_the_threshold():
+    rng = random.Random(6)
+    body = _text(rng)
+    reviewer = NearDuplicateReviewer(reuse=True)
+    high = reviewer.evaluate({"draft": _draft(1, "Post", body, confidence=0.95), "confidence_threshold": 0.7})
+    assert high["review"]["decision"] == "APPROVED"
+
+    low = reviewer.evaluate({"draft": _draft(2, "Post", body, confidence=0.10), "confidence_threshold": 0.7})
+    assert low["review"]["decision"] == "REQUIRES_HUMAN_REVIEW"
+    assert low["review"]["reason_codes"] == ["LOW_CONFIDENCE"]  # evaluated, not reused
+    assert low["near_duplicate"]["draft_id"] == high["review"]["draft_id"]
+
+    same = reviewer.evaluate({"draft": _draft(3, "Post", body, confidence=0.80), "confidence_threshold": 0.7})
+    assert same["review"]["decision"] == "APPROVED"
+    assert same["review"]["reason_codes"] == [NEAR_DUPLICATE]
+    assert reviewer.stats == {"evaluated": 2, "flagged": 2, "reused": 1}
+
+
+def test_pipeline_reviews_through_the_reviewer():
+    # Every generated draft has the same title and body: one evaluation per review worker at most.
+    requests = [{"platform": "youtube", "region": "ET", "time_window": "24h", "limit": 20}]
+    reviewer = NearDuplicateReviewer(reuse=True)
+    result = run_pipeline(requests, content_type="post", confidence_threshold=0.5, near_duplicates=reviewer)
+    assert result["errors"] == []
+    assert len(result["published"]) + len(result["parked"]) + len(result["rejected"]) == 20
+    assert reviewer.stats["evaluated"] + reviewer.stats["reused"] == 20
+    # Every decision, copied or not, agrees with the draft's own confidence.
+    assert all(p["draft"]["confidence"] < 0.5 for p in result["parked"])
+    published = {p["draft_id"] for p in result["published"]}
+    topics = fetch_trends(requests[0])["topics"]
+    drafts = [generate_draft({"content_type": "post", "selected_topics": [t]})["draft"] for t in topics]
+    confidence = {d["draft_id"]: d["confidence"] for d in drafts}
+    assert published and all(confidence[d] >= 0.5 for d in published)
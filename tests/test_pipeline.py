@@ -0,0 +1,132 @@
+"""
+Pipeline Tests (streaming Planner workflow)
+
+These tests assert the Planner workflow defined in:
+- specs/functional.md F5 - Orchestrate Content Workflow (fetch -> draft -> review -> publish)
+- specs/technical.md Section 3.3 - REQUIRES_HUMAN_REVIEW / REJECTED drafts MUST NOT proceed
+- specs/functional.md F8 - failures MUST NOT silently continue
+"""
+
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from chimera.pipeline import Pipeline, run_pipeline
+from chimera.store import SQLiteStore
+
+
+REQUESTS = [
+    {"platform": "youtube", "region": "ET", "time_window": "24h", "limit": 10},
+    {"platform": "tiktok", "region": "US", "time_window": "7d", "limit": 10},
+]
+
+
+def test_pipeline_routes_every_topic():
+    """
+    Maps to: specs/functional.md F5, specs/technical.md Section 3.3
+    """
+    result = run_pipeline(REQUESTS, content_type="post", confidence_threshold=0.5)
+
+    assert result["errors"] == []
+    assert len(result["published"]) + len(result["parked"]) == 20
+    assert result["published"] and result["parked"]
+    for parked in result["parked"]:
+        assert parked["review"]["decision"] == "REQUIRES_HUMAN_REVIEW"
+    parked_ids = {p["draft"]["draft_id"] for p in result["parked"]}
+    assert not parked_ids & {p["draft_id"] for p in result["published"]}
+    assert result["stats"]["review"]["processed"] == 20
+
+
+def test_bounded_queues_apply_backpressure():
+    """
+    Maps to: specs/functional.md F5 - a flood of trends cannot overwhelm review
+    """
+    requests = [dict(REQUESTS[0], limit=50) for _ in range(4)]
+    result = run_pipeline(requests, queue_size=2, concurrency={"draft": 1, "review": 1})
+
+    assert len(result["published"]) + len(result["parked"]) == 200
+    for stage in ("fetch", "draft", "review", "publish"):
+        assert result["stats"][stage]["max_queue_depth"] <= 2
+
+
+def test_parking_does_not_block_pipeline():
+    """
+    Maps to: specs/technical.md Section 3.3 - REQUIRES_HUMAN_REVIEW waits for human approval
+    """
+    parked = []
+
+    async def slow_park(draft, review):
+        await asyncio.sleep(0.01)
+        parked.append(draft["draft_id"])
+
+    result = run_pipeline(REQUESTS, confidence_threshold=0.9, on_park=slow_park)
+    assert sorted(parked) == sorted(p["draft"]["draft_id"] for p in result["parked"])
+    assert len(result["published"]) + len(parked) == 20
+
+
+@pytest.mark.parametrize("asynchronous", [False, True])
+def test_failed_park_is_an_error_not_a_parked_draft(asynchronous):
+    """
+    Maps to: specs/functional.md F8 - a failed step is reported once, as an error
+    """
+    def sink(draft, review):
+        if draft["confidence"] < 0.3:
+            raise RuntimeError("review inbox unavailable")
+
+    async def async_sink(draft, review):
+        sink(draft, review)
+
+    result = run_pipeline(REQUESTS, confidence_threshold=0.9, on_park=async_sink if asynchronous else sink)
+    parked = {p["draft"]["draft_id"] for p in result["parked"]}
+    failed = {e["input"]["draft_id"] for e in result["errors"]}
+    assert failed and parked and not parked & failed
+    assert {e["stage"] for e in result["errors"]} == {"review"}
+    assert all("review inbox unavailable" in e["error"]["message"] for e in result["errors"])
+    assert len(result["published"]) + len(parked) + len(failed) == 20
+
+
+def test_errors_are_reported_not_dropped():
+    """
+    Maps to: specs/functional.md F8 - failed steps return structured error information
+    """
+    result = run_pipeline([{"platform": "myspace", "region": "ET", "time_window": "24h"}, REQUESTS[0]])
+    assert len(result["errors"]) == 1
+    assert result["errors"][0]["stage"] == "fetch"
+    assert result["errors"][0]["error"]["code"] == "INVALID_PLATFORM"
+    assert len(result["published"]) + len(result["parked"]) == 10
+
+
+def test_pipeline_persists_through_store(tmp_path):
+    """
+    Maps to: specs/technical.md Section 5 - every stage writes its records
+    """
+    store = SQLiteStore(str(tmp_path / "chimera.db"))
+    result = run_pipeline(REQUESTS[:1], store=store, confidence_threshold=0.5)
+    assert store.count("trend_topics") == 10
+    assert store.count("content_drafts") == 10
+    assert store.count("reviews") == 10
+    assert store.count("publish_jobs") == len(result["published"])
+    store.close()
+
+
+def test_pipeline_runs_on_a_process_pool():
+    """
+    Maps to: specs/functional.md F5 - stages may run in worker processes
+    """
+    threaded = run_pipeline(REQUESTS, content_type="post", confidence_threshold=0.5)
+    with ProcessPoolExecutor(2, mp_context=multiprocessing.get_context("spawn")) as pool:
+        result = run_pipeline(REQUESTS, content_type="post", confidence_threshold=0.5, executor=pool)
+    assert result["errors"] == []
+    assert sorted(p["draft_id"] for p in result["published"]) == sorted(p["draft_id"] for p in threaded["published"])
+    assert len(result["parked"]) == len(threaded["parked"])
+    # The run's pinned timestamp crosses the process boundary.
+    assert len({p["timestamp"] for p in result["published"]}) == 1
+
+
+def test_invalid_configuration():
+    with pytest.raises(ValueError):
+        Pipeline(concurrency={"review": 0})
+    with pytest.raises(ValueError):
+        Pipeline(queue_size=0)
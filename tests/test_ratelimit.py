@@ -0,0 +1,167 @@
+"""
+Rate Limiter Tests (sliding-window read/write quotas)
+
+These tests assert the rate limiting intent defined in:
+- specs/technical.md Security Intent - read endpoints 60/min, write endpoints 10/min
+"""
+
+import asyncio
+import http.client
+import json
+import multiprocessing
+import threading
+
+import pytest
+
+from chimera.api import ApiServer, RateLimiter, SharedRateLimiter
+from chimera.api.http import Request
+from chimera.api.server import _client_key
+
+
+@pytest.fixture(params=["local", "shared"])
+def limiter(request):
+    if request.param == "local":
+        yield RateLimiter()
+        return
+    shared = SharedRateLimiter(slots=1024)
+    yield shared
+    shared.unlink()
+
+
+def test_write_quota_per_token(limiter):
+    """
+    Maps to: specs/technical.md Security Intent - write endpoints 10/min
+    """
+    results = [limiter.allow("svc_a", "write", now=600.0 + i) for i in range(11)]
+    assert [ok for ok, _ in results] == [True] * 10 + [False]
+    assert results[-1][1] > 0
+
+    # Quotas are per token and per endpoint class.
+    assert limiter.allow("svc_b", "write", now=611.0)[0]
+    assert limiter.allow("svc_a", "read", now=611.0)[0]
+
+
+def test_previous_window_is_weighted(limiter):
+    for i in range(10):
+        limiter.allow("svc_a", "write", now=600.0 + i)
+    # Halfway through the next window half of the previous ten still count.
+    admitted = sum(limiter.allow("svc_a", "write", now=690.0)[0] for _ in range(10))
+    assert admitted == 5
+    # Two windows later the history is gone.
+    assert sum(limiter.allow("svc_a", "write", now=800.0)[0] for _ in range(12)) == 10
+
+
+def test_memory_is_bounded():
+    limiter = RateLimiter(shards=4, max_keys=64)
+    for i in range(10_000):
+        assert limiter.allow(f"svc_{i}", "read", now=600.0)[0]
+    assert len(limiter) <= 64
+
+
+def test_eviction_keeps_recently_used_keys():
+    limiter = RateLimiter({"write": (10, 60.0)}, shards=1, max_keys=8)
+    for _ in range(10):
+        limiter.allow("svc_a", "write", now=600.0)
+    for i in range(100):
+        # svc_a stays in use while new keys push older ones out.
+        limiter.allow(f"svc_{i}", "write", now=600.0)
+        assert not limiter.allow("svc_a", "write", now=600.0)[0]
+    assert len(limiter) <= 8
+
+
+def test_quota_key_is_the_peer():
+    """
+    Maps to: specs/technical.md Security Intent - the (unverified) bearer token
+    neither spends another client's quota nor buys a fresh one
+    """
+    request = Request("POST", "/v1/drafts", "HTTP/1.1", {"authorization": "Bearer svc_a"}, b"")
+    rotated = Request("POST", "/v1/drafts", "HTTP/1.1", {"authorization": "Bearer svc_b"}, b"")
+    assert _client_key(request, "10.0.0.1") != _client_key(request, "10.0.0.2")
+    assert _client_key(request, "10.0.0.1") == _client_key(rotated, "10.0.0.1")
+    assert _client_key(Request("GET", "/", "HTTP/1.1", {}, b""), "10.0.0.1") == "10.0.0.1"
+
+
+def test_threads_share_one_quota():
+    limiter = RateLimiter({"write": (1000, 60.0)})
+    admitted = []
+
+    def worker():
+        admitted.append(sum(limiter.allow("svc_a", "write", now=600.0)[0] for _ in range(500)))
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert sum(admitted) == 1000
+
+
+def _consume(limiter, n, out):
+    out.put(sum(limiter.allow("svc_a", "write", now=600.0)[0] for _ in range(n)))
+
+
+def test_shared_limit_holds_across_processes():
+    limiter = SharedRateLimiter({"write": (100, 60.0)}, slots=256)
+    out = multiprocessing.Queue()
+    procs = [multiprocessing.Process(target=_consume, args=(limiter, 60, out)) for _ in range(3)]
+    for p in procs:
+        p.start()
+    admitted = sum(out.get(timeout=30) for _ in procs)
+    for p in procs:
+        p.join()
+    assert admitted == 100
+    assert not limiter.allow("svc_a", "write", now=600.0)[0]
+    limiter.unlink()
+
+
+def test_server_answers_429_with_retry_after():
+    """
+    Maps to: specs/technical.md Section 4 - error envelope on rejected requests
+    """
+    server = ApiServer(rate_limiter=RateLimiter({"read": (3, 60.0), "write": (10, 60.0)}))
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(server.start())
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        conn = http.client.HTTPConnection("127.0.0.1", server.port)
+        statuses = []
+        for token in ("svc_a",) * 4 + ("svc_b",):
+            conn.request("GET", "/v1/capabilities", headers={"Authorization": f"Bearer {token}"})
+            resp = conn.getresponse()
+            body = json.loads(resp.read())
+            statuses.append(resp.status)
+            if resp.status == 429:
+                assert body["error"]["code"] == "RATE_LIMITED"
+                assert int(resp.getheader("Retry-After")) >= 1
+        assert statuses == [200, 200, 200, 429, 429]
+        conn.close()
+    finally:
+        asyncio.run_coroutine_threadsafe(server.close(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+def test_rotating_tokens_share_the_peer_quota():
+    server = ApiServer(rate_limiter=RateLimiter({"read": (3, 60.0), "write": (10, 60.0)}))
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(server.start())
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        conn = http.client.HTTPConnection("127.0.0.1", server.port)
+        statuses = []
+        for i in range(11):
+            conn.request("POST", "/v1/content/drafts", body=b"{}", headers={"Authorization": f"Bearer svc_{i}"})
+            resp = conn.getresponse()
+            resp.read()
+            statuses.append(resp.status)
+        assert 429 not in statuses[:10]
+        assert statuses[10] == 429
+        conn.close()
+    finally:
+        asyncio.run_coroutine_threadsafe(server.close(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
@@ -0,0 +1,116 @@
+"""
+Traffic Capture and Replay Tests (capture log, paced replay, frozen timestamps)
+
+These tests assert the replay harness around the skills defined in:
+- specs/technical.md Sections 3.1-3.5 - skill outputs deterministic apart from timestamps
+- specs/technical.md Section 4 - error.code values reported per replay
+"""
+
+import gzip
+import json
+
+import pytest
+
+from chimera import clock, metrics, replay
+from chimera.skills import registry
+
+
+TRENDS = {"platform": "youtube", "region": "ET", "time_window": "24h", "limit": 3}
+
+
+def _capture(path):
+    with replay.capture(str(path)) as recorder:
+        registry.dispatch("skill_fetch_trends", TRENDS)
+        registry.dispatch("skill_fetch_trends", dict(TRENDS, platform="bogus"))
+        registry.dispatch("skill_fetch_trends", dict(TRENDS, limit=1))
+        draft = {"draft_id": "drf_1", "platform": "youtube", "confidence": 0.8}
+        registry.dispatch("skill_evaluate_policy", {"draft": draft, "confidence_threshold": 0.5})
+    return recorder
+
+
+def test_capture_writes_compact_log_and_restores_registry(tmp_path):
+    before = registry.get_skill("skill_fetch_trends")
+    recorder = _capture(tmp_path / "traffic.log.gz")
+    assert recorder.count == 4
+    assert registry.get_skill("skill_fetch_trends") is before
+
+    with gzip.open(tmp_path / "traffic.log.gz", "rt") as f:
+        assert json.loads(f.readline())["format"] == "chimera-replay"
+    header, records = replay.load(str(tmp_path / "traffic.log.gz"))
+    assert header["started_at"] == recorder.started_at
+    assert [r[1] for r in records] == ["skill_fetch_trends"] * 3 + ["skill_evaluate_policy"]
+    assert records[0][3] == TRENDS
+    assert all(r[0] >= 0 and r[2] >= 0 for r in records)
+
+
+def test_frozen_replay_outputs_are_identical_across_runs(tmp_path):
+    _capture(tmp_path / "t.gz")
+    _, records = replay.load(str(tmp_path / "t.gz"))
+
+    a = replay.replay(records, speed=0, concurrency=4, freeze="2026-01-01T00:00:00Z")
+    b = replay.replay(records, speed=0, concurrency=1, freeze="2026-01-01T00:00:00Z")
+    assert a["outputs"] == b["outputs"] and None not in a["outputs"]
+    assert a["requests"] == 4 and a["errors"] == {"INVALID_PLATFORM": 1}
+    assert a["throughput_rps"] > 0 and a["latency"]["p50_us"] <= a["latency"]["max_us"]
+
+    with clock.frozen("2026-01-01T00:00:00Z"):
+        out = registry.dispatch("skill_fetch_trends", dict(TRENDS, platform="bogus"))
+    assert out["error"]["timestamp"] == "2026-01-01T00:00:00Z"
+    assert replay.digest(out) == a["outputs"][1]
+    live = registry.dispatch("skill_fetch_trends", dict(TRENDS, platform="bogus"))
+    assert live["error"]["timestamp"] != "2026-01-01T00:00:00Z"
+
+
+def test_paced_replay_honours_speed():
+    records = [(i * 20_000, "skill_fetch_trends", 50, TRENDS) for i in range(6)]
+    # 100ms of captured traffic: ~0.1s at 1x, ~0.01s at 10x.
+    assert replay.replay(records, speed=1.0)["elapsed_s"] >= 0.1
+    assert replay.replay(records, speed=10.0)["elapsed_s"] < 0.1
+
+
+def test_pipeline_target_runs_fetch_records_end_to_end(tmp_path):
+    _capture(tmp_path / "t.gz")
+    _, records = replay.load(str(tmp_path / "t.gz"))
+    report = replay.replay(records, speed=0, target="pipeline", freeze="2026-01-01T00:00:00Z")
+    assert report["requests"] == 3
+    again = replay.replay(records, speed=0, target="pipeline", freeze="2026-01-01T00:00:00Z")
+    assert report["outputs"] == again["outputs"]
+    with pytest.raises(ValueError):
+        replay.replay(records, target="http")
+
+
+def test_cli_writes_output_digests(tmp_path, capsys):
+    _capture(tmp_path / "t.gz")
+    out = tmp_path / "digests.txt"
+    assert replay.main([str(tmp_path / "t.gz"), "--speed", "0", "--outputs", str(out)]) == 0
+    assert json.loads(capsys.readouterr().out)["requests"] == 4
+    assert len(out.read_text().split()) == 4
+
+
+def test_params_are_captured_as_they_were_at_call_time(tmp_path):
+    params = dict(TRENDS)
+    with replay.capture(str(tmp_path / "t.gz")):
+        registry.dispatch("skill_fetch_trends", params)
+        params["limit"] = 99
+    _, records = replay.load(str(tmp_path / "t.gz"))
+    assert records[0][3] == TRENDS
+
+
+def test_stop_capture_keeps_instrumentation_installed_later(tmp_path):
+    replay.start_capture(str(tmp_path / "t.gz"))
+    try:
+        metrics.instrument()
+        instrumented = registry.get_skill("skill_fetch_trends")
+    finally:
+        replay.stop_capture()
+    try:
+        assert registry.get_skill("skill_fetch_trends") is instrumented
+        assert "topics" in registry.dispatch("skill_fetch_trends", TRENDS)
+    finally:
+        metrics.uninstrument()
+
+
+def test_failures_outside_the_call_are_counted(monkeypatch):
+    monkeypatch.setattr(replay, "_run_skill", lambda record, store: None)
+    report = replay.replay([(0, "skill_fetch_trends", 50, TRENDS)] * 3, speed=0)
+    assert report["errors"] == {"REPLAY_EXCEPTION": 3}
@@ -0,0 +1,249 @@
+"""
+Human Review Queue Tests (priority, leases, long-poll, bulk decisions)
+
+These tests assert the human approval contracts defined in:
+- specs/technical.md Section 3.4 - human approval validation and error codes
+- specs/functional.md F4 - Human Reviewer approves or rejects sensitive content
+"""
+
+import asyncio
+import contextlib
+import threading
+import time
+
+import pytest
+
+from chimera.review import ReviewQueue
+from chimera.skills import evaluate_policy, fetch_trends, generate_draft
+from chimera.store import SQLiteStore
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _review(i, confidence=0.5):
+    return {"review_id": f"rev_{i}", "draft_id": f"drf_{i}", "decision": "REQUIRES_HUMAN_REVIEW", "confidence": confidence}
+
+
+def _draft(i):
+    return {"draft_id": f"drf_{i}"}
+
+
+def test_claims_follow_priority_order():
+    queue = ReviewQueue()
+    queue.enqueue(_draft(1), _review(1, 0.50), "2026-02-06T10:00:00Z")
+    queue.enqueue(_draft(2), _review(2, 0.20))
+    queue.enqueue(_draft(3), _review(3, 0.50), "2026-02-05T10:00:00Z")
+    queue.enqueue(_draft(4), _review(4, 0.50))
+    queue.enqueue(_draft(5), _review(5, 0.50))
+
+    out = queue.claim("usr_1", n=5)
+    # Lowest confidence, then earliest schedule (unscheduled last), then age.
+    assert [i["review_id"] for i in out["items"]] == ["rev_2", "rev_3", "rev_1", "rev_4", "rev_5"]
+    assert len(queue) == 0
+
+
+def test_enqueue_rejects_non_human_review_decisions():
+    queue = ReviewQueue()
+    out = queue.enqueue(_draft(1), dict(_review(1), decision="APPROVED"))
+    assert out["error"]["code"] == "INVALID_REVIEW_STATE"
+    assert queue.claim("bad")["error"]["code"] == "INVALID_REVIEWER_ID"
+
+
+def test_expired_lease_returns_review_to_its_position():
+    clock = FakeClock()
+    queue = ReviewQueue(lease_seconds=60, clock=clock)
+    queue.enqueue(_draft(1), _review(1, 0.1))
+    queue.enqueue(_draft(2), _review(2, 0.2))
+
+    assert queue.claim("usr_1")["items"][0]["review_id"] == "rev_1"
+    assert [i["review_id"] for i in queue.leased("usr_1")] == ["rev_1"]
+    clock.now += 30
+    assert queue.renew("rev_1", "usr_1")["review_id"] == "rev_1"
+    assert queue.renew("rev_1", "usr_2")["error"]["code"] == "INVALID_REVIEW_STATE"
+
+    clock.now += 61
+    assert queue.leased("usr_1") == []
+    assert queue.claim("usr_2")["items"][0]["review_id"] == "rev_1"
+
+    assert queue.release("rev_1", "usr_2")["review_id"] == "rev_1"
+    assert queue.claim("usr_3", n=2)["items"][0]["review_id"] == "rev_1"
+
+
+def test_blocking_claim_wakes_on_enqueue():
+    queue = ReviewQueue()
+    timer = threading.Timer(0.05, queue.enqueue, args=(_draft(1), _review(1)))
+    timer.start()
+    start = time.monotonic()
+    out = queue.claim("usr_1", timeout=5)
+    assert out["items"][0]["review_id"] == "rev_1"
+    assert time.monotonic() - start < 2
+    assert queue.claim("usr_1", timeout=0.01)["items"] == []
+
+
+def test_async_long_poll():
+    queue = ReviewQueue()
+
+    async def scenario():
+        waiter = asyncio.ensure_future(queue.wait_claim("usr_1", timeout=5))
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+        # Enqueue from another thread, as a pipeline worker would.
+        await asyncio.get_running_loop().run_in_executor(None, queue.enqueue, _draft(1), _review(1))
+        out = await waiter
+        empty = await queue.wait_claim("usr_1", timeout=0.01)
+        return out, empty
+
+    out, empty = asyncio.run(scenario())
+    assert out["items"][0]["review_id"] == "rev_1"
+    assert empty == {"items": []}
+
+
+def test_bulk_decisions_are_atomic(tmp_path):
+    """
+    Maps to: specs/technical.md Section 3.4 - approvals recorded in human_approvals
+    """
+    store = SQLiteStore(str(tmp_path / "chimera.db"))
+    queue = ReviewQueue(store)
+    topic = fetch_trends({"platform": "youtube", "region": "ET", "time_window": "24h", "limit": 1}, store=store)["topics"][0]
+    for content_type in ("post", "caption", "short_script"):
+        draft = generate_draft({"content_type": content_type, "selected_topics": [topic]}, store=store)["draft"]
+        review = evaluate_policy({"draft": draft, "confidence_threshold": 1.0}, store=store)["review"]
+        queue.enqueue(draft, review)
+    claimed = queue.claim("usr_1", n=3)["items"]
+
+    batch = [{"review_id": r["review_id"], "reviewer_id": "usr_1", "decision": "APPROVED"} for r in claimed]
+    bad = batch[:2] + [dict(batch[2], decision="MAYBE")]
+    err = queue.decide(bad)["error"]
+    assert err["code"] == "INVALID_DECISION" and err["details"]["index"] == 2
+    assert store.count("human_approvals") == 0
+
+    assert queue.decide([dict(batch[0], reviewer_id="usr_2")])["error"]["code"] == "INVALID_REVIEW_STATE"
+
+    batch[1]["decision"] = "REJECTED"
+    out = queue.decide(batch)
+    assert [a["approval_id"][:4] for a in out["approvals"]] == ["hap_"] * 3
+    assert store.count("human_approvals") == 3
+    assert store.get_human_approval(out["approvals"][1]["approval_id"])["decision"] == "REJECTED"
+    assert queue.leased("usr_1") == []
+    assert queue.decide(batch[:1])["error"]["code"] == "REVIEW_NOT_FOUND"
+    store.close()
+
+
+class SlowStore:
+    """Stands in for SQLiteStore: the approval insert blocks until released, then may fail."""
+
+    def __init__(self, fail=False):
+        self.started, self.release, self.fail = threading.Event(), threading.Event(), fail
+        self.approvals = []
+        self.finished = False
+
+    @contextlib.contextmanager
+    def transaction(self):
+        yield
+
+    def insert_human_approvals(self, approvals):
+        self.started.set()
+        self.release.wait(5)
+        self.finished = True
+        if self.fail:
+            raise OSError("disk I/O error")
+        self.approvals.extend(approvals)
+
+
+def test_store_write_does_not_hold_the_queue_lock():
+    store = SlowStore()
+    queue = ReviewQueue(store)
+    for i in range(3):
+        queue.enqueue(_draft(i), _review(i, confidence=i / 10))
+    queue.claim("usr_1")  # leases rev_0
+    decide = threading.Thread(target=queue.decide, args=([{"review_id": "rev_0", "reviewer_id": "usr_1", "decision": "APPROVED"}],))
+    decide.start()
+    assert store.started.wait(5)
+    # While the write is in flight the queue keeps serving, and the review cannot be decided twice.
+    assert [i["review_id"] for i in queue.claim("usr_2")["items"]] == ["rev_1"]
+    queue.enqueue(_draft(3), _review(3))
+    assert not store.finished
+    again = queue.decide([{"review_id": "rev_0", "reviewer_id": "usr_1", "decision": "REJECTED"}])
+    assert again["error"]["code"] == "REVIEW_NOT_FOUND"
+    store.release.set()
+    decide.join(5)
+    assert [a["review_id"] for a in store.approvals] == ["rev_0"]
+    assert queue.leased("usr_1") == []
+
+
+def test_failed_store_write_puts_reviews_back():
+    store = SlowStore(fail=True)
+    store.release.set()
+    queue = ReviewQueue(store)
+    for i in range(2):
+        queue.enqueue(_draft(i), _review(i, confidence=i / 10))
+    queue.claim("usr_1")  # leases rev_0; rev_1 stays queued
+    batch = [{"review_id": f"rev_{i}", "reviewer_id": "usr_1", "decision": "APPROVED"} for i in range(2)]
+    with pytest.raises(OSError):
+        queue.decide(batch)
+    assert [i["review_id"] for i in queue.leased("usr_1")] == ["rev_0"]
+    assert [i["review_id"] for i in queue.claim("usr_2")["items"]] == ["rev_1"]
+
+
+def test_lease_that_expires_during_a_failed_write_is_requeued():
+    clock = FakeClock()
+    store = SlowStore(fail=True)
+    queue = ReviewQueue(store, lease_seconds=60, clock=clock)
+    queue.enqueue(_draft(0), _review(0))
+    queue.claim("usr_1")
+    errors = []
+
+    def decide():
+        try:
+            queue.decide([{"review_id": "rev_0", "reviewer_id": "usr_1", "decision": "APPROVED"}])
+        except OSError as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=decide)
+    thread.start()
+    assert store.started.wait(5)
+    clock.now += 61
+    assert queue.leased("usr_1") == []  # pops the lease's heap entry mid-write
+    store.release.set()
+    thread.join(5)
+    assert errors
+    assert queue.leased("usr_1") == []
+    assert [i["review_id"] for i in queue.claim("usr_2")["items"]] == ["rev_0"]
+
+
+def test_lease_restored_after_a_failed_write_still_expires():
+    clock = FakeClock()
+    store = SlowStore(fail=True)
+    queue = ReviewQueue(store, lease_seconds=60, clock=clock)
+    queue.enqueue(_draft(0), _review(0))
+    queue.claim("usr_1")
+    # Drop the heap entry as a concurrent _expire would; the rollback must re-arm it.
+    queue._lease_heap.clear()
+    store.release.set()
+    with pytest.raises(OSError):
+        queue.decide([{"review_id": "rev_0", "reviewer_id": "usr_1", "decision": "APPROVED"}])
+    assert [i["review_id"] for i in queue.leased("usr_1")] == ["rev_0"]
+    clock.now += 61
+    assert queue.leased("usr_1") == []
+    assert [i["review_id"] for i in queue.claim("usr_2")["items"]] == ["rev_0"]
+
+
+def test_reviewer_id_with_trailing_newline_is_rejected():
+    queue = ReviewQueue()
+    assert queue.claim("usr_1\n")["error"]["code"] == "INVALID_REVIEWER_ID"
+
+
+def test_many_reviews():
+    queue = ReviewQueue()
+    for i in range(50_000):
+        queue.enqueue(_draft(i), _review(i, (i * 7919 % 1000) / 1000))
+    out = queue.claim("usr_1", n=50_000)["items"]
+    confidences = [i["confidence"] for i in out]
+    assert confidences == sorted(confidences)
+    assert len(queue) == 0
@@ -0,0 +1,60 @@
+"""
+Sharded Runner Tests (multi-process workflow execution)
+
+These tests assert the Planner workflow defined in:
+- specs/functional.md F5 - Orchestrate Content Workflow
+- specs/technical.md Section 3.1 - deterministic outputs regardless of which worker runs them
+"""
+
+import pytest
+
+from chimera.pipeline import ShardedRunner, run_pipeline
+from chimera.pipeline.sharding import by_platform_region, run_batch, shard_of
+
+
+REQUESTS = [
+    {"platform": p, "region": r, "time_window": "24h", "limit": 5}
+    for p in ("youtube", "tiktok", "instagram")
+    for r in ("ET", "US", "GB", "DE")
+]
+
+
+def test_shard_assignment_is_stable():
+    """
+    Maps to: specs/technical.md Section 3.1 - deterministic behaviour
+    """
+    keys = [by_platform_region(r) for r in REQUESTS]
+    assert [shard_of(k, 4) for k in keys] == [shard_of(k, 4) for k in keys]
+    assert all(0 <= shard_of(k, 3) < 3 for k in keys)
+
+
+def test_sharded_results_match_in_process_pipeline():
+    """
+    Maps to: specs/functional.md F5 - same routing as the in-process pipeline
+    """
+    with ShardedRunner(3, batch_size=2, confidence_threshold=0.5) as runner:
+        sharded = runner.run(REQUESTS + [{"platform": "bogus", "region": "ET", "time_window": "24h"}])
+    local = run_pipeline(REQUESTS, confidence_threshold=0.5)
+
+    assert sorted(p["publish_id"] for p in sharded["published"]) == sorted(p["publish_id"] for p in local["published"])
+    assert len(sharded["parked"]) == len(local["parked"])
+    assert [e["error"]["code"] for e in sharded["errors"]] == ["INVALID_PLATFORM"]
+
+    totals = sharded["metrics"]["totals"]
+    assert totals["requests"] == len(REQUESTS) + 1
+    assert totals["topics"] == totals["drafts"] == 5 * len(REQUESTS)
+    assert totals["published"] + totals["parked"] == 5 * len(REQUESTS)
+    assert sum(m["requests"] > 0 for m in sharded["metrics"]["shards"]) >= 2
+
+
+def test_run_batch_round_trips_through_marshal():
+    import marshal
+
+    options = {"content_type": "post", "constraints": [], "confidence_threshold": 0.0, "schedule_time": None}
+    out = marshal.loads(run_batch(marshal.dumps((options, REQUESTS[:1]))))
+    assert out["metrics"]["published"] == 5
+
+
+def test_invalid_configuration():
+    with pytest.raises(ValueError):
+        ShardedRunner(2, batch_size=0)
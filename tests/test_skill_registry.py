@@ -0,0 +1,80 @@
+"""
+Skill Registry Tests (lazy dispatch and capability discovery)
+
+These tests assert the capability discovery contract defined in:
+- specs/technical.md Section 3.6 - GET /v1/capabilities MUST NOT execute any skills
+- specs/functional.md F8 - Discover Available Capabilities
+"""
+
+import json
+import re
+import subprocess
+import sys
+
+from chimera.skills import registry
+
+
+SKILL_MODULES = [module for module, _ in registry.SKILLS.values()]
+
+
+def _run(code):
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=True
+    )
+
+
+def test_package_import_loads_no_skill_code():
+    """
+    Maps to: specs/technical.md Section 3.6 - discovery without importing/executing skill code
+    """
+    proc = _run(
+        "import sys, chimera.skills as s; s.capabilities(); "
+        "print(','.join(m for m in sys.modules if m.startswith('chimera.skills.')))"
+    )
+    assert proc.stdout.strip() == "chimera.skills.registry"
+
+    # -X importtime lines: "import time: self_us | cumulative_us | module"
+    times = {
+        m.group(2).strip(): int(m.group(1))
+        for m in re.finditer(r"import time:\s+\d+ \|\s+(\d+) \|(.*)", proc.stderr)
+    }
+    assert not set(SKILL_MODULES) & set(times)
+    assert times["chimera.skills"] < 500_000
+
+
+def test_manifest_is_up_to_date():
+    """
+    Maps to: specs/technical.md Section 3.6 - all skills with input/output contracts
+    """
+    with open(registry.MANIFEST_PATH, encoding="utf-8") as f:
+        assert json.load(f) == registry.build_manifest()
+
+
+def test_capabilities_contract():
+    """
+    Maps to: specs/technical.md Section 3.6 - skill_name pattern, inputs/outputs fields
+    """
+    caps = registry.capabilities()["capabilities"]
+    assert [c["skill_name"] for c in caps] == list(registry.SKILLS)
+    for cap in caps:
+        assert re.match(r"^skill_[a-zA-Z0-9_]+$", cap["skill_name"])
+        assert all({"name", "type", "required"} <= set(i) for i in cap["inputs"])
+        assert all({"name", "type", "description"} <= set(o) for o in cap["outputs"])
+    assert [c["requires_approval"] for c in caps] == [False, False, False, True]
+    assert registry.capabilities("skill_publish_content")["capabilities"][0]["skill_name"] == "skill_publish_content"
+
+
+def test_dispatch_by_name():
+    result = registry.dispatch(
+        "skill_fetch_trends", {"platform": "youtube", "region": "ET", "time_window": "24h", "limit": 2}
+    )
+    assert len(result["topics"]) == 2
+    assert "skill_fetch_trends" in registry.loaded()
+    assert registry.dispatch("skill_unknown", {})["error"]["code"] == "INVALID_INPUT"
+
+
+def test_package_attributes_stay_functions():
+    import chimera.skills.fetch_trends  # noqa: F401  (binds the submodule on the package)
+    from chimera.skills import fetch_trends
+
+    assert callable(fetch_trends) and fetch_trends.__name__ == "fetch_trends"
@@ -0,0 +1,105 @@
+"""
+Snapshot Format Tests (binary topic/draft batches, lossless round trip)
+
+These tests assert the batch encoding of the outputs defined in:
+- specs/technical.md Section 3.1 - fetch_trends topic fields
+- specs/technical.md Section 3.2 - generate_draft draft fields
+- specs/technical.md Section 5.3 - ID patterns (fixed-width ID columns)
+"""
+
+import json
+import random
+
+import pytest
+
+from chimera import snapshot
+from chimera.skills import fetch_trends, generate_draft
+
+
+def _topics(limit=50, platform="youtube", region="ET"):
+    return fetch_trends({"platform": platform, "region": region, "time_window": "24h", "limit": limit})["topics"]
+
+
+def _drafts():
+    topics = _topics(10) + _topics(5, platform="tiktok", region="KE")
+    out = [generate_draft({"content_type": ct, "selected_topics": [t]})["draft"] for t in topics for ct in ("post", "caption")]
+    # No topic selected: topic_id "tpc_default" and platform None.
+    out.append(generate_draft({"content_type": "short_script", "selected_topics": []})["draft"])
+    return out
+
+
+def test_round_trip_is_lossless_for_skill_output():
+    for kind, rows in (("topics", _topics() + _topics(7, region="KE")), ("drafts", _drafts())):
+        data = snapshot.dumps(rows, kind)
+        snap = snapshot.loads(data)
+        assert snap.kind == kind and len(snap) == len(rows)
+        assert snap.to_dicts() == rows
+        assert [list(r) for r in snap] == [list(r) for r in rows]  # key order too
+        assert json.dumps(snap.to_dicts()) == json.dumps(rows)
+        assert snap.flags == 0  # 3-decimal scores fit float32
+        assert len(data) < len(json.dumps(rows)) / 3
+
+
+def test_every_three_decimal_score_survives_float32():
+    rows = _topics(1) * 1001
+    rows = [dict(r, score=i / 1000) for i, r in enumerate(rows)]
+    snap = snapshot.loads(snapshot.dumps(rows, "topics"))
+    assert snap.flags == 0
+    assert [r["score"] for r in snap] == [i / 1000 for i in range(1001)]
+
+
+def test_unrounded_scores_fall_back_to_float64():
+    rng = random.Random(46)
+    rows = [dict(r, score=rng.random()) for r in _topics(20)]
+    snap = snapshot.loads(snapshot.dumps(rows, "topics"))
+    assert snap.flags & snapshot.FLAG_F64_SCORES
+    assert snap.to_dicts() == rows
+
+
+def test_columns_are_8_byte_aligned():
+    rows = _topics(3)
+    data = snapshot.dumps(rows, "topics")
+    pos = snapshot._HEADER.size
+    assert pos % 8 == 0
+    for _, typ in snapshot.TOPIC_FIELDS:
+        assert pos % 8 == 0
+        size = {"id": snapshot.ID_WIDTH, "str": 4, "score": 4}[typ] * len(rows)
+        pos += size + snapshot._pad(size)
+    assert data[pos : pos + 4] == b"\0\0\0\0"  # the string table's first offset
+    # Version 1 snapshots (20-byte header) are refused, not misread.
+    old = bytearray(data)
+    old[8] = 1
+    with pytest.raises(ValueError):
+        snapshot.loads(bytes(old))
+
+
+def test_rows_that_cannot_round_trip_are_rejected():
+    topic = _topics(1)[0]
+    with pytest.raises(ValueError):
+        snapshot.dumps([dict(topic, extra=1)], "topics")
+    with pytest.raises(ValueError):
+        snapshot.dumps([dict(topic, topic_id="tpc_" + "a" * 20)], "topics")
+    with pytest.raises(ValueError):
+        snapshot.dumps([dict(topic, score=1)], "topics")  # int would come back as 1.0
+    with pytest.raises(ValueError):
+        snapshot.dumps([dict(topic, label=3)], "topics")
+    with pytest.raises(ValueError):
+        snapshot.loads(b"not a snapshot at all")
+    with pytest.raises(ValueError):
+        snapshot.loads(snapshot.dumps(_topics(5), "topics")[:-10])
+    with pytest.raises(ValueError):
+        snapshot.loads(snapshot.dumps(_topics(5), "topics")[:100])
+
+
+def test_load_is_memory_mapped_and_lazy(tmp_path):
+    rows = _topics()
+    path = str(tmp_path / "topics.snap")
+    snapshot.dump(rows, "topics", path)
+    with snapshot.load(path) as snap:
+        assert snap._strings.count(None) == len(snap._strings)  # nothing decoded yet
+        assert snap[-1] == rows[-1] and snap[10:12] == rows[10:12]
+        assert snap.ids("topic_id") == [r["topic_id"] for r in rows]
+        assert [round(v, 3) for v in snap.column("score")] == [r["score"] for r in rows]
+        with pytest.raises(IndexError):
+            snap[len(rows)]
+    assert snapshot.loads(snapshot.dumps([], "drafts")).to_dicts() == []
@@ -0,0 +1,154 @@
+"""
+Persistence Tests (SQLite store)
+
+These tests assert the data model defined in:
+- specs/technical.md Section 5 - Data Model (entities, FK/unique constraints, immutability)
+- specs/technical.md Sections 3.2, 3.3, 3.5 - *_NOT_FOUND checks backed by persisted records
+"""
+
+import sqlite3
+import threading
+
+import pytest
+
+from chimera.skills.evaluate_policy import evaluate_policy
+from chimera.skills.fetch_trends import fetch_trends
+from chimera.skills.generate_draft import generate_draft
+from chimera.skills.publish_content import publish_content
+from chimera.store import SQLiteStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    s = SQLiteStore(str(tmp_path / "chimera.db"))
+    yield s
+    s.close()
+
+
+def _fetch(store, limit=3):
+    return fetch_trends({"platform": "youtube", "region": "ET", "time_window": "24h", "limit": limit}, store=store)
+
+
+def test_store_uses_wal_and_foreign_keys(store):
+    """
+    Maps to: specs/technical.md Section 5.3 - Referential Integrity
+    """
+    conn = store._connection()
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+
+
+def test_skills_persist_through_store(store):
+    """
+    Maps to: specs/technical.md Section 5.1 - trend_topics, content_drafts, reviews, publish_jobs
+    """
+    topics = _fetch(store)["topics"]
+    assert store.count("trend_topics") == 3
+
+    draft = generate_draft({"content_type": "post", "selected_topics": [topics[0]]}, store=store)["draft"]
+    assert store.get_draft(draft["draft_id"])["version"] == 1
+
+    review = evaluate_policy({"draft": draft, "confidence_threshold": 0.0}, store=store)["review"]
+    assert store.get_latest_review(draft["draft_id"])["decision"] == review["decision"] == "APPROVED"
+
+    publish = publish_content({"draft": draft, "approval_id": "hap_auto"}, store=store)["publish"]
+    assert store.count("publish_jobs") == 1
+    assert publish["status"] == "PUBLISHED"
+
+
+def test_not_found_checks_use_store(store):
+    """
+    Maps to: specs/technical.md Sections 3.2, 3.3, 3.5 - TOPIC_NOT_FOUND, DRAFT_NOT_FOUND
+    """
+    result = generate_draft({"content_type": "post", "selected_topics": [{"topic_id": "tpc_missing"}]}, store=store)
+    assert result["error"]["code"] == "TOPIC_NOT_FOUND"
+
+    result = evaluate_policy({"draft": {"draft_id": "drf_missing"}}, store=store)
+    assert result["error"]["code"] == "DRAFT_NOT_FOUND"
+
+    result = publish_content({"draft": {"draft_id": "drf_missing"}, "approval_id": "hap_1"}, store=store)
+    assert result["error"]["code"] == "DRAFT_NOT_FOUND"
+
+
+def test_publish_requires_stored_human_approval(store):
+    """
+    Maps to: specs/technical.md Section 3.5 - MISSING_APPROVAL when review requires human approval
+    """
+    topics = _fetch(store)["topics"]
+    draft = generate_draft({"content_type": "post", "selected_topics": [topics[0]]}, store=store)["draft"]
+    review = evaluate_policy({"draft": draft, "confidence_threshold": 1.0}, store=store)["review"]
+    assert review["decision"] == "REQUIRES_HUMAN_REVIEW"
+
+    result = publish_content({"draft": draft, "approval_id": "hap_unknown"}, store=store)
+    assert result["error"]["code"] == "MISSING_APPROVAL"
+
+    store.insert_human_approvals([{
+        "approval_id": "hap_001",
+        "review_id": review["review_id"],
+        "draft_id": draft["draft_id"],
+        "reviewer_id": "usr_123",
+        "decision": "APPROVED",
+        "recorded_at": "2026-02-05T10:15:00Z",
+    }])
+    assert "publish" in publish_content({"draft": draft, "approval_id": "hap_001"}, store=store)
+
+
+def test_publish_requires_a_stored_review(store):
+    """
+    Maps to: specs/technical.md Section 3.5 - DRAFT_NOT_APPROVED for a draft never reviewed
+    """
+    topics = _fetch(store)["topics"]
+    draft = generate_draft({"content_type": "post", "selected_topics": [topics[0]]}, store=store)["draft"]
+    result = publish_content({"draft": draft, "approval_id": "hap_anything"}, store=store)
+    assert result["error"]["code"] == "DRAFT_NOT_APPROVED"
+    assert store.count("publish_jobs") == 0
+
+
+def test_draft_versions_increment_per_topic_platform_type(store):
+    """
+    Maps to: specs/technical.md Section 3.2 - version = existing_max_version + 1
+    """
+    topic = _fetch(store, limit=1)["topics"][0]
+    base = {"topic_id": topic["topic_id"], "platform": "youtube", "content_type": "post",
+            "confidence": 0.5, "title": "T", "body": "B", "timestamp": "2026-02-05T10:00:00Z"}
+    store.insert_drafts([dict(base, draft_id="drf_a"), dict(base, draft_id="drf_b")])
+    assert store.get_draft("drf_a")["version"] == 1
+    assert store.get_draft("drf_b")["version"] == 2
+
+
+def test_constraints_are_enforced(store):
+    """
+    Maps to: specs/technical.md Section 5.3 - FK RESTRICT, CHECK ranges, immutable audit rows
+    """
+    with pytest.raises(sqlite3.IntegrityError):
+        store.insert_drafts([{"draft_id": "drf_x", "topic_id": "tpc_missing", "content_type": "post",
+                              "confidence": 0.5, "title": "T", "body": "B", "timestamp": "2026-02-05T10:00:00Z"}])
+
+    topic = dict(_fetch(store, limit=1)["topics"][0], topic_id="tpc_bad", score=1.5)
+    with pytest.raises(sqlite3.IntegrityError):
+        store.insert_topics([topic])
+
+    store.insert_skill_runs([{"run_id": "run_1", "skill_name": "skill_fetch_trends", "status": "success",
+                              "started_at": "2026-02-05T10:00:00Z"}])
+    with pytest.raises(sqlite3.IntegrityError):
+        store._connection().execute("DELETE FROM skill_runs")
+
+
+def test_connection_per_thread(store):
+    """
+    Maps to: specs/technical.md Section 5 - concurrent agents share one store
+    """
+    _fetch(store, limit=5)
+    seen = []
+
+    def worker():
+        seen.append((id(store._connection()), store.topic_exists(_fetch(None, limit=1)["topics"][0]["topic_id"])))
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert all(found for _, found in seen)
+    assert len({conn_id for conn_id, _ in seen} | {id(store._connection())}) == 5
@@ -0,0 +1,134 @@
+"""
+Existence Pre-check Tests (Bloom filters in front of the store)
+
+These tests assert the lookup behaviour required by:
+- specs/technical.md Sections 3.2, 3.3 - TOPIC_NOT_FOUND / DRAFT_NOT_FOUND
+- specs/technical.md Section 5.3 - tpc_/drf_/rev_/hap_ ID patterns
+"""
+
+import threading
+
+import pytest
+
+from chimera.skills.evaluate_policy import evaluate_policy
+from chimera.skills.fetch_trends import fetch_trends
+from chimera.skills.generate_draft import generate_draft
+from chimera.store import SQLiteStore
+from chimera.store.bloom import BloomFilter
+
+
+def test_bloom_filter_has_no_false_negatives_and_bounded_fp_rate():
+    """
+    Maps to: configurable false-positive rate
+    """
+    f = BloomFilter(5000, fp_rate=0.01)
+    keys = [f"tpc_{i:012x}" for i in range(5000)]
+    for k in keys:
+        f.add(k)
+    assert all(k in f for k in keys)
+    false_positives = sum(f"drf_{i:012x}" in f for i in range(20000))
+    assert false_positives / 20000 < 0.03
+
+
+def test_bloom_filter_rejects_bad_parameters():
+    with pytest.raises(ValueError):
+        BloomFilter(0)
+    with pytest.raises(ValueError):
+        BloomFilter(10, fp_rate=1.5)
+
+
+def test_unknown_ids_rejected_without_database_round_trip(tmp_path):
+    """
+    Maps to: specs/technical.md Sections 3.2, 3.3 - *_NOT_FOUND from a pre-check
+    """
+    store = SQLiteStore(str(tmp_path / "chimera.db"), bloom_fp_rate=0.001, bloom_capacity=1000)
+    topic = fetch_trends({"platform": "youtube", "region": "ET", "time_window": "24h", "limit": 5}, store=store)["topics"][0]
+
+    assert "draft" in generate_draft({"content_type": "post", "selected_topics": [topic]}, store=store)
+    for i in range(50):
+        result = generate_draft({"content_type": "post", "selected_topics": [{"topic_id": f"tpc_bogus{i}"}]}, store=store)
+        assert result["error"]["code"] == "TOPIC_NOT_FOUND"
+        result = evaluate_policy({"draft": {"draft_id": f"drf_bogus{i}"}}, store=store)
+        assert result["error"]["code"] == "DRAFT_NOT_FOUND"
+
+    stats = store.filters.stats()
+    assert stats["tpc"]["items"] == 5
+    assert stats["drf"]["items"] == 1
+    assert stats["tpc"]["negative_hits"] + stats["tpc"]["false_positives"] == 50
+    assert stats["tpc"]["negative_hits"] >= 45
+    assert stats["drf"]["negative_hits"] >= 45
+    store.close()
+
+
+def test_filters_rebuilt_from_store_at_startup(tmp_path):
+    """
+    Maps to: specs/technical.md Section 5 - persisted IDs remain visible after restart
+    """
+    path = str(tmp_path / "chimera.db")
+    with SQLiteStore(path) as store:
+        topics = fetch_trends({"platform": "tiktok", "region": "US", "time_window": "7d", "limit": 20}, store=store)["topics"]
+
+    with SQLiteStore(path, bloom_fp_rate=0.01) as store:
+        assert store.filters.stats()["tpc"]["items"] == 20
+        assert all(store.topic_exists(t["topic_id"]) for t in topics)
+        assert store.filters.stats()["tpc"]["negative_hits"] == 0
+
+
+def _topics(n, start=0):
+    return [
+        {
+            "topic_id": f"tpc_{i:012x}",
+            "platform": "youtube",
+            "region": "ET",
+            "label": f"topic {i}",
+            "description": f"description {i}",
+            "score": 0.5,
+            "source": "test",
+            "collected_at": "2026-02-05T10:00:00Z",
+        }
+        for i in range(start, start + n)
+    ]
+
+
+@pytest.mark.parametrize("shared_memory", [False, True])
+def test_rows_written_by_another_store_are_found(tmp_path, shared_memory):
+    """
+    Maps to: specs/technical.md Sections 3.2, 3.3 - no false TOPIC_NOT_FOUND for rows
+    another process committed
+    """
+    path = "file:bloom-shared?mode=memory&cache=shared" if shared_memory else str(tmp_path / "chimera.db")
+    with SQLiteStore(path, bloom_fp_rate=0.01, bloom_capacity=1000) as reader, SQLiteStore(path) as writer:
+        assert not reader.topic_exists("tpc_000000000001")
+        writer.insert_topics(_topics(3))
+        assert all(reader.topic_exists(f"tpc_{i:012x}") for i in range(3))
+        assert not reader.topic_exists("tpc_bogus")
+
+
+def test_filter_is_rebuilt_past_its_capacity(tmp_path):
+    with SQLiteStore(str(tmp_path / "chimera.db"), bloom_fp_rate=0.01, bloom_capacity=10) as store:
+        bits = store.filters.stats()["tpc"]["bits"]
+        for start in range(0, 200, 20):
+            store.insert_topics(_topics(20, start))
+        stats = store.filters.stats()["tpc"]
+        assert stats["bits"] > bits
+        assert stats["items"] == 200
+        assert all(store.topic_exists(f"tpc_{i:012x}") for i in range(200))
+        false_positives = sum(f"tpc_x{i:011x}" in store.filters._filters["tpc"] for i in range(2000))
+        assert false_positives / 2000 < 0.03
+
+
+def test_counters_are_exact_under_threads(tmp_path):
+    with SQLiteStore(str(tmp_path / "chimera.db"), bloom_fp_rate=0.01, bloom_capacity=1000) as store:
+
+        def worker():
+            for i in range(2000):
+                store.topic_exists(f"tpc_bogus{i}")
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        stats = store.filters.stats()["tpc"]
+        assert stats["checks"] == 8000
+        assert stats["negative_hits"] + stats["false_positives"] == 8000
@@ -0,0 +1,108 @@
+"""
+Topic Selection Tests (bounded-heap top-N with quotas, floor and diversity)
+
+These tests assert the topic selection feeding draft generation:
+- specs/technical.md Section 3.1 - fetch_trends topics (topic_id, platform, region, score)
+- specs/technical.md Section 3.2 - generate_draft selected_topics
+- specs/functional.md F5 - planner workflow (fetch -> draft)
+"""
+
+import random
+
+import pytest
+
+from chimera.skills import generate_draft
+from chimera.trends import TopicSelector, draft_top_topics
+
+
+def _reference(candidates, n, min_score=0.0, per_platform=None, per_region=None):
+    """Sort everything, then take each topic that still fits (the definition being streamed)."""
+    order = sorted(enumerate(candidates), key=lambda c: (-c[1]["score"], c[0]))
+    best = {}
+    for _, t in order:
+        best.setdefault(t["topic_id"], t)
+    out, platforms, regions = [], {}, {}
+    for _, t in order:
+        if best.get(t["topic_id"]) is not t or t["score"] < min_score or len(out) == n:
+            continue
+        p, r = t["platform"], (t["platform"], t["region"])
+        quota = per_platform.get(p) if isinstance(per_platform, dict) else per_platform
+        if quota is not None and platforms.get(p, 0) >= quota:
+            continue
+        if per_region is not None and regions.get(r, 0) >= per_region:
+            continue
+        out.append(t)
+        platforms[p] = platforms.get(p, 0) + 1
+        regions[r] = regions.get(r, 0) + 1
+    return out
+
+
+def _candidates(rng, count):
+    out = []
+    for _ in range(count):
+        platform, region = rng.choice(["youtube", "tiktok", "reddit"]), rng.choice(["ET", "KE", "NG"])
+        # Some repeats; like fetch_trends, a topic_id always has the same platform and region.
+        topic_id = f"tpc_{platform[0]}{region}{rng.randrange(count):09x}"
+        out.append({"topic_id": topic_id, "platform": platform, "region": region, "score": round(rng.random(), 2)})
+    return out
+
+
+@pytest.mark.parametrize(
+    "rules",
+    [
+        {},
+        {"min_score": 0.5},
+        {"per_platform": 3},
+        {"per_platform": {"youtube": 1, "tiktok": 0}},
+        {"per_region": 2},
+        {"per_platform": 4, "per_region": 2, "min_score": 0.2},
+    ],
+)
+def test_streamed_selection_matches_sorting_everything(rules):
+    rng = random.Random(49)
+    for _ in range(30):
+        candidates = _candidates(rng, rng.randint(0, 300))
+        n = rng.randint(1, 12)
+        selector = TopicSelector(n, **rules)
+        selector.offer_all(candidates)
+        assert selector.selected() == _reference(candidates, n, **rules)
+
+
+def test_memory_is_bounded_by_the_selection_size():
+    rng = random.Random(7)
+    selector = TopicSelector(10, per_platform=4, per_region=2)
+    for _ in range(200):
+        selector.offer_all(_candidates(rng, 500))
+    groups = [selector._all, *selector._platforms.values(), *selector._regions.values()]
+    assert len(selector) == 10 and selector.offered == 100_000
+    assert len(selector._by_topic) == 10
+    assert all(len(g.heap) <= 2 * g.live + 8 for g in groups)
+    assert len(groups) <= 1 + 2 * 10
+    # Sets of platforms that never make it in are not kept either.
+    excluded = TopicSelector(3, per_platform={"youtube": 0})
+    excluded.offer_all({"topic_id": f"tpc_{i}", "platform": "youtube", "region": "ET", "score": 0.9} for i in range(100))
+    assert len(excluded) == 0 and not excluded._platforms
+
+
+def test_invalid_rules_are_rejected():
+    for args, kwargs in [((0,), {}), ((5,), {"per_platform": -1}), ((5,), {"per_region": 0}), ((5,), {"per_platform": {"x": 1.5}})]:
+        with pytest.raises(ValueError):
+            TopicSelector(*args, **kwargs)
+
+
+def test_selected_topics_go_straight_to_generate_draft():
+    requests = [
+        {"platform": platform, "region": region, "time_window": "24h", "limit": 50}
+        for platform in ("youtube", "tiktok", "reddit")
+        for region in ("ET", "KE")
+    ] + [{"platform": "bogus", "region": "ET", "time_window": "24h"}]
+    out = draft_top_topics(requests, 8, content_type="post", per_platform={"reddit": 1}, per_region=2, min_score=0.5)
+    assert out["candidates"] == 300
+    assert [e["error"]["code"] for e in out["errors"]] == ["INVALID_PLATFORM"]
+    scores = [t["score"] for t in out["selected"]]
+    assert len(scores) == 8 and scores == sorted(scores, reverse=True) and min(scores) >= 0.5
+    assert sum(t["platform"] == "reddit" for t in out["selected"]) <= 1
+    assert [d["topic_id"] for d in out["drafts"]] == [t["topic_id"] for t in out["selected"]]
+    topic = out["selected"][0]
+    expected = generate_draft({"content_type": "post", "constraints": [], "selected_topics": [topic]})["draft"]
+    assert out["drafts"][0]["draft_id"] == expected["draft_id"]
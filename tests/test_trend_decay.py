@@ -0,0 +1,97 @@
+"""
+Decayed Trend Score Tests (exponentially decayed counters, any-window queries)
+
+These tests assert the windowed score aggregation behind:
+- specs/technical.md Section 3.1 - fetch_trends time_window (^\\d+[hHdD]$) and score range
+- specs/functional.md F1 - trend discovery across repeated collection
+"""
+
+import math
+import random
+
+import pytest
+
+from chimera import clock
+from chimera.skills import fetch_trends
+from chimera.trends import DecayedScores, window_seconds
+
+T0 = 1_767_225_600  # 2026-01-01T00:00:00Z
+
+
+def _brute(observations, tau, at):
+    weights = [math.exp(-(at - t) / tau) for t, _ in observations]
+    return sum(w * s for w, (_, s) in zip(weights, observations)) / sum(weights), sum(weights)
+
+
+def test_window_seconds():
+    assert window_seconds("24h") == 86400
+    assert window_seconds("7d") == window_seconds("168H") == 7 * 86400
+    for bad in ("0h", "24", "1w", "h", "-1d", "24h\n", 24):
+        with pytest.raises(ValueError):
+            window_seconds(bad)
+
+
+def test_counters_match_recomputing_from_raw_observations():
+    rng = random.Random(48)
+    decayed = DecayedScores()
+    raw = {"tpc_a": [], "tpc_b": []}
+    at = T0
+    for _ in range(300):
+        at += rng.randint(0, 7200)
+        topic = rng.choice(sorted(raw))
+        score = round(rng.random(), 3)
+        raw[topic].append((at, score))
+        decayed.observe(topic, score, at)
+    for window in ("1h", "6h", "24h", "7d", "30d"):
+        tau = window_seconds(window)
+        for topic, observations in raw.items():
+            mean, weight = _brute(observations, tau, at)
+            assert decayed.score(topic, window) == pytest.approx(mean, rel=1e-9)
+            assert decayed.weights(window, at)[decayed.topic_ids.index(topic)] == pytest.approx(weight, rel=1e-9)
+        assert decayed.scores(window) == [decayed.score(t, window) for t in decayed.topic_ids]
+
+
+def test_out_of_order_observations_land_at_their_own_time():
+    in_order, shuffled = DecayedScores(), DecayedScores()
+    observations = [(T0 + 600 * i, (i % 7) / 10) for i in range(40)]
+    for at, score in observations:
+        in_order.observe("tpc_a", score, at)
+    rng = random.Random(4)
+    rest = observations[1:]
+    rng.shuffle(rest)
+    for at, score in [observations[0]] + sorted(rest[:20]) + rest[20:]:
+        shuffled.observe("tpc_a", score, at)
+    for window in ("1h", "2d", "30d"):
+        assert shuffled.score("tpc_a", window) == pytest.approx(in_order.score("tpc_a", window), rel=1e-9)
+
+
+def test_windows_between_kept_constants_interpolate():
+    decayed = DecayedScores()
+    decayed.observe("tpc_a", 1.0, T0)  # old and high
+    decayed.observe("tpc_a", 0.0, T0 + 3 * 86400)  # recent and low
+    day, week = decayed.score("tpc_a", "24h"), decayed.score("tpc_a", "7d")
+    assert day < decayed.score("tpc_a", "36h") < decayed.score("tpc_a", "4d") < week
+    assert decayed.score("tpc_a", "1d") == day
+    # Outside the kept constants: clamped to the nearest one.
+    assert decayed.score("tpc_a", "90d") == decayed.score("tpc_a", "30d")
+    assert decayed.score("tpc_missing", "24h") is None
+    with pytest.raises(ValueError):
+        decayed.score("tpc_a", "24x")
+    with pytest.raises(ValueError):
+        DecayedScores([0, 3600])
+
+
+def test_rescore_fetch_trends_topics_by_their_window():
+    params = {"platform": "youtube", "region": "ET", "time_window": "7d", "limit": 5}
+    decayed = DecayedScores()
+    with clock.frozen("2026-01-01T00:00:00Z"):
+        topics = fetch_trends(params)["topics"]
+    decayed.observe_topics(topics)
+    decayed.observe(topics[0]["topic_id"], 1.0, T0 + 86400)
+    unseen = fetch_trends(dict(params, region="KE"))["topics"][0]
+    rescored = decayed.rescore(topics + [unseen])
+    assert rescored[0]["score"] == round(decayed.score(topics[0]["topic_id"], "7d"), 3)
+    assert topics[0]["score"] < rescored[0]["score"] < 1.0
+    assert [t["score"] for t in rescored[1:5]] == [t["score"] for t in topics[1:5]]
+    assert unseen["topic_id"] not in decayed and rescored[5] == unseen
+    assert list(rescored[0]) == list(topics[0])
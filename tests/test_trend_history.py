@@ -0,0 +1,116 @@
+"""
+Trend History Tests (per-topic score rings, downsampling tiers, rising detection)
+
+These tests assert the score history kept across collection cycles for:
+- specs/technical.md Section 3.1 - fetch_trends topic_id, score, collected_at
+- specs/functional.md F1 - trend discovery across repeated collection
+"""
+
+import math
+import sys
+
+import pytest
+
+from chimera import clock
+from chimera.skills import fetch_trends
+from chimera.trends import ScoreHistory
+
+T0 = 1_767_225_600  # 2026-01-01T00:00:00Z, a day boundary
+
+
+def test_tiers_keep_bucket_means():
+    history = ScoreHistory()
+    for minute, score in enumerate([0.1, 0.3, 0.5, 0.7]):
+        history.observe("tpc_a", score, T0 + 60 * minute)
+        history.observe("tpc_a", score + 0.1, T0 + 60 * minute + 30)
+    assert [round(v, 6) for _, v in history.series("tpc_a", "1m")] == [0.15, 0.35, 0.55, 0.75]
+    assert history.series("tpc_a", "1m")[0][0] == T0
+    # Coarser tiers are downsampled views of the same observations.
+    assert [(b, round(v, 6)) for b, v in history.series("tpc_a", "1h")] == [(T0, 0.45)]
+    assert [(b, round(v, 6)) for b, v in history.series("tpc_a", "1d")] == [(T0, 0.45)]
+    assert history.series("tpc_missing", "1m") == []
+
+
+def test_memory_per_topic_is_bounded():
+    history = ScoreHistory()
+    history.observe("tpc_a", 0.5, T0)
+    sizes = lambda: [sys.getsizeof(c) for t in history._tiers.values() for c in (*t.means, *t.counts)]
+    before = sizes()
+    for i in range(5000):  # ~3.5 days of minutes: every ring wraps at least once
+        history.observe("tpc_a", (i % 100) / 100, T0 + 60 * i)
+    assert sizes() == before
+    assert history.bytes_per_topic() == 12 * (60 + 48 + 30)
+    assert len(history.series("tpc_a", "1m")) == 60
+    assert len(history.series("tpc_a", "1h")) == 48
+    # Older than the minute ring: dropped there, still counted in the hour/day tiers.
+    history.observe("tpc_a", 1.0, T0 + 60 * 4000)
+    assert all(b != T0 + 60 * 4000 for b, _ in history.series("tpc_a", "1m"))
+
+
+def test_velocity_acceleration_and_rising_over_all_topics():
+    history = ScoreHistory()
+    paths = {
+        "tpc_accel": [0.1, 0.2, 0.4],  # rising faster and faster
+        "tpc_steady": [0.1, 0.3, 0.5],  # rising at a constant rate
+        "tpc_falling": [0.9, 0.6, 0.3],
+        "tpc_new": [None, None, 0.9],  # only seen this hour: no velocity yet
+    }
+    for hour in range(3):
+        history.observe_many(
+            [(t, s[hour]) for t, s in paths.items() if s[hour] is not None], T0 + 3600 * hour
+        )
+    vel = dict(zip(history.topic_ids, history.velocity("1h")))
+    acc = dict(zip(history.topic_ids, history.acceleration("1h")))
+    assert vel["tpc_accel"] == pytest.approx(0.2) and acc["tpc_accel"] == pytest.approx(0.1)
+    assert vel["tpc_steady"] == pytest.approx(0.2) and acc["tpc_steady"] == pytest.approx(0.0)
+    assert vel["tpc_falling"] == pytest.approx(-0.3)
+    assert math.isnan(vel["tpc_new"]) and math.isnan(acc["tpc_new"])
+
+    assert [t for t, _, _ in history.rising("1h")] == ["tpc_accel", "tpc_steady"]
+    assert [t for t, _, _ in history.rising("1h", min_acceleration=0.05)] == ["tpc_accel"]
+    assert history.rising("1h", limit=1)[0][0] == "tpc_accel"
+    # An hour later with no new data, nothing has a current velocity.
+    assert history.rising("1h", at=T0 + 3600 * 3) == []
+    assert [t for t, _, _ in history.rising("1h")] == ["tpc_accel", "tpc_steady"]
+
+
+def test_queries_do_not_change_the_history():
+    history = ScoreHistory()
+    for hour, score in enumerate([0.1, 0.2, 0.4]):
+        history.observe("tpc_a", score, T0 + 3600 * hour)
+    before = history.series("tpc_a", "1h")
+    assert math.isnan(history.velocity("1h", at=T0 + 3600 * 100)[0])  # far future: nothing recent
+    assert history.rising("1h", at=T0 + 3600 * 100) == []
+    assert history.series("tpc_a", "1h", at=T0 + 3600 * 100) == []
+    assert history.series("tpc_a", "1h") == before
+    # The history still takes observations in the current window.
+    history.observe("tpc_a", 0.7, T0 + 3600 * 5)
+    assert history.series("tpc_a", "1h") == before + [(T0 + 3600 * 5, 0.7)]
+    # A past "at" views the window as it was then.
+    assert history.velocity("1h", at=T0 + 3600 * 2)[0] == pytest.approx(0.2)
+    assert [b for b, _ in history.series("tpc_a", "1h", at=T0 + 3600)] == [T0, T0 + 3600]
+
+
+def test_gaps_longer_than_the_window_clear_the_ring():
+    history = ScoreHistory([("1m", 60, 5)])
+    history.observe("tpc_a", 0.2, T0)
+    history.observe("tpc_a", 0.4, T0 + 60)
+    history.observe("tpc_a", 0.9, T0 + 60 * 100)
+    assert history.series("tpc_a", "1m") == [(T0 + 60 * 100, 0.9)]
+    with pytest.raises(ValueError):
+        ScoreHistory([("1m", 60, 2)])
+
+
+def test_observe_topics_uses_collected_at():
+    params = {"platform": "youtube", "region": "ET", "time_window": "24h", "limit": 10}
+    history = ScoreHistory()
+    with clock.frozen("2026-01-01T00:00:00Z"):
+        first = fetch_trends(params)["topics"]
+    with clock.frozen("2026-01-01T01:00:00Z"):
+        second = fetch_trends(params)["topics"]
+    history.observe_topics(first + second)
+    assert history.topic_ids == [t["topic_id"] for t in first]
+    assert history.series(first[0]["topic_id"], "1h") == [(T0, first[0]["score"]), (T0 + 3600, first[0]["score"])]
+    # Deterministic scores: flat, so nothing is rising.
+    assert history.velocity("1h") == [0.0] * 10
+    assert history.rising("1h") == []
@@ -0,0 +1,124 @@
+"""
+Compiled Input Validator Tests
+
+These tests assert the input validation rules defined in:
+- specs/technical.md Sections 3.1-3.5 - per-skill validation rules and check order
+- specs/technical.md Section 4 - INVALID_* error codes
+"""
+
+import pytest
+
+from chimera.skills._validate import ISO_UTC_RE, REGION_RE, TIME_WINDOW_RE, compile_schema, validate_many
+from chimera.skills.evaluate_policy import _validate_input as evaluate_policy_input
+from chimera.skills.evaluate_policy import evaluate_policy
+from chimera.skills.fetch_trends import _validate_input as fetch_trends_input
+from chimera.skills.generate_draft import _validate_input as generate_draft_input
+from chimera.skills.publish_content import _validate_input as publish_content_input
+
+
+VALID = {"platform": "youtube", "region": "ET", "time_window": "24h"}
+
+
+def _code(validator, params):
+    err, _ = validator(params)
+    return err and err[0]
+
+
+def test_defaults_and_normalized_values():
+    """
+    Maps to: specs/technical.md Section 3.1 - limit defaults to 25
+    """
+    assert fetch_trends_input(VALID) == (None, ("youtube", "ET", "24h", 25))
+    assert evaluate_policy_input({"draft": {"draft_id": "drf_1"}, "confidence_threshold": 1}) == (
+        None,
+        (1.0, {"draft_id": "drf_1"}),
+    )
+    assert generate_draft_input({"content_type": "post", "constraints": None}) == (None, ("post", [], []))
+    assert publish_content_input({"draft": {"draft_id": "drf_1"}, "schedule_time": None})[1][0] is None
+
+
+def test_first_failure_in_spec_order():
+    """
+    Maps to: specs/technical.md Sections 3.1-3.5 - check order
+    """
+    assert _code(fetch_trends_input, {"platform": "myspace", "region": "et"}) == "INVALID_PLATFORM"
+    assert _code(fetch_trends_input, dict(VALID, region="et", time_window="1w")) == "INVALID_REGION"
+    assert _code(fetch_trends_input, dict(VALID, time_window="1w", limit=0)) == "INVALID_TIME_WINDOW"
+    assert _code(generate_draft_input, {"content_type": "post", "constraints": ["x"], "selected_topics": 1}) == "INVALID_CONSTRAINT"
+    assert _code(evaluate_policy_input, {"confidence_threshold": 2.0, "draft": None}) == "INVALID_CONFIDENCE_THRESHOLD"
+    assert _code(publish_content_input, {"schedule_time": "tomorrow", "draft": None}) == "INVALID_SCHEDULE_TIME"
+
+
+def test_error_details():
+    """
+    Maps to: specs/technical.md Section 4 - error details carry the offending field
+    """
+    assert fetch_trends_input(dict(VALID, limit=True))[0] == (
+        "INVALID_LIMIT",
+        "limit must be an integer in range 1..50",
+        {"limit": True},
+    )
+    assert generate_draft_input({"content_type": "post", "constraints": ["brand_safe", "nope"]})[0][1:] == (
+        "unknown constraint: nope",
+        {"constraint": "nope"},
+    )
+    assert evaluate_policy_input({"draft": {"draft_id": "x"}})[0][2] == {"draft_id": "x"}
+    assert evaluate_policy_input({"draft": {}, "confidence_threshold": None})[0][2] == {"confidence_threshold": None}
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"draft": {"draft_id": "drf_1"}},
+        {"draft": {"draft_id": "drf_1"}, "confidence_threshold": "0.5"},
+        {"draft": {"draft_id": "drf_1"}, "confidence_threshold": None},
+        {"draft": {"draft_id": "drf_1"}, "confidence_threshold": "high"},
+        {"draft": {"draft_id": "drf_1"}, "confidence_threshold": 1.5},
+        {"draft": {"draft_id": "drf_1"}, "confidence_threshold": float("nan")},
+        {"draft": {"draft_id": "drf_1"}, "confidence_threshold": 10**400},
+        {"draft": None, "confidence_threshold": 2.0},
+        {"draft": []},
+        {"draft": {}},
+        {"draft": {"draft_id": "rev_1"}},
+        {},
+    ],
+)
+def test_evaluate_policy_inline_checks_match_its_schema(params):
+    """
+    Maps to: specs/technical.md Section 3.3 - one set of rules, however it is checked
+    """
+    err, _ = evaluate_policy_input(params)
+    out = evaluate_policy(params)
+    if err is None:
+        assert "review" in out
+    else:
+        assert (out["error"]["code"], out["error"]["message"], out["error"]["details"]) == err
+
+
+@pytest.mark.parametrize("region", ["et", "E1", "ETH", "ET\n", ""])
+def test_region_is_strict_alpha2(region):
+    assert _code(fetch_trends_input, dict(VALID, region=region)) == "INVALID_REGION"
+
+
+def test_patterns_reject_a_trailing_newline():
+    for pattern, value in ((REGION_RE, "ET"), (TIME_WINDOW_RE, "24h"), (ISO_UTC_RE, "2026-02-05T10:00:00Z")):
+        assert pattern.match(value)
+        assert not pattern.match(value + "\n")
+    assert _code(fetch_trends_input, dict(VALID, time_window="24h\n")) == "INVALID_TIME_WINDOW"
+
+
+def test_validate_many_matches_single_calls():
+    payloads = [
+        VALID,
+        dict(VALID, limit=51),
+        {"platform": None},
+        dict(VALID, region="US", time_window="7D", limit=50),
+        dict(VALID, time_window="h"),
+    ] * 3
+    assert validate_many(fetch_trends_input, payloads) == [fetch_trends_input(p)[0] for p in payloads]
+    assert validate_many(lambda p: (None, ()), payloads) == [None] * len(payloads)
+
+
+def test_compile_rejects_unknown_kind():
+    with pytest.raises(ValueError):
+        compile_schema([{"field": "x", "kind": "uuid", "code": "INVALID_INPUT", "message": "x"}])
@@ -0,0 +1,246 @@
+"""
+Workflow Tests (checkpointed pause/resume/cancel)
+
+These tests assert the workflow interruption contracts defined in:
+- specs/technical.md Sections 3.8-3.10 - pause/resume/cancel, WORKFLOW_* error codes
+- specs/technical.md Section 5.1 - `workflows` status transitions
+- specs/functional.md F7 - Interrupt Workflow for Human Intervention
+"""
+
+import threading
+
+import pytest
+
+from chimera.store import SQLiteStore
+from chimera.workflow import WorkflowEngine
+from chimera.workflow import engine as engine_mod
+
+
+TRENDS = {"platform": "youtube", "region": "ET", "time_window": "24h", "limit": 3}
+
+
+def _params(threshold=0.0):
+    return {"trends": TRENDS, "content_type": "post", "confidence_threshold": threshold}
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    """Count skill executions per step to prove completed steps are never re-run."""
+    counts = {}
+    original = engine_mod.WorkflowEngine._execute
+
+    def counting(self, step, state):
+        counts[step] = counts.get(step, 0) + 1
+        return original(self, step, state)
+
+    monkeypatch.setattr(engine_mod.WorkflowEngine, "_execute", counting)
+    return counts
+
+
+def test_run_to_completion():
+    """
+    Maps to: specs/technical.md Section 5.1 - RUNNING -> COMPLETED
+    """
+    wf = WorkflowEngine()
+    wf_id = wf.create(_params(), workflow_id="wf_001")["workflow_id"]
+    view = wf.run(wf_id)
+
+    assert view["status"] == "COMPLETED"
+    assert view["state"]["publish_id"].startswith("pub_")
+    assert view["state"]["draft_id"].startswith("drf_")
+
+
+def test_pause_resume_continues_from_checkpoint(tmp_path, calls):
+    """
+    Maps to: specs/technical.md Sections 3.8, 3.9 - pause point holds until resume
+    """
+    path = str(tmp_path / "workflows.log")
+    wf = WorkflowEngine(path)
+    wf_id = wf.create(_params())["workflow_id"]
+    wf.step(wf_id)
+    wf.step(wf_id)
+
+    paused = wf.pause(wf_id, reason="Human review requested")
+    assert paused["status"] == "PAUSED"
+    assert paused["current_step"] == "evaluate_policy"
+    assert set(paused["state"]) == {"topic_id", "draft_id"}
+    assert wf.step(wf_id) is None
+    wf.close()
+
+    # A fresh engine replays the log and does not re-run fetch or draft.
+    wf = WorkflowEngine(path)
+    assert wf.get(wf_id)["status"] == "PAUSED"
+    resumed = wf.resume(wf_id)
+    assert resumed["status"] == "RUNNING" and "resumed_at" in resumed
+    assert wf.run(wf_id)["status"] == "COMPLETED"
+    assert calls == {"fetch_trends": 1, "generate_draft": 1, "evaluate_policy": 1, "publish_content": 1}
+    wf.close()
+
+
+def test_human_review_parks_until_approval(tmp_path):
+    """
+    Maps to: specs/functional.md F7 - awaiting_review requires a human approval to continue
+    """
+    store = SQLiteStore(str(tmp_path / "chimera.db"))
+    wf = WorkflowEngine(store=store)
+    wf_id = wf.create(_params(threshold=1.0))["workflow_id"]
+    view = wf.run(wf_id)
+    assert view["status"] == "PAUSED"
+    assert view["current_step"] == "awaiting_review"
+
+    assert wf.resume(wf_id)["error"]["code"] == "MISSING_APPROVAL"
+    store.insert_human_approvals([{
+        "approval_id": "hap_001",
+        "review_id": view["state"]["review_id"],
+        "draft_id": view["state"]["draft_id"],
+        "reviewer_id": "usr_123",
+        "decision": "APPROVED",
+        "recorded_at": "2026-02-05T10:15:00Z",
+    }])
+    assert wf.resume(wf_id, {"approval_id": "hap_001"})["status"] == "RUNNING"
+    assert wf.run(wf_id)["status"] == "COMPLETED"
+    store.close()
+
+
+def test_cancel_is_immediate_and_final():
+    """
+    Maps to: specs/technical.md Section 3.10 - cancelled workflow MUST NOT proceed
+    """
+    wf = WorkflowEngine()
+    wf_id = wf.create(_params())["workflow_id"]
+    wf.step(wf_id)
+
+    cancelled = wf.cancel(wf_id, reason="operator")
+    assert cancelled["status"] == "CANCELLED"
+    assert wf.run(wf_id)["current_step"] == "generate_draft"
+    assert wf.resume(wf_id)["error"]["code"] == "WORKFLOW_NOT_PAUSED"
+    assert wf.cancel(wf_id)["error"]["code"] == "WORKFLOW_FINALIZED"
+
+
+def test_cancel_during_step_discards_result(monkeypatch):
+    """
+    Maps to: specs/technical.md Section 3.10 - a step in flight does not advance a cancelled workflow
+    """
+    wf = WorkflowEngine()
+    wf_id = wf.create(_params())["workflow_id"]
+    original = engine_mod.WorkflowEngine._execute
+
+    def cancel_mid_step(self, step, state):
+        out = original(self, step, state)
+        self.cancel(wf_id)
+        return out
+
+    monkeypatch.setattr(engine_mod.WorkflowEngine, "_execute", cancel_mid_step)
+    view = wf.run(wf_id)
+    assert view["status"] == "CANCELLED"
+    assert "topic_id" not in view["state"]
+
+
+def test_concurrent_runs_execute_each_step_once(monkeypatch):
+    """
+    Maps to: specs/technical.md Section 3.5 - a workflow publishes its draft once
+    """
+    wf = WorkflowEngine()
+    wf_id = wf.create(_params())["workflow_id"]
+    original = engine_mod.WorkflowEngine._execute
+    started, release = threading.Event(), threading.Event()
+    counts = {}
+
+    def slow(self, step, state):
+        counts[step] = counts.get(step, 0) + 1
+        if step == "publish_content":
+            started.set()
+            release.wait(5)
+        return original(self, step, state)
+
+    monkeypatch.setattr(engine_mod.WorkflowEngine, "_execute", slow)
+    first = threading.Thread(target=wf.run, args=(wf_id,))
+    first.start()
+    assert started.wait(5)
+    # The publish step is in flight: a second runner must not execute it again.
+    assert wf.run(wf_id)["status"] == "RUNNING"
+    release.set()
+    first.join(5)
+    assert wf.get(wf_id)["status"] == "COMPLETED"
+    assert set(counts.values()) == {1}
+
+
+def test_pause_and_resume_during_step_discard_its_result(monkeypatch):
+    """
+    Maps to: specs/technical.md Sections 3.8, 3.9 - resumed steps use the modified params
+    """
+    wf = WorkflowEngine()
+    wf_id = wf.create(_params())["workflow_id"]
+    original = engine_mod.WorkflowEngine._execute
+    interrupted = []
+
+    def interrupt_once(self, step, state):
+        out = original(self, step, state)
+        if not interrupted:
+            interrupted.append(step)
+            self.pause(wf_id)
+            self.resume(wf_id, {"trends": dict(TRENDS, platform="tiktok")})
+        return out
+
+    monkeypatch.setattr(engine_mod.WorkflowEngine, "_execute", interrupt_once)
+    view = wf.run(wf_id)
+    assert view["status"] == "COMPLETED"
+    assert view["state"]["topic"]["platform"] == "tiktok"
+
+
+def test_error_codes():
+    """
+    Maps to: specs/technical.md Section 4 - WORKFLOW_NOT_FOUND, WORKFLOW_FINALIZED, WORKFLOW_NOT_PAUSED
+    """
+    wf = WorkflowEngine()
+    assert wf.pause("wf_missing")["error"]["code"] == "WORKFLOW_NOT_FOUND"
+    assert wf.cancel("wf_missing")["error"]["code"] == "WORKFLOW_NOT_FOUND"
+    assert wf.resume("wf_missing")["error"]["code"] == "WORKFLOW_NOT_FOUND"
+
+    wf_id = wf.create(_params())["workflow_id"]
+    assert wf.resume(wf_id)["error"]["code"] == "WORKFLOW_NOT_PAUSED"
+    wf.run(wf_id)
+    assert wf.pause(wf_id)["error"]["code"] == "WORKFLOW_FINALIZED"
+    assert wf.cancel(wf_id)["error"]["code"] == "WORKFLOW_FINALIZED"
+
+    bad = wf.create({"trends": dict(TRENDS, platform="bogus")})["workflow_id"]
+    view = wf.run(bad)
+    assert view["status"] == "FAILED"
+    assert view["state"]["error"]["code"] == "INVALID_PLATFORM"
+
+
+def test_many_paused_workflows_and_compaction(tmp_path):
+    """
+    Maps to: specs/technical.md Section 5.1 - workflow state snapshot survives compaction
+    """
+    path = tmp_path / "workflows.log"
+    wf = WorkflowEngine(str(path))
+    ids = [wf.create(_params(), workflow_id=f"wf_{i}")["workflow_id"] for i in range(20_000)]
+    for wf_id in ids:
+        wf.pause(wf_id)
+    assert wf.status_counts() == {"PAUSED": 20_000}
+
+    size = path.stat().st_size
+    wf.compact()
+    assert path.stat().st_size < size
+    wf.close()
+
+    wf = WorkflowEngine(str(path))
+    assert len(wf) == 20_000
+    assert wf.get("wf_19999")["status"] == "PAUSED"
+    assert wf.get("wf_19999")["state"]["params"] == _params()
+    wf.close()
+
+
+def test_torn_checkpoint_tail_is_dropped(tmp_path):
+    path = tmp_path / "workflows.log"
+    wf = WorkflowEngine(str(path))
+    wf_id = wf.create(_params())["workflow_id"]
+    wf.close()
+    with open(path, "ab") as f:
+        f.write(b'{"id":"' + wf_id.encode() + b'","status":"CANC')
+
+    wf = WorkflowEngine(str(path))
+    assert wf.get(wf_id)["status"] == "RUNNING"
+    assert wf.run(wf_id)["status"] == "COMPLETED"
+    wf.close()